@@ -0,0 +1,70 @@
+"""
+Lazily loaded package attributes, see PEP 562.
+
+Importing a subpackage like `ctapipe.io` should not import all of its
+submodules and their (heavy) dependencies, e.g. to only show the help
+of a command-line tool. Instead, the submodule providing an attribute
+is imported on first access of the attribute.
+"""
+
+import importlib
+import sys
+
+__all__ = ["attach"]
+
+
+def attach(package_name, submodule_attributes):
+    """
+    Create ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Parameters
+    ----------
+    package_name : str
+        ``__name__`` of the package
+    submodule_attributes : dict[str, list[str]]
+        Names of the public attributes provided by each submodule,
+        submodule names are relative to the package.
+        The submodules themselves are also accessible as attributes.
+
+    Returns
+    -------
+    __getattr__ : Callable
+        Module level ``__getattr__``, importing the submodule that
+        provides the requested attribute.
+    __dir__ : Callable
+        Module level ``__dir__``, including the not yet loaded attributes.
+
+    Examples
+    --------
+    In the ``__init__.py`` of a package:
+
+    >>> from ctapipe._lazy import attach
+    >>> __getattr__, __dir__ = attach(  # doctest: +SKIP
+    ...     __name__, {"hillas": ["hillas_parameters"]}
+    ... )
+    """
+    attribute_modules = {
+        name: module for module, names in submodule_attributes.items() for name in names
+    }
+
+    def __getattr__(name):
+        package = sys.modules[package_name]
+
+        if name in submodule_attributes:
+            return importlib.import_module(f"{package_name}.{name}")
+
+        module_name = attribute_modules.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        module = importlib.import_module(f"{package_name}.{module_name}")
+        value = getattr(module, name)
+        # store in the package, so __getattr__ is only called once per name
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        package = sys.modules[package_name]
+        return sorted(set(vars(package)) | set(attribute_modules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,28 @@
+"""
+Performance benchmarks of the computationally expensive parts of ctapipe.
+
+The benchmarks run offline on synthetic data, see `BenchmarkContext`.
+Use the ``ctapipe-benchmark`` tool to run them and to compare the results
+to a previous run.
+"""
+
+from .context import BenchmarkContext, make_toy_subarray
+from .core import (
+    Benchmark,
+    benchmark,
+    compare_results,
+    get_benchmarks,
+    register_benchmark,
+    run_benchmark,
+)
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkContext",
+    "benchmark",
+    "compare_results",
+    "get_benchmarks",
+    "make_toy_subarray",
+    "register_benchmark",
+    "run_benchmark",
+]
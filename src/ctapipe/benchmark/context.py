@@ -0,0 +1,294 @@
+"""
+Synthetic input data for the performance benchmarks.
+"""
+
+import tempfile
+from contextlib import nullcontext
+from functools import cached_property
+from pathlib import Path
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import EarthLocation
+from astropy.time import Time
+from scipy.stats import norm
+
+from ..containers import (
+    DL2Container,
+    MonitoringContainer,
+    ObservationBlockContainer,
+    TelescopeTriggerContainer,
+    TriggerContainer,
+)
+from ..coordinates import CameraFrame
+from ..core import Provenance
+from ..image import ImageProcessor
+from ..image.toymodel import WaveformModel
+from ..instrument import (
+    CameraDescription,
+    CameraGeometry,
+    CameraReadout,
+    OpticsDescription,
+    ReflectorShape,
+    SizeType,
+    SubarrayDescription,
+    TelescopeDescription,
+)
+from ..instrument.camera.geometry import PixelShape
+from ..io import DataWriter
+from ..io.toymodel import ToyEventSource
+
+__all__ = [
+    "BenchmarkContext",
+    "make_toy_subarray",
+]
+
+
+def make_toy_subarray(n_telescopes=4, n_pixels_side=43, n_samples=40):
+    """
+    Create a subarray of identical telescopes without reading any files.
+
+    The camera has square pixels on a rectangular grid and a similar number
+    of pixels and samples as the LST camera.
+
+    Parameters
+    ----------
+    n_telescopes : int
+        Number of telescopes, placed on a circle with a radius of 100 m
+    n_pixels_side : int
+        The camera has ``n_pixels_side**2`` pixels
+    n_samples : int
+        Number of waveform samples
+
+    Returns
+    -------
+    SubarrayDescription
+    """
+    focal_length = 28 * u.m
+    pixel_size = 0.05
+
+    half_width = 0.5 * (n_pixels_side - 1) * pixel_size
+    x = np.linspace(-half_width, half_width, n_pixels_side)
+    pix_x, pix_y = np.meshgrid(x, x)
+    n_pixels = n_pixels_side**2
+
+    geometry = CameraGeometry(
+        name="ToyCam",
+        pix_id=np.arange(n_pixels),
+        pix_x=pix_x.ravel() * u.m,
+        pix_y=pix_y.ravel() * u.m,
+        pix_area=np.full(n_pixels, pixel_size**2) * u.m**2,
+        pix_type=PixelShape.SQUARE,
+        frame=CameraFrame(focal_length=focal_length),
+    )
+
+    sample_width = 0.1
+    time = np.arange(0, 20, sample_width)
+    reference_pulse = norm.pdf(time, 5, 1.5)[np.newaxis]
+    readout = CameraReadout(
+        name="ToyCam",
+        sampling_rate=1 * u.GHz,
+        reference_pulse_shape=reference_pulse / reference_pulse.max(),
+        reference_pulse_sample_width=sample_width * u.ns,
+        n_channels=1,
+        n_pixels=n_pixels,
+        n_samples=n_samples,
+    )
+
+    optics = OpticsDescription(
+        name="ToyOptics",
+        size_type=SizeType.LST,
+        n_mirrors=1,
+        equivalent_focal_length=focal_length,
+        effective_focal_length=focal_length,
+        mirror_area=400 * u.m**2,
+        n_mirror_tiles=200,
+        reflector_shape=ReflectorShape.PARABOLIC,
+    )
+
+    telescope = TelescopeDescription(
+        name="ToyTel",
+        optics=optics,
+        camera=CameraDescription(name="ToyCam", geometry=geometry, readout=readout),
+    )
+
+    angles = 2 * np.pi * np.arange(n_telescopes) / n_telescopes
+    positions = {
+        tel_id: [100 * np.cos(angle), 100 * np.sin(angle), 0] * u.m
+        for tel_id, angle in enumerate(angles, start=1)
+    }
+    return SubarrayDescription(
+        name="ToyArray",
+        tel_positions=positions,
+        tel_descriptions=dict.fromkeys(positions, telescope),
+        reference_location=EarthLocation(
+            lon=-17.89 * u.deg, lat=28.76 * u.deg, height=2200 * u.m
+        ),
+    )
+
+
+class _BenchmarkEventSource(ToyEventSource):
+    """ToyEventSource with the information needed to write events with `DataWriter`"""
+
+    start_time = Time("2025-01-01T00:00:00")
+
+    @property
+    def is_simulation(self):
+        return False
+
+    @property
+    def observation_blocks(self):
+        return {1: ObservationBlockContainer(obs_id=1, producer_id="ctapipe")}
+
+    def generate_event(self):
+        event = super().generate_event()
+        event.trigger = TriggerContainer(
+            time=self.start_time + self.event_id * u.ms,
+            tels_with_trigger=np.array(sorted(event.dl1.tel)),
+        )
+        event.monitoring = MonitoringContainer()
+        event.dl2 = DL2Container()
+        event.monitoring.pointing.array_altitude = 70 * u.deg
+        event.monitoring.pointing.array_azimuth = 0 * u.deg
+
+        for tel_id, dl1 in event.dl1.tel.items():
+            dl1.image = dl1.image.astype(np.float32)
+            dl1.peak_time = self.rng.uniform(0, 20, len(dl1.image)).astype(np.float32)
+            event.trigger.tel[tel_id] = TelescopeTriggerContainer(
+                time=event.trigger.time
+            )
+            event.monitoring.tel[tel_id].pointing.altitude = 70 * u.deg
+            event.monitoring.tel[tel_id].pointing.azimuth = 0 * u.deg
+
+        return event
+
+
+class BenchmarkContext:
+    """
+    Input data shared by the benchmarks, created lazily on first access.
+
+    All data is generated from a seeded random number generator,
+    so benchmarks run on the same inputs every time.
+
+    Parameters
+    ----------
+    subarray : SubarrayDescription or None
+        Subarray to use for the synthetic data, defaults to `make_toy_subarray`.
+    tmp_dir : pathlib.Path or None
+        Directory for files created by the benchmarks.
+        If None, a temporary directory is created and removed by `close`.
+    n_events : int
+        Number of array events for benchmarks working on multiple events
+    seed : int
+        Seed for the random number generators
+    """
+
+    def __init__(self, subarray=None, tmp_dir=None, n_events=100, seed=0):
+        self._tmp_dir = None
+        if tmp_dir is None:
+            self._tmp_dir = tempfile.TemporaryDirectory(prefix="ctapipe_benchmark_")
+            tmp_dir = self._tmp_dir.name
+
+        self.tmp_dir = Path(tmp_dir)
+        self.n_events = n_events
+        self.seed = seed
+        if subarray is not None:
+            self.subarray = subarray
+
+    @cached_property
+    def subarray(self):
+        """The subarray, defaults to `make_toy_subarray`"""
+        return make_toy_subarray()
+
+    @property
+    def rng(self):
+        """A new random number generator seeded with ``seed``"""
+        return np.random.default_rng(self.seed)
+
+    @property
+    def tel_id(self):
+        """The first telescope of the subarray, used for single-telescope benchmarks"""
+        return self.subarray.tel_ids[0]
+
+    @property
+    def camera(self):
+        """Camera geometry of ``tel_id``"""
+        return self.subarray.tel[self.tel_id].camera.geometry
+
+    @cached_property
+    def events(self):
+        """
+        ``n_events`` toy events with images and peak times for all telescopes,
+        processed by the `~ctapipe.image.ImageProcessor`.
+        """
+        source = _BenchmarkEventSource(
+            subarray=self.subarray,
+            max_events=self.n_events,
+            trigger_probability=1.0,
+            rng=self.rng,
+        )
+        process_images = ImageProcessor(subarray=self.subarray)
+
+        events = []
+        for event in source:
+            process_images(event)
+            events.append(event)
+        return events
+
+    @cached_property
+    def dl1(self):
+        """DL1 data (image, peak time, cleaning mask and parameters) of one bright shower"""
+        for event in self.events:
+            dl1 = event.dl1.tel.get(self.tel_id)
+            if dl1 is not None and dl1.parameters.hillas.intensity > 500:
+                return dl1
+        return self.events[0].dl1.tel[self.tel_id]
+
+    @cached_property
+    def waveforms(self):
+        """
+        Waveforms of shape (n_channels, n_pixels, n_samples)
+        of the shower in ``dl1``, with gaussian noise.
+        """
+        readout = self.subarray.tel[self.tel_id].camera.readout
+        model = WaveformModel.from_camera_readout(readout)
+
+        peak_time = np.clip(self.dl1.peak_time, 5, readout.n_samples - 15)
+        waveforms = model.get_waveform(self.dl1.image, peak_time, readout.n_samples)
+        return waveforms + self.rng.normal(0, 0.5, waveforms.shape)
+
+    @cached_property
+    def dl1_file(self):
+        """Path of a DL1 file with images and parameters of all ``events``"""
+        path = self.tmp_dir / "benchmark.dl1.h5"
+        source = _BenchmarkEventSource(subarray=self.subarray, max_events=self.n_events)
+
+        # the DataWriter stores metadata of the current provenance activity
+        provenance = Provenance()
+        activity = nullcontext()
+        if provenance.current_activity is None:
+            activity = provenance.activity("ctapipe-benchmark")
+
+        with activity:
+            with DataWriter(
+                source,
+                output_path=path,
+                write_dl1_images=True,
+                write_dl1_parameters=True,
+                overwrite=True,
+            ) as write:
+                for event in self.events:
+                    write(event)
+        return path
+
+    def close(self):
+        """Remove the temporary directory, if one was created"""
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
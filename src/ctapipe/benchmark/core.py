@@ -0,0 +1,202 @@
+"""
+Registry, runner and comparison of the performance benchmarks.
+"""
+
+import inspect
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+__all__ = [
+    "Benchmark",
+    "benchmark",
+    "register_benchmark",
+    "get_benchmarks",
+    "run_benchmark",
+    "compare_results",
+]
+
+_BENCHMARKS = {}
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A registered performance benchmark.
+
+    Attributes
+    ----------
+    name : str
+        Unique, dot-separated name, e.g. ``image.hillas_parameters``
+    setup : Callable
+        Called with a `~ctapipe.benchmark.BenchmarkContext`, prepares the
+        input data and returns the function without arguments to be timed.
+    description : str
+        Short description of what is timed
+    """
+
+    name: str
+    setup: Callable
+    description: str = ""
+
+
+def register_benchmark(name, setup, description=""):
+    """
+    Register a benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Unique, dot-separated name of the benchmark
+    setup : Callable
+        See `Benchmark`
+    description : str
+        Short description of what is timed
+    """
+    if name in _BENCHMARKS:
+        raise ValueError(f"Benchmark {name!r} is already registered")
+    _BENCHMARKS[name] = Benchmark(name=name, setup=setup, description=description)
+
+
+def benchmark(name):
+    """
+    Decorator registering the decorated setup function as benchmark ``name``.
+
+    The first line of the docstring of the setup function is used as description.
+    """
+
+    def decorator(setup):
+        doc = inspect.getdoc(setup) or ""
+        register_benchmark(name, setup, description=doc.split("\n")[0])
+        return setup
+
+    return decorator
+
+
+def get_benchmarks(pattern=None):
+    """
+    Get the registered benchmarks.
+
+    Parameters
+    ----------
+    pattern : str or None
+        If given, only benchmarks with a name matching this regular expression
+        (using `re.search`) are returned.
+
+    Returns
+    -------
+    list[Benchmark]
+        Benchmarks sorted by name
+    """
+    # importing the suite modules registers their benchmarks
+    from . import image, io, monitoring, reco  # noqa: F401
+
+    benchmarks = sorted(_BENCHMARKS.values(), key=lambda b: b.name)
+    if pattern is not None:
+        regex = re.compile(pattern)
+        benchmarks = [b for b in benchmarks if regex.search(b.name)]
+    return benchmarks
+
+
+def _time_calls(func, n_calls):
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(benchmark, context, min_time=0.2, repeat=5):
+    """
+    Time a benchmark.
+
+    The function returned by the setup of the benchmark is called once to
+    warm up (e.g. for numba compilation), then ``repeat`` times
+    ``n_calls`` times, with ``n_calls`` chosen so that all repeats
+    take at least ``min_time`` seconds.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The benchmark to run
+    context : ctapipe.benchmark.BenchmarkContext
+        Provides the input data for the benchmark
+    min_time : float
+        Minimum total duration of the timed calls in seconds
+    repeat : int
+        Number of repetitions
+
+    Returns
+    -------
+    dict
+        Number of calls per repetition, number of repetitions
+        and the minimum, median, mean and standard deviation of the time per call
+        over the repetitions in seconds.
+    """
+    func = benchmark.setup(context)
+    func()
+
+    target = min_time / repeat
+    n_calls = 1
+    elapsed = _time_calls(func, n_calls)
+    while elapsed < target:
+        # aim slightly above the target, but grow by at most a factor 10 per step
+        factor = 1.2 * target / elapsed if elapsed > 0 else 10
+        n_calls = int(np.ceil(n_calls * min(max(factor, 2), 10)))
+        elapsed = _time_calls(func, n_calls)
+
+    times = [elapsed]
+    times.extend(_time_calls(func, n_calls) for _ in range(repeat - 1))
+    times = np.array(times) / n_calls
+
+    return {
+        "n_calls": n_calls,
+        "repeat": repeat,
+        "min": float(np.min(times)),
+        "median": float(np.median(times)),
+        "mean": float(np.mean(times)),
+        "std": float(np.std(times)),
+    }
+
+
+def compare_results(results, baseline, max_slowdown=1.2, statistic="min"):
+    """
+    Find benchmarks that got slower compared to a baseline.
+
+    Parameters
+    ----------
+    results : dict[str, dict]
+        Results of `run_benchmark` by benchmark name
+    baseline : dict[str, dict]
+        Results of `run_benchmark` by benchmark name of the reference run
+    max_slowdown : float
+        Benchmarks with ``time / baseline_time`` above this value are regressions
+    statistic : str
+        Which time per call to compare, one of the keys of the result of `run_benchmark`
+
+    Returns
+    -------
+    list[dict]
+        Name, baseline time, time and ratio of all regressed benchmarks,
+        benchmarks missing in either input are ignored.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        reference = baseline[name][statistic]
+        current = result[statistic]
+        ratio = current / reference if reference > 0 else np.inf
+        if ratio > max_slowdown:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline": reference,
+                    "time": current,
+                    "ratio": ratio,
+                }
+            )
+    return regressions
@@ -0,0 +1,153 @@
+"""
+Benchmarks of image extraction, cleaning, parametrization and likelihood.
+"""
+
+import numpy as np
+
+from ..core import non_abstract_children
+from ..image import (
+    ImageCleaner,
+    concentration_parameters,
+    hillas_parameters,
+    leakage_parameters,
+    timing_parameters,
+)
+from ..image.extractor import ImageExtractor
+from ..image.pixel_likelihood import (
+    neg_log_likelihood,
+    neg_log_likelihood_approx,
+)
+from ..image.reducer import TailCutsDataVolumeReducer
+from .core import benchmark, register_benchmark
+
+__all__ = []
+
+
+@benchmark("image.hillas_parameters")
+def _hillas(context):
+    """Hillas parameters of one cleaned image"""
+    mask = context.dl1.image_mask
+    geometry = context.camera[mask]
+    image = context.dl1.image[mask]
+    return lambda: hillas_parameters(geometry, image)
+
+
+@benchmark("image.timing_parameters")
+def _timing(context):
+    """Timing parameters of one cleaned image"""
+    mask = context.dl1.image_mask
+    geometry = context.camera[mask]
+    image = context.dl1.image[mask]
+    peak_time = context.dl1.peak_time[mask]
+    hillas = hillas_parameters(geometry, image)
+    return lambda: timing_parameters(geometry, image, peak_time, hillas)
+
+
+@benchmark("image.leakage_parameters")
+def _leakage(context):
+    """Leakage parameters of one cleaned image"""
+    geometry = context.camera
+    image = context.dl1.image
+    mask = context.dl1.image_mask
+    return lambda: leakage_parameters(geometry, image, mask)
+
+
+@benchmark("image.concentration_parameters")
+def _concentration(context):
+    """Concentration parameters of one cleaned image"""
+    geometry = context.camera
+    image = context.dl1.image
+    mask = context.dl1.image_mask
+    hillas = hillas_parameters(geometry[mask], image[mask])
+    return lambda: concentration_parameters(geometry, image, hillas)
+
+
+def _make_cleaner_benchmark(cls):
+    def setup(context):
+        cleaner = cls(subarray=context.subarray)
+        image = context.dl1.image
+        peak_time = context.dl1.peak_time
+        tel_id = context.tel_id
+        return lambda: cleaner(tel_id, image, peak_time)
+
+    return setup
+
+
+def _make_extractor_benchmark(cls):
+    def setup(context):
+        extractor = cls(subarray=context.subarray)
+        waveforms = context.waveforms
+        tel_id = context.tel_id
+        n_channels, n_pixels, _ = waveforms.shape
+        selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
+        broken_pixels = np.zeros((n_channels, n_pixels), dtype=bool)
+        return lambda: extractor(
+            waveforms, tel_id, selected_gain_channel, broken_pixels
+        )
+
+    return setup
+
+
+def _reducer_inputs(context, n_events):
+    waveforms = np.repeat(context.waveforms[np.newaxis], n_events, axis=0)
+    n_pixels = waveforms.shape[-2]
+    selected_gain_channel = np.zeros((n_events, n_pixels), dtype=np.int8)
+    return waveforms, selected_gain_channel
+
+
+@benchmark("image.reducer.tailcuts")
+def _tailcuts_reducer(context):
+    """TailCutsDataVolumeReducer on the waveforms of one camera"""
+    reducer = TailCutsDataVolumeReducer(subarray=context.subarray)
+    waveforms, selected_gain_channel = _reducer_inputs(context, 1)
+    return lambda: reducer(
+        waveforms[0], context.tel_id, selected_gain_channel=selected_gain_channel[0]
+    )
+
+
+@benchmark("image.reducer.tailcuts_batch")
+def _tailcuts_reducer_batch(context):
+    """TailCutsDataVolumeReducer on a batch of 100 events of one camera"""
+    reducer = TailCutsDataVolumeReducer(subarray=context.subarray)
+    waveforms, selected_gain_channel = _reducer_inputs(context, 100)
+    return lambda: reducer.select_pixels_batch(
+        waveforms, context.tel_id, selected_gain_channel=selected_gain_channel
+    )
+
+
+def _likelihood_inputs(context):
+    image = context.dl1.image.astype(np.float64)
+    n_pixels = len(image)
+    prediction = np.clip(image + context.rng.normal(0, 1, n_pixels), 0.1, None)
+    spe_width = np.full(n_pixels, 0.5)
+    pedestal = np.full(n_pixels, 1.0)
+    return image, prediction, spe_width, pedestal
+
+
+@benchmark("image.likelihood.neg_log_likelihood")
+def _likelihood(context):
+    """Pixel likelihood used by ImPACT for one camera image"""
+    image, prediction, spe_width, pedestal = _likelihood_inputs(context)
+    return lambda: neg_log_likelihood(image, prediction, spe_width, pedestal)
+
+
+@benchmark("image.likelihood.neg_log_likelihood_approx")
+def _likelihood_approx(context):
+    """Approximated pixel likelihood used by ImPACT for one camera image"""
+    image, prediction, spe_width, pedestal = _likelihood_inputs(context)
+    return lambda: neg_log_likelihood_approx(image, prediction, spe_width, pedestal)
+
+
+for _cls in non_abstract_children(ImageCleaner):
+    register_benchmark(
+        f"image.cleaning.{_cls.__name__}",
+        _make_cleaner_benchmark(_cls),
+        description=f"{_cls.__name__} on one camera image",
+    )
+
+for _cls in non_abstract_children(ImageExtractor):
+    register_benchmark(
+        f"image.extraction.{_cls.__name__}",
+        _make_extractor_benchmark(_cls),
+        description=f"{_cls.__name__} on the waveforms of one camera",
+    )
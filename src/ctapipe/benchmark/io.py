@@ -0,0 +1,91 @@
+"""
+Benchmarks of reading and writing ctapipe HDF5 files.
+"""
+
+import numpy as np
+
+from ..containers import HillasParametersContainer, TelEventIndexContainer
+from ..io import HDF5Merger, HDF5TableReader, HDF5TableWriter, TableLoader
+from ..io.toymodel import SyntheticEventSource
+from .core import benchmark
+
+__all__ = []
+
+
+def _hillas_rows(context):
+    rows = []
+    for event in context.events:
+        for tel_id, dl1 in event.dl1.tel.items():
+            index = TelEventIndexContainer(
+                obs_id=event.index.obs_id,
+                event_id=event.index.event_id,
+                tel_id=np.int16(tel_id),
+            )
+            rows.append((index, dl1.parameters.hillas))
+    return rows
+
+
+def _write_hillas(path, rows):
+    with HDF5TableWriter(path, mode="w") as writer:
+        for index, hillas in rows:
+            writer.write("hillas", [index, hillas])
+
+
+@benchmark("io.hdf5tablewriter")
+def _table_writer(context):
+    """Write the hillas parameters of all telescope events into a new file"""
+    path = context.tmp_dir / "benchmark_writer.h5"
+    rows = _hillas_rows(context)
+    return lambda: _write_hillas(path, rows)
+
+
+def _read_all(path):
+    with HDF5TableReader(path) as reader:
+        for _ in reader.read(
+            "/hillas", [TelEventIndexContainer, HillasParametersContainer]
+        ):
+            pass
+
+
+@benchmark("io.hdf5tablereader")
+def _table_reader(context):
+    """Read the hillas parameters of all telescope events into containers"""
+    path = context.tmp_dir / "benchmark_reader.h5"
+    _write_hillas(path, _hillas_rows(context))
+    return lambda: _read_all(path)
+
+
+def _read_chunked(path, chunk_size):
+    with TableLoader(path, dl1_images=True, dl1_parameters=True) as loader:
+        for _ in loader.read_telescope_events_chunked(chunk_size):
+            pass
+
+
+@benchmark("io.tableloader.read_telescope_events_chunked")
+def _tableloader_chunked(context):
+    """Read images and parameters of all telescope events in chunks of 10 events"""
+    path = context.dl1_file
+    return lambda: _read_chunked(path, chunk_size=10)
+
+
+def _merge(output_path, input_paths):
+    with HDF5Merger(
+        output_path, overwrite=True, merge_strategy="events-single-ob"
+    ) as merger:
+        for path in input_paths:
+            merger(path)
+
+
+@benchmark("io.hdf5merger")
+def _merger(context):
+    """Merge two DL1 files with images and parameters"""
+    input_paths = [context.dl1_file] * 2
+    output_path = context.tmp_dir / "benchmark_merged.dl1.h5"
+    return lambda: _merge(output_path, input_paths)
+
+
+@benchmark("io.SyntheticEventSource.generate_batch")
+def _synthetic_source(context):
+    """Generate the DL1 images of a batch of 100 synthetic array events"""
+    source = SyntheticEventSource(subarray=context.subarray, seed=context.seed)
+    return lambda: source.generate_batch(100)
@@ -0,0 +1,51 @@
+"""
+Benchmarks of the monitoring aggregators.
+"""
+
+import astropy.units as u
+import numpy as np
+from astropy.table import Table
+from traitlets.config import Config
+
+from ..core import non_abstract_children
+from ..monitoring import StatisticsAggregator
+from .core import register_benchmark
+
+__all__ = []
+
+
+def _pedestal_table(context, n_events=1000):
+    n_pixels = context.camera.n_pixels
+    start = context.events[0].trigger.time
+    return Table(
+        {
+            "time": start + np.arange(n_events) * 10 * u.ms,
+            "event_id": np.arange(n_events),
+            "image": context.rng.normal(77.0, 10.0, size=(n_events, 2, n_pixels)),
+        }
+    )
+
+
+def _make_aggregator_benchmark(cls):
+    def setup(context):
+        config = Config(
+            {
+                cls.__name__: {"chunking_type": "SizeChunking"},
+                "SizeChunking": {"chunk_size": 500},
+            }
+        )
+        aggregator = cls(config=config)
+        table = _pedestal_table(context)
+        return lambda: aggregator(table)
+
+    return setup
+
+
+for _cls in non_abstract_children(StatisticsAggregator):
+    register_benchmark(
+        f"monitoring.aggregation.{_cls.__name__}",
+        _make_aggregator_benchmark(_cls),
+        description=(
+            f"{_cls.__name__} on 1000 events of two gain channels in chunks of 500"
+        ),
+    )
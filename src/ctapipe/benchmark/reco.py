@@ -0,0 +1,70 @@
+"""
+Benchmarks of the stereo reconstruction.
+"""
+
+import astropy.units as u
+import numpy as np
+from astropy.table import Table
+
+from ..io import TableLoader
+from ..reco import HillasReconstructor, StereoMeanCombiner
+from ..reco.reconstructor import ReconstructionProperty
+from .core import benchmark
+
+__all__ = []
+
+
+def _reconstruct_events(reconstructor, events):
+    for event in events:
+        reconstructor(event)
+
+
+@benchmark("reco.HillasReconstructor")
+def _hillas_reconstructor(context):
+    """HillasReconstructor on 10 events, one event at a time"""
+    reconstructor = HillasReconstructor(context.subarray)
+    events = context.events[:10]
+    return lambda: _reconstruct_events(reconstructor, events)
+
+
+@benchmark("reco.HillasReconstructor.predict_table")
+def _hillas_reconstructor_table(context):
+    """HillasReconstructor on a table of the telescope events of all events"""
+    reconstructor = HillasReconstructor(context.subarray)
+    with TableLoader(
+        context.dl1_file, dl1_parameters=True, observation_info=True, pointing=True
+    ) as loader:
+        table = loader.read_telescope_events()
+    return lambda: reconstructor.predict_table(table)
+
+
+def _mono_energy_table(context, prefix):
+    rng = context.rng
+    n_events = 10_000
+    multiplicity = rng.integers(1, len(context.subarray) + 1, n_events)
+    n_tel_events = multiplicity.sum()
+
+    return Table(
+        {
+            "obs_id": np.ones(n_tel_events, dtype=np.int32),
+            "event_id": np.repeat(np.arange(n_events), multiplicity),
+            "tel_id": np.concatenate([np.arange(1, m + 1) for m in multiplicity]),
+            "hillas_intensity": rng.uniform(50, 5000, n_tel_events),
+            f"{prefix}_tel_energy": rng.lognormal(0, 1, n_tel_events) * u.TeV,
+            f"{prefix}_tel_is_valid": rng.uniform(size=n_tel_events) < 0.9,
+        }
+    )
+
+
+@benchmark("reco.StereoMeanCombiner.predict_table")
+def _stereo_mean_combiner(context):
+    """Intensity weighted mean of the energy of 10000 events"""
+    prefix = "Benchmark"
+    combiner = StereoMeanCombiner(
+        prefix=prefix,
+        property=ReconstructionProperty.ENERGY,
+        weights="intensity",
+        log_target=True,
+    )
+    table = _mono_energy_table(context, prefix)
+    return lambda: combiner.predict_table(table)
@@ -0,0 +1,65 @@
+import pytest
+
+from ctapipe.benchmark import (
+    Benchmark,
+    BenchmarkContext,
+    compare_results,
+    get_benchmarks,
+    run_benchmark,
+)
+
+
+@pytest.fixture(scope="module")
+def benchmark_context(tmp_path_factory):
+    return BenchmarkContext(
+        tmp_dir=tmp_path_factory.mktemp("benchmark"),
+        n_events=10,
+    )
+
+
+def test_get_benchmarks():
+    benchmarks = get_benchmarks()
+    names = [b.name for b in benchmarks]
+    assert names == sorted(names)
+    assert "image.hillas_parameters" in names
+    assert "image.cleaning.TailcutsImageCleaner" in names
+    assert "image.extraction.NeighborPeakWindowSum" in names
+
+    selected = get_benchmarks(r"^image\.cleaning\.")
+    assert 0 < len(selected) < len(benchmarks)
+    assert all(b.name.startswith("image.cleaning.") for b in selected)
+
+
+@pytest.mark.parametrize("benchmark", get_benchmarks(), ids=lambda b: b.name)
+def test_run_benchmark(benchmark, benchmark_context):
+    """Make sure all benchmarks run"""
+    result = run_benchmark(benchmark, benchmark_context, min_time=0, repeat=1)
+    assert result["n_calls"] == 1
+    assert result["repeat"] == 1
+    assert result["min"] > 0
+
+
+def test_run_benchmark_n_calls(benchmark_context):
+    calls = []
+
+    def setup(context):
+        assert context is benchmark_context
+        return lambda: calls.append(1)
+
+    result = run_benchmark(
+        Benchmark("test", setup), benchmark_context, min_time=0.01, repeat=3
+    )
+    assert result["n_calls"] > 1
+    # one warm up call
+    assert len(calls) >= 1 + 3 * result["n_calls"]
+    assert result["min"] <= result["median"]
+
+
+def test_compare_results():
+    baseline = {"a": {"min": 1.0}, "b": {"min": 1.0}, "c": {"min": 1.0}}
+    results = {"a": {"min": 1.1}, "b": {"min": 2.0}, "d": {"min": 5.0}}
+
+    regressions = compare_results(results, baseline, max_slowdown=1.2)
+    assert len(regressions) == 1
+    assert regressions[0]["name"] == "b"
+    assert regressions[0]["ratio"] == 2.0
@@ -13,6 +13,7 @@ from ctapipe.containers import DL0CameraContainer, DL1CameraContainer, PixelStat
 from ctapipe.core import TelescopeComponent
 from ctapipe.core.env import CTAPIPE_DISABLE_NUMBA_CACHE
 from ctapipe.core.traits import (
+    Bool,
     BoolTelescopeParameter,
     ComponentName,
     TelescopeParameter,
@@ -21,7 +22,7 @@ from ctapipe.image.extractor import ImageExtractor, VarianceExtractor
 from ctapipe.image.invalid_pixels import InvalidPixelHandler
 from ctapipe.image.reducer import DataVolumeReducer
 
-__all__ = ["CameraCalibrator"]
+__all__ = ["CameraCalibrator", "shift_waveforms", "subtract_pedestal_and_shift"]
 
 
 @cache
@@ -81,6 +82,17 @@ class CameraCalibrator(TelescopeComponent):
         ),
     ).tag(config=True)
 
+    reuse_waveform_buffer = Bool(
+        default_value=False,
+        help=(
+            "Write the pedestal subtracted and shifted waveforms into a buffer"
+            " allocated once per telescope instead of a new array for each event."
+            " Only enable this if the image extractor does not keep references"
+            " to the waveforms it is called with, which holds for all"
+            " extractors of ctapipe."
+        ),
+    ).tag(config=True)
+
     def __init__(
         self,
         subarray,
@@ -117,6 +129,7 @@ class CameraCalibrator(TelescopeComponent):
 
         self._r1_empty_warn = False
         self._dl0_empty_warn = False
+        self._waveform_buffers = {}
 
         self.image_extractors = {}
 
@@ -200,6 +213,19 @@ class CameraCalibrator(TelescopeComponent):
             calibration_monitoring_id=r1.calibration_monitoring_id,
         )
 
+    def _get_waveform_buffer(self, tel_id, waveforms):
+        """Output array for the calibrated waveforms of ``tel_id``"""
+        if not self.reuse_waveform_buffer:
+            return None
+
+        # integer waveforms are converted to float
+        dtype = waveforms.dtype if waveforms.dtype.kind == "f" else np.float32
+        buffer = self._waveform_buffers.get(tel_id)
+        if buffer is None or buffer.shape != waveforms.shape or buffer.dtype != dtype:
+            buffer = np.empty(waveforms.shape, dtype=dtype)
+            self._waveform_buffers[tel_id] = buffer
+        return buffer
+
     def _calibrate_dl1(self, event, tel_id):
         waveforms = event.dl0.tel[tel_id].waveform
         if self._check_dl0_empty(waveforms):
@@ -222,14 +248,32 @@ class CameraCalibrator(TelescopeComponent):
 
         readout = self.subarray.tel[tel_id].camera.readout
 
-        # subtract any remaining pedestal before extraction
-        if pedestal is not None:
-            if selected_gain_channel is not None:
-                pedestal = pedestal[selected_gain_channel, pixel_index]
-            # this copies intentionally, we don't want to modify the dl0 data
-            # waveforms have shape (n_channels, n_pixel, n_samples), pedestals (n_pixels)
-            waveforms = waveforms.copy()
-            waveforms -= np.atleast_2d(pedestal)[..., np.newaxis]
+        if pedestal is not None and selected_gain_channel is not None:
+            pedestal = pedestal[selected_gain_channel, pixel_index]
+
+        # integer shift of the waveforms if time_shift is available,
+        # the remaining shift is applied to the peak time after extraction
+        integer_shift = None
+        remaining_shift = None
+        if time_shift is not None and n_samples > 1:
+            if self.apply_waveform_time_shift.tel[tel_id]:
+                sampling_rate = readout.sampling_rate.to_value(u.GHz)
+                integer_shift, remaining_shift = _split_time_shift(
+                    time_shift * sampling_rate
+                )
+                remaining_shift /= sampling_rate
+            else:
+                remaining_shift = time_shift
+
+        # subtract any remaining pedestal and shift in one pass before extraction,
+        # this never modifies the dl0 data
+        if pedestal is not None or integer_shift is not None:
+            waveforms = subtract_pedestal_and_shift(
+                waveforms,
+                pedestal=pedestal,
+                integer_shift=integer_shift,
+                out=self._get_waveform_buffer(tel_id, waveforms),
+            )
 
         if n_samples == 1:
             # To handle ASTRI and dst
@@ -244,19 +288,6 @@ class CameraCalibrator(TelescopeComponent):
                 is_valid=True,
             )
         else:
-            # shift waveforms if time_shift is available
-            remaining_shift = None
-            if time_shift is not None:
-                if self.apply_waveform_time_shift.tel[tel_id]:
-                    sampling_rate = readout.sampling_rate.to_value(u.GHz)
-                    time_shift_samples = time_shift * sampling_rate
-                    waveforms, remaining_shift = shift_waveforms(
-                        waveforms, time_shift_samples
-                    )
-                    remaining_shift /= sampling_rate
-                else:
-                    remaining_shift = time_shift
-
             extractor = self.image_extractors[self.image_extractor_type.tel[tel_id]]
             dl1 = extractor(
                 waveforms,
@@ -308,6 +339,21 @@ class CameraCalibrator(TelescopeComponent):
             self._calibrate_dl0(event, tel_id)
             self._calibrate_dl1(event, tel_id)
 
+    def calibrate_dl0(self, event):
+        """
+        Perform only the R1 to DL0 step of the calibration.
+
+        Used if the DL1 data of the event is already available,
+        e.g. from the `~ctapipe.io.stagecache.DL1StageCache`.
+
+        Parameters
+        ----------
+        event : container
+            A `~ctapipe.containers.ArrayEventContainer` event container
+        """
+        for tel_id in event.r1.tel.keys():
+            self._calibrate_dl0(event, tel_id)
+
 
 def shift_waveforms(waveforms, time_shift_samples):
     """
@@ -332,11 +378,56 @@ def shift_waveforms(waveforms, time_shift_samples):
     remaining_shift: ndarray
         The remaining shift after applying the integer shift to the waveforms.
     """
+    integer_shift, remaining_shift = _split_time_shift(time_shift_samples)
+    shifted_waveforms = _shift_waveforms_by_integer(waveforms, integer_shift)
+    return shifted_waveforms, remaining_shift
+
+
+def _split_time_shift(time_shift_samples):
+    """Split the time shift into the integer shift of the waveforms and the rest"""
     mean_shift = time_shift_samples.mean(axis=-1, keepdims=True)
     integer_shift = np.round(time_shift_samples - mean_shift).astype("int16")
     remaining_shift = time_shift_samples - integer_shift
-    shifted_waveforms = _shift_waveforms_by_integer(waveforms, integer_shift)
-    return shifted_waveforms, remaining_shift
+    return integer_shift, remaining_shift
+
+
+def subtract_pedestal_and_shift(waveforms, pedestal=None, integer_shift=None, out=None):
+    """
+    Subtract the pedestal from the waveforms and shift them by an integer
+    number of samples in a single pass.
+
+    Same as subtracting the pedestal from a copy of the waveforms
+    and then shifting them using `shift_waveforms`, but without
+    creating intermediate arrays.
+
+    Parameters
+    ----------
+    waveforms: ndarray of shape (n_channels, n_pixels, n_samples)
+        The waveforms, not modified
+    pedestal: ndarray or None
+        Pedestal to subtract, of shape (n_pixels) or (n_channels, n_pixels)
+    integer_shift: ndarray or None
+        Integer shift in samples, of shape (n_pixels) or (n_channels, n_pixels).
+        Waveforms are shifted to the left, values out of bounds are
+        filled with the first or last sample.
+    out: ndarray or None
+        Array of the same shape and dtype as ``waveforms`` to store the result in,
+        e.g. a buffer reused for all events of a telescope.
+        Must not be ``waveforms`` itself.
+
+    Returns
+    -------
+    calibrated_waveforms: ndarray of shape (n_channels, n_pixels, n_samples)
+        ``out`` if given, else a new array
+    """
+    if pedestal is None:
+        pedestal = 0.0
+    if integer_shift is None:
+        integer_shift = 0
+    if out is not None and np.may_share_memory(out, waveforms):
+        raise ValueError("out must not share memory with waveforms")
+
+    return _subtract_pedestal_and_shift(waveforms, pedestal, integer_shift, out=out)
 
 
 @guvectorize(
@@ -353,3 +444,22 @@ def _shift_waveforms_by_integer(waveforms, integer_shift, shifted_waveforms):
         # repeat last value if out ouf bounds to the right
         sample_idx = min(max(new_sample_idx + integer_shift, 0), n_samples - 1)
         shifted_waveforms[new_sample_idx] = waveforms[sample_idx]
+
+
+@guvectorize(
+    [
+        (float32[:], float64, int64, float32[:]),
+        (float64[:], float64, int64, float64[:]),
+    ],
+    "(s),(),()->(s)",
+    nopython=True,
+    cache=not CTAPIPE_DISABLE_NUMBA_CACHE,
+)
+def _subtract_pedestal_and_shift(waveforms, pedestal, integer_shift, calibrated):
+    n_samples = waveforms.size
+
+    for new_sample_idx in range(n_samples):
+        # repeat first value if out ouf bounds to the left
+        # repeat last value if out ouf bounds to the right
+        sample_idx = min(max(new_sample_idx + integer_shift, 0), n_samples - 1)
+        calibrated[new_sample_idx] = waveforms[sample_idx] - pedestal
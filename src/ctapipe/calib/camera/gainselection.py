@@ -6,14 +6,18 @@ from abc import abstractmethod
 from enum import IntEnum
 
 import numpy as np
+from numba import njit
 
 from ctapipe.core import Component, traits
 
+from ...core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+
 __all__ = [
     "GainChannel",
     "GainSelector",
     "ManualGainSelector",
     "ThresholdGainSelector",
+    "threshold_gain_selection",
 ]
 
 
@@ -26,6 +30,39 @@ class GainChannel(IntEnum):
     LOW = 1
 
 
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def threshold_gain_selection(waveforms, threshold):
+    """
+    Select the low gain channel for pixels with a high gain sample above threshold.
+
+    Parameters
+    ----------
+    waveforms : ndarray
+        Waveforms of several events of one telescope,
+        shape (n_events, n_chan, n_pix, n_samples).
+    threshold : float
+        Threshold in waveform sample units
+
+    Returns
+    -------
+    selected_gain_channel : ndarray
+        Gain channel to use for each pixel of each event
+        Shape: (n_events, n_pix)
+        Dtype: int8
+    """
+    n_events, _, n_pixels, n_samples = waveforms.shape
+    selected_gain_channel = np.zeros((n_events, n_pixels), dtype=np.int8)
+
+    for event in range(n_events):
+        for pixel in range(n_pixels):
+            for sample in range(n_samples):
+                if waveforms[event, 0, pixel, sample] > threshold:
+                    selected_gain_channel[event, pixel] = 1
+                    break
+
+    return selected_gain_channel
+
+
 class GainSelector(Component):
     """
     Base class for algorithms that decide on the gain channel to use
@@ -58,6 +95,59 @@ class GainSelector(Component):
             return np.zeros(n_pixels, dtype=np.int8)
         return self.select_channel(waveforms)
 
+    def select_batch(self, waveforms):
+        """
+        Select the gain channels of several events of one telescope at once.
+
+        Parameters
+        ----------
+        waveforms : ndarray
+            Waveforms stored in a numpy array of shape
+            (n_events, n_chan, n_pix, n_samples).
+
+        Returns
+        -------
+        selected_gain_channel : ndarray
+            Gain channel to use for each pixel of each event
+            Shape: (n_events, n_pix)
+            Dtype: int8
+        """
+        if waveforms.ndim != 4:
+            raise ValueError(
+                f"Cannot handle waveform array of shape: {waveforms.shape}"
+            )
+
+        n_events, n_channels, n_pixels, _ = waveforms.shape
+        if n_channels == 1:
+            return np.zeros((n_events, n_pixels), dtype=np.int8)
+        return self.select_channel_batch(waveforms)
+
+    def select_channel_batch(self, waveforms):
+        """
+        Decide on the gain channels of several events.
+
+        Applies `select_channel` to each event, subclasses should override
+        this with a vectorized or compiled implementation.
+
+        Parameters
+        ----------
+        waveforms : ndarray
+            Waveforms stored in a numpy array of shape
+            (n_events, n_chan, n_pix, n_samples).
+
+        Returns
+        -------
+        selected_gain_channel : ndarray
+            Gain channel to use for each pixel of each event
+            Shape: (n_events, n_pix)
+            Dtype: int8
+        """
+        n_events, _, n_pixels, _ = waveforms.shape
+        selected_gain_channel = np.empty((n_events, n_pixels), dtype=np.int8)
+        for event, event_waveforms in enumerate(waveforms):
+            selected_gain_channel[event] = self.select_channel(event_waveforms)
+        return selected_gain_channel
+
     @abstractmethod
     def select_channel(self, waveforms):
         """
@@ -94,6 +184,10 @@ class ManualGainSelector(GainSelector):
         n_pixels = waveforms.shape[1]
         return np.full(n_pixels, GainChannel[self.channel])
 
+    def select_channel_batch(self, waveforms):
+        n_events, _, n_pixels, _ = waveforms.shape
+        return np.full((n_events, n_pixels), GainChannel[self.channel], dtype=np.int8)
+
 
 class ThresholdGainSelector(GainSelector):
     """
@@ -109,3 +203,6 @@ class ThresholdGainSelector(GainSelector):
 
     def select_channel(self, waveforms):
         return (waveforms[0] > self.threshold).any(axis=1).astype(np.int8)
+
+    def select_channel_batch(self, waveforms):
+        return threshold_gain_selection(waveforms, self.threshold)
@@ -11,7 +11,7 @@ from scipy.stats import norm
 from traitlets.config import Config
 
 from ctapipe.calib.camera.calibrator import CameraCalibrator
-from ctapipe.containers import ArrayEventContainer
+from ctapipe.containers import ArrayEventContainer, PixelStatus
 from ctapipe.image.extractor import (
     FullWaveformSum,
     GlobalPeakWindowSum,
@@ -340,6 +340,125 @@ def test_shift_waveforms():
     assert (shifted_waveforms[:, 4, 14] == 1).all()
 
 
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("n_channels", [1, 2])
+def test_subtract_pedestal_and_shift(dtype, n_channels):
+    from ctapipe.calib.camera.calibrator import (
+        shift_waveforms,
+        subtract_pedestal_and_shift,
+    )
+
+    rng = np.random.default_rng(0)
+    waveforms = rng.normal(10, 5, (n_channels, 20, 40)).astype(dtype)
+    original = waveforms.copy()
+    pedestal = rng.uniform(-4, 4, (n_channels, 20))
+    shifts = rng.uniform(-5, 5, (n_channels, 20))
+
+    subtracted = waveforms.copy()
+    subtracted -= pedestal[..., np.newaxis]
+    expected, remaining_shift = shift_waveforms(subtracted, shifts)
+    integer_shift = np.round(shifts - remaining_shift).astype(np.int16)
+
+    result = subtract_pedestal_and_shift(waveforms, pedestal, integer_shift)
+    assert result.dtype == dtype
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(waveforms, original)
+
+    # only one of the two steps
+    np.testing.assert_array_equal(
+        subtract_pedestal_and_shift(waveforms, pedestal=pedestal), subtracted
+    )
+    np.testing.assert_array_equal(
+        subtract_pedestal_and_shift(waveforms, integer_shift=integer_shift),
+        shift_waveforms(waveforms, shifts)[0],
+    )
+
+    # into a preallocated buffer
+    out = np.empty_like(waveforms)
+    result = subtract_pedestal_and_shift(waveforms, pedestal, integer_shift, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, expected)
+
+    with pytest.raises(ValueError, match="share memory"):
+        subtract_pedestal_and_shift(waveforms, pedestal, integer_shift, out=waveforms)
+
+
+@pytest.mark.parametrize("apply_waveform_time_shift", [False, True])
+def test_reuse_waveform_buffer(apply_waveform_time_shift):
+    """Calibrating into a reused buffer gives the same results"""
+    from ctapipe.benchmark import make_toy_subarray
+
+    subarray = make_toy_subarray(n_telescopes=1, n_pixels_side=11, n_samples=40)
+    tel_id = 1
+    n_pixels = subarray.tel[tel_id].camera.geometry.n_pixels
+    rng = np.random.default_rng(0)
+
+    def make_event():
+        event = ArrayEventContainer()
+        pulse = norm.pdf(np.arange(40), rng.uniform(15, 25, (1, n_pixels, 1)), 3)
+        waveforms = (100 * pulse + rng.normal(5, 1, pulse.shape)).astype(np.float32)
+        event.dl0.tel[tel_id].waveform = waveforms
+        event.dl0.tel[tel_id].selected_gain_channel = np.zeros(n_pixels, dtype=int)
+        coefficients = event.monitoring.tel[tel_id].camera.coefficients
+        coefficients.pedestal_offset = np.full((1, n_pixels), 5.0)
+        coefficients.time_shift = rng.uniform(-3, 3, (1, n_pixels))
+        coefficients.factor = np.ones((1, n_pixels))
+        coefficients.outlier_mask = np.zeros((1, n_pixels), dtype=bool)
+        return event
+
+    calibrators = {
+        reuse: CameraCalibrator(
+            subarray=subarray,
+            reuse_waveform_buffer=reuse,
+            apply_waveform_time_shift=apply_waveform_time_shift,
+        )
+        for reuse in (False, True)
+    }
+
+    buffers = []
+    for _ in range(3):
+        event = make_event()
+        dl0_waveform = event.dl0.tel[tel_id].waveform.copy()
+        results = {}
+        for reuse, calibrator in calibrators.items():
+            calibrator(event)
+            results[reuse] = deepcopy(event.dl1.tel[tel_id])
+
+        np.testing.assert_array_equal(results[True].image, results[False].image)
+        np.testing.assert_array_equal(results[True].peak_time, results[False].peak_time)
+        np.testing.assert_array_equal(event.dl0.tel[tel_id].waveform, dl0_waveform)
+        buffers.append(calibrators[True]._waveform_buffers[tel_id])
+
+    assert all(buffer is buffers[0] for buffer in buffers)
+    assert len(calibrators[False]._waveform_buffers) == 0
+
+
+def test_calibrate_dl0():
+    """Test only the R1 to DL0 step is performed by calibrate_dl0"""
+    from ctapipe.benchmark import make_toy_subarray
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=11, n_samples=40)
+    rng = np.random.default_rng(0)
+
+    event = ArrayEventContainer()
+    for tel_id in subarray.tel_ids:
+        n_pixels = subarray.tel[tel_id].camera.geometry.n_pixels
+        r1 = event.r1.tel[tel_id]
+        r1.waveform = rng.normal(5, 1, (1, n_pixels, 40)).astype(np.float32)
+        r1.selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
+        r1.pixel_status = np.zeros(n_pixels, dtype=np.uint8)
+
+    calibrator = CameraCalibrator(subarray=subarray)
+    calibrator.calibrate_dl0(event)
+
+    assert event.dl0.tel.keys() == event.r1.tel.keys()
+    assert len(event.dl1.tel) == 0
+    for tel_id, dl0 in event.dl0.tel.items():
+        # the default NullDataVolumeReducer keeps all pixels
+        np.testing.assert_array_equal(dl0.waveform, event.r1.tel[tel_id].waveform)
+        assert np.all(dl0.pixel_status & PixelStatus.DVR_STATUS)
+
+
 def test_invalid_pixels(example_event, example_subarray):
     # switching off the corrections makes it easier to test for
     # the exact value of 1.0
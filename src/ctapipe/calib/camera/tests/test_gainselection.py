@@ -66,3 +66,36 @@ def test_threshold_gain_selector():
     selected_gain_channel = gain_selector(waveforms)
     assert selected_gain_channel[0] == 1
     assert (selected_gain_channel[np.arange(1, 2048)] == 0).all()
+
+
+def test_select_batch():
+    rng = np.random.default_rng(0)
+    waveforms = rng.uniform(0, 100, (10, 2, 50, 20)).astype(np.float32)
+
+    gain_selector = ThresholdGainSelector(threshold=99)
+    selected_gain_channel = gain_selector.select_batch(waveforms)
+    assert selected_gain_channel.shape == (10, 50)
+    assert selected_gain_channel.dtype == np.int8
+    assert 0 < selected_gain_channel.sum() < selected_gain_channel.size
+    for event_waveforms, selected in zip(waveforms, selected_gain_channel):
+        np.testing.assert_equal(selected, gain_selector(event_waveforms))
+
+    # integer R0 waveforms
+    waveforms = waveforms.astype(np.uint16)
+    np.testing.assert_equal(
+        gain_selector.select_batch(waveforms),
+        [gain_selector(w) for w in waveforms],
+    )
+
+    # the generic implementation loops over the events
+    np.testing.assert_equal(DummyGainSelector().select_batch(waveforms), 0)
+    np.testing.assert_equal(
+        ManualGainSelector(channel="LOW").select_batch(waveforms), 1
+    )
+
+    # single channel
+    selected_gain_channel = gain_selector.select_batch(waveforms[:, :1])
+    np.testing.assert_equal(selected_gain_channel, 0)
+
+    with pytest.raises(ValueError):
+        gain_selector.select_batch(waveforms[0])
@@ -0,0 +1,316 @@
+"""
+Coordinate transformations between the ctapipe frames on plain numpy arrays.
+
+The astropy frame transformations of `~ctapipe.coordinates.CameraFrame`,
+`~ctapipe.coordinates.TelescopeFrame`, `~ctapipe.coordinates.NominalFrame`
+and `~ctapipe.coordinates.TiltedGroundFrame` are general, but creating the
+frames and coordinates and looking up the transformation path costs hundreds
+of microseconds per call. This dominates when only a few coordinates are
+transformed per event, e.g. in the stereo reconstruction.
+
+The functions here implement the same transformations using only numpy.
+All angles are in radians and all lengths in meters, the pointing may differ
+per coordinate: all arguments are broadcast against each other.
+Cartesian vectors have the three components in the last axis.
+
+As for the astropy transformations without ``obstime`` and ``location``,
+all ``AltAz`` coordinates are assumed to be in the same frame.
+"""
+
+import numpy as np
+
+from .ground_frames import _get_shower_trans_matrix
+
+__all__ = [
+    "pointing_rotation_matrix",
+    "spherical_to_cartesian",
+    "cartesian_to_spherical",
+    "fov_to_altaz_cartesian",
+    "altaz_cartesian_to_fov",
+    "fov_to_altaz",
+    "altaz_to_fov",
+    "fov_to_fov",
+    "camera_to_fov",
+    "fov_to_camera",
+    "ground_to_tilted",
+    "tilted_to_ground",
+    "project_tilted_to_ground",
+]
+
+
+def pointing_rotation_matrix(pointing_alt, pointing_az):
+    """
+    Rotation matrices from the AltAz frame into the field of view of a pointing.
+
+    This is the rotation of the AltAz to `~ctapipe.coordinates.TelescopeFrame`
+    and `~ctapipe.coordinates.NominalFrame` transformations.
+    The inverse rotation is given by the transposed matrices.
+
+    Parameters
+    ----------
+    pointing_alt : float or np.ndarray
+        Altitude of the pointing in radians
+    pointing_az : float or np.ndarray
+        Azimuth of the pointing in radians
+
+    Returns
+    -------
+    np.ndarray
+        Matrices of shape ``(..., 3, 3)``
+    """
+    pointing_alt, pointing_az = np.broadcast_arrays(pointing_alt, pointing_az)
+    cos_alt = np.cos(pointing_alt)
+    sin_alt = np.sin(pointing_alt)
+    cos_az = np.cos(pointing_az)
+    sin_az = np.sin(pointing_az)
+    zero = np.zeros_like(cos_alt)
+
+    return np.stack(
+        [
+            np.stack([cos_alt * cos_az, cos_alt * sin_az, sin_alt], axis=-1),
+            np.stack([-sin_az, cos_az, zero], axis=-1),
+            np.stack([-sin_alt * cos_az, -sin_alt * sin_az, cos_alt], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def spherical_to_cartesian(lon, lat):
+    """Cartesian unit vectors of spherical coordinates in radians"""
+    cos_lat = np.cos(lat)
+    return np.stack(
+        np.broadcast_arrays(cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)),
+        axis=-1,
+    )
+
+
+def cartesian_to_spherical(vec):
+    """Longitude and latitude in radians of cartesian vectors"""
+    x, y, z = vec[..., 0], vec[..., 1], vec[..., 2]
+    lon = np.arctan2(y, x)
+    lat = np.arctan2(z, np.hypot(x, y))
+    return lon, lat
+
+
+def fov_to_altaz_cartesian(fov_lon, fov_lat, pointing_alt, pointing_az):
+    """
+    Cartesian AltAz unit vectors of field of view coordinates of a pointing.
+
+    Parameters
+    ----------
+    fov_lon, fov_lat : float or np.ndarray
+        Field of view coordinates in radians
+    pointing_alt, pointing_az : float or np.ndarray
+        Pointing in radians
+
+    Returns
+    -------
+    np.ndarray
+        Unit vectors with ``x`` to the north, ``y`` to the east
+        and ``z`` to the zenith, i.e. the astropy cartesian representation
+        of ``AltAz``.
+    """
+    matrix = pointing_rotation_matrix(pointing_alt, pointing_az)
+    fov = spherical_to_cartesian(fov_lon, fov_lat)
+    # the inverse of the rotation is its transpose
+    return np.einsum("...ji,...j->...i", matrix, fov)
+
+
+def altaz_cartesian_to_fov(vec, pointing_alt, pointing_az):
+    """
+    Field of view coordinates of cartesian AltAz vectors.
+
+    Inverse of `fov_to_altaz_cartesian`, returns field of view
+    longitude and latitude in radians.
+    """
+    matrix = pointing_rotation_matrix(pointing_alt, pointing_az)
+    return cartesian_to_spherical(np.einsum("...ij,...j->...i", matrix, vec))
+
+
+def fov_to_altaz(fov_lon, fov_lat, pointing_alt, pointing_az):
+    """
+    Transform field of view coordinates into horizontal coordinates.
+
+    Same as transforming a `~ctapipe.coordinates.TelescopeFrame`
+    or `~ctapipe.coordinates.NominalFrame` coordinate into ``AltAz``.
+
+    Parameters
+    ----------
+    fov_lon, fov_lat : float or np.ndarray
+        Field of view coordinates in radians
+    pointing_alt, pointing_az : float or np.ndarray
+        Pointing in radians
+
+    Returns
+    -------
+    alt, az : np.ndarray
+        Horizontal coordinates in radians, az in [0, 2π)
+    """
+    vec = fov_to_altaz_cartesian(fov_lon, fov_lat, pointing_alt, pointing_az)
+    az, alt = cartesian_to_spherical(vec)
+    return alt, np.mod(az, 2 * np.pi)
+
+
+def altaz_to_fov(alt, az, pointing_alt, pointing_az):
+    """
+    Transform horizontal coordinates into field of view coordinates.
+
+    Same as transforming an ``AltAz`` coordinate into
+    `~ctapipe.coordinates.TelescopeFrame` or `~ctapipe.coordinates.NominalFrame`.
+
+    Parameters
+    ----------
+    alt, az : float or np.ndarray
+        Horizontal coordinates in radians
+    pointing_alt, pointing_az : float or np.ndarray
+        Pointing in radians
+
+    Returns
+    -------
+    fov_lon, fov_lat : np.ndarray
+        Field of view coordinates in radians
+    """
+    vec = spherical_to_cartesian(az, alt)
+    return altaz_cartesian_to_fov(vec, pointing_alt, pointing_az)
+
+
+def fov_to_fov(fov_lon, fov_lat, from_alt, from_az, to_alt, to_az):
+    """
+    Transform field of view coordinates of one pointing into those of another.
+
+    Same as transforming a `~ctapipe.coordinates.TelescopeFrame` coordinate
+    into the `~ctapipe.coordinates.NominalFrame` of the array pointing.
+
+    Parameters
+    ----------
+    fov_lon, fov_lat : float or np.ndarray
+        Field of view coordinates in radians relative to the pointing
+        ``from_alt``, ``from_az``
+    from_alt, from_az : float or np.ndarray
+        Pointing of the input coordinates in radians
+    to_alt, to_az : float or np.ndarray
+        Pointing of the output coordinates in radians
+
+    Returns
+    -------
+    fov_lon, fov_lat : np.ndarray
+        Field of view coordinates in radians relative to ``to_alt``, ``to_az``
+    """
+    vec = fov_to_altaz_cartesian(fov_lon, fov_lat, from_alt, from_az)
+    return altaz_cartesian_to_fov(vec, to_alt, to_az)
+
+
+def camera_to_fov(x, y, focal_length, rotation=0.0):
+    """
+    Transform `~ctapipe.coordinates.CameraFrame` positions into
+    `~ctapipe.coordinates.TelescopeFrame` coordinates.
+
+    Like the astropy transformation, this assumes an equidistant
+    mapping function of the telescope optics.
+
+    Parameters
+    ----------
+    x, y : float or np.ndarray
+        Positions in the camera frame in meters
+    focal_length : float or np.ndarray
+        Focal length in meters
+    rotation : float or np.ndarray
+        Rotation of the camera frame in radians
+
+    Returns
+    -------
+    fov_lon, fov_lat : np.ndarray
+        Field of view coordinates in radians
+    """
+    cos_rot = np.cos(rotation)
+    sin_rot = np.sin(rotation)
+    x_rotated = x * cos_rot - y * sin_rot
+    y_rotated = x * sin_rot + y * cos_rot
+    return y_rotated / focal_length, x_rotated / focal_length
+
+
+def fov_to_camera(fov_lon, fov_lat, focal_length, rotation=0.0):
+    """
+    Transform `~ctapipe.coordinates.TelescopeFrame` coordinates into
+    `~ctapipe.coordinates.CameraFrame` positions.
+
+    Inverse of `camera_to_fov`, returns positions in meters.
+    """
+    cos_rot = np.cos(rotation)
+    sin_rot = np.sin(rotation)
+    x = fov_lat * focal_length
+    y = fov_lon * focal_length
+    return x * cos_rot + y * sin_rot, -x * sin_rot + y * cos_rot
+
+
+def _tilted_rotation_matrix(pointing_alt, pointing_az):
+    pointing_alt, pointing_az = np.broadcast_arrays(pointing_alt, pointing_az)
+    trans = _get_shower_trans_matrix(pointing_az, pointing_alt)
+    # the matrix axes come first, move them to the end for broadcasting
+    return np.moveaxis(trans, (0, 1), (-2, -1))
+
+
+def ground_to_tilted(positions, pointing_alt, pointing_az):
+    """
+    Transform `~ctapipe.coordinates.GroundFrame` positions into the
+    `~ctapipe.coordinates.TiltedGroundFrame` of a pointing.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Cartesian ground positions in meters, shape ``(..., 3)``
+    pointing_alt, pointing_az : float or np.ndarray
+        Pointing direction of the tilted frame in radians
+
+    Returns
+    -------
+    np.ndarray
+        Cartesian positions in the tilted frame in meters
+    """
+    matrix = _tilted_rotation_matrix(pointing_alt, pointing_az)
+    return np.einsum("...ij,...j->...i", matrix, positions)
+
+
+def tilted_to_ground(positions, pointing_alt, pointing_az):
+    """
+    Transform `~ctapipe.coordinates.TiltedGroundFrame` positions into the
+    `~ctapipe.coordinates.GroundFrame`.
+
+    Inverse of `ground_to_tilted`.
+    """
+    matrix = _tilted_rotation_matrix(pointing_alt, pointing_az)
+    # the inverse of the rotation is its transpose
+    return np.einsum("...ji,...j->...i", matrix, positions)
+
+
+def project_tilted_to_ground(tilted_x, tilted_y, pointing_alt, pointing_az):
+    """
+    Project positions in the tilted frame onto the ground.
+
+    Same as `~ctapipe.coordinates.project_to_ground` for positions with ``z=0``
+    in the `~ctapipe.coordinates.TiltedGroundFrame`, i.e. the intersection
+    of the lines along the pointing direction through the positions with the ground.
+
+    Parameters
+    ----------
+    tilted_x, tilted_y : float or np.ndarray
+        Positions in the tilted frame in meters
+    pointing_alt, pointing_az : float or np.ndarray
+        Pointing direction of the tilted frame in radians
+
+    Returns
+    -------
+    x, y : np.ndarray
+        Positions on the ground in meters
+    """
+    matrix = _tilted_rotation_matrix(pointing_alt, pointing_az)
+    tilted_x, tilted_y = np.broadcast_arrays(tilted_x, tilted_y)
+    tilted = np.stack([tilted_x, tilted_y, np.zeros_like(tilted_x)], axis=-1)
+    ground = np.einsum("...ji,...j->...i", matrix, tilted)
+
+    # last row of the matrix is the pointing direction in the ground frame
+    direction = matrix[..., 2, :]
+    scale = ground[..., 2] / direction[..., 2]
+    x = ground[..., 0] - direction[..., 0] * scale
+    y = ground[..., 1] - direction[..., 1] * scale
+    return x, y
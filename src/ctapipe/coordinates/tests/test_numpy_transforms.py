@@ -0,0 +1,214 @@
+"""Tests comparing the numpy transformations to the astropy frame transformations"""
+
+import warnings
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.coordinates import AltAz, SkyCoord
+
+from ctapipe.coordinates import (
+    CameraFrame,
+    GroundFrame,
+    MissingFrameAttributeWarning,
+    NominalFrame,
+    TelescopeFrame,
+    TiltedGroundFrame,
+    project_to_ground,
+)
+from ctapipe.coordinates import numpy_transforms as nt
+
+N = 50
+
+
+@pytest.fixture(autouse=True)
+def _ignore_missing_frame_attributes():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", MissingFrameAttributeWarning)
+        yield
+
+
+@pytest.fixture(scope="module")
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def pointings(rng):
+    """Pointing per coordinate, including the zenith and azimuth wrap-around"""
+    alt = rng.uniform(np.deg2rad(20), np.deg2rad(90), N)
+    az = rng.uniform(-np.pi, 2 * np.pi, N)
+    alt[0] = np.pi / 2
+    return alt, az
+
+
+@pytest.fixture(scope="module")
+def fov_coords(rng):
+    return rng.uniform(-0.1, 0.1, N), rng.uniform(-0.1, 0.1, N)
+
+
+def altaz(alt, az):
+    return AltAz(alt=u.Quantity(alt, u.rad), az=u.Quantity(az, u.rad))
+
+
+def assert_angles_close(actual, expected):
+    """Compare angles in radians, to astropy precision (~1e-12 rad)"""
+    diff = np.angle(np.exp(1j * (np.asanyarray(actual) - expected)))
+    np.testing.assert_allclose(diff, 0, atol=1e-12)
+
+
+def test_pointing_rotation_matrix():
+    """The matrices are rotations and the pointing is the x axis of the fov"""
+    alt = np.deg2rad([70.0, 20.0])
+    az = np.deg2rad([10.0, 200.0])
+    matrix = nt.pointing_rotation_matrix(alt, az)
+    assert matrix.shape == (2, 3, 3)
+    np.testing.assert_allclose(
+        matrix @ np.swapaxes(matrix, -1, -2),
+        np.broadcast_to(np.eye(3), (2, 3, 3)),
+        atol=1e-15,
+    )
+
+    pointing = nt.spherical_to_cartesian(az, alt)
+    np.testing.assert_allclose(
+        np.einsum("nij,nj->ni", matrix, pointing), [[1, 0, 0], [1, 0, 0]], atol=1e-15
+    )
+
+    assert nt.pointing_rotation_matrix(0.1, 0.2).shape == (3, 3)
+
+
+def test_fov_to_altaz(pointings, fov_coords):
+    alt, az = pointings
+    fov_lon, fov_lat = fov_coords
+
+    coord = SkyCoord(
+        fov_lon=u.Quantity(fov_lon, u.rad),
+        fov_lat=u.Quantity(fov_lat, u.rad),
+        frame=TelescopeFrame(telescope_pointing=altaz(alt, az)),
+    ).transform_to(AltAz())
+
+    result_alt, result_az = nt.fov_to_altaz(fov_lon, fov_lat, alt, az)
+    assert_angles_close(result_alt, coord.alt.rad)
+    assert_angles_close(result_az, coord.az.rad)
+    assert np.all((result_az >= 0) & (result_az < 2 * np.pi))
+
+    # and back
+    lon, lat = nt.altaz_to_fov(result_alt, result_az, alt, az)
+    assert_angles_close(lon, fov_lon)
+    assert_angles_close(lat, fov_lat)
+
+
+def test_altaz_to_fov(pointings, fov_coords):
+    alt, az = pointings
+    source_alt = np.minimum(alt + fov_coords[0], np.pi / 2)
+    source_az = az + fov_coords[1]
+
+    coord = SkyCoord(
+        alt=u.Quantity(source_alt, u.rad),
+        az=u.Quantity(source_az, u.rad),
+        frame=AltAz(),
+    ).transform_to(NominalFrame(origin=altaz(alt, az)))
+
+    fov_lon, fov_lat = nt.altaz_to_fov(source_alt, source_az, alt, az)
+    assert_angles_close(fov_lon, coord.fov_lon.rad)
+    assert_angles_close(fov_lat, coord.fov_lat.rad)
+
+
+def test_fov_to_fov(pointings, fov_coords):
+    """TelescopeFrame to NominalFrame with a common array pointing"""
+    alt, az = pointings
+    fov_lon, fov_lat = fov_coords
+    array_alt, array_az = np.deg2rad(70), np.deg2rad(5)
+
+    coord = SkyCoord(
+        fov_lon=u.Quantity(fov_lon, u.rad),
+        fov_lat=u.Quantity(fov_lat, u.rad),
+        frame=TelescopeFrame(telescope_pointing=altaz(alt, az)),
+    ).transform_to(NominalFrame(origin=altaz(array_alt, array_az)))
+
+    lon, lat = nt.fov_to_fov(fov_lon, fov_lat, alt, az, array_alt, array_az)
+    assert_angles_close(lon, coord.fov_lon.rad)
+    assert_angles_close(lat, coord.fov_lat.rad)
+
+
+@pytest.mark.parametrize("rotation", [0.0, np.deg2rad(10.9)])
+def test_camera_to_fov(rng, rotation):
+    x, y = rng.uniform(-1, 1, (2, N))
+    focal_length = rng.uniform(10, 30, N)
+    pointing = altaz(np.deg2rad(70), 0.0)
+
+    camera_frame = CameraFrame(
+        focal_length=u.Quantity(focal_length, u.m),
+        rotation=u.Quantity(rotation, u.rad),
+        telescope_pointing=pointing,
+    )
+    coord = SkyCoord(x=x * u.m, y=y * u.m, frame=camera_frame).transform_to(
+        TelescopeFrame(telescope_pointing=pointing)
+    )
+
+    fov_lon, fov_lat = nt.camera_to_fov(x, y, focal_length, rotation)
+    assert_angles_close(fov_lon, coord.fov_lon.rad)
+    assert_angles_close(fov_lat, coord.fov_lat.rad)
+
+    back = coord.transform_to(camera_frame)
+    result_x, result_y = nt.fov_to_camera(fov_lon, fov_lat, focal_length, rotation)
+    np.testing.assert_allclose(result_x, back.x.to_value(u.m), atol=1e-12)
+    np.testing.assert_allclose(result_y, back.y.to_value(u.m), atol=1e-12)
+    np.testing.assert_allclose(result_x, x, atol=1e-12)
+    np.testing.assert_allclose(result_y, y, atol=1e-12)
+
+
+def test_camera_to_nominal(rng, pointings):
+    """The full chain used by the stereo reconstruction"""
+    alt, az = pointings
+    x, y = rng.uniform(-1, 1, (2, N))
+    array_alt, array_az = np.deg2rad(70), np.deg2rad(355)
+
+    camera_frame = CameraFrame(focal_length=28 * u.m, telescope_pointing=altaz(alt, az))
+    coord = SkyCoord(x=x * u.m, y=y * u.m, frame=camera_frame).transform_to(
+        NominalFrame(origin=altaz(array_alt, array_az))
+    )
+
+    lon, lat = nt.fov_to_fov(
+        *nt.camera_to_fov(x, y, 28.0), alt, az, array_alt, array_az
+    )
+    assert_angles_close(lon, coord.fov_lon.rad)
+    assert_angles_close(lat, coord.fov_lat.rad)
+
+
+def test_ground_to_tilted(rng, pointings):
+    alt, az = pointings
+    positions = rng.uniform(-500, 500, (N, 3))
+
+    # astropy only supports a common tilted frame for all coordinates
+    for i in range(0, N, 10):
+        frame = TiltedGroundFrame(pointing_direction=altaz(alt[i], az[i]))
+        tilted = SkyCoord(*(positions.T * u.m), frame=GroundFrame()).transform_to(frame)
+        expected = tilted.cartesian.xyz.to_value(u.m).T
+
+        result = nt.ground_to_tilted(positions, alt[i], az[i])
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+
+        ground = nt.tilted_to_ground(result, alt[i], az[i])
+        np.testing.assert_allclose(ground, positions, atol=1e-9)
+
+    # different pointing per position
+    result = nt.ground_to_tilted(positions, alt, az)
+    for i in range(0, N, 10):
+        expected = nt.ground_to_tilted(positions[i], alt[i], az[i])
+        np.testing.assert_allclose(result[i], expected, atol=1e-9)
+
+
+def test_project_tilted_to_ground(rng, pointings):
+    alt, az = pointings
+    tilted_x, tilted_y = rng.uniform(-500, 500, (2, N))
+
+    x, y = nt.project_tilted_to_ground(tilted_x, tilted_y, alt, az)
+    for i in range(0, N, 10):
+        frame = TiltedGroundFrame(pointing_direction=altaz(alt[i], az[i]))
+        tilted = SkyCoord(
+            x=tilted_x[i] * u.m, y=tilted_y[i] * u.m, z=0 * u.m, frame=frame
+        )
+        expected = project_to_ground(tilted)
+        np.testing.assert_allclose(x[i], expected.x.to_value(u.m), atol=1e-9)
+        np.testing.assert_allclose(y[i], expected.y.to_value(u.m), atol=1e-9)
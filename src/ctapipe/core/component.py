@@ -64,6 +64,15 @@ def non_abstract_children(base):
     non_abstract : dict
         dict of all non-abstract subclasses
     """
+    # implementations might be provided by plugins or by
+    # not yet imported modules of the lazily loaded ctapipe subpackages
+    if hasattr(base, "plugin_entry_point"):
+        detect_and_import_plugins(base.plugin_entry_point)
+
+    return _non_abstract_children(base)
+
+
+def _non_abstract_children(base):
     non_abstract = []
 
     for subcls in base.__subclasses__():
@@ -71,7 +80,7 @@ def non_abstract_children(base):
             non_abstract.append(subcls)
 
         # recurse
-        non_abstract.extend(non_abstract_children(subcls))
+        non_abstract.extend(_non_abstract_children(subcls))
 
     return non_abstract
 
@@ -218,9 +227,6 @@ class Component(Configurable, metaclass=AbstractConfigurableMeta):
             A dict mapping the name to the class of all found,
             non-abstract  subclasses of this class.
         """
-        if hasattr(cls, "plugin_entry_point"):
-            detect_and_import_plugins(cls.plugin_entry_point)
-
         subclasses = {base.__name__: base for base in non_abstract_children(cls)}
         return subclasses
 
@@ -233,7 +239,12 @@ class Component(Configurable, metaclass=AbstractConfigurableMeta):
         name = self.__class__.__name__
         config = {name: {k: v.get(self) for k, v in self.traits(config=True).items()}}
 
-        for val in self.__dict__.values():
+        for attr, val in self.__dict__.items():
+            # e.g. components per telescope type or algorithm name,
+            # private dicts include the traitlets internals (e.g. the parent)
+            if isinstance(val, dict) and not attr.startswith("_"):
+                val = list(val.values())
+
             if isinstance(val, (Component, Tool)):
                 config[name].update(val.get_current_config())
             if (
@@ -298,6 +309,8 @@ class Component(Configurable, metaclass=AbstractConfigurableMeta):
     def __getstate__(self):
         """Make Components pickle-able by removing non-pickleable members"""
         state = self.__dict__.copy()
+        # copy, so that the parent of this instance is kept
+        state["_trait_values"] = state["_trait_values"].copy()
         state["_trait_values"]["parent"] = None
         state["_trait_notifiers"] = {}
         return state
@@ -1,7 +1,7 @@
 import logging
 import warnings
 from collections import defaultdict
-from functools import partial
+from functools import cache, partial
 from inspect import isclass
 from pprint import pformat
 from textwrap import dedent, wrap
@@ -11,7 +11,7 @@ from astropy.units import Quantity, Unit, UnitConversionError
 
 log = logging.getLogger(__name__)
 
-__all__ = ["Container", "Field", "FieldValidationError", "Map"]
+__all__ = ["Container", "Field", "FieldValidationError", "Map", "lazy_container"]
 
 
 def _fqdn(obj):
@@ -458,6 +458,114 @@ class Container(metaclass=ContainerMeta):
                 )
 
 
+def _restore_container(cls, prefix, meta, values):
+    """Reconstruct a plain container from its state, used for pickling lazy containers"""
+    container = cls(prefix=prefix, **values)
+    container.meta = meta
+    return container
+
+
+class _LazyContainerMixin:
+    """
+    Mixin for containers whose field values are only loaded on first access.
+
+    Instances are created without calling ``Container.__init__``, so the
+    slots of the fields stay empty and accessing them ends up in ``__getattr__``,
+    which calls the loader once and fills all fields that have not been
+    assigned explicitly in the meantime.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        # only called if the normal lookup failed, i.e. for unset slots
+        if name not in self.fields or self._lazy_loader is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self._lazy_load()
+        return object.__getattribute__(self, name)
+
+    def _lazy_load(self):
+        loader = self._lazy_loader
+        if loader is None:
+            return
+
+        self._lazy_loader = None
+        values = loader()
+
+        for name, field in self.fields.items():
+            try:
+                # keep values that were assigned before loading
+                object.__getattribute__(self, name)
+                continue
+            except AttributeError:
+                pass
+
+            if name in values:
+                value = values[name]
+            elif field.default_factory is not None:
+                value = field.default_factory()
+            else:
+                value = field.default
+            setattr(self, name, value)
+
+    @property
+    def is_loaded(self):
+        """True if the values of this container were already read"""
+        return self._lazy_loader is None
+
+    def __reduce__(self):
+        self._lazy_load()
+        values = {name: getattr(self, name) for name in self.fields}
+        return _restore_container, (self._lazy_base, self.prefix, self.meta, values)
+
+
+@cache
+def _lazy_container_class(cls):
+    return type.__new__(
+        type(cls),
+        f"Lazy{cls.__name__}",
+        (_LazyContainerMixin, cls),
+        {
+            "__slots__": ("_lazy_loader",),
+            "__module__": cls.__module__,
+            "__qualname__": f"Lazy{cls.__qualname__}",
+            "__doc__": cls.__doc__,
+            "_lazy_base": cls,
+        },
+    )
+
+
+def lazy_container(cls, loader, prefix=None, meta=None):
+    """
+    Create an instance of ``cls`` whose field values are provided by ``loader``.
+
+    ``loader`` is only called on the first access to any field of the returned
+    container and must return a dict mapping field names to values.
+    Fields missing in that dict are set to their default values.
+    The returned object is an instance of a subclass of ``cls``, so it can
+    be used everywhere an instance of ``cls`` is expected.
+
+    Parameters
+    ----------
+    cls : type
+        Subclass of `Container` to create
+    loader : Callable[[], dict]
+        Callable returning the field values
+    prefix : str or None
+        Prefix of the container, if None, ``cls.default_prefix`` is used
+    meta : dict or None
+        Metadata attached to the container
+    """
+    lazy_cls = _lazy_container_class(cls)
+    container = lazy_cls.__new__(lazy_cls)
+    container.meta = meta if meta is not None else {}
+    container.prefix = prefix if prefix is not None else cls.default_prefix
+    container._lazy_loader = loader
+    return container
+
+
 class Map(defaultdict):
     """A dictionary of sub-containers that can be added to a Container. This
     may be used e.g. to store a set of identical sub-Containers (e.g. indexed
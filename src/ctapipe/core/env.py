@@ -3,9 +3,11 @@ Environment variables to configure ctapipe.
 """
 
 import os
+import sys
 
 __all__ = [
     "CTAPIPE_DISABLE_NUMBA_CACHE",
+    "CTAPIPE_NUMBA_CACHE_DIR",
 ]
 
 
@@ -26,3 +28,25 @@ def env_bool(key, default=False):
 
 #: Boolean flag. Set this variable to a truthy value disable numba caching.
 CTAPIPE_DISABLE_NUMBA_CACHE = env_bool("CTAPIPE_DISABLE_NUMBA_CACHE")
+
+#: Directory for the numba cache instead of ``__pycache__`` next to the sources.
+#: Used as ``NUMBA_CACHE_DIR`` if that is not set, so a cache filled
+#: by ``ctapipe-precompile`` can be shared by all processes using the
+#: same installation, even if the installation directory is read-only.
+CTAPIPE_NUMBA_CACHE_DIR = os.getenv("CTAPIPE_NUMBA_CACHE_DIR")
+
+
+def _configure_numba_cache_dir():
+    if CTAPIPE_NUMBA_CACHE_DIR is None or "NUMBA_CACHE_DIR" in os.environ:
+        return
+
+    os.environ["NUMBA_CACHE_DIR"] = CTAPIPE_NUMBA_CACHE_DIR
+    # numba reads its configuration on import, the cache
+    # location of a function is determined when it is decorated
+    if "numba" in sys.modules:
+        from numba.core.config import reload_config
+
+        reload_config()
+
+
+_configure_numba_cache_dir()
@@ -25,6 +25,11 @@ class ExpressionEngine:
     Additionally, astropy.units is exposed as ``u`` and numpy as ``np``.
 
     Basic mathematical functions are also exposed without the np prefix.
+
+    Calling the engine evaluates the expressions one after another, so
+    the context can be updated in between. If the expressions are independent,
+    `ExpressionEngine.evaluate_all` evaluates all of them at once, which avoids
+    the overhead of evaluating each expression separately.
     """
 
     def __init__(self, expressions):
@@ -42,22 +47,49 @@ class ExpressionEngine:
                     f"{type(err).__name__}: {err}"
                 ) from err
 
+        # all expressions as a single tuple expression, each expression
+        # is already known to be valid on its own
+        combined = "".join(f"({expression}\n),\n" for _, expression in self.expressions)
+        self.compiled_all = compile(f"({combined})", __name__, mode="eval")
+
     def __call__(self, locals):
         for compiled, expression in zip(self.compiled, self.expressions):
-            try:
-                yield eval(compiled, ALLOWED_GLOBALS, locals)
-            except NameError as err:
-                raise ExpressionError(
-                    f"Error evaluating expression '{expression}': {err}"
-                ) from None
-            except Exception as err:
-                raise ExpressionError(
-                    f"Error evaluating expression '{expression}': {err}"
-                ) from err
+            yield self._eval(compiled, expression, locals)
+
+    @staticmethod
+    def _eval(compiled, expression, locals):
+        try:
+            return eval(compiled, ALLOWED_GLOBALS, locals)
+        except NameError as err:
+            raise ExpressionError(
+                f"Error evaluating expression '{expression}': {err}"
+            ) from None
+        except Exception as err:
+            raise ExpressionError(
+                f"Error evaluating expression '{expression}': {err}"
+            ) from err
+
+    def evaluate_all(self, locals):
+        """
+        Evaluate all expressions in a single call.
+
+        Only valid if the expressions do not depend on each others results.
+
+        Returns
+        -------
+        results : tuple
+            The result of each expression, in order.
+        """
+        try:
+            return eval(self.compiled_all, ALLOWED_GLOBALS, locals)
+        except Exception:
+            # evaluate one by one to report the failing expression
+            return tuple(self(locals))
 
     def __getstate__(self):
         state = self.__dict__.copy()
         del state["compiled"]
+        del state["compiled_all"]
         return state
 
     def __setstate__(self, state):
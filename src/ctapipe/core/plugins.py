@@ -1,16 +1,27 @@
 """ctapipe plugin system"""
 
 import logging
+from functools import cache
 from importlib.metadata import entry_points
 
 log = logging.getLogger(__name__)
-installed_entry_points = entry_points()
 
 
+@cache
+def installed_entry_points():
+    """All installed entry points, only collected once on first use"""
+    return entry_points()
+
+
+@cache
 def detect_and_import_plugins(group):
-    """detect and import plugins with given prefix,"""
+    """detect and import plugins with given prefix,
+
+    Plugins of each group are only imported once, on the first lookup
+    of implementations for the group and not when ctapipe is imported.
+    """
     modules = set()
-    for entry_point in installed_entry_points.select(group=group):
+    for entry_point in installed_entry_points().select(group=group):
         log.debug("Loading %s plugin: %s", group, entry_point.value)
         try:
             plugin = entry_point.load()
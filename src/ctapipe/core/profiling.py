@@ -0,0 +1,207 @@
+"""
+Lightweight timing of the processing stages of a `~ctapipe.core.Tool`.
+"""
+
+import time
+from array import array
+from contextlib import nullcontext
+
+import astropy.units as u
+import numpy as np
+from astropy.table import Table
+
+__all__ = [
+    "StageProfiler",
+]
+
+_NULL_CONTEXT = nullcontext()
+_END = object()
+
+
+class _Stage:
+    """Context manager timing one call of a stage, reused for all calls"""
+
+    __slots__ = ("name", "profiler", "wall", "cpu")
+
+    def __init__(self, name, profiler):
+        self.name = name
+        self.profiler = profiler
+        # exclusive wall clock and cpu time of each call in ns
+        self.wall = array("q")
+        self.cpu = array("q")
+
+    def __enter__(self):
+        # start times and accumulated time of nested stages
+        self.profiler._stack.append(
+            [time.perf_counter_ns(), time.process_time_ns(), 0, 0]
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall = time.perf_counter_ns()
+        cpu = time.process_time_ns()
+
+        stack = self.profiler._stack
+        start_wall, start_cpu, nested_wall, nested_cpu = stack.pop()
+        wall -= start_wall
+        cpu -= start_cpu
+
+        if stack:
+            stack[-1][2] += wall
+            stack[-1][3] += cpu
+
+        self.wall.append(wall - nested_wall)
+        self.cpu.append(cpu - nested_cpu)
+
+
+class StageProfiler:
+    """
+    Collect call counts, wall clock and cpu times of processing stages.
+
+    Stages are timed by using `StageProfiler.stage` as a context manager
+    around each call, or by iterating through `StageProfiler.iterate`.
+    Stages can be nested, the time spent in nested stages is not counted
+    for the enclosing stage, so the times of all stages add up to the
+    total processing time.
+
+    When disabled, `StageProfiler.stage` returns a shared no-op context manager
+    and `StageProfiler.iterate` returns the iterable unchanged.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to time the stages.
+
+    Examples
+    --------
+    >>> profiler = StageProfiler()
+    >>> for i in profiler.iterate("read", range(10)):
+    ...     with profiler.stage("process"):
+    ...         pass
+    >>> profiler.to_table()["stage"].tolist()
+    ['read', 'process']
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._stages = {}
+        self._stack = []
+
+    def stage(self, name):
+        """
+        Context manager timing one call of the stage ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage, e.g. the name of the component class.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = _Stage(name, self)
+        return stage
+
+    def iterate(self, name, iterable):
+        """
+        Iterate ``iterable``, timing the production of each item as a call of stage ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage, e.g. the name of the event source class.
+        iterable : Iterable
+            e.g. an `~ctapipe.io.EventSource`
+        """
+        if not self.enabled:
+            return iterable
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(self, name, iterator):
+        stage = self.stage(name)
+        while True:
+            with stage:
+                item = next(iterator, _END)
+
+            if item is _END:
+                # don't count the final call, which produced no item
+                stage.wall.pop()
+                stage.cpu.pop()
+                return
+            yield item
+
+    @property
+    def stages(self):
+        """Names of the timed stages, in order of their first call"""
+        return list(self._stages)
+
+    def to_table(self):
+        """
+        Summary statistics of all stages.
+
+        Returns
+        -------
+        astropy.table.Table
+            One row per stage with the number of calls, the total, mean and
+            99th percentile of the wall clock and cpu time per call and
+            the number of calls per second of wall clock time.
+        """
+        rows = []
+        for name, stage in self._stages.items():
+            wall = np.frombuffer(stage.wall, dtype=np.int64) / 1e9
+            cpu = np.frombuffer(stage.cpu, dtype=np.int64) / 1e9
+            n_calls = len(wall)
+            total_wall = wall.sum()
+
+            rows.append(
+                (
+                    name,
+                    n_calls,
+                    total_wall,
+                    wall.mean() if n_calls > 0 else np.nan,
+                    np.percentile(wall, 99) if n_calls > 0 else np.nan,
+                    cpu.sum(),
+                    cpu.mean() if n_calls > 0 else np.nan,
+                    np.percentile(cpu, 99) if n_calls > 0 else np.nan,
+                    n_calls / total_wall if total_wall > 0 else np.nan,
+                )
+            )
+
+        table = Table(
+            rows=rows,
+            names=[
+                "stage",
+                "n_calls",
+                "total_wall_time",
+                "mean_wall_time",
+                "p99_wall_time",
+                "total_cpu_time",
+                "mean_cpu_time",
+                "p99_cpu_time",
+                "rate",
+            ],
+            dtype=[str, np.int64, *[np.float64] * 7],
+        )
+        for col in table.colnames[2:-1]:
+            table[col].unit = u.s
+        table["rate"].unit = u.Hz
+        for col in table.colnames[2:]:
+            table[col].format = ".4g"
+        return table
+
+    def to_dict(self):
+        """Summary statistics of all stages as json-serializable dict, see `to_table`"""
+        table = self.to_table()
+        summary = {}
+        for row in table:
+            summary[str(row["stage"])] = {
+                col: row[col].item() for col in table.colnames if col != "stage"
+            }
+        return summary
+
+    def reset(self):
+        """Remove all recorded timings"""
+        self._stages.clear()
+        self._stack.clear()
@@ -234,6 +234,10 @@ class _ActivityProvenance:
         """add a dictionary of configuration parameters to this activity"""
         self._prov["config"] = config
 
+    def register_stage_profile(self, profile):
+        """add a dictionary of timing statistics per processing stage to this activity"""
+        self._prov["stage_profile"] = profile
+
     def finish(self, status="success", exit_code=0):
         """record final provenance information, normally called at shutdown."""
         self._prov["stop"].update(_sample_cpu_and_memory())
@@ -378,6 +382,19 @@ class Provenance(metaclass=Singleton):
             activity.name,
         )
 
+    def add_stage_profile(self, profile):
+        """
+        add timing statistics of the processing stages to the current activity
+
+        Parameters
+        ----------
+        profile: dict
+            statistics per stage, e.g. from `ctapipe.core.profiling.StageProfiler.to_dict`
+        """
+        activity = self._get_current_or_start_activity()
+        activity.register_stage_profile(profile)
+        log.debug("added stage profile to activity: '%s'", activity.name)
+
     def finish_activity(self, status="completed", exit_code=0, activity_name=None):
         """end the current activity"""
         activity = self._activities.pop()
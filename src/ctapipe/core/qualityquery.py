@@ -107,15 +107,17 @@ class QualityQuery(Component):
         np.ndarray:
             array of booleans with results of each selection criterion in order
         """
-        # add 1 for total
-        result = np.ones(len(self.quality_criteria) + 1, dtype=bool)
-
-        for i, res in enumerate(self.engine(kwargs), start=1):
-            result[i] = res
-
-        self._counts += result.astype(int)
-        self._cumulative_counts += result.cumprod()
-        return result[1:]  # strip off TOTAL criterion, since redundant
+        n_criteria = len(self.quality_criteria)
+        result = np.fromiter(
+            self.engine.evaluate_all(kwargs), dtype=bool, count=n_criteria
+        )
+
+        # update the counts in place, first entry is the total count
+        self._counts[0] += 1
+        self._counts[1:] += result
+        n_passed_cumulative = n_criteria if result.all() else np.argmin(result)
+        self._cumulative_counts[: n_passed_cumulative + 1] += 1
+        return result
 
     def get_table_mask(self, table):
         """
@@ -135,9 +137,11 @@ class QualityQuery(Component):
         n_criteria = len(self.quality_criteria) + 1
         result = np.ones((n_criteria, len(table)), dtype=bool)
 
-        for i, res in enumerate(self.engine(table), start=1):
+        for i, res in enumerate(self.engine.evaluate_all(table), start=1):
             result[i] = res
 
         self._counts += np.count_nonzero(result, axis=1)
-        self._cumulative_counts += np.count_nonzero(np.cumprod(result, axis=0), axis=1)
-        return np.all(result, axis=0)
+        np.logical_and.accumulate(result, axis=0, out=result)
+        self._cumulative_counts += np.count_nonzero(result, axis=1)
+        # after accumulating, the last row is true if all criteria passed
+        return result[-1].copy()
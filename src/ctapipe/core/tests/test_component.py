@@ -428,6 +428,26 @@ def test_full_config():
     assert dict_config == comp_from_config.get_current_config()
 
 
+def test_full_config_dict_of_components():
+    """Test that components stored in a dict are included in the current config"""
+
+    class SubA(Component):
+        param = Int(default_value=3).tag(config=True)
+
+    class SubB(Component):
+        param = Int(default_value=4).tag(config=True)
+
+    class MyComponent(Component):
+        def __init__(self, config=None, parent=None):
+            super().__init__(config=config, parent=parent)
+            self.subs = {"a": SubA(parent=self), "b": SubB(parent=self)}
+
+    comp = MyComponent(config=Config({"SubB": {"param": 5}}))
+    assert comp.get_current_config() == {
+        "MyComponent": {"SubA": {"param": 3}, "SubB": {"param": 5}}
+    }
+
+
 def test_logging_hierarchy():
     class Foo(Component):
         def __init__(self, **kwargs):
@@ -453,3 +473,18 @@ def test_logging_hierarchy():
     assert baz.log.name == "ctapipe.baz"
     assert baz.bar.log.name == "ctapipe.baz.Bar"
     assert baz.bar.foo.log.name == "ctapipe.baz.Bar.Foo"
+
+
+def test_pickle_keeps_parent():
+    """Pickling a component must not change the parent of the original"""
+    import pickle
+
+    parent = ExampleComponent()
+    component = SubComponent(parent=parent, value=5.0)
+
+    copy = pickle.loads(pickle.dumps(component))
+
+    # parent is stored as weakref.proxy
+    assert component.parent == parent
+    assert copy.parent is None
+    assert copy.value == 5.0
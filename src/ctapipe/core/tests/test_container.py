@@ -321,3 +321,46 @@ def test_long_field_repr():
 
     field = Field(default_factory=lambda: np.linspace(1.0, 2.0, 5))
     assert repr(field) == "Field(default=[1.   1.25 ... 1.75 2.  ])"
+
+
+def test_lazy_container():
+    """Test values of a lazy container are only loaded on first access"""
+    from copy import deepcopy
+
+    from ctapipe.core.container import lazy_container
+
+    class ExampleContainer(Container):
+        x = Field(-1, "x value")
+        y = Field(-1, "y value")
+        z = Field(default_factory=list, description="z value")
+
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"x": 1, "y": 2}
+
+    cont = lazy_container(ExampleContainer, loader, prefix="foo")
+    assert isinstance(cont, ExampleContainer)
+    assert cont.prefix == "foo"
+    assert not cont.is_loaded
+    assert len(calls) == 0
+
+    # values assigned before loading are kept
+    cont.y = 5
+    assert cont.x == 1
+    assert cont.y == 5
+    assert cont.z == []
+    assert cont.is_loaded
+    assert len(calls) == 1
+
+    cont.x = 10
+    assert cont.as_dict() == {"x": 10, "y": 5, "z": []}
+    assert len(calls) == 1
+
+    with pytest.raises(AttributeError):
+        cont.foo  # noqa: B018
+
+    copy = deepcopy(lazy_container(ExampleContainer, loader))
+    assert type(copy) is ExampleContainer
+    assert copy.x == 1
@@ -24,3 +24,15 @@ def test_pickle():
 
     assert loaded.expressions == expressions
     assert tuple(loaded({"x": 3, "y": 5})) == (15, 50)
+
+
+def test_evaluate_all():
+    """Test evaluating all expressions at once"""
+    expressions = [("foo", "5 * x  # a comment"), ("bar", "10 * y")]
+    engine = ExpressionEngine(expressions=expressions)
+
+    assert engine.evaluate_all({"x": 3, "y": 5}) == (15, 50)
+
+    # errors are reported for the failing expression
+    with pytest.raises(ExpressionError, match="10 \\* y"):
+        engine.evaluate_all({"x": 3})
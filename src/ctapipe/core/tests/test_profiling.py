@@ -0,0 +1,63 @@
+import time
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+from ctapipe.core.profiling import StageProfiler
+
+
+def test_stage_profiler():
+    profiler = StageProfiler()
+
+    for _ in profiler.iterate("read", range(3)):
+        with profiler.stage("outer"):
+            time.sleep(0.01)
+            with profiler.stage("inner"):
+                time.sleep(0.02)
+
+    assert profiler.stages == ["read", "outer", "inner"]
+
+    table = profiler.to_table()
+    assert len(table) == 3
+    assert table["n_calls"].tolist() == [3, 3, 3]
+    assert table["total_wall_time"].unit == u.s
+    assert table["rate"].unit == u.Hz
+
+    outer, inner = table[1], table[2]
+    # time spent in the inner stage is not counted for the outer stage
+    assert 0.01 <= outer["mean_wall_time"] < 0.02
+    assert inner["mean_wall_time"] >= 0.02
+    assert inner["p99_wall_time"] >= inner["mean_wall_time"]
+    assert np.isclose(inner["rate"], 3 / inner["total_wall_time"])
+
+    summary = profiler.to_dict()
+    assert summary.keys() == {"read", "outer", "inner"}
+    assert summary["inner"]["n_calls"] == 3
+
+    profiler.reset()
+    assert profiler.stages == []
+    assert len(profiler.to_table()) == 0
+
+
+def test_stage_profiler_exception():
+    profiler = StageProfiler()
+
+    with pytest.raises(ValueError):
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                raise ValueError()
+
+    assert profiler.to_dict()["inner"]["n_calls"] == 1
+    assert profiler.to_dict()["outer"]["n_calls"] == 1
+
+
+def test_stage_profiler_disabled():
+    profiler = StageProfiler(enabled=False)
+    values = [1, 2, 3]
+
+    assert profiler.iterate("read", values) is values
+    with profiler.stage("process"):
+        pass
+
+    assert profiler.stages == []
@@ -24,8 +24,8 @@ from ctapipe.core.traits import (
 def mock_subarray():
     subarray = mock.MagicMock()
     subarray.tel_ids = [1, 2, 3, 4]
-    subarray.get_tel_ids_for_type = (
-        lambda x: [3, 4] if x == "LST_LST_LSTCam" else [1, 2]
+    subarray.get_tel_ids_for_type = lambda x: (
+        [3, 4] if x == "LST_LST_LSTCam" else [1, 2]
     )
     subarray.telescope_types = [
         "LST_LST_LSTCam",
@@ -640,6 +640,33 @@ def test_exit_status(exit_code, expected_status, tmp_path, provenance):
     assert provlog["status"] == expected_status
 
 
+def test_profile_stages(tmp_path, provenance):
+    """check the stage timing summary ends up in the provenance"""
+
+    class MyTool(Tool):
+        def start(self):
+            for _ in self.profiler.iterate("read", range(5)):
+                with self.profiler.stage("process"):
+                    pass
+
+    tool = MyTool()
+    run_tool(tool, raises=True, cwd=tmp_path)
+    assert tool.profiler.stages == []
+
+    provenance_path = tmp_path / "provlog.json"
+    run_tool(
+        MyTool(),
+        [f"--provenance-log={provenance_path}", "--profile-stages"],
+        raises=True,
+    )
+
+    activities = json.loads(provenance_path.read_text())
+    assert "stage_profile" not in activities[0]
+    profile = activities[-1]["stage_profile"]
+    assert profile.keys() == {"read", "process"}
+    assert profile["process"]["n_calls"] == 5
+
+
 class InterruptTestTool(Tool):
     name = "test-interrupt"
 
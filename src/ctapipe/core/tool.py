@@ -23,6 +23,7 @@ from .. import __version__ as version
 from . import Provenance
 from .component import Component
 from .logging import ColoredFormatter, create_logging_config
+from .profiling import StageProfiler
 from .traits import Bool, Dict, Enum, Path
 
 __all__ = ["Tool", "ToolConfigurationError"]
@@ -172,6 +173,14 @@ class Tool(Application):
     quiet = Bool(default_value=False).tag(config=True)
     overwrite = Bool(default_value=False).tag(config=True)
 
+    profile_stages = Bool(
+        default_value=False,
+        help=(
+            "Record call counts, wall clock and cpu times of the processing stages"
+            " of this tool. The summary is logged and stored in the provenance log."
+        ),
+    ).tag(config=True)
+
     _log_formatter_cls = ColoredFormatter
 
     provenance_log = Path(directory_ok=False).tag(config=True)
@@ -206,6 +215,10 @@ class Tool(Application):
                     {"Tool": {"overwrite": True}},
                     "Overwrite existing output files without asking",
                 ),
+                "profile-stages": (
+                    {"Tool": {"profile_stages": True}},
+                    "Record the time spent in the processing stages of this tool",
+                ),
             }
         )
         self.flags = {**flags, **self.flags}
@@ -221,6 +234,7 @@ class Tool(Application):
         self.trait_warning_handler = CollectTraitWarningsHandler()
         self.update_logging_config()
         self._exit_stack = ExitStack()
+        self.profiler = StageProfiler(enabled=False)
 
     def enter_context(self, context_manager):
         """
@@ -419,6 +433,7 @@ class Tool(Application):
                 Provenance().start_activity(self.name)
 
                 self.initialize(argv)
+                self.profiler.enabled = self.profile_stages
 
                 if not self.show_config:
                     self.setup()
@@ -438,6 +453,9 @@ class Tool(Application):
                 if not self.show_config:
                     self.finish()
 
+                if self.profile_stages:
+                    self._report_stage_profile()
+
             except (ToolConfigurationError, TraitError) as err:
                 current_exception = err
                 self.log.error("%s", err)
@@ -476,6 +494,17 @@ class Tool(Application):
         self.log.info("Finished %s", self.name)
         self.exit(exit_status)
 
+    def _report_stage_profile(self):
+        """Log the stage timing summary and add it to the provenance"""
+        table = self.profiler.to_table()
+        if len(table) == 0:
+            self.log.warning("No processing stages were timed by %s", self.name)
+            return
+
+        for line in table.pformat(max_lines=-1, max_width=-1):
+            self.log.info(line)
+        Provenance().add_stage_profile(self.profiler.to_dict())
+
     def write_provenance(self):
         for activity in Provenance().finished_activities:
             output_str = " ".join([x["url"] for x in activity.output])
@@ -14,8 +14,6 @@ import traitlets.config
 from astropy.time import Time
 from traitlets import Undefined
 
-from ctapipe.core.plugins import detect_and_import_plugins
-
 from .component import Component, non_abstract_children
 from .telescope_component import TelescopeParameter
 
@@ -408,9 +406,6 @@ def classes_with_traits(base_class):
     """Returns a list of the base class plus its non-abstract children
     if they have traits"""
 
-    if hasattr(base_class, "plugin_entry_point"):
-        detect_and_import_plugins(base_class.plugin_entry_point)
-
     all_classes = [base_class] + non_abstract_children(base_class)
     with_traits = []
 
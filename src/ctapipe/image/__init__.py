@@ -1,72 +1,10 @@
-from .cleaning import (
-    ImageCleaner,
-    NSBImageCleaner,
-    TailcutsImageCleaner,
-    apply_time_delta_cleaning,
-    bright_cleaning,
-    dilate,
-    fact_image_cleaning,
-    mars_cleaning_1st_pass,
-    nsb_image_cleaning,
-    tailcuts_clean,
-    time_constrained_clean,
-)
-from .concentration import concentration_parameters
-from .extractor import (
-    BaselineSubtractedNeighborPeakWindowSum,
-    FixedWindowSum,
-    FullWaveformSum,
-    GlobalPeakWindowSum,
-    ImageExtractor,
-    LocalPeakWindowSum,
-    NeighborPeakWindowSum,
-    SlidingWindowMaxSum,
-    TwoPassWindowSum,
-    VarianceExtractor,
-    extract_around_peak,
-    extract_sliding_window,
-    integration_correction,
-    neighbor_average_maximum,
-    subtract_baseline,
-)
-from .hillas import (
-    HillasParameterizationError,
-    camera_to_shower_coordinates,
-    hillas_parameters,
-)
-from .image_processor import ImageProcessor
-from .invalid_pixels import InvalidPixelHandler, NeighborAverage
-from .leakage import leakage_parameters
-from .modifications import ImageModifier
-from .morphology import (
-    brightest_island,
-    largest_island,
-    morphology_parameters,
-    number_of_island_sizes,
-    number_of_islands,
-)
-from .muon import (
-    MuonIntensityFitter,
-    MuonProcessor,
-    MuonRingFitter,
-    intensity_ratio_inside_ring,
-    kundu_chaudhuri_circle_fit,
-    mean_squared_error,
-    ring_completeness,
-    ring_containment,
-)
-from .pixel_likelihood import (
-    PixelLikelihoodError,
-    chi_squared,
-    mean_poisson_likelihood_full,
-    mean_poisson_likelihood_gaussian,
-    neg_log_likelihood,
-    neg_log_likelihood_approx,
-    neg_log_likelihood_numeric,
-)
-from .reducer import DataVolumeReducer, NullDataVolumeReducer, TailCutsDataVolumeReducer
-from .statistics import descriptive_statistics
-from .timing import timing_parameters
+"""
+ctapipe image module
+
+The submodules are only imported when one of their attributes is accessed.
+"""
+
+from .._lazy import attach
 
 __all__ = [
     "ImageModifier",
@@ -84,8 +22,10 @@ __all__ = [
     "largest_island",
     "brightest_island",
     "tailcuts_clean",
+    "tailcuts_clean_batch",
     "bright_cleaning",
     "dilate",
+    "dilate_batch",
     "mars_cleaning_1st_pass",
     "nsb_image_cleaning",
     "fact_image_cleaning",
@@ -130,3 +70,85 @@ __all__ = [
     "InvalidPixelHandler",
     "NeighborAverage",
 ]
+
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "cleaning": [
+            "ImageCleaner",
+            "NSBImageCleaner",
+            "TailcutsImageCleaner",
+            "apply_time_delta_cleaning",
+            "bright_cleaning",
+            "dilate",
+            "dilate_batch",
+            "fact_image_cleaning",
+            "mars_cleaning_1st_pass",
+            "nsb_image_cleaning",
+            "tailcuts_clean",
+            "tailcuts_clean_batch",
+            "time_constrained_clean",
+        ],
+        "concentration": ["concentration_parameters"],
+        "extractor": [
+            "BaselineSubtractedNeighborPeakWindowSum",
+            "FixedWindowSum",
+            "FullWaveformSum",
+            "GlobalPeakWindowSum",
+            "ImageExtractor",
+            "LocalPeakWindowSum",
+            "NeighborPeakWindowSum",
+            "SlidingWindowMaxSum",
+            "TwoPassWindowSum",
+            "VarianceExtractor",
+            "extract_around_peak",
+            "extract_sliding_window",
+            "integration_correction",
+            "neighbor_average_maximum",
+            "subtract_baseline",
+        ],
+        "hillas": [
+            "HillasParameterizationError",
+            "camera_to_shower_coordinates",
+            "hillas_parameters",
+        ],
+        "image_processor": ["ImageProcessor"],
+        "invalid_pixels": ["InvalidPixelHandler", "NeighborAverage"],
+        "leakage": ["leakage_parameters"],
+        "modifications": ["ImageModifier"],
+        "morphology": [
+            "brightest_island",
+            "largest_island",
+            "morphology_parameters",
+            "number_of_island_sizes",
+            "number_of_islands",
+        ],
+        "muon": [
+            "MuonIntensityFitter",
+            "MuonProcessor",
+            "MuonRingFitter",
+            "intensity_ratio_inside_ring",
+            "kundu_chaudhuri_circle_fit",
+            "mean_squared_error",
+            "ring_completeness",
+            "ring_containment",
+        ],
+        "pixel_likelihood": [
+            "PixelLikelihoodError",
+            "chi_squared",
+            "mean_poisson_likelihood_full",
+            "mean_poisson_likelihood_gaussian",
+            "neg_log_likelihood",
+            "neg_log_likelihood_approx",
+            "neg_log_likelihood_numeric",
+        ],
+        "reducer": [
+            "DataVolumeReducer",
+            "NullDataVolumeReducer",
+            "TailCutsDataVolumeReducer",
+        ],
+        "statistics": ["descriptive_statistics"],
+        "timing": ["timing_parameters"],
+    },
+)
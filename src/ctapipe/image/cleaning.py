@@ -14,8 +14,10 @@ image size and just set unclean pixels to 0 or similar, use
 
 __all__ = [
     "tailcuts_clean",
+    "tailcuts_clean_batch",
     "bright_cleaning",
     "dilate",
+    "dilate_batch",
     "mars_cleaning_1st_pass",
     "fact_image_cleaning",
     "apply_time_delta_cleaning",
@@ -33,11 +35,13 @@ __all__ = [
 from abc import abstractmethod
 
 import numpy as np
+from numba import njit
 
 from ctapipe.image.statistics import n_largest
 
 from ..containers import CameraMonitoringContainer
 from ..core import TelescopeComponent
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
 from ..core.traits import (
     BoolTelescopeParameter,
     FloatTelescopeParameter,
@@ -119,6 +123,126 @@ def tailcuts_clean(
         )
 
 
+def _neighbor_indices(geom):
+    """Row pointers and column indices of the CSR neighbor matrix of ``geom``"""
+    neighbors = geom.neighbor_matrix_sparse.tocsr()
+    return neighbors.indptr, neighbors.indices
+
+
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def _any_neighbor(mask, pixel, indptr, indices):
+    for i in range(indptr[pixel], indptr[pixel + 1]):
+        if mask[indices[i]]:
+            return True
+    return False
+
+
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def _tailcuts_clean_csr(
+    images,
+    indptr,
+    indices,
+    picture_thresh,
+    boundary_thresh,
+    keep_isolated_pixels,
+    min_number_picture_neighbors,
+):
+    n_events, n_pixels = images.shape
+    masks = np.zeros((n_events, n_pixels), dtype=np.bool_)
+    above_picture = np.empty(n_pixels, dtype=np.bool_)
+    above_boundary = np.empty(n_pixels, dtype=np.bool_)
+    in_picture = np.empty(n_pixels, dtype=np.bool_)
+    check_neighbors = not keep_isolated_pixels and min_number_picture_neighbors > 0
+
+    for event in range(n_events):
+        for pixel in range(n_pixels):
+            above_picture[pixel] = images[event, pixel] >= picture_thresh[pixel]
+            above_boundary[pixel] = images[event, pixel] >= boundary_thresh[pixel]
+
+        for pixel in range(n_pixels):
+            in_picture[pixel] = above_picture[pixel]
+            if check_neighbors and above_picture[pixel]:
+                n_neighbors = 0
+                for i in range(indptr[pixel], indptr[pixel + 1]):
+                    n_neighbors += above_picture[indices[i]]
+                in_picture[pixel] = n_neighbors >= min_number_picture_neighbors
+
+        for pixel in range(n_pixels):
+            if above_boundary[pixel] and _any_neighbor(
+                in_picture, pixel, indptr, indices
+            ):
+                masks[event, pixel] = True
+            elif in_picture[pixel]:
+                masks[event, pixel] = keep_isolated_pixels or _any_neighbor(
+                    above_boundary, pixel, indptr, indices
+                )
+
+    return masks
+
+
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def _dilate_csr(masks, indptr, indices, n_dilations):
+    n_events, n_pixels = masks.shape
+    result = masks.copy()
+    previous = np.empty(n_pixels, dtype=np.bool_)
+
+    for event in range(n_events):
+        for _ in range(n_dilations):
+            previous[:] = result[event]
+            for pixel in range(n_pixels):
+                if not previous[pixel] and _any_neighbor(
+                    previous, pixel, indptr, indices
+                ):
+                    result[event, pixel] = True
+
+    return result
+
+
+def tailcuts_clean_batch(
+    geom,
+    images,
+    picture_thresh=7,
+    boundary_thresh=5,
+    keep_isolated_pixels=False,
+    min_number_picture_neighbors=0,
+):
+    """
+    Apply `tailcuts_clean` to several images of the same camera at once.
+
+    Parameters
+    ----------
+    geom : `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    images : np.ndarray
+        pixel charges, shape (n_images, n_pixels)
+    picture_thresh : float | np.ndarray
+        threshold above which all pixels are retained
+    boundary_thresh : float | np.ndarray
+        threshold above which pixels are retained if they have a neighbor
+        already above the picture_thresh
+    keep_isolated_pixels : bool
+        See `tailcuts_clean`
+    min_number_picture_neighbors : int
+        See `tailcuts_clean`
+
+    Returns
+    -------
+    A boolean mask of selected pixels of shape (n_images, n_pixels).
+    """
+    images = np.asanyarray(images)
+    n_pixels = images.shape[-1]
+    indptr, indices = _neighbor_indices(geom)
+    return _tailcuts_clean_csr(
+        images,
+        indptr,
+        indices,
+        np.broadcast_to(np.asarray(picture_thresh, dtype=np.float64), n_pixels),
+        np.broadcast_to(np.asarray(boundary_thresh, dtype=np.float64), n_pixels),
+        bool(keep_isolated_pixels),
+        int(min_number_picture_neighbors),
+    )
+
+
 def bright_cleaning(image, threshold, fraction, n_pixels=3):
     """
     Clean an image by removing pixels below a fraction of the mean charge
@@ -253,6 +377,30 @@ def dilate(geom, mask):
     return mask | geom.neighbor_matrix_sparse.dot(mask)
 
 
+def dilate_batch(geom, masks, n_dilations=1):
+    """
+    Add ``n_dilations`` rows of neighbors to several pixel masks at once.
+
+    Same as calling `dilate` ``n_dilations`` times on each mask.
+
+    Parameters
+    ----------
+    geom : `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    masks : np.ndarray
+        input masks (array of booleans) of shape (n_masks, n_pixels)
+    n_dilations : int
+        Number of rows of neighbors to add
+
+    Returns
+    -------
+    np.ndarray
+        The dilated masks
+    """
+    indptr, indices = _neighbor_indices(geom)
+    return _dilate_csr(np.asarray(masks, dtype=bool), indptr, indices, n_dilations)
+
+
 def apply_time_delta_cleaning(
     geom, mask, arrival_times, min_number_neighbors, time_limit
 ):
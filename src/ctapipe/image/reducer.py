@@ -5,6 +5,7 @@ Algorithms for the data volume reduction.
 from abc import abstractmethod
 
 import numpy as np
+from numba import njit
 
 from ctapipe.containers import DL1CameraContainer
 from ctapipe.core import TelescopeComponent
@@ -15,12 +16,63 @@ from ctapipe.core.traits import (
     TelescopeParameter,
 )
 from ctapipe.image import TailcutsImageCleaner
-from ctapipe.image.cleaning import dilate
+from ctapipe.image.cleaning import (
+    _neighbor_indices,
+    dilate_batch,
+    tailcuts_clean_batch,
+)
 from ctapipe.image.extractor import ImageExtractor
 
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+
 __all__ = ["DataVolumeReducer", "NullDataVolumeReducer", "TailCutsDataVolumeReducer"]
 
 
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def _dilate_within_csr(masks, allowed, indptr, indices):
+    """
+    Iterate ``mask = dilate(mask) & allowed`` until the masks do not change.
+
+    Instead of dilating the full masks until convergence, the pixels connected
+    to the masks by allowed pixels are collected by a depth-first search.
+    """
+    n_events, n_pixels = masks.shape
+    result = np.zeros((n_events, n_pixels), dtype=np.bool_)
+    stack = np.empty(n_pixels, dtype=np.int64)
+
+    for event in range(n_events):
+        # first iteration: one row of neighbors, restricted to the allowed pixels
+        n_stack = 0
+        for pixel in range(n_pixels):
+            if not allowed[event, pixel]:
+                continue
+
+            selected = masks[event, pixel]
+            if not selected:
+                for i in range(indptr[pixel], indptr[pixel + 1]):
+                    if masks[event, indices[i]]:
+                        selected = True
+                        break
+
+            if selected:
+                result[event, pixel] = True
+                stack[n_stack] = pixel
+                n_stack += 1
+
+        # all further iterations only add allowed neighbors of selected pixels
+        while n_stack > 0:
+            n_stack -= 1
+            pixel = stack[n_stack]
+            for i in range(indptr[pixel], indptr[pixel + 1]):
+                neighbor = indices[i]
+                if allowed[event, neighbor] and not result[event, neighbor]:
+                    result[event, neighbor] = True
+                    stack[n_stack] = neighbor
+                    n_stack += 1
+
+    return result
+
+
 class DataVolumeReducer(TelescopeComponent):
     """
     Base component for data volume reducers.
@@ -93,6 +145,44 @@ class DataVolumeReducer(TelescopeComponent):
             Mask of selected pixels.
         """
 
+    def select_pixels_batch(self, waveforms, tel_id=None, selected_gain_channel=None):
+        """
+        Select the pixels of several events of one telescope at once.
+
+        Applies `select_pixels` to each event, subclasses should override
+        this with a vectorized or compiled implementation.
+
+        Parameters
+        ----------
+        waveforms: ndarray
+            Waveforms stored in a numpy array of shape
+            (n_events, n_channels, n_pix, n_samples).
+        tel_id: int
+            The telescope id.
+        selected_gain_channel: ndarray
+            The channel selected in the gain selection, per event and pixel,
+            shape (n_events, n_pix).
+
+        Returns
+        -------
+        masks: array
+            Masks of selected pixels of shape (n_events, n_pix).
+        """
+        masks = [
+            self.select_pixels(
+                event_waveforms,
+                tel_id=tel_id,
+                selected_gain_channel=(
+                    None
+                    if selected_gain_channel is None
+                    else selected_gain_channel[event]
+                ),
+            )
+            for event, event_waveforms in enumerate(waveforms)
+        ]
+        n_pixels = waveforms.shape[-2]
+        return np.array(masks, dtype=bool).reshape(len(waveforms), n_pixels)
+
 
 class NullDataVolumeReducer(DataVolumeReducer):
     """
@@ -103,6 +193,10 @@ class NullDataVolumeReducer(DataVolumeReducer):
         n_pixels = waveforms.shape[-2]
         return np.ones(n_pixels, dtype=bool)
 
+    def select_pixels_batch(self, waveforms, tel_id=None, selected_gain_channel=None):
+        n_events, _, n_pixels, _ = waveforms.shape
+        return np.ones((n_events, n_pixels), dtype=bool)
+
 
 class TailCutsDataVolumeReducer(DataVolumeReducer):
     """
@@ -179,38 +273,75 @@ class TailCutsDataVolumeReducer(DataVolumeReducer):
             self.image_extractors[name] = image_extractor
 
     def select_pixels(self, waveforms, tel_id=None, selected_gain_channel=None):
+        if selected_gain_channel is not None:
+            selected_gain_channel = selected_gain_channel[np.newaxis]
+        return self.select_pixels_batch(
+            waveforms[np.newaxis],
+            tel_id=tel_id,
+            selected_gain_channel=selected_gain_channel,
+        )[0]
+
+    def select_pixels_batch(self, waveforms, tel_id=None, selected_gain_channel=None):
+        """
+        Select the pixels of several events of one telescope at once.
+
+        The images are extracted event by event, the cleaning (for
+        `~ctapipe.image.TailcutsImageCleaner`) and the dilations are applied
+        to all events at once by compiled functions working directly on the
+        neighbor indices of the camera.
+
+        See `DataVolumeReducer.select_pixels_batch` for the parameters.
+        """
         camera_geom = self.subarray.tel[tel_id].camera.geometry
+        n_events = len(waveforms)
         # Pulse-integrate waveforms
         extractor = self.image_extractors[self.image_extractor_type.tel[tel_id]]
         # do not treat broken pixels in data volume reduction
         broken_pixels = np.zeros(
             (waveforms.shape[-3], camera_geom.n_pixels), dtype=bool
         )
-        dl1: DL1CameraContainer = extractor(
-            waveforms,
-            tel_id=tel_id,
-            selected_gain_channel=selected_gain_channel,
-            broken_pixels=broken_pixels,
-        )
+        images = []
+        for event in range(n_events):
+            dl1: DL1CameraContainer = extractor(
+                waveforms[event],
+                tel_id=tel_id,
+                selected_gain_channel=(
+                    None
+                    if selected_gain_channel is None
+                    else selected_gain_channel[event]
+                ),
+                broken_pixels=broken_pixels,
+            )
+            images.append(dl1.image)
+        images = np.array(images).reshape(n_events, camera_geom.n_pixels)
 
         # 1) Step: TailcutCleaning at first
-        mask = self.cleaner(tel_id, dl1.image)
-        pixels_above_boundary_thresh = (
-            dl1.image >= self.cleaner.boundary_threshold_pe.tel[tel_id]
-        )
-        mask_in_loop = np.array([])
+        if type(self.cleaner) is TailcutsImageCleaner:
+            masks = tailcuts_clean_batch(
+                camera_geom,
+                images,
+                picture_thresh=self.cleaner.picture_threshold_pe.tel[tel_id],
+                boundary_thresh=self.cleaner.boundary_threshold_pe.tel[tel_id],
+                min_number_picture_neighbors=self.cleaner.min_picture_neighbors.tel[
+                    tel_id
+                ],
+                keep_isolated_pixels=self.cleaner.keep_isolated_pixels.tel[tel_id],
+            )
+        else:
+            masks = np.array([self.cleaner(tel_id, image) for image in images])
+            masks = masks.astype(bool).reshape(images.shape)
+
         # 2) Step: Add iteratively all pixels with Signal
         #          S > boundary_thresh with ctapipe module
         #          'dilate' until no new pixels were added.
-        while (
-            not np.array_equal(mask, mask_in_loop)
-            and self.do_boundary_dilation.tel[tel_id]
-        ):
-            mask_in_loop = mask
-            mask = dilate(camera_geom, mask) & pixels_above_boundary_thresh
+        if self.do_boundary_dilation.tel[tel_id]:
+            pixels_above_boundary_thresh = (
+                images >= self.cleaner.boundary_threshold_pe.tel[tel_id]
+            )
+            indptr, indices = _neighbor_indices(camera_geom)
+            masks = _dilate_within_csr(
+                masks, pixels_above_boundary_thresh, indptr, indices
+            )
 
         # 3) Step: Adding Pixels with 'dilate' to get more conservative.
-        for _ in range(self.n_end_dilates.tel[tel_id]):
-            mask = dilate(camera_geom, mask)
-
-        return mask
+        return dilate_batch(camera_geom, masks, self.n_end_dilates.tel[tel_id])
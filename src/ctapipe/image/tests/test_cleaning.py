@@ -1,6 +1,7 @@
 import astropy.units as u
 import numpy as np
-from numpy.testing import assert_allclose
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
 
 from ctapipe.image import cleaning
 from ctapipe.instrument import CameraGeometry
@@ -558,3 +559,51 @@ def test_nsb_image_cleaning(prod5_lst):
 
     mask = cleaning.nsb_image_cleaning(geom, charge, peak_time, **args)
     assert np.count_nonzero(mask) == 1 + 6
+
+
+@pytest.mark.parametrize(
+    ("keep_isolated_pixels", "min_number_picture_neighbors"),
+    [(False, 0), (False, 2), (True, 0), (True, 2)],
+)
+def test_tailcuts_clean_batch(keep_isolated_pixels, min_number_picture_neighbors):
+    """The batched cleaning gives the same result as tailcuts_clean per image"""
+    geom = CameraGeometry.make_rectangular(30, 30)
+    rng = np.random.default_rng(0)
+    images = rng.exponential(3, (20, geom.n_pixels))
+    picture_thresh = rng.uniform(6, 10, geom.n_pixels)
+
+    masks = cleaning.tailcuts_clean_batch(
+        geom,
+        images,
+        picture_thresh=picture_thresh,
+        boundary_thresh=4,
+        keep_isolated_pixels=keep_isolated_pixels,
+        min_number_picture_neighbors=min_number_picture_neighbors,
+    )
+    assert masks.shape == images.shape
+    assert np.count_nonzero(masks) > 0
+
+    for image, mask in zip(images, masks):
+        expected = cleaning.tailcuts_clean(
+            geom,
+            image,
+            picture_thresh=picture_thresh,
+            boundary_thresh=4,
+            keep_isolated_pixels=keep_isolated_pixels,
+            min_number_picture_neighbors=min_number_picture_neighbors,
+        )
+        assert_array_equal(mask, expected)
+
+
+def test_dilate_batch():
+    geom = CameraGeometry.make_rectangular(30, 30)
+    rng = np.random.default_rng(0)
+    masks = rng.uniform(size=(10, geom.n_pixels)) > 0.98
+
+    for n_dilations in range(4):
+        dilated = cleaning.dilate_batch(geom, masks, n_dilations)
+        for mask, result in zip(masks, dilated):
+            expected = mask
+            for _ in range(n_dilations):
+                expected = cleaning.dilate(geom, expected)
+            assert_array_equal(result, expected)
@@ -4,6 +4,7 @@ import pytest
 from numpy.testing import assert_array_equal
 from traitlets.config import Config
 
+from ctapipe.image import TailcutsImageCleaner, dilate, tailcuts_clean
 from ctapipe.image.reducer import NullDataVolumeReducer, TailCutsDataVolumeReducer
 from ctapipe.instrument import SubarrayDescription
 
@@ -92,3 +93,84 @@ def test_tailcuts_data_volume_reducer(subarray_lst):
 
     assert (reduced_waveforms != 0).sum() == (1 + 4 + 14) * n_samples
     assert_array_equal(expected_waveforms, reduced_waveforms)
+
+
+def _reference_tailcuts_reduction(geom, image, picture, boundary, n_end_dilates):
+    """The per-event algorithm of TailCutsDataVolumeReducer using scipy.sparse"""
+    mask = tailcuts_clean(
+        geom,
+        image,
+        picture_thresh=picture,
+        boundary_thresh=boundary,
+        min_number_picture_neighbors=2,
+    )
+    mask_in_loop = np.array([])
+    while not np.array_equal(mask, mask_in_loop):
+        mask_in_loop = mask
+        mask = dilate(geom, mask) & (image >= boundary)
+    for _ in range(n_end_dilates):
+        mask = dilate(geom, mask)
+    return mask
+
+
+@pytest.mark.parametrize("subclass_cleaner", [False, True])
+def test_tailcuts_data_volume_reducer_batch(subclass_cleaner):
+    """The batched reduction agrees with the per-event algorithm"""
+    from ctapipe.benchmark import make_toy_subarray
+
+    subarray = make_toy_subarray(n_telescopes=1, n_pixels_side=31, n_samples=30)
+    tel_id = 1
+    geom = subarray.tel[tel_id].camera.geometry
+    rng = np.random.default_rng(0)
+
+    # pulses with random amplitudes, a few bright ones forming showers
+    n_events = 20
+    amplitude = rng.exponential(1.5, (n_events, geom.n_pixels))
+    amplitude[rng.uniform(size=amplitude.shape) > 0.97] *= 8
+    pulse = np.exp(-0.5 * ((np.arange(30) - 12) / 2) ** 2)
+    waveforms = amplitude[:, np.newaxis, :, np.newaxis] * pulse
+    waveforms += rng.normal(0, 0.1, waveforms.shape)
+    selected_gain_channel = np.zeros((n_events, geom.n_pixels), dtype=np.int8)
+
+    cleaner = None
+    if subclass_cleaner:
+        # not exactly a TailcutsImageCleaner, cleaned event by event
+        class Cleaner(TailcutsImageCleaner):
+            pass
+
+        cleaner = Cleaner(subarray=subarray)
+
+    reducer = TailCutsDataVolumeReducer(
+        subarray=subarray, cleaner=cleaner, n_end_dilates=2
+    )
+    masks = reducer.select_pixels_batch(
+        waveforms, tel_id=tel_id, selected_gain_channel=selected_gain_channel
+    )
+    assert masks.shape == (n_events, geom.n_pixels)
+    assert 0 < np.count_nonzero(masks) < masks.size
+
+    extractor = reducer.image_extractors["NeighborPeakWindowSum"]
+    broken_pixels = np.zeros((1, geom.n_pixels), dtype=bool)
+    for event in range(n_events):
+        image = extractor(
+            waveforms[event], tel_id, selected_gain_channel[event], broken_pixels
+        ).image
+        expected = _reference_tailcuts_reduction(geom, image, 10, 5, n_end_dilates=2)
+        assert_array_equal(masks[event], expected)
+
+        mask = reducer(
+            waveforms[event],
+            tel_id=tel_id,
+            selected_gain_channel=selected_gain_channel[event],
+        )
+        assert_array_equal(mask, expected)
+
+
+def test_null_data_volume_reducer_batch():
+    from ctapipe.benchmark import make_toy_subarray
+
+    subarray = make_toy_subarray(n_telescopes=1, n_pixels_side=5)
+    reducer = NullDataVolumeReducer(subarray=subarray)
+    masks = reducer.select_pixels_batch(np.zeros((3, 1, 25, 10)), tel_id=1)
+    assert masks.shape == (3, 25)
+    assert masks.all()
@@ -129,6 +129,51 @@ def test_compare(frame, prod5_lst):
     assert np.isclose(signal_skewed, signal_normal).all()
 
 
+@pytest.mark.parametrize("frame", ["telescope", "camera"])
+def test_skewed_gaussian_expected_signal(frame, prod5_lst):
+    from ctapipe.image.toymodel import (
+        Gaussian,
+        SkewedGaussian,
+        skewed_gaussian_expected_signal,
+    )
+
+    if frame == "camera":
+        geom = prod5_lst.camera.geometry
+        unit = u.m
+    else:
+        geom = prod5_lst.camera.geometry.transform_to(TelescopeFrame())
+        unit = u.deg
+
+    x = u.Quantity([0.2, -0.1, 0.0], unit)
+    y = u.Quantity([0.3, 0.1, -0.2], unit)
+    width = u.Quantity([0.05, 0.02, 0.04], unit)
+    length = u.Quantity([0.15, 0.1, 0.2], unit)
+    psi = u.Quantity([30, -60, 120], u.deg)
+    skewness = np.array([0.0, 0.3, -0.5])
+    intensity = np.array([50, 1000, 200])
+
+    signal = skewed_gaussian_expected_signal(
+        geom, intensity, x, y, length, width, psi, skewness
+    )
+    assert signal.shape == (3, geom.n_pixels)
+
+    for i in range(3):
+        model = SkewedGaussian(
+            x=x[i],
+            y=y[i],
+            length=length[i],
+            width=width[i],
+            psi=psi[i],
+            skewness=skewness[i],
+        )
+        expected = model.expected_signal(geom, intensity=intensity[i])
+        np.testing.assert_allclose(signal[i], expected, rtol=1e-10, atol=1e-12)
+
+    normal = Gaussian(x=x[0], y=y[0], width=width[0], length=length[0], psi=psi[0])
+    expected = normal.expected_signal(geom, intensity=intensity[0])
+    np.testing.assert_allclose(signal[0], expected, rtol=1e-10, atol=1e-12)
+
+
 @pytest.mark.parametrize("frame", ["telescope", "camera"])
 def test_obtain_time_image(frame, prod5_sst):
     geom = prod5_sst.camera.geometry
@@ -282,3 +327,33 @@ def test_waveform_model(frame, prod5_sst):
 
     with pytest.raises(ValueError):
         WaveformModel.from_camera_readout(readout, gain_channel=0)
+
+
+def test_waveform_model_batch(prod5_sst):
+    prod5_sst = deepcopy(prod5_sst)
+    readout = prod5_sst.camera.readout
+    n_samples = readout.n_samples
+    waveform_model = WaveformModel.from_camera_readout(readout)
+
+    rng = np.random.default_rng(0)
+    n_pixels = readout.n_pixels
+    charge = rng.uniform(0, 100, (5, n_pixels))
+    # include times outside of the readout window
+    duration = n_samples / readout.sampling_rate.to_value(u.GHz)
+    time = rng.uniform(-5, duration + 5, (5, n_pixels))
+
+    waveforms = waveform_model.get_waveforms(charge, time, n_samples)
+    assert waveforms.shape == (5, readout.n_channels, n_pixels, n_samples)
+
+    for i in range(5):
+        expected = waveform_model.get_waveform(charge[i].copy(), time[i], n_samples)
+        np.testing.assert_allclose(waveforms[i], expected, atol=1e-10)
+
+    single = waveform_model.get_waveforms(charge[0], time[0], n_samples)
+    np.testing.assert_allclose(single, waveforms[0])
+
+    waveforms_32 = waveform_model.get_waveforms(
+        charge, time, n_samples, dtype=np.float32
+    )
+    assert waveforms_32.dtype == np.float32
+    np.testing.assert_allclose(waveforms_32, waveforms, rtol=1e-5, atol=1e-4)
@@ -26,7 +26,7 @@ import numpy as np
 from numpy.random import default_rng
 from scipy.integrate import quad
 from scipy.ndimage import convolve1d
-from scipy.special import ellipe
+from scipy.special import ellipe, ndtr
 from scipy.stats import multivariate_normal, norm, skewnorm
 
 from ctapipe.calib.camera.gainselection import GainChannel
@@ -39,6 +39,7 @@ __all__ = [
     "SkewedGaussian",
     "ImageModel",
     "obtain_time_image",
+    "skewed_gaussian_expected_signal",
 ]
 
 
@@ -126,6 +127,7 @@ class WaveformModel:
             self.ref_interp_y.T / (self.ref_interp_y.sum(-1) * self.ref_width_ns)
         ).T
         self.origin = self.ref_interp_y.argmax(-1) - self.ref_interp_y[0].size // 2
+        self._sampled_pulses = {}
 
     def get_waveform(self, charge, time, n_samples):
         """Obtain the waveform toy model.
@@ -178,6 +180,69 @@ class WaveformModel:
         )
         return sampled
 
+    def get_sampled_pulses(self, n_samples):
+        """Waveforms of a single photo electron for each possible arrival time.
+
+        The result is cached, as it only depends on ``n_samples``.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of samples in the waveform
+
+        Returns
+        -------
+        pulses : ndarray
+            Waveform of one photo electron arriving in each upsampled time bin
+            Shape (n_channels, n_samples * upsampling, n_samples)
+        """
+        pulses = self._sampled_pulses.get(n_samples)
+        if pulses is None:
+            n_upsampled_samples = n_samples * self.upsampling
+            time = (np.arange(n_upsampled_samples) + 0.5) * self.ref_width_ns
+            pulses = self.get_waveform(
+                np.ones(n_upsampled_samples), time, n_samples=n_samples
+            )
+            self._sampled_pulses[n_samples] = pulses
+        return pulses
+
+    def get_waveforms(self, charge, time, n_samples, dtype=np.float64):
+        """Obtain the waveform toy model for a batch of images.
+
+        Gives the same result as `get_waveform` for each image,
+        but looks up the pre-computed `get_sampled_pulses` instead
+        of convolving each image with the reference pulse.
+
+        Parameters
+        ----------
+        charge : ndarray
+            Amount of charge in each pixel
+            Shape: (..., n_pixels)
+        time : ndarray
+            The signal time in the waveform in nanoseconds
+            Shape: (..., n_pixels)
+        n_samples : int
+            Number of samples in the waveform
+        dtype : numpy.dtype
+            dtype of the returned waveforms
+
+        Returns
+        -------
+        waveform : ndarray
+            Toy model waveforms
+            Shape (..., n_channels, n_pixels, n_samples)
+        """
+        pulses = self.get_sampled_pulses(n_samples).astype(dtype, copy=False)
+        charge = np.asanyarray(charge)
+
+        sample = (np.asanyarray(time) / self.ref_width_ns).astype(np.int64)
+        outofrange = (sample < 0) | (sample >= pulses.shape[1])
+        sample[outofrange] = 0
+        charge = np.where(outofrange, 0, charge).astype(dtype, copy=False)
+
+        waveforms = pulses[:, sample] * charge[..., np.newaxis]
+        return np.moveaxis(waveforms, 0, -3)
+
     @classmethod
     def from_camera_readout(cls, readout, gain_channel="ALL"):
         """Create class from a `ctapipe.instrument.CameraReadout`.
@@ -208,6 +273,78 @@ class WaveformModel:
         )
 
 
+def skewed_gaussian_expected_signal(
+    camera, intensity, x, y, length, width, psi, skewness
+):
+    """Expected signal in each pixel for a batch of `SkewedGaussian` showers.
+
+    Vectorized equivalent of calling `SkewedGaussian.expected_signal`
+    for each set of parameters. A skewness of 0 results in a `Gaussian` shower.
+
+    Parameters
+    ----------
+    camera : `ctapipe.instrument.CameraGeometry`
+        camera geometry object
+    intensity : ndarray
+        Total number of expected photo electrons of each shower
+    x : u.Quantity[length]
+        X position of the centroid of each shower
+    y : u.Quantity[length]
+        Y position of the centroid of each shower
+    length : u.Quantity[length]
+        length of each shower (major axis)
+    width : u.Quantity[length]
+        width of each shower (minor axis)
+    psi : u.Quantity[angle]
+        rotation angle of each shower about the centroid (0=x-axis)
+    skewness : ndarray
+        skewness of each shower along the major axis
+
+    Returns
+    -------
+    ndarray
+        Expected signal, shape (n_showers, n_pixels)
+    """
+    unit = camera.pix_x.unit
+
+    def column(value, unit=u.one):
+        return np.atleast_1d(u.Quantity(value).to_value(unit))[:, np.newaxis]
+
+    x = column(x, unit)
+    y = column(y, unit)
+    length = column(length, unit)
+    width = column(width, unit)
+    psi = column(psi, u.rad)
+    skewness = column(skewness)
+
+    # see SkewedGaussian._moments_to_parameters
+    skew23 = np.abs(skewness) ** (2 / 3)
+    delta = np.sign(skewness) * np.sqrt(
+        (np.pi / 2 * skew23) / (skew23 + (0.5 * (4 - np.pi)) ** (2 / 3))
+    )
+    a = delta / np.sqrt(1 - delta**2)
+    scale = length / np.sqrt(1 - 2 * delta**2 / np.pi)
+    loc = -scale * delta * np.sqrt(2 / np.pi)
+
+    longitudinal, transverse = camera_to_shower_coordinates(
+        camera.pix_x.to_value(unit), camera.pix_y.to_value(unit), x, y, psi
+    )
+    # product of the skew normal pdf along the shower axis and the normal pdf
+    # perpendicular to it, avoiding the overhead of scipy.stats
+    z = (longitudinal - loc) / scale
+    signal = ndtr(a * z)
+    transverse /= width
+    z *= z
+    transverse *= transverse
+    z += transverse
+    signal *= np.exp(-0.5 * z)
+
+    pix_area = camera.pix_area.to_value(unit**2)
+    normalization = column(intensity) / (np.pi * scale * width)
+    signal *= normalization * pix_area
+    return signal
+
+
 class ImageModel(metaclass=ABCMeta):
     @abstractmethod
     def pdf(self, x, y):
@@ -1,18 +1,10 @@
-from .atmosphere import get_atmosphere_profile_functions
-from .camera import CameraDescription, CameraGeometry, CameraReadout, PixelShape
-from .guess import guess_telescope
-from .optics import (
-    ComaPSFModel,
-    FocalLengthKind,
-    OpticsDescription,
-    PSFModel,
-    ReflectorShape,
-    SizeType,
-)
-from .subarray import SubarrayDescription, UnknownTelescopeID
-from .telescope import TelescopeDescription
-from .trigger import SoftwareTrigger
-from .warnings import FromNameWarning
+"""
+ctapipe instrument module
+
+The submodules are only imported when one of their attributes is accessed.
+"""
+
+from .._lazy import attach
 
 __all__ = [
     "CameraDescription",
@@ -33,3 +25,30 @@ __all__ = [
     "PSFModel",
     "ComaPSFModel",
 ]
+
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "atmosphere": ["get_atmosphere_profile_functions"],
+        "camera": [
+            "CameraDescription",
+            "CameraGeometry",
+            "CameraReadout",
+            "PixelShape",
+        ],
+        "guess": ["guess_telescope"],
+        "optics": [
+            "ComaPSFModel",
+            "FocalLengthKind",
+            "OpticsDescription",
+            "PSFModel",
+            "ReflectorShape",
+            "SizeType",
+        ],
+        "subarray": ["SubarrayDescription", "UnknownTelescopeID"],
+        "telescope": ["TelescopeDescription"],
+        "trigger": ["SoftwareTrigger"],
+        "warnings": ["FromNameWarning"],
+    },
+)
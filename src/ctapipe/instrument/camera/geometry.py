@@ -427,18 +427,6 @@ class CameraGeometry:
         pixel_centers = np.column_stack([self.pix_x.value, self.pix_y.value])
         return cKDTree(pixel_centers)
 
-    @lazyproperty
-    def _all_pixel_areas_equal(self):
-        """
-        Pre-calculated kdtree of all pixel centers inside camera
-
-        Returns
-        -------
-        True if all pixels are of equal size, False otherwise
-
-        """
-        return ~np.any(~np.isclose(self.pix_area.value, self.pix_area[0].value), axis=0)
-
     def image_index_to_cartesian_index(self, pixel_index):
         """
         Convert pixel index in the 1d image representation to row and col
@@ -944,12 +932,16 @@ class CameraGeometry:
         Convert a position  to the corresponding pixel index.
 
         Returns the index of a camera pixel which contains a given position (x, y)
-        in the geometry's frame. The (x, y) coordinates can be arrays (of equal length),
+        in the geometry's frame. The (x, y) coordinates can be arrays (of equal shape),
         for which the methods returns an array of pixel ids.
 
         The method returns ``INT64_MIN=-9223372036854775808`` for coordinates not covered
         by any pixel.
 
+        The exact pixel shapes (hexagons, squares or circles, as drawn by
+        `~ctapipe.visualization.CameraDisplay`) are used, also for cameras
+        with pixels of different sizes.
+
         Parameters
         ----------
         x : astropy.units.Quantity
@@ -962,63 +954,111 @@ class CameraGeometry:
         pix_indices: Pixel index or array of pixel indices. Returns INT64_MIN=-9223372036854775808
             if position is not inside a pixel.
         """
-        if not self._all_pixel_areas_equal:
-            logger.warning(
-                "Method not implemented for cameras with varying pixel sizes"
-            )
-        unit = x.unit
-        scalar = x.ndim == 0
-
-        points_searched = np.dstack([x.to_value(unit), y.to_value(unit)])
-        circum_rad = self._pixel_circumradius[0].to_value(unit)
-        kdtree = self._kdtree
-        dist, pix_indices = kdtree.query(
-            points_searched, distance_upper_bound=circum_rad
-        )
-        del dist
-        pix_indices = pix_indices.flatten()
+        scalar = np.ndim(x) == 0
+        shape = np.shape(x)
 
+        points = np.column_stack(
+            [
+                np.ravel(x.to_value(self.unit)),
+                np.ravel(y.to_value(self.unit)),
+            ]
+        )
         invalid = np.iinfo(np.int64).min
-        # 1. Mark all points outside pixel circumeference as lying outside camera
-        pix_indices[pix_indices == self.n_pixels] = invalid
-
-        # 2. Accurate check for the remaining cases (within circumference, but still outside
-        # camera). It is first checked if any border pixel numbers are returned.
-        # If not, everything is fine. If yes, the distance of the given position to the
-        # the given position to the closest pixel center is translated to the distance to
-        # the center of a non-border pixel', pos -> pos', and it is checked whether pos'
-        # still lies within pixel'. If not, pos lies outside the camera. This approach
-        # does not need to know the particular pixel shape, but as the kdtree itself,
-        # presumes all camera pixels being of equal size.
-        border_mask = self.get_border_pixel_mask()
-        # get all pixels at camera border:
-        borderpix_indices = np.nonzero(border_mask)[0]
-        borderpix_indices_in_list = np.intersect1d(borderpix_indices, pix_indices)
-        if borderpix_indices_in_list.any():
-            # Get some pixel not at the border:
-            insidepix_index = np.nonzero(~border_mask)[0][0]
-            # Check in detail whether location is in border pixel or outside camera:
-            for borderpix_index in borderpix_indices_in_list:
-                index = np.nonzero(pix_indices == borderpix_index)[0][0]
-                # compare with inside pixel:
-                xprime = (
-                    points_searched[0][index, 0]
-                    - self.pix_x[borderpix_index].to_value(unit)
-                    + self.pix_x[insidepix_index].to_value(unit)
-                )
-                yprime = (
-                    points_searched[0][index, 1]
-                    - self.pix_y[borderpix_index].to_value(unit)
-                    + self.pix_y[insidepix_index].to_value(unit)
-                )
-                dist_check, index_check = kdtree.query(
-                    [xprime, yprime], distance_upper_bound=circum_rad
-                )
-                del dist_check
-                if index_check != insidepix_index:
-                    pix_indices[index] = invalid
+        pix_indices = np.full(len(points), invalid)
+        if len(points) == 0:
+            return pix_indices.reshape(shape)
+
+        # 1. for most points, the pixel with the closest center contains the point,
+        # pixels don't overlap, so that is the only pixel containing the point
+        circum_rad = self._pixel_circumradius.to_value(self.unit).max()
+        _, closest = self._kdtree.query(points, distance_upper_bound=circum_rad)
+        # no pixel can contain points without any pixel center within the circumradius
+        close = closest < self.n_pixels
+        found = close.copy()
+        found[close] = self._pixels_contain(points[close], closest[close])
+        pix_indices[found] = closest[found]
+
+        # 2. remaining points are either outside of the camera, in gaps between pixels
+        # or, e.g. for pixels of different sizes, not in the pixel with the closest center.
+        # Check all pixels that could contain them.
+        remaining = np.nonzero(close & ~found)[0]
+        if len(remaining) == 0:
+            return np.squeeze(pix_indices) if scalar else pix_indices.reshape(shape)
+
+        n_candidates = self._max_pixels_containing_point
+
+        _, candidates = self._kdtree.query(
+            points[remaining], k=n_candidates, distance_upper_bound=circum_rad
+        )
+        # for k=1, the query returns 1d arrays
+        candidates = candidates.reshape(-1, n_candidates)
+        valid = candidates < self.n_pixels
+        inside = np.zeros(candidates.shape, dtype=bool)
+        inside[valid] = self._pixels_contain(
+            np.repeat(points[remaining], n_candidates, axis=0)[valid.ravel()],
+            candidates[valid],
+        )
+        has_pixel = inside.any(axis=1)
+        # only on shared borders, more than one pixel contains a point,
+        # argmax gives the first, i.e. closest of these
+        first = np.argmax(inside, axis=1)
+        pix_indices[remaining[has_pixel]] = candidates[has_pixel, first[has_pixel]]
 
-        return np.squeeze(pix_indices) if scalar else pix_indices
+        return np.squeeze(pix_indices) if scalar else pix_indices.reshape(shape)
+
+    def _pixels_contain(self, points, pix_indices):
+        """
+        Check if the points (shape (n, 2), in units of ``self.unit``)
+        are inside the pixels with the given indices (shape (n,)).
+        """
+        dx = points[:, 0] - self.pix_x.to_value(self.unit)[pix_indices]
+        dy = points[:, 1] - self.pix_y.to_value(self.unit)[pix_indices]
+        # in-circle radius for hexagons and squares, radius for circles
+        inner_radius = 0.5 * self.pixel_width.to_value(self.unit)[pix_indices]
+
+        if self.pix_type is PixelShape.CIRCLE:
+            return dx**2 + dy**2 <= inner_radius**2
+
+        # regular polygons are the intersection of the stripes between opposite sides
+        inside = np.ones(len(points), dtype=bool)
+        for cos_normal, sin_normal in self._pixel_side_normals:
+            inside &= np.abs(dx * cos_normal + dy * sin_normal) <= inner_radius
+        return inside
+
+    @lazyproperty
+    def _pixel_side_normals(self):
+        """
+        Directions (cos, sin) of the normals of the pairs of opposite sides
+        of the pixels, for the orientation of pixels as drawn by
+        `~ctapipe.visualization.CameraDisplay`.
+        """
+        if self.pix_type is PixelShape.HEXAGON:
+            n_sides = 6
+        elif self.pix_type is PixelShape.SQUARE:
+            n_sides = 4
+        else:
+            raise NotImplementedError(f"No sides for pixel type {self.pix_type!r}")
+
+        angles = self.pix_rotation.to_value(u.rad) + np.arange(n_sides // 2) * (
+            2 * np.pi / n_sides
+        )
+        return np.column_stack([np.cos(angles), np.sin(angles)])
+
+    @lazyproperty
+    def _max_pixels_containing_point(self):
+        """
+        Number of closest pixel centers that need to be checked
+        to find the pixel containing a given point.
+
+        A pixel containing a point has its center within the maximum circumradius
+        of the point. All of these pixels have their centers within twice the
+        maximum circumradius of each other.
+        """
+        circum_rad = self._pixel_circumradius.to_value(self.unit).max()
+        n_close = self._kdtree.query_ball_point(
+            self._kdtree.data, r=2 * circum_rad, return_length=True
+        )
+        return int(min(n_close.max(), self.n_pixels))
 
     @staticmethod
     def simtel_shape_to_type(pixel_shape):
@@ -85,6 +85,134 @@ def test_position_to_pix_index(prod5_lst):
     assert geometry.position_to_pix_index(5 * u.m, 5 * u.m) == np.iinfo(int).min
 
 
+def _hexagonal_geometry(pix_rotation):
+    """Camera of pointy-top hexagonal pixels rotated by ``pix_rotation``"""
+    width = 0.05
+    i, j = np.meshgrid(np.arange(-10, 11), np.arange(-10, 11))
+    x = width * (i + 0.5 * j).ravel()
+    y = width * np.sqrt(3) / 2 * j.ravel()
+    inside = np.hypot(x, y) < 0.4
+    x, y = x[inside], y[inside]
+    angle = np.deg2rad(pix_rotation)
+    x, y = x * np.cos(angle) - y * np.sin(angle), x * np.sin(angle) + y * np.cos(angle)
+
+    n_pixels = len(x)
+    return CameraGeometry(
+        name="hexagonal",
+        pix_id=np.arange(n_pixels),
+        pix_x=x * u.m,
+        pix_y=y * u.m,
+        pix_area=np.full(n_pixels, np.sqrt(3) / 2 * width**2) * u.m**2,
+        pix_type=PixelShape.HEXAGON,
+        pix_rotation=pix_rotation * u.deg,
+    )
+
+
+def _pixel_containing_points(geometry, x, y):
+    """Brute force check of each point against the pixel corners"""
+    n_corners = 6 if geometry.pix_type is PixelShape.HEXAGON else 4
+    circumradius = geometry.pixel_width.to_value(u.m) / np.cos(np.pi / n_corners) / 2
+    # first corner pointing up, like RegularPolygon in matplotlib
+    angles = np.pi / 2 + 2 * np.pi * np.arange(n_corners) / n_corners
+    angles += geometry.pix_rotation.to_value(u.rad)
+    if geometry.pix_type is PixelShape.SQUARE:
+        angles += np.pi / 4
+
+    pix_indices = np.full(len(x), np.iinfo(np.int64).min)
+    for pix_index in range(geometry.n_pixels):
+        corners_x = geometry.pix_x[pix_index].to_value(u.m)
+        corners_x = corners_x + circumradius[pix_index] * np.cos(angles)
+        corners_y = geometry.pix_y[pix_index].to_value(u.m)
+        corners_y = corners_y + circumradius[pix_index] * np.sin(angles)
+
+        inside = np.ones(len(x), dtype=bool)
+        for k in range(n_corners):
+            x0, y0 = corners_x[k], corners_y[k]
+            x1, y1 = corners_x[(k + 1) % n_corners], corners_y[(k + 1) % n_corners]
+            inside &= (x1 - x0) * (y - y0) - (y1 - y0) * (x - x0) >= 0
+        pix_indices[inside] = pix_index
+    return pix_indices
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        _hexagonal_geometry(pix_rotation=0),
+        _hexagonal_geometry(pix_rotation=30),
+        _hexagonal_geometry(pix_rotation=13),
+        CameraGeometry.make_rectangular(20, 20),
+    ],
+    ids=["hexagon-0deg", "hexagon-30deg", "hexagon-13deg", "square"],
+)
+def test_position_to_pix_index_exact(geometry):
+    """Pixels found for random points match the brute force result"""
+    rng = np.random.default_rng(0)
+    extent = 1.2 * np.abs(geometry.pix_x.to_value(u.m)).max()
+    x, y = rng.uniform(-extent, extent, (2, 10_000))
+
+    pix_indices = geometry.position_to_pix_index(x * u.m, y * u.m)
+    assert np.count_nonzero(pix_indices >= 0) > 1000
+    np.testing.assert_array_equal(pix_indices, _pixel_containing_points(geometry, x, y))
+
+    # units and shape of the input
+    pix_indices_cm = geometry.position_to_pix_index(
+        x.reshape(100, 100) * 100 * u.cm, y.reshape(100, 100) * 100 * u.cm
+    )
+    np.testing.assert_array_equal(pix_indices_cm, pix_indices.reshape(100, 100))
+
+
+def test_position_to_pix_index_different_sizes():
+    """A large circular pixel surrounded by small ones"""
+    angles = np.linspace(0, 2 * np.pi, 6, endpoint=False)
+    pix_x = np.append(0, 0.04 * np.cos(angles))
+    pix_y = np.append(0, 0.04 * np.sin(angles))
+    radius = np.append(0.03, np.full(len(angles), 0.01))
+
+    geometry = CameraGeometry(
+        name="different-sizes",
+        pix_id=np.arange(len(pix_x)),
+        pix_x=pix_x * u.m,
+        pix_y=pix_y * u.m,
+        pix_area=np.pi * radius**2 * u.m**2,
+        pix_type=PixelShape.CIRCLE,
+    )
+
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-0.05, 0.05, (2, 10_000))
+    inside = np.hypot(x[:, np.newaxis] - pix_x, y[:, np.newaxis] - pix_y) <= radius
+    expected = np.where(
+        inside.any(axis=1), np.argmax(inside, axis=1), np.iinfo(int).min
+    )
+
+    pix_indices = geometry.position_to_pix_index(x * u.m, y * u.m)
+    np.testing.assert_array_equal(pix_indices, expected)
+
+    # inside the large pixel, but closer to the center of a small one
+    assert geometry.position_to_pix_index(0.022 * u.m, 0.019 * u.m) == 0
+
+
+def test_position_to_pix_index_single_candidate():
+    """Sparse pixels, so that at most one pixel can contain a point"""
+    geometry = CameraGeometry(
+        name="sparse",
+        pix_id=np.arange(3),
+        pix_x=[0.0, 1.0, 2.0] * u.m,
+        pix_y=np.zeros(3) * u.m,
+        pix_area=np.full(3, 0.01) * u.m**2,
+        pix_type=PixelShape.HEXAGON,
+    )
+
+    assert geometry._max_pixels_containing_point == 1
+    assert geometry.position_to_pix_index(0.045 * u.m, 0 * u.m) == 0
+
+    # the flat sides of the hexagons are at x = ±0.054 m, the corners at y = ±0.062 m
+    invalid = np.iinfo(int).min
+    pix_indices = geometry.position_to_pix_index(
+        [0.0, 0.055, 0.0, 1.01, 0.5] * u.m, [0.0, 0.0, 0.058, 0.0, 0.0] * u.m
+    )
+    np.testing.assert_array_equal(pix_indices, [0, invalid, 0, 1, invalid])
+
+
 def test_find_neighbor_pixels():
     """test basic neighbor functionality"""
     n_pixels_grid = 5
@@ -1,27 +1,10 @@
 """
 ctapipe io module
 
-# order matters to prevent circular imports
-isort:skip_file
+The submodules are only imported when one of their attributes is accessed.
 """
 
-from .astropy_helpers import read_table, write_table  # noqa: I001
-from .datalevels import DataLevel
-from .dl2_tables_preprocessing import DL2EventPreprocessor, DL2EventLoader
-from .eventsource import EventSource
-from .eventseeker import EventSeeker
-from .tableio import TableReader, TableWriter
-from .hdf5tableio import HDF5TableReader, HDF5TableWriter
-from .tableloader import TableLoader
-from .hdf5merger import HDF5Merger
-from .hdf5monitoringsource import HDF5MonitoringSource, get_hdf5_monitoring_types
-from .monitoringsource import MonitoringSource
-from .monitoringtypes import MonitoringType
-
-from .hdf5eventsource import HDF5EventSource, get_hdf5_datalevels
-from .simteleventsource import SimTelEventSource
-
-from .datawriter import DATA_MODEL_VERSION, DataWriter
+from .._lazy import attach
 
 __all__ = [
     "HDF5TableWriter",
@@ -40,6 +23,7 @@ __all__ = [
     "DataLevel",
     "read_table",
     "write_table",
+    "TableWriteSession",
     "DataWriter",
     "DATA_MODEL_VERSION",
     "get_hdf5_datalevels",
@@ -47,3 +31,25 @@ __all__ = [
     "DL2EventLoader",
     "get_hdf5_monitoring_types",
 ]
+
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "astropy_helpers": ["read_table", "write_table", "TableWriteSession"],
+        "datalevels": ["DataLevel"],
+        "dl2_tables_preprocessing": ["DL2EventPreprocessor", "DL2EventLoader"],
+        "eventsource": ["EventSource"],
+        "eventseeker": ["EventSeeker"],
+        "tableio": ["TableReader", "TableWriter"],
+        "hdf5tableio": ["HDF5TableReader", "HDF5TableWriter"],
+        "tableloader": ["TableLoader"],
+        "hdf5merger": ["HDF5Merger"],
+        "hdf5monitoringsource": ["HDF5MonitoringSource", "get_hdf5_monitoring_types"],
+        "monitoringsource": ["MonitoringSource"],
+        "monitoringtypes": ["MonitoringType"],
+        "hdf5eventsource": ["HDF5EventSource", "get_hdf5_datalevels"],
+        "simteleventsource": ["SimTelEventSource"],
+        "datawriter": ["DATA_MODEL_VERSION", "DataWriter"],
+    },
+)
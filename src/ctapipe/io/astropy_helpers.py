@@ -25,11 +25,19 @@ from .tableio import (
     TimeColumnTransform,
 )
 
-__all__ = ["read_table", "write_table", "join_allow_empty"]
+__all__ = ["read_table", "write_table", "TableWriteSession", "join_allow_empty"]
 
 
 def read_table(
-    h5file, path, start=None, stop=None, step=None, condition=None, table_cls=Table
+    h5file,
+    path,
+    start=None,
+    stop=None,
+    step=None,
+    condition=None,
+    table_cls=Table,
+    columns=None,
+    coordinates=None,
 ) -> Table:
     """Read a table from an HDF5 file
 
@@ -58,6 +66,15 @@ def read_table(
         For example, use "hillas_length > 0" to only load rows where the
         hillas length is larger than 0 (so not nan and not 0).
         Ignored when reading tables that were written using astropy.
+    columns: Iterable[str] or None
+        If given, only these columns are read, in the order they appear
+        in the table. The rows are read block-wise and only the selected
+        columns are kept, so the peak memory usage scales with the size
+        of the selected columns and not with the full table.
+    coordinates: array-like of int or None
+        If given, only the rows with these indices are loaded.
+        Cannot be combined with start, stop, step or condition.
+        Ignored when reading tables that were written using astropy.
 
     Returns
     -------
@@ -66,6 +83,13 @@ def read_table(
 
     """
 
+    if coordinates is not None and any(
+        v is not None for v in (start, stop, step, condition)
+    ):
+        raise ValueError(
+            "coordinates cannot be combined with start, stop, step or condition"
+        )
+
     with ExitStack() as stack:
         if not isinstance(h5file, tables.File):
             h5file = stack.enter_context(tables.open_file(h5file))
@@ -75,7 +99,12 @@ def read_table(
         is_astropy = f"{path}.__table_column_meta__" in h5file.root
         if is_astropy:
             sl = slice(start, stop, step)
-            return table_cls.read(h5file.filename, path)[sl]
+            astropy_table = table_cls.read(h5file.filename, path)[sl]
+            if columns is not None:
+                astropy_table = astropy_table[
+                    [c for c in astropy_table.colnames if c in set(columns)]
+                ]
+            return astropy_table
 
         # support leaving out the leading '/' for consistency with other
         # methods
@@ -87,7 +116,13 @@ def read_table(
             )
         transforms, descriptions, meta, column_meta = _parse_hdf5_attrs(table)
 
-        if condition is None:
+        if columns is not None:
+            array = _read_columns(
+                table, columns, start, stop, step, condition, coordinates
+            )
+        elif coordinates is not None:
+            array = table.read_coordinates(coordinates)
+        elif condition is None:
             array = table.read(start=start, stop=stop, step=step)
         else:
             array = table.read_where(
@@ -125,6 +160,66 @@ def read_table(
         return astropy_table
 
 
+def _read_columns(
+    table,
+    columns,
+    start=None,
+    stop=None,
+    step=None,
+    condition=None,
+    coordinates=None,
+):
+    """Read a subset of the columns of a pytables table into a structured array
+
+    PyTables can only read full rows or a single column, so we read
+    blocks of rows and only keep the requested columns of each block.
+    """
+    columns = set(columns)
+    missing = columns.difference(table.colnames)
+    if missing:
+        raise KeyError(f"Table {table._v_pathname} has no column(s) {sorted(missing)}")
+
+    names = [name for name in table.colnames if name in columns]
+    dtype = np.dtype([(name, table.coldtypes[name]) for name in names])
+    block_size = max(table.nrowsinbuf, 1)
+
+    if coordinates is not None:
+        coordinates = np.asanyarray(coordinates)
+        array = np.empty(len(coordinates), dtype=dtype)
+        for block_start in range(0, len(coordinates), block_size):
+            block_stop = block_start + block_size
+            block = table.read_coordinates(coordinates[block_start:block_stop])
+            array[block_start:block_stop] = block[names]
+        return array
+
+    start, stop, step = slice(start, stop, step).indices(table.nrows)
+    # make sure each block starts at a row that would also be selected by step
+    block_size *= step
+    block_starts = range(start, stop, block_size)
+
+    if condition is None:
+        array = np.empty(len(range(start, stop, step)), dtype=dtype)
+        offset = 0
+        for block_start in block_starts:
+            block_stop = min(stop, block_start + block_size)
+            block = table.read(start=block_start, stop=block_stop, step=step)
+            array[offset : offset + len(block)] = block[names]
+            offset += len(block)
+        return array
+
+    blocks = []
+    for block_start in block_starts:
+        block_stop = min(stop, block_start + block_size)
+        block = table.read_where(
+            condition=condition, start=block_start, stop=block_stop, step=step
+        )
+        blocks.append(block[names].astype(dtype))
+
+    if len(blocks) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(blocks)
+
+
 def write_table(
     table,
     h5file,
@@ -139,7 +234,9 @@ def write_table(
 
     This writes a table in the ctapipe format into ``h5file``.
 
-                attrs.update(transform.get_meta(name))
+    When writing many tables or chunks of tables into the same file,
+    use a `TableWriteSession` to avoid opening the file and looking
+    up the output node for each call.
 
     Parameters
     ----------
@@ -162,34 +259,130 @@ def write_table(
         Format to use for storing time columns.
         Either 'ctao_high_res' (the default) or a format supported by `astropy.time.Time`.
     """
-    copied = False
-    parent, table_name = os.path.split(path)
-
     if append and overwrite:
         raise ValueError("overwrite and append are mutually exclusive")
 
-    with ExitStack() as stack:
-        if not isinstance(h5file, tables.File):
-            h5file = stack.enter_context(tables.open_file(h5file, mode=mode))
+    with TableWriteSession(
+        h5file, mode=mode, time_format=time_format, filters=filters
+    ) as session:
+        session.write(table, path, append=append, overwrite=overwrite)
 
-        already_exists = path in h5file.root
-        if already_exists:
-            if overwrite and not append:
-                h5file.remove_node(parent, table_name)
-                already_exists = False
 
-            elif not overwrite and not append:
+class TableWriteSession:
+    """Write tables into an HDF5 file that stays open between calls
+
+    Behaves like calling `write_table` repeatedly, but the file is only
+    opened once and the output nodes and the attributes already written
+    to them are cached per path. Appending a chunk to an existing table
+    then is a single append to the cached node, and attributes are only
+    written if they changed.
+
+    Parameters
+    ----------
+    h5file: Union[str, Path, tables.file.File]
+        input filename or PyTables file handle. If a PyTables file handle,
+        must be opened writable and is not closed by the session.
+    mode: str
+        If given a path for ``h5file``, it will be opened in this mode.
+        See the docs of ``tables.open_file``.
+    time_format: str
+        Format to use for storing time columns.
+        Either 'ctao_high_res' (the default) or a format supported by `astropy.time.Time`.
+    filters: tables.Filters
+        Compression settings for newly created tables.
+
+    Examples
+    --------
+    >>> from astropy.table import Table
+    >>> from ctapipe.io import TableWriteSession
+    >>> with TableWriteSession("chunks.h5", mode="w") as session:  # doctest: +SKIP
+    ...     for chunk in chunks:
+    ...         session.write(chunk, "/data/chunks", append=True)
+    """
+
+    def __init__(
+        self,
+        h5file,
+        mode="a",
+        time_format="ctao_high_res",
+        filters=DEFAULT_FILTERS,
+    ):
+        self._owns_file = not isinstance(h5file, tables.File)
+        if self._owns_file:
+            h5file = tables.open_file(h5file, mode=mode)
+
+        self.h5file = h5file
+        self.time_format = time_format
+        self.filters = filters
+        self._nodes = {}
+        self._attrs = {}
+
+    def write(self, table, path, append=False, overwrite=False):
+        """Write or append ``table`` to ``path``, see `write_table`
+
+        Parameters
+        ----------
+        table: astropy.table.Table
+            The table to be written.
+        path: str
+            dataset path inside the file
+        append: bool
+            Whether to try to append to or replace an existing table
+        overwrite: bool
+            If table is already in file and overwrite and append are false,
+            raise an error.
+        """
+        if append and overwrite:
+            raise ValueError("overwrite and append are mutually exclusive")
+
+        h5_table = self._nodes.get(path)
+        if h5_table is None and path in self.h5file.root:
+            h5_table = self.h5file.get_node(path)
+
+        if h5_table is not None and not append:
+            if not overwrite:
                 raise OSError(
                     f"Table {path} already exists in output file, use append or overwrite"
                 )
+            h5_table.remove()
+            h5_table = None
+            self._nodes.pop(path, None)
+            self._attrs.pop(path, None)
+
+        table, attrs = self._convert(table)
+
+        if h5_table is None:
+            parent, table_name = os.path.split(path)
+            h5_table = self.h5file.create_table(
+                parent,
+                table_name,
+                filters=self.filters,
+                expectedrows=len(table),
+                createparents=True,
+                obj=table.as_array(),
+            )
+            self._nodes[path] = h5_table
+        else:
+            h5_table.append(table.as_array())
+            self._nodes[path] = h5_table
+
+        written = self._attrs.setdefault(path, {})
+        for key, val in attrs.items():
+            if key not in written or not _attr_equal(written[key], val):
+                h5_table.attrs[key] = val
+                written[key] = val
+
+    def _convert(self, table):
+        """Convert columns to storable types and collect the column attributes"""
+        copied = False
+        attrs = dict(table.meta)
 
-        attrs = {}
         for pos, (colname, column) in enumerate(table.columns.items()):
             if hasattr(column, "description") and column.description is not None:
                 attrs[f"CTAFIELD_{pos}_DESC"] = column.description
 
             if isinstance(column, Time):
-                transform = TimeColumnTransform(scale="tai", format=time_format)
+                transform = TimeColumnTransform(scale="tai", format=self.time_format)
                 attrs.update(transform.get_meta(pos))
 
                 if copied is False:
@@ -225,24 +418,33 @@ def write_table(
                 for k, v in col_meta.items():
                     attrs[f"CTAFIELD_{pos}_{k}"] = v
 
-        if not already_exists:
-            h5_table = h5file.create_table(
-                parent,
-                table_name,
-                filters=filters,
-                expectedrows=len(table),
-                createparents=True,
-                obj=table.as_array(),
-            )
-        else:
-            h5_table = h5file.get_node(path)
-            h5_table.append(table.as_array())
+        return table, attrs
 
-        for key, val in table.meta.items():
-            h5_table.attrs[key] = val
+    def flush(self):
+        """Flush the file to disk"""
+        self.h5file.flush()
 
-        for key, val in attrs.items():
-            h5_table.attrs[key] = val
+    def close(self):
+        """Close the file, if it was opened by this session"""
+        self._nodes.clear()
+        self._attrs.clear()
+        if self._owns_file:
+            self.h5file.close()
+        elif self.h5file.isopen:
+            self.h5file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _attr_equal(a, b):
+    try:
+        return bool(np.all(a == b)) and type(a) is type(b)
+    except (TypeError, ValueError):
+        return False
 
 
 def _parse_hdf5_attrs(table):
@@ -264,6 +466,8 @@ def _parse_hdf5_attrs(table):
         "TRANSFORM",
         "TRANSFORM_SCALE",
         "TRANSFORM_OFFSET",
+        "TRANSFORM_RESOLUTION",
+        "TRANSFORM_RELATIVE_RESOLUTION",
         "NAN_VALUE",
         "POSINF_VALUE",
         "NEGINF_VALUE",
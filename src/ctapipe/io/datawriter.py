@@ -19,11 +19,16 @@ from ..core import Component, Container, Field, Provenance, ToolConfigurationErr
 from ..core.traits import Bool, CaselessStrEnum, Float, Int, Path, Unicode
 from ..instrument import SubarrayDescription
 from . import metadata as meta
-from .astropy_helpers import write_table
+from .astropy_helpers import TableWriteSession
 from .datalevels import DataLevel
 from .eventsource import EventSource
 from .hdf5tableio import HDF5TableWriter
-from .tableio import FixedPointColumnTransform, TelListToMaskTransform
+from .sparse_images import SPARSE_IMAGE_COLUMNS, SparseImageWriter
+from .tableio import (
+    FixedPointColumnTransform,
+    QuantizationColumnTransform,
+    TelListToMaskTransform,
+)
 
 __all__ = ["DataWriter", "DATA_MODEL_VERSION", "write_reference_metadata_headers"]
 
@@ -44,8 +49,10 @@ def _get_tel_index(event, tel_id):
 #   (meaning readers need to update scripts)
 # - increase the minor number if new columns or datasets are added
 # - increase the patch number if there is a small bugfix to the model.
-DATA_MODEL_VERSION = "v7.3.0"
+DATA_MODEL_VERSION = "v7.4.0"
 DATA_MODEL_CHANGE_HISTORY = """
+- v7.4.0: - Add the optional pixel-sparse layout of DL1 images, storing only
+            the pixels in the dilated image mask in /dl1/event/telescope/image_pixels.
 - v7.3.0: - Add possibility to attach monitoring data to the event HDF5 file.
           - Add the event type to the telescope trigger container.
 - v7.2.0: - Added new monitoring groups: DL1_TEL_[OPTICAL_PSF, MUON_THROUGHPUT, ILLUMINATOR_THROUGHPUT]_GROUP
@@ -153,6 +160,10 @@ def write_reference_metadata_headers(
     meta.write_to_hdf5(headers, writer.h5file)
 
 
+_FILTER_OPTIONS = ("complib", "complevel", "shuffle", "bitshuffle", "fletcher32")
+_CHUNK_OPTIONS = ("chunkshape", "chunk_bytes")
+
+
 class DataWriter(Component):
     """
     Serialize a sequence of events into a HDF5 file, in the correct format
@@ -200,6 +211,23 @@ class DataWriter(Component):
         help="Store DL1 Images if available", default_value=False
     ).tag(config=True)
 
+    sparse_dl1_images = Bool(
+        help=(
+            "Only store the pixels in the dilated image mask of the DL1 images,"
+            " see `ctapipe.io.sparse_images`. The other pixels are lost."
+        ),
+        default_value=False,
+    ).tag(config=True)
+
+    sparse_image_dilations = Int(
+        help=(
+            "Number of rows of neighboring pixels added to the image mask"
+            " to select the stored pixels if ``sparse_dl1_images`` is True"
+        ),
+        default_value=2,
+        min=0,
+    ).tag(config=True)
+
     write_dl1_parameters = Bool(
         help="Store DL1 image parameters if available", default_value=True
     ).tag(config=True)
@@ -222,6 +250,30 @@ class DataWriter(Component):
         default_value="blosc:zstd",
     ).tag(config=True)
 
+    table_options = Dict(
+        default_value={},
+        help=(
+            "Storage options for specific tables, overriding the global compression"
+            " settings. Mapping of a regular expression matching the table path,"
+            " e.g. ``/dl1/event/telescope/images/.*``, to a dictionary of options."
+            " Supported options are the ``tables.Filters`` arguments"
+            f" {', '.join(_FILTER_OPTIONS)} and the chunk size, given either"
+            " as number of rows (``chunkshape``) or in bytes (``chunk_bytes``)."
+            " If several patterns match a table, later patterns take precedence."
+        ),
+    ).tag(config=True)
+
+    expected_events = Int(
+        default_value=None,
+        allow_none=True,
+        min=1,
+        help=(
+            "Expected number of events to be written, used by pytables to choose"
+            " the chunk size of the event tables. If not given, ``max_events`` of"
+            " the event source is used, if set."
+        ),
+    ).tag(config=True)
+
     overwrite = Bool(help="overwrite output file if it exists").tag(config=True)
 
     transform_waveform = Bool(default_value=False).tag(config=True)
@@ -239,6 +291,39 @@ class DataWriter(Component):
     peak_time_offset = Int(default_value=0).tag(config=True)
     peak_time_scale = Float(default_value=100.0).tag(config=True)
 
+    quantize_image = Bool(
+        default_value=False,
+        help=(
+            "Store DL1 images as int16 using a"
+            " `~ctapipe.io.tableio.QuantizationColumnTransform`"
+            " with ``image_resolution`` and ``image_relative_resolution``."
+            " Cannot be combined with ``transform_image``."
+        ),
+    ).tag(config=True)
+    image_resolution = Float(
+        default_value=0.1,
+        help="Absolute resolution of quantized images in p.e.",
+    ).tag(config=True)
+    image_relative_resolution = Float(
+        default_value=1e-4,
+        help=(
+            "Relative resolution of quantized images, extending the range"
+            " of the stored values to about 25000 p.e. for the default resolutions"
+        ),
+    ).tag(config=True)
+
+    quantize_peak_time = Bool(
+        default_value=False,
+        help=(
+            "Store DL1 peak times as int16 quantized to ``peak_time_resolution``."
+            " Cannot be combined with ``transform_peak_time``."
+        ),
+    ).tag(config=True)
+    peak_time_resolution = Float(
+        default_value=0.1,
+        help="Resolution of quantized peak times in ns",
+    ).tag(config=True)
+
     def __init__(self, event_source: EventSource, config=None, parent=None, **kwargs):
         """
 
@@ -270,6 +355,7 @@ class DataWriter(Component):
 
         self._setup_output_path()
         self._setup_compression()
+        self._check_image_transforms()
         self._setup_writer()
         self._setup_outputfile()
 
@@ -379,6 +465,9 @@ class DataWriter(Component):
         )
 
         self._write_context_metadata_headers()
+        if self._sparse_image_writer is not None:
+            self._sparse_image_writer.flush()
+        self._table_session.close()
         self._writer.close()
         PROV.add_output_file(str(self.output_path), role="DL1/Event")
 
@@ -409,6 +498,45 @@ class DataWriter(Component):
         )
         self.log.debug("compression filters: %s", self._hdf5_filters)
 
+        self._table_options = {}
+        for table_regexp, options in self.table_options.items():
+            unknown = set(options) - set(_FILTER_OPTIONS) - set(_CHUNK_OPTIONS)
+            if unknown:
+                raise ToolConfigurationError(
+                    f"Unknown table options {sorted(unknown)} for {table_regexp!r},"
+                    f" supported are {_FILTER_OPTIONS + _CHUNK_OPTIONS}"
+                )
+
+            complib = options.get("complib", self.compression_type)
+            if complib not in tables.filters.all_complibs:
+                raise ToolConfigurationError(
+                    f"Unknown complib {complib!r} for {table_regexp!r},"
+                    f" supported are {tables.filters.all_complibs}"
+                )
+
+            filters = {
+                "complevel": self.compression_level,
+                "complib": self.compression_type,
+                "fletcher32": True,
+            }
+            filters.update({k: options[k] for k in _FILTER_OPTIONS if k in options})
+            self._table_options[table_regexp] = dict(
+                filters=tables.Filters(**filters),
+                chunkshape=options.get("chunkshape"),
+                chunk_bytes=options.get("chunk_bytes"),
+            )
+            self.log.debug(
+                "storage options for %s: %s",
+                table_regexp,
+                self._table_options[table_regexp],
+            )
+
+    @property
+    def _expected_events(self):
+        if self.expected_events is not None:
+            return self.expected_events
+        return getattr(self.event_source, "max_events", None)
+
     def _setup_output_path(self):
         """
         ensure output path exists, and if requested delete what is there for
@@ -440,6 +568,16 @@ class DataWriter(Component):
                 ", only writing trigger and simulation information"
             )
 
+    def _check_image_transforms(self):
+        """Fail early for conflicting transforms of the image columns"""
+        for column in ("image", "peak_time"):
+            if getattr(self, f"quantize_{column}") and getattr(
+                self, f"transform_{column}"
+            ):
+                raise ToolConfigurationError(
+                    f"quantize_{column} and transform_{column} cannot be used together"
+                )
+
     def _setup_writer(self):
         """
         Create a TableWriter and setup any column exclusions
@@ -452,6 +590,13 @@ class DataWriter(Component):
             add_prefix=True,
             filters=self._hdf5_filters,
         )
+        # only the tables with one row per event grow with the number of events
+        if self._expected_events is not None:
+            writer.add_table_options(
+                "[^/]+/event/.*", expectedrows=self._expected_events
+            )
+        for table_regexp, options in self._table_options.items():
+            writer.add_table_options(table_regexp, **options)
 
         tr_tel_list_to_mask = TelListToMaskTransform(self._subarray)
 
@@ -472,6 +617,7 @@ class DataWriter(Component):
             writer.exclude("/dl1/event/telescope/images/.*", "image_mask")
 
         # Set up transforms
+        image_transforms = {}
         if self.transform_image:
             transform = FixedPointColumnTransform(
                 scale=self.image_scale,
@@ -482,6 +628,19 @@ class DataWriter(Component):
             writer.add_column_transform_regexp(
                 "dl1/event/telescope/images/.*", "image", transform
             )
+            image_transforms["image"] = transform
+
+        if self.quantize_image:
+            transform = QuantizationColumnTransform(
+                resolution=self.image_resolution,
+                relative_resolution=self.image_relative_resolution,
+                source_dtype=np.float32,
+                target_dtype=np.int16,
+            )
+            writer.add_column_transform_regexp(
+                "dl1/event/telescope/images/.*", "image", transform
+            )
+            image_transforms["image"] = transform
 
         if self.transform_waveform:
             transform = FixedPointColumnTransform(
@@ -504,6 +663,35 @@ class DataWriter(Component):
             writer.add_column_transform_regexp(
                 "dl1/event/telescope/images/.*", "peak_time", transform
             )
+            image_transforms["peak_time"] = transform
+
+        if self.quantize_peak_time:
+            transform = QuantizationColumnTransform(
+                resolution=self.peak_time_resolution,
+                source_dtype=np.float32,
+                target_dtype=np.int16,
+            )
+            writer.add_column_transform_regexp(
+                "dl1/event/telescope/images/.*", "peak_time", transform
+            )
+            image_transforms["peak_time"] = transform
+
+        self._sparse_image_writer = None
+        if self.write_dl1_images and self.sparse_dl1_images:
+            columns = ["image", "peak_time"]
+            if self.write_dl1_parameters:
+                columns.append("image_mask")
+
+            for column in SPARSE_IMAGE_COLUMNS:
+                writer.exclude("/dl1/event/telescope/images/.*", column)
+
+            self._sparse_image_writer = SparseImageWriter(
+                writer,
+                self._subarray,
+                n_dilations=self.sparse_image_dilations,
+                columns=columns,
+                transforms=image_transforms,
+            )
 
         # set up DL2 transforms:
         # - the single-tel output has no list of telescopes
@@ -517,6 +705,7 @@ class DataWriter(Component):
 
         # final initialization
         self._writer = writer
+        self._table_session = TableWriteSession(writer.h5file, filters=writer.filters)
         self.log.debug("Writer initialized: %s", self._writer)
 
     def _write_scheduling_and_observation_blocks(self):
@@ -570,6 +759,26 @@ class DataWriter(Component):
                 containers=container,
             )
 
+    def write_table(self, table, path, append=False, overwrite=False):
+        """
+        Write an astropy table into the output file, see `~ctapipe.io.write_table`.
+
+        Uses the already open output file, so this can be called repeatedly,
+        e.g. to append chunks, without reopening the file.
+
+        Parameters
+        ----------
+        table : astropy.table.Table
+            The table to be written.
+        path : str
+            dataset path inside the output file
+        append : bool
+            Whether to try to append to or replace an existing table
+        overwrite : bool
+            Whether to replace an already existing table
+        """
+        self._table_session.write(table, path, append=append, overwrite=overwrite)
+
     def table_name(self, tel_id):
         """construct dataset table names depending on chosen split method"""
         return f"tel_{tel_id:03d}"
@@ -631,9 +840,13 @@ class DataWriter(Component):
                         "DataWriter.write_dl1_images is True but event does not contain image"
                     )
 
+                containers = [tel_index, dl1_camera]
+                if self._sparse_image_writer is not None:
+                    containers.append(self._sparse_image_writer(tel_id, dl1_camera))
+
                 self._writer.write(
                     table_name=f"dl1/event/telescope/images/{table_name}",
-                    containers=[tel_index, dl1_camera],
+                    containers=containers,
                 )
 
             if self._is_simulation:
@@ -745,12 +958,7 @@ class DataWriter(Component):
 
         if profile:
             if hasattr(profile, "table"):
-                write_table(
-                    table=profile.table,
-                    h5file=self._writer.h5file,
-                    path=path,
-                    append=False,
-                )
+                self.write_table(profile.table, path)
             else:
                 self.logger.warning(
                     f"The AtmosphereDensityProfile type '{profile.__class__.__name__}' "
@@ -15,6 +15,7 @@ __all__ = [
     "FIXED_POINTING_GROUP",
     "ATMOSPHERE_DENSITY_PROFILE_TABLE",
     "DL1_IMAGE_STATISTICS_TABLE",
+    "STAGE_PROFILE_TABLE",
     "DL2_EVENT_STATISTICS_GROUP",
     "SHOWER_DISTRIBUTION_TABLE",
     "SIMULATION_SHOWER_TABLE",
@@ -28,6 +29,7 @@ __all__ = [
     "DL1_TEL_GROUP",
     "DL1_TEL_TRIGGER_TABLE",
     "DL1_TEL_IMAGES_GROUP",
+    "DL1_TEL_IMAGE_PIXELS_GROUP",
     "DL1_TEL_PARAMETERS_GROUP",
     "DL1_TEL_MUON_GROUP",
     "DL2_SUBARRAY_GROUP",
@@ -65,6 +67,7 @@ OBSERVATION_BLOCK_TABLE = "/configuration/observation/observation_block"
 SIMULATION_RUN_TABLE = "/configuration/simulation/run"
 FIXED_POINTING_GROUP = "/configuration/telescope/pointing"
 DL1_IMAGE_STATISTICS_TABLE = "/dl1/service/image_statistics"
+STAGE_PROFILE_TABLE = "/dl1/service/stage_profile"
 DL2_EVENT_STATISTICS_GROUP = "/dl2/service/tel_event_statistics"
 SIMULATION_GROUP = "/simulation"
 SIMULATION_TEL_TABLE = "/simulation/event/telescope"
@@ -87,6 +90,7 @@ DL1_SUBARRAY_TRIGGER_TABLE = "/dl1/event/subarray/trigger"
 DL1_TEL_GROUP = "/dl1/event/telescope"
 DL1_TEL_TRIGGER_TABLE = "/dl1/event/telescope/trigger"
 DL1_TEL_IMAGES_GROUP = "/dl1/event/telescope/images"
+DL1_TEL_IMAGE_PIXELS_GROUP = "/dl1/event/telescope/image_pixels"
 DL1_TEL_PARAMETERS_GROUP = "/dl1/event/telescope/parameters"
 DL1_TEL_MUON_GROUP = "/dl1/event/telescope/muon"
 DL2_TEL_GROUP = "/dl2/event/telescope"
@@ -46,7 +46,7 @@ from ..containers import (
     TriggerContainer,
 )
 from ..core import Container, Field, Provenance
-from ..core.traits import UseEnum
+from ..core.traits import Bool, UseEnum
 from ..exceptions import InputMissing
 from ..instrument import SubarrayDescription
 from ..instrument.optics import FocalLengthKind
@@ -81,6 +81,7 @@ from .hdf5dataformat import (
 )
 from .hdf5tableio import HDF5TableReader, get_column_attrs
 from .metadata import _read_reference_metadata_hdf5
+from .sparse_images import SPARSE_IMAGE_COLUMNS, get_sparse_image_reader
 
 __all__ = ["HDF5EventSource"]
 
@@ -106,6 +107,7 @@ COMPATIBLE_DATA_MODEL_VERSIONS = [
     "v7.1.0",
     "v7.2.0",
     "v7.3.0",
+    "v7.4.0",
 ]
 
 
@@ -135,6 +137,15 @@ def get_hdf5_datalevels(h5file: tables.File | str | Path):
     return tuple(datalevels)
 
 
+def _fill_sparse_images(reader, sparse_reader, ignore_columns):
+    """Fill the dense images of the sparse layout into the containers of reader"""
+    for container, images in zip(reader, sparse_reader.iter_rows()):
+        for column, values in images.items():
+            if column not in ignore_columns:
+                container[column] = values
+        yield container
+
+
 def read_atmosphere_density_profile(
     h5file: tables.File, path=ATMOSPHERE_DENSITY_PROFILE_TABLE
 ):
@@ -215,6 +226,18 @@ class HDF5EventSource(EventSource):
         ),
     ).tag(config=True)
 
+    lazy = Bool(
+        default_value=False,
+        help=(
+            "If True, DL1 images, image parameters, muon parameters and"
+            " telescope-wise DL2 containers are only read from the file when"
+            " one of their fields is accessed for the first time."
+            " This speeds up iterating over files when only a few of these"
+            " fields are used. The file must stay open until the containers"
+            " have been read."
+        ),
+    ).tag(config=True)
+
     def __init__(self, input_url=None, config=None, parent=None, **kwargs):
         """
         EventSource for dl1 files in the standard DL1 data format
@@ -572,14 +595,22 @@ class HDF5EventSource(EventSource):
             # if there are no parameters, there are no image_mask, avoids warnings
             ignore_columns.add("image_mask")
 
-        image_readers = {
-            table.name: self.reader.read(
+        image_readers = {}
+        for table in self.file_.root.dl1.event.telescope.images:
+            sparse_reader = get_sparse_image_reader(self.file_, table)
+            table_ignore_columns = ignore_columns
+            if sparse_reader is not None:
+                table_ignore_columns = ignore_columns | set(SPARSE_IMAGE_COLUMNS)
+
+            reader = self.reader.read(
                 f"{DL1_TEL_IMAGES_GROUP}/{table.name}",
                 DL1CameraContainer,
-                ignore_columns=ignore_columns,
+                ignore_columns=table_ignore_columns,
+                lazy=self.lazy,
             )
-            for table in self.file_.root.dl1.event.telescope.images
-        }
+            if sparse_reader is not None:
+                reader = _fill_sparse_images(reader, sparse_reader, ignore_columns)
+            image_readers[table.name] = reader
 
         return image_readers
 
@@ -630,6 +661,7 @@ class HDF5EventSource(EventSource):
                     "intensity",
                     "peak_time",
                 ],
+                lazy=self.lazy,
             )
             for table in self.file_.root.dl1.event.telescope.parameters
         }
@@ -667,6 +699,7 @@ class HDF5EventSource(EventSource):
                     "true_morphology",
                     "true_intensity",
                 ],
+                lazy=self.lazy,
             )
             for table in self.file_.root.dl1.event.telescope.parameters
         }
@@ -699,6 +732,7 @@ class HDF5EventSource(EventSource):
                     MuonParametersContainer,
                     MuonEfficiencyContainer,
                 ],
+                lazy=self.lazy,
             )
             for table in self.file_.root.dl1.event.telescope.muon
         }
@@ -775,6 +809,7 @@ class HDF5EventSource(EventSource):
                     table._v_pathname,
                     containers=container,
                     prefixes=prefixes,
+                    lazy=self.lazy,
                 )
 
         return tel_group_readers
@@ -23,6 +23,7 @@ from .hdf5dataformat import (
     DL1_SUBARRAY_TRIGGER_TABLE,
     DL1_TEL_CALIBRATION_GROUP,
     DL1_TEL_ILLUMINATOR_THROUGHPUT_GROUP,
+    DL1_TEL_IMAGE_PIXELS_GROUP,
     DL1_TEL_IMAGES_GROUP,
     DL1_TEL_MUON_GROUP,
     DL1_TEL_MUON_THROUGHPUT_GROUP,
@@ -53,6 +54,7 @@ from .hdf5tableio import DEFAULT_FILTERS, get_column_attrs, get_node_meta, split
 COMPATIBLE_DATA_MODEL_VERSIONS = [
     "v7.2.0",
     "v7.3.0",
+    "v7.4.0",
 ]
 
 
@@ -84,6 +86,7 @@ _NODES_TO_CHECK = {
     DL1_SUBARRAY_TRIGGER_TABLE: NodeType.TABLE,
     DL1_TEL_TRIGGER_TABLE: NodeType.TABLE,
     DL1_TEL_IMAGES_GROUP: NodeType.TEL_GROUP,
+    DL1_TEL_IMAGE_PIXELS_GROUP: NodeType.TEL_GROUP,
     DL1_TEL_PARAMETERS_GROUP: NodeType.TEL_GROUP,
     DL1_TEL_MUON_GROUP: NodeType.TEL_GROUP,
     DL1_SUBARRAY_POINTING_GROUP: NodeType.TABLE,
@@ -450,6 +453,10 @@ class HDF5Merger(Component):
         if self.dl1_images and DL1_TEL_IMAGES_GROUP in other.root:
             self._append_table_group(other, other.root[DL1_TEL_IMAGES_GROUP])
 
+        # pixels of images stored in the sparse layout
+        if self.dl1_images and DL1_TEL_IMAGE_PIXELS_GROUP in other.root:
+            self._append_table_group(other, other.root[DL1_TEL_IMAGE_PIXELS_GROUP])
+
         if self.dl1_parameters and DL1_TEL_PARAMETERS_GROUP in other.root:
             self._append_table_group(other, other.root[DL1_TEL_PARAMETERS_GROUP])
 
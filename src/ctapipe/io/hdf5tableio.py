@@ -1,6 +1,8 @@
 """Implementations of TableWriter and -Reader for HDF5 files"""
 
 import enum
+import re
+from functools import partial
 from pathlib import PurePath
 
 import numpy as np
@@ -11,10 +13,12 @@ from astropy.units import Quantity
 import ctapipe
 
 from ..core import Container, Map
+from ..core.container import lazy_container
 from .tableio import (
     EnumColumnTransform,
     FixedPointColumnTransform,
     QuantityColumnTransform,
+    QuantizationColumnTransform,
     StringTransform,
     TableReader,
     TableWriter,
@@ -158,6 +162,15 @@ def get_column_transforms(column_attrs):
             transform = TimeColumnTransform(scale=scale, format=time_format)
             transforms[colname] = transform
 
+        elif col_attrs.get("TRANSFORM") == "quantization":
+            transform = QuantizationColumnTransform(
+                resolution=col_attrs["TRANSFORM_RESOLUTION"],
+                relative_resolution=col_attrs.get("TRANSFORM_RELATIVE_RESOLUTION", 0),
+                source_dtype=col_attrs.get("TRANSFORM_DTYPE", "float32"),
+                target_dtype=col_attrs["DTYPE"].base,
+            )
+            transforms[colname] = transform
+
         elif scale := col_attrs.get("TRANSFORM_SCALE"):
             transform = FixedPointColumnTransform(
                 scale=scale,
@@ -220,6 +233,11 @@ class HDF5TableWriter(TableWriter):
     filters: pytables.Filters
         A set of filters (compression settings) to be used for
         all datasets created by this writer.
+        Can be overridden for specific tables using `add_table_options`.
+    expectedrows: int or None
+        Expected number of rows of the tables, used by pytables
+        to choose the chunk shape and the size of internal buffers.
+        If None, the pytables default is used.
     kwargs:
         any other arguments that will be passed through to ``pytables.open_file``.
     """
@@ -232,6 +250,7 @@ class HDF5TableWriter(TableWriter):
         mode="w",
         root_uep="/",
         filters=DEFAULT_FILTERS,
+        expectedrows=None,
         parent=None,
         config=None,
         **kwargs,
@@ -239,6 +258,7 @@ class HDF5TableWriter(TableWriter):
         super().__init__(add_prefix=add_prefix, parent=parent, config=config)
         self._schemas = {}
         self._tables = {}
+        self._table_options = []
 
         if mode not in ["a", "w", "r+"]:
             raise OSError(f"The mode '{mode}' is not supported for writing")
@@ -248,6 +268,7 @@ class HDF5TableWriter(TableWriter):
         self.open(str(filename), **kwargs)
         self._group = "/" + group_name
         self.filters = filters
+        self.expectedrows = expectedrows
 
         self.log.debug("h5file: %s", self.h5file)
 
@@ -258,6 +279,76 @@ class HDF5TableWriter(TableWriter):
     def close(self):
         self.h5file.close()
 
+    def add_table_options(
+        self,
+        table_regexp,
+        filters=None,
+        chunkshape=None,
+        chunk_bytes=None,
+        expectedrows=None,
+    ):
+        """
+        Set storage options for the tables matching ``table_regexp``.
+
+        The options only apply to tables created after calling this method.
+        If several patterns match a table, options given later take precedence,
+        options not given by any matching pattern use the defaults of the writer.
+
+        Parameters
+        ----------
+        table_regexp: str
+            regular expression matching the table name (via re.fullmatch)
+        filters: tables.Filters or None
+            compression settings of the tables
+        chunkshape: int or None
+            number of rows per chunk
+        chunk_bytes: int or None
+            target size of a chunk in bytes, the number of rows per chunk
+            is computed from the row size of each table.
+            Takes precedence over ``chunkshape`` given for the same pattern.
+        expectedrows: int or None
+            expected number of rows of the tables
+        """
+        options = dict(
+            filters=filters,
+            chunkshape=chunkshape,
+            chunk_bytes=chunk_bytes,
+            expectedrows=expectedrows,
+        )
+        options = {k: v for k, v in options.items() if v is not None}
+        # the chunk size of a later pattern replaces both settings
+        if chunk_bytes is not None:
+            options["chunkshape"] = None
+        elif chunkshape is not None:
+            options["chunk_bytes"] = None
+
+        table_regexp = table_regexp.lstrip("/")
+        self._table_options.append((re.compile(table_regexp), options))
+        self.log.debug("Added table options for %s: %s", table_regexp, options)
+
+    def _get_table_options(self, table_name, rowsize):
+        """Storage options for a new table, see `add_table_options`"""
+        options = dict(
+            filters=self.filters,
+            chunkshape=None,
+            chunk_bytes=None,
+            expectedrows=self.expectedrows,
+        )
+        for table_regexp, pattern_options in self._table_options:
+            if table_regexp.fullmatch(table_name):
+                options.update(pattern_options)
+
+        chunk_bytes = options.pop("chunk_bytes")
+        if chunk_bytes is not None:
+            options["chunkshape"] = max(1, chunk_bytes // rowsize)
+
+        if options["chunkshape"] is not None:
+            options["chunkshape"] = (options["chunkshape"],)
+
+        if options["expectedrows"] is None:
+            del options["expectedrows"]
+        return options
+
     def _add_column_to_schema(
         self, table_name, schema, meta, field, name, value, time_format
     ):
@@ -422,15 +513,18 @@ class HDF5TableWriter(TableWriter):
             meta.update(container.meta)  # copy metadata from container
 
         if table_path not in self.h5file:
+            schema = self._schemas[table_name]
+            rowsize = tables.Description(schema().columns)._v_dtype.itemsize
+            options = self._get_table_options(table_name, rowsize)
             table = self.h5file.create_table(
                 where=table_group,
                 name=table_basename,
                 title="Storage of {}".format(
                     ",".join(c.__class__.__name__ for c in containers)
                 ),
-                description=self._schemas[table_name],
+                description=schema,
                 createparents=True,
-                filters=self.filters,
+                **options,
             )
             self.log.debug(f"CREATED TABLE: {table}")
             for key, val in meta.items():
@@ -492,6 +586,22 @@ class HDF5TableWriter(TableWriter):
         self._append_row(table_name, containers)
 
 
+class _LazyRow:
+    """A row of a table that is only read on first request"""
+
+    __slots__ = ("table", "index", "_row")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+        self._row = None
+
+    def get(self):
+        if self._row is None:
+            self._row = self.table[self.index]
+        return self._row
+
+
 class HDF5TableReader(TableReader):
     """
     Reader that reads a single row of an HDF5 table at once into a Container.
@@ -604,7 +714,9 @@ class HDF5TableReader(TableReader):
                 else:
                     col_name = field_name if prefix == "" else f"{prefix}_{field_name}"
 
-                if col_name in ignore_columns:
+                if col_name in ignore_columns or (
+                    col_name is None and field_name in ignore_columns
+                ):
                     continue
 
                 elif col_name is None or col_name not in column_attrs:
@@ -639,7 +751,25 @@ class HDF5TableReader(TableReader):
                     "that does not map to any of the specified containers"
                 )
 
-    def read(self, table_name, containers, prefixes=None, ignore_columns=None):
+    def _read_fields(self, table_name, row, mapping, missing_fields):
+        """Convert the columns of a table row into container field values"""
+        if isinstance(row, _LazyRow):
+            row = row.get()
+
+        data = {
+            field_name: self._apply_col_transform(table_name, col_name, row[col_name])
+            for field_name, col_name in mapping.items()
+        }
+
+        # set missing fields to None
+        for field_name in missing_fields:
+            data[field_name] = None
+
+        return data
+
+    def read(
+        self, table_name, containers, prefixes=None, ignore_columns=None, lazy=False
+    ):
         """
         Returns a generator that reads the next row from the table into the
         given container. The generator returns the same container. Note that
@@ -661,6 +791,10 @@ class HDF5TableReader(TableReader):
             If a string is provided, it is used as prefix for all containers.
             If a list is provided, the length needs to match th number
             of containers.
+        lazy: bool
+            If True, the generator yields containers that only read
+            their row from the table when one of their fields is accessed
+            for the first time. All containers of the same row share a single read.
         """
 
         ignore_columns = set(ignore_columns) if ignore_columns is not None else set()
@@ -706,27 +840,34 @@ class HDF5TableReader(TableReader):
         mappings = self._col_mapping[table_name]
 
         for row_index in range(len(tab)):
-            # looping over table yields Row instances.
-            # __getitem__ just gives plain numpy data
-            row = tab[row_index]
+            if lazy:
+                row = _LazyRow(tab, row_index)
+            else:
+                # looping over table yields Row instances.
+                # __getitem__ just gives plain numpy data
+                row = tab[row_index]
 
             ret = []
             for cls, prefix, mapping, missing_fields in zip(
                 containers, prefixes, mappings, missing
             ):
-                data = {
-                    field_name: self._apply_col_transform(
-                        table_name, col_name, row[col_name]
+                if lazy:
+                    container = lazy_container(
+                        cls,
+                        partial(
+                            self._read_fields,
+                            table_name,
+                            row,
+                            mapping,
+                            missing_fields,
+                        ),
+                        prefix=prefix,
+                        meta=self._meta[table_name],
                     )
-                    for field_name, col_name in mapping.items()
-                }
-
-                # set missing fields to None
-                for field_name in missing_fields:
-                    data[field_name] = None
-
-                container = cls(**data, prefix=prefix)
-                container.meta = self._meta[table_name]
+                else:
+                    data = self._read_fields(table_name, row, mapping, missing_fields)
+                    container = cls(**data, prefix=prefix)
+                    container.meta = self._meta[table_name]
                 ret.append(container)
 
             if return_iterable:
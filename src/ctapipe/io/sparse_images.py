@@ -0,0 +1,325 @@
+"""
+Pixel-sparse storage of DL1 images.
+
+After image cleaning, only a small fraction of the pixels of a camera
+carries signal. In the sparse layout, written by `~ctapipe.io.DataWriter`
+if ``DataWriter.sparse_dl1_images`` is set, only the pixels in the
+dilated image mask are stored:
+
+- The table of each telescope in ``/dl1/event/telescope/images`` contains
+  one row per telescope event as for the dense layout, but instead of the
+  ``image``, ``peak_time`` and ``image_mask`` columns, it contains the number of
+  stored pixels of each event in the ``n_stored_pixels`` column.
+- The table of each telescope in ``/dl1/event/telescope/image_pixels`` contains
+  one row per stored pixel, with the ``pixel_id`` and the values of
+  the stored pixels of each event one after the other.
+
+As only the number of pixels and not the offsets into the pixel table
+are stored, the tables of several files can simply be appended to each other.
+
+`~ctapipe.io.HDF5EventSource` and `~ctapipe.io.TableLoader` convert the
+images back into dense arrays when reading, pixels not stored are filled
+with `SPARSE_FILL_VALUES`.
+"""
+
+import numpy as np
+import tables
+
+from ..containers import DL1CameraContainer
+from ..core import Container, Field
+from .hdf5dataformat import DL1_TEL_IMAGE_PIXELS_GROUP
+from .hdf5tableio import get_column_attrs, get_column_transforms, split_h5path
+
+__all__ = [
+    "SPARSE_IMAGE_COLUMNS",
+    "SPARSE_FILL_VALUES",
+    "N_STORED_PIXELS_COLUMN",
+    "SparseImageIndexContainer",
+    "SparseImageWriter",
+    "SparseImageReader",
+    "is_sparse_image_table",
+    "get_sparse_image_reader",
+]
+
+#: columns of `~ctapipe.containers.DL1CameraContainer` stored in the pixel table
+SPARSE_IMAGE_COLUMNS = ("image", "peak_time", "image_mask")
+
+#: values of the pixels not stored when converting back to dense images
+SPARSE_FILL_VALUES = {"image": 0.0, "peak_time": np.nan, "image_mask": False}
+
+#: column of the images table with the number of stored pixels
+N_STORED_PIXELS_COLUMN = "n_stored_pixels"
+
+
+class SparseImageIndexContainer(Container):
+    """Number of stored pixels of a telescope event in the sparse image layout"""
+
+    default_prefix = ""
+
+    n_stored_pixels = Field(
+        np.int32(0),
+        "Number of pixels of this event stored in the image pixel table",
+        dtype=np.int32,
+    )
+
+
+def is_sparse_image_table(table):
+    """Check if a table of the images group uses the sparse layout
+
+    Parameters
+    ----------
+    table : tables.Table or astropy.table.Table
+        table of a telescope in ``/dl1/event/telescope/images``
+    """
+    return N_STORED_PIXELS_COLUMN in table.colnames
+
+
+def _pixel_dtype(n_pixels):
+    return np.uint16 if n_pixels <= np.iinfo(np.uint16).max else np.uint32
+
+
+class SparseImageWriter:
+    """
+    Write the pixels in the dilated image mask of DL1 images into the pixel tables.
+
+    The pixels are buffered and appended to the pixel tables of each
+    telescope in chunks. The number of stored pixels returned by `__call__`
+    has to be written to the images table.
+
+    Parameters
+    ----------
+    writer : ctapipe.io.HDF5TableWriter
+        Writer of the output file, the pixel tables are created
+        using its storage options.
+    subarray : ctapipe.instrument.SubarrayDescription
+        Subarray of the events, to get the camera geometries
+    n_dilations : int
+        Number of rows of neighbors added to the image mask.
+        If an event has no image mask, all pixels are stored.
+    columns : tuple[str]
+        Columns of `~ctapipe.containers.DL1CameraContainer` to store
+    transforms : dict[str, ctapipe.io.tableio.FixedPointColumnTransform]
+        Transforms applied to the stored values of the columns
+    buffer_size : int
+        Number of buffered pixels after which the pixels are written
+    """
+
+    def __init__(
+        self,
+        writer,
+        subarray,
+        n_dilations=1,
+        columns=SPARSE_IMAGE_COLUMNS,
+        transforms=None,
+        buffer_size=1_000_000,
+    ):
+        # imported here, so that reading sparse images does not need numba
+        from ..image.cleaning import dilate
+
+        self._dilate = dilate
+        self.writer = writer
+        self.subarray = subarray
+        self.n_dilations = n_dilations
+        self.columns = tuple(columns)
+        self.transforms = transforms if transforms is not None else {}
+        self.buffer_size = buffer_size
+
+        self._buffers = {}
+        self._n_buffered = 0
+        self._tables = {}
+
+    def __call__(self, tel_id, dl1: DL1CameraContainer):
+        """
+        Buffer the pixels to be stored of one telescope event.
+
+        Returns
+        -------
+        SparseImageIndexContainer
+            The number of stored pixels, to be written into the images table
+        """
+        geometry = self.subarray.tel[tel_id].camera.geometry
+
+        if dl1.image_mask is None:
+            mask = np.ones(geometry.n_pixels, dtype=bool)
+        else:
+            mask = dl1.image_mask
+            for _ in range(self.n_dilations):
+                mask = self._dilate(geometry, mask)
+
+        pixel_id = np.flatnonzero(mask).astype(_pixel_dtype(geometry.n_pixels))
+        values = {"pixel_id": pixel_id}
+        for column in self.columns:
+            value = dl1[column]
+            if value is not None:
+                # pixels are the last axis, the pixel table has one row per pixel
+                values[column] = np.moveaxis(value[..., pixel_id], -1, 0)
+
+        self._buffers.setdefault(tel_id, []).append(values)
+        self._n_buffered += len(pixel_id)
+        if self._n_buffered >= self.buffer_size:
+            self.flush()
+
+        return SparseImageIndexContainer(n_stored_pixels=np.int32(len(pixel_id)))
+
+    def flush(self):
+        """Write all buffered pixels"""
+        for tel_id, buffer in self._buffers.items():
+            if len(buffer) == 0:
+                continue
+
+            columns = buffer[0].keys()
+            data = {col: np.concatenate([v[col] for v in buffer]) for col in columns}
+            for column, transform in self.transforms.items():
+                if column in data:
+                    data[column] = transform(data[column])
+
+            table = self._get_table(tel_id, data)
+            rows = np.empty(len(data["pixel_id"]), dtype=table.dtype)
+            for column, value in data.items():
+                rows[column] = value
+            table.append(rows)
+            buffer.clear()
+
+        self._n_buffered = 0
+
+    def _get_table(self, tel_id, data):
+        table = self._tables.get(tel_id)
+        if table is not None:
+            return table
+
+        dtype = np.dtype(
+            [(column, value.dtype, value.shape[1:]) for column, value in data.items()]
+        )
+        table_path = f"{DL1_TEL_IMAGE_PIXELS_GROUP}/tel_{tel_id:03d}"
+        options = self.writer._get_table_options(table_path.lstrip("/"), dtype.itemsize)
+        table = self.writer.h5file.create_table(
+            *split_h5path(table_path),
+            description=dtype,
+            createparents=True,
+            **options,
+        )
+
+        n_pixels = self.subarray.tel[tel_id].camera.geometry.n_pixels
+        table.attrs["N_PIXELS"] = n_pixels
+        for pos, column in enumerate(data):
+            if column == "pixel_id":
+                description = "Index of the stored pixel"
+            else:
+                description = DL1CameraContainer.fields[column].description
+            table.attrs[f"CTAFIELD_{pos}_DESC"] = description
+
+            if column in self.transforms:
+                for key, value in self.transforms[column].get_meta(pos).items():
+                    table.attrs[key] = value
+
+        self._tables[tel_id] = table
+        return table
+
+
+class SparseImageReader:
+    """
+    Read the images of one telescope stored in the sparse layout as dense arrays.
+
+    Parameters
+    ----------
+    images_table : tables.Table
+        Table of the telescope in ``/dl1/event/telescope/images``
+    pixel_table : tables.Table
+        Table of the telescope in ``/dl1/event/telescope/image_pixels``
+    """
+
+    def __init__(self, images_table, pixel_table):
+        counts = images_table.col(N_STORED_PIXELS_COLUMN).astype(np.int64)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+
+        self.pixel_table = pixel_table
+        self.n_pixels = int(pixel_table.attrs["N_PIXELS"])
+        self.columns = [c for c in pixel_table.colnames if c in SPARSE_IMAGE_COLUMNS]
+        self._transforms = get_column_transforms(get_column_attrs(pixel_table))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def read(self, start=None, stop=None, coordinates=None, columns=None):
+        """
+        Read dense images of the rows ``start:stop`` or ``coordinates``.
+
+        Parameters
+        ----------
+        start, stop : int or None
+            Range of rows of the images table to read
+        coordinates : np.ndarray or None
+            Indices of rows of the images table to read, exclusive with
+            ``start`` and ``stop``
+        columns : Iterable[str] or None
+            Only read these of `SPARSE_IMAGE_COLUMNS`, if given
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Dense arrays with pixels in the last axis and one entry per row
+        """
+        if coordinates is None:
+            start, stop, _ = slice(start, stop).indices(len(self))
+            coordinates = np.arange(start, stop)
+        coordinates = np.asarray(coordinates, dtype=np.int64)
+
+        pixel_start = self.offsets[coordinates]
+        counts = self.offsets[coordinates + 1] - pixel_start
+        n_stored = int(counts.sum())
+
+        if len(coordinates) == 0 or np.all(np.diff(coordinates) == 1):
+            first = pixel_start[0] if len(coordinates) > 0 else 0
+            pixels = self.pixel_table.read(first, first + n_stored)
+        else:
+            # indices of the pixel rows of all requested events
+            row_start = np.cumsum(counts) - counts
+            pixel_rows = np.repeat(pixel_start - row_start, counts) + np.arange(
+                n_stored
+            )
+            pixels = self.pixel_table.read_coordinates(pixel_rows)
+
+        rows = np.repeat(np.arange(len(coordinates)), counts)
+        pixel_id = pixels["pixel_id"]
+
+        dense = {}
+        for column in self.columns:
+            if columns is not None and column not in columns:
+                continue
+
+            values = pixels[column]
+            if column in self._transforms:
+                values = self._transforms[column].inverse(values)
+
+            fill_value = SPARSE_FILL_VALUES[column]
+            if values.dtype.kind not in "fc":
+                fill_value = np.zeros(1, dtype=values.dtype)[0]
+
+            shape = (len(coordinates), *values.shape[1:], self.n_pixels)
+            dense[column] = np.full(shape, fill_value, dtype=values.dtype)
+            dense[column][rows, ..., pixel_id] = values
+
+        return dense
+
+    def iter_rows(self, chunk_size=1000):
+        """Iterate over the rows, yielding the dense images of one row at a time
+
+        The pixels are read and converted in chunks of ``chunk_size`` rows.
+        """
+        for start in range(0, len(self), chunk_size):
+            chunk = self.read(start, start + chunk_size)
+            n_rows = min(chunk_size, len(self) - start)
+            for i in range(n_rows):
+                yield {column: values[i] for column, values in chunk.items()}
+
+
+def get_sparse_image_reader(h5file, images_table):
+    """SparseImageReader for a table of the images group, None for dense images"""
+    if not is_sparse_image_table(images_table):
+        return None
+
+    key = f"{DL1_TEL_IMAGE_PIXELS_GROUP}/{images_table.name}"
+    if key not in h5file.root:
+        raise tables.NoSuchNodeError(f"Sparse image table {key} is missing")
+    return SparseImageReader(images_table, h5file.root[key])
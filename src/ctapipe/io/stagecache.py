@@ -0,0 +1,380 @@
+"""
+Cache for the results of the DL1 processing stages of ``ctapipe-process``.
+
+The results of each stage are stored in a sidecar HDF5 file, whose name
+is a hash of the identity of the input file and the configuration of all
+components the stage depends on. Running again on the same input
+with a matching configuration reads the results from the cache instead of
+recomputing them.
+"""
+
+import enum
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import tables
+
+from ..containers import (
+    DL1CameraContainer,
+    ImageParametersContainer,
+    TelEventIndexContainer,
+)
+from ..core import Component, Provenance
+from ..version import __version__
+from .astropy_helpers import read_table, write_table
+from .hdf5tableio import HDF5TableReader, HDF5TableWriter
+
+__all__ = [
+    "DL1Stage",
+    "DL1StageCache",
+    "get_config_hash",
+]
+
+IMAGE_STATISTICS_TABLE = "/image_statistics"
+
+#: image parameters computed for the true image, no peak time based containers
+TRUE_PARAMETER_NAMES = [
+    "hillas",
+    "leakage",
+    "concentration",
+    "morphology",
+    "intensity_statistics",
+]
+
+
+class DL1Stage(enum.IntEnum):
+    """DL1 processing stages that can be cached, in processing order"""
+
+    #: calibrated images and peak times, output of `~ctapipe.calib.CameraCalibrator`
+    IMAGES = 1
+    #: cleaning masks and image parameters, output of `~ctapipe.image.ImageProcessor`
+    PARAMETERS = 2
+
+
+def _json_default(value):
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def get_config_hash(*configs):
+    """
+    Compute a stable hash of json-serializable configuration values.
+
+    Parameters
+    ----------
+    *configs
+        Configuration values, e.g. the result of
+        `~ctapipe.core.Component.get_current_config`.
+        Values that are not json-serializable are hashed by their ``str``.
+
+    Returns
+    -------
+    str
+        hexadecimal sha256 digest
+    """
+    serialized = json.dumps(configs, sort_keys=True, default=_json_default)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _get_file_identity(path):
+    path = Path(path).expanduser().absolute()
+    stat = path.stat()
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+class _TableCursor:
+    """Read the rows of a telescope table belonging to the current event"""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self._next = next(rows, None)
+
+    def pop(self, obs_id, event_id):
+        """Return the containers of the next row if it belongs to the given event"""
+        row = self._next
+        if row is None or row[0].obs_id != obs_id or row[0].event_id != event_id:
+            return None
+
+        self._next = next(self._rows, None)
+        return row
+
+
+class DL1StageCache(Component):
+    """
+    Read and write the results of the DL1 processing stages from / to a cache directory.
+
+    Stages with results available in the cache are filled into the events
+    by `DL1StageCache.fill`, the results of the stages computed in
+    this run are stored by calling the instance on each event.
+    Cache files are only created when `DL1StageCache.finish` is called,
+    so interrupted runs don't leave incomplete results behind.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        Directory for the cache files, created if it does not exist.
+    event_source : ctapipe.io.EventSource
+        The event source, the identity of its input file (path, size, modification time)
+        and its configuration are part of the cache key.
+    components : list[ctapipe.core.Component]
+        Further components that select or modify events before the cached
+        stages, e.g. event filters or monitoring sources.
+    calibrator : ctapipe.calib.CameraCalibrator or None
+        If given, the `DL1Stage.IMAGES` stage is cached.
+    image_processor : ctapipe.image.ImageProcessor or None
+        If given, the `DL1Stage.PARAMETERS` stage is cached.
+    """
+
+    def __init__(
+        self,
+        cache_dir,
+        event_source,
+        components=(),
+        calibrator=None,
+        image_processor=None,
+        config=None,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(config=config, parent=parent, **kwargs)
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.paths = self._get_cache_paths(
+            event_source, components, calibrator, image_processor
+        )
+
+        self._parameter_classes = {}
+        if image_processor is not None:
+            self._parameter_classes = {
+                name: (container.__class__, container.prefix)
+                for name, container in image_processor.default_image_container.items()
+            }
+
+        #: the last stage with results in the cache, or None
+        self.cached_stage = None
+        for stage, path in self.paths.items():
+            if path.exists():
+                self.cached_stage = stage
+
+        self._h5file = None
+        self._cursors = {}
+        if self.cached_stage is not None:
+            self._setup_reader()
+
+        self._writers = {}
+        self._tmp_paths = {}
+        for stage, path in self.paths.items():
+            if self.cached_stage is None or stage > self.cached_stage:
+                self._setup_writer(stage, path)
+
+        self.log.info(
+            "Cached stage: %s, caching stages: %s",
+            self.cached_stage.name if self.cached_stage is not None else None,
+            [stage.name for stage in self._writers],
+        )
+
+    def _get_cache_paths(self, event_source, components, calibrator, image_processor):
+        key = get_config_hash(
+            __version__,
+            _get_file_identity(event_source.input_url),
+            event_source.get_current_config(),
+            *(component.get_current_config() for component in components),
+        )
+
+        paths = {}
+        if calibrator is not None:
+            key = get_config_hash(key, calibrator.get_current_config())
+            paths[DL1Stage.IMAGES] = self.cache_dir / f"{key}.dl1_images.h5"
+
+        if image_processor is not None:
+            key = get_config_hash(key, image_processor.get_current_config())
+            paths[DL1Stage.PARAMETERS] = self.cache_dir / f"{key}.dl1_parameters.h5"
+
+        return paths
+
+    def _setup_reader(self):
+        path = self.paths[self.cached_stage]
+        self.log.info("Reading cached %s from %s", self.cached_stage.name, path)
+        Provenance().add_input_file(path, role="DL1 stage cache", add_meta=False)
+
+        self._h5file = tables.open_file(path)
+        reader = HDF5TableReader(self._h5file)
+
+        ignore_columns = {"parameters"}
+        if self.cached_stage is DL1Stage.IMAGES:
+            ignore_columns.add("image_mask")
+
+        groups = {
+            "images": ((TelEventIndexContainer, DL1CameraContainer), [None, ""]),
+        }
+        if self.cached_stage is DL1Stage.PARAMETERS:
+            classes, prefixes = zip(*self._parameter_classes.values())
+            groups["parameters"] = (
+                (TelEventIndexContainer, *classes),
+                [None, *prefixes],
+            )
+            classes, prefixes = zip(
+                *(self._parameter_classes[name] for name in TRUE_PARAMETER_NAMES)
+            )
+            groups["true_parameters"] = (
+                (TelEventIndexContainer, *classes),
+                [None, *(f"true_{prefix}" for prefix in prefixes)],
+            )
+
+        for group, (containers, prefixes) in groups.items():
+            self._cursors[group] = {}
+            if f"/{group}" not in self._h5file:
+                continue
+
+            for table in self._h5file.root[group]:
+                rows = reader.read(
+                    f"/{group}/{table.name}",
+                    containers,
+                    prefixes=prefixes,
+                    ignore_columns=ignore_columns,
+                )
+                self._cursors[group][table.name] = _TableCursor(rows)
+
+    def _setup_writer(self, stage, path):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.part")
+        writer = HDF5TableWriter(tmp_path, parent=self, mode="w", add_prefix=True)
+        writer.exclude("/images/.*", "parameters")
+        if stage is DL1Stage.IMAGES:
+            writer.exclude("/images/.*", "image_mask")
+
+        self._writers[stage] = writer
+        self._tmp_paths[stage] = tmp_path
+
+    def fill(self, event):
+        """
+        Fill the cached results into ``event``.
+
+        Returns
+        -------
+        stage : DL1Stage or None
+            The last stage filled into the event, None if nothing was cached.
+        """
+        if self.cached_stage is None:
+            return None
+
+        obs_id = event.index.obs_id
+        event_id = event.index.event_id
+
+        for key, cursor in self._cursors["images"].items():
+            row = cursor.pop(obs_id, event_id)
+            if row is None:
+                continue
+
+            index, dl1_camera = row
+            tel_id = int(index.tel_id)
+            event.dl1.tel[tel_id] = dl1_camera
+
+            if self.cached_stage is not DL1Stage.PARAMETERS:
+                continue
+
+            row = self._cursors["parameters"][key].pop(obs_id, event_id)
+            dl1_camera.parameters = ImageParametersContainer(
+                **dict(zip(self._parameter_classes, row[1:]))
+            )
+
+            true_cursor = self._cursors["true_parameters"].get(key)
+            row = true_cursor.pop(obs_id, event_id) if true_cursor else None
+            if row is not None:
+                event.simulation.tel[tel_id].true_parameters = ImageParametersContainer(
+                    **dict(zip(TRUE_PARAMETER_NAMES, row[1:]))
+                )
+
+        return self.cached_stage
+
+    def __call__(self, event):
+        """Store the results of the stages that are not yet cached"""
+        if not self._writers:
+            return
+
+        for tel_id, dl1_camera in event.dl1.tel.items():
+            index = TelEventIndexContainer(
+                obs_id=event.index.obs_id,
+                event_id=event.index.event_id,
+                tel_id=np.int16(tel_id),
+            )
+            table_name = f"tel_{tel_id:03d}"
+            dl1_camera.prefix = ""
+
+            for stage, writer in self._writers.items():
+                writer.write(f"images/{table_name}", [index, dl1_camera])
+
+                if stage is not DL1Stage.PARAMETERS:
+                    continue
+
+                writer.write(
+                    f"parameters/{table_name}",
+                    [index, *dl1_camera.parameters.values()],
+                )
+
+                simulation = event.simulation
+                if (
+                    simulation is not None
+                    and tel_id in simulation.tel
+                    and simulation.tel[tel_id].true_image is not None
+                ):
+                    true_parameters = simulation.tel[tel_id].true_parameters
+                    writer.write(
+                        f"true_parameters/{table_name}",
+                        [index, *(true_parameters[n] for n in TRUE_PARAMETER_NAMES)],
+                    )
+
+    def finish(self, image_query=None):
+        """
+        Complete the cache files of the stages computed in this run.
+
+        Parameters
+        ----------
+        image_query : ctapipe.image.ImageQualityQuery or None
+            The image quality query of the image processor.
+            Its counts are stored with the cached parameters and restored
+            when reading the parameters from the cache, so the image statistics
+            are the same as when computing the parameters.
+        """
+        if image_query is not None and self.cached_stage is DL1Stage.PARAMETERS:
+            path = self.paths[DL1Stage.PARAMETERS]
+            statistics = read_table(path, IMAGE_STATISTICS_TABLE)
+            image_query._counts += statistics["counts"]
+            image_query._cumulative_counts += statistics["cumulative_counts"]
+
+        for stage, writer in self._writers.items():
+            writer.close()
+            tmp_path = self._tmp_paths[stage]
+
+            if stage is DL1Stage.PARAMETERS and image_query is not None:
+                write_table(image_query.to_table(), tmp_path, IMAGE_STATISTICS_TABLE)
+
+            path = self.paths[stage]
+            os.replace(tmp_path, path)
+            self.log.info("Cached %s in %s", stage.name, path)
+            Provenance().add_output_file(path, role="DL1 stage cache")
+
+        self._writers.clear()
+        self._tmp_paths.clear()
+
+    def close(self):
+        """Close all files, incomplete cache files are removed"""
+        if self._h5file is not None:
+            self._h5file.close()
+            self._h5file = None
+
+        for stage, writer in self._writers.items():
+            writer.close()
+            self._tmp_paths[stage].unlink(missing_ok=True)
+        self._writers.clear()
+        self._tmp_paths.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,171 @@
+"""
+Report on the storage layout of the tables in HDF5 files.
+
+The size, compression ratio and throughput of a table depend on the chunk
+shape and compression filters chosen when writing it, e.g. by
+`~ctapipe.io.DataWriter`. The report summarizes these per group of tables,
+e.g. the images of all telescopes, to help tuning the storage options.
+
+Only uses pytables and astropy tables, so it stays cheap to import
+for the ``ctapipe-fileinfo`` tool.
+"""
+
+import time
+from collections import defaultdict
+
+import numpy as np
+import tables
+from astropy.table import Table
+
+__all__ = ["get_storage_report"]
+
+MB = 1024**2
+
+
+def _read_sample(table, max_rows):
+    """Read the first ``max_rows`` rows of ``table``, returning the rows and time"""
+    n_rows = min(table.nrows, max_rows)
+    start = time.perf_counter()
+    rows = table.read(0, n_rows)
+    return rows, time.perf_counter() - start
+
+
+def _write_sample(table, rows):
+    """Time writing ``rows`` into an in-memory table with the options of ``table``"""
+    with tables.open_file(
+        "storage_report.h5",
+        mode="w",
+        driver="H5FD_CORE",
+        driver_core_backing_store=0,
+    ) as h5file:
+        new_table = h5file.create_table(
+            "/",
+            "table",
+            description=table.description,
+            filters=table.filters,
+            chunkshape=table.chunkshape,
+        )
+        start = time.perf_counter()
+        new_table.append(rows)
+        new_table.flush()
+        return time.perf_counter() - start
+
+
+def _get_table_storage(table, max_rows, measure_write):
+    """Storage information of a single table"""
+    rows, read_time = _read_sample(table, max_rows)
+    write_time = 0.0
+    if measure_write and len(rows) > 0:
+        write_time = _write_sample(table, rows)
+
+    filters = table.filters
+    return dict(
+        n_rows=table.nrows,
+        rowsize=table.rowsize,
+        size_in_memory=table.size_in_memory,
+        size_on_disk=table.size_on_disk,
+        chunk_rows=table.chunkshape[0],
+        complib=filters.complib if filters.complevel > 0 else "none",
+        complevel=filters.complevel,
+        shuffle=filters.shuffle,
+        read_bytes=len(rows) * table.rowsize,
+        read_time=read_time,
+        write_time=write_time,
+    )
+
+
+def get_storage_report(path, max_rows=10_000, measure_write=False):
+    """
+    Summarize the storage of the tables in an HDF5 file per group.
+
+    All tables with the same parent group, e.g. the tables of all telescopes
+    in ``/dl1/event/telescope/images``, are summarized in one row.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        HDF5 file to inspect
+    max_rows : int
+        Maximum number of rows read from each table to measure the throughput
+    measure_write : bool
+        If True, also measure the write throughput by writing the rows read
+        into an in-memory file, using the same filters and chunk shape.
+
+    Returns
+    -------
+    astropy.table.Table
+        One row per group with the number of tables and rows, the uncompressed
+        and stored size, the compression ratio, the chunk shape, the filters
+        and the throughput in MB/s of uncompressed data.
+        If the tables of a group use different options, the ones of
+        the first table are reported.
+    """
+    groups = defaultdict(list)
+    with tables.open_file(path, mode="r") as h5file:
+        for table in h5file.walk_nodes("/", classname="Table"):
+            group = table._v_parent._v_pathname
+            groups[group].append(_get_table_storage(table, max_rows, measure_write))
+
+    rows = []
+    for group, infos in sorted(groups.items()):
+        first = infos[0]
+        size_in_memory = sum(info["size_in_memory"] for info in infos)
+        size_on_disk = sum(info["size_on_disk"] for info in infos)
+        read_bytes = sum(info["read_bytes"] for info in infos)
+        read_time = sum(info["read_time"] for info in infos)
+        write_time = sum(info["write_time"] for info in infos)
+
+        rows.append(
+            dict(
+                group=group,
+                n_tables=len(infos),
+                n_rows=sum(info["n_rows"] for info in infos),
+                uncompressed_size=size_in_memory / MB,
+                stored_size=size_on_disk / MB,
+                compression_ratio=(
+                    size_in_memory / size_on_disk if size_on_disk > 0 else np.nan
+                ),
+                chunk_rows=first["chunk_rows"],
+                chunk_size=first["chunk_rows"] * first["rowsize"] / 1024,
+                complib=first["complib"],
+                complevel=first["complevel"],
+                shuffle=first["shuffle"],
+                read_throughput=(
+                    read_bytes / MB / read_time if read_time > 0 else np.nan
+                ),
+                write_throughput=(
+                    read_bytes / MB / write_time if write_time > 0 else np.nan
+                ),
+            )
+        )
+
+    names = [
+        "group",
+        "n_tables",
+        "n_rows",
+        "uncompressed_size",
+        "stored_size",
+        "compression_ratio",
+        "chunk_rows",
+        "chunk_size",
+        "complib",
+        "complevel",
+        "shuffle",
+        "read_throughput",
+    ]
+    if measure_write:
+        names.append("write_throughput")
+
+    report = Table(rows=[[row[name] for name in names] for row in rows], names=names)
+    for name, unit in [
+        ("uncompressed_size", "MB"),
+        ("stored_size", "MB"),
+        ("chunk_size", "kB"),
+        ("read_throughput", "MB / s"),
+        ("write_throughput", "MB / s"),
+    ]:
+        if name in report.colnames:
+            report[name].unit = unit
+            report[name].format = ".2f"
+    report["compression_ratio"].format = ".2f"
+    return report
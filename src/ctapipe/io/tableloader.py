@@ -3,14 +3,18 @@ Class and related functions to read DL1 (a,b) and/or DL2 (a) data
 from an HDF5 file produced with ctapipe-process.
 """
 
+import multiprocessing
+import multiprocessing.util
 import warnings
 from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import tables
-from astropy.table import Table, hstack, vstack
+from astropy.table import Column, MaskedColumn, Table, hstack, vstack
 from astropy.utils.decorators import lazyproperty
+from astropy.utils.metadata import merge
 
 from ..core import Component, Provenance, traits
 from ..exceptions import InputMissing
@@ -19,6 +23,7 @@ from .astropy_helpers import join_allow_empty, read_table
 from .hdf5dataformat import (
     DL0_TEL_POINTING_GROUP,
     DL1_SUBARRAY_TRIGGER_TABLE,
+    DL1_TEL_IMAGE_PIXELS_GROUP,
     DL1_TEL_IMAGES_GROUP,
     DL1_TEL_MUON_GROUP,
     DL1_TEL_PARAMETERS_GROUP,
@@ -35,12 +40,18 @@ from .hdf5dataformat import (
     SIMULATION_RUN_TABLE,
     SIMULATION_SHOWER_TABLE,
 )
+from .sparse_images import (
+    N_STORED_PIXELS_COLUMN,
+    SPARSE_IMAGE_COLUMNS,
+    get_sparse_image_reader,
+)
 
 __all__ = ["TableLoader"]
 
 
 SUBARRAY_EVENT_KEYS = ["obs_id", "event_id"]
 TELESCOPE_EVENT_KEYS = ["obs_id", "event_id", "tel_id"]
+POINTING_COLUMNS = {"telescope_pointing_altitude", "telescope_pointing_azimuth"}
 
 
 Chunk = namedtuple("Chunk", ["start", "stop", "data"])
@@ -124,20 +135,183 @@ def _empty_telescope_events_table():
     return Table(names=TELESCOPE_EVENT_KEYS, dtype=[np.uint64, np.uint64, np.uint16])
 
 
+def _encode_keys(table1, table2, keys):
+    """
+    Encode the integer key columns of both tables into a single int64 value per row.
+
+    Returns None if the keys are not integers or not all combinations of the
+    key values fit into 64 bit.
+    """
+    encoded1 = np.zeros(len(table1), dtype=np.int64)
+    encoded2 = np.zeros(len(table2), dtype=np.int64)
+    n_combinations = 1
+
+    for key in keys:
+        col1 = table1[key]
+        col2 = table2[key]
+        if col1.dtype.kind not in "iu" or col2.dtype.kind not in "iu":
+            return None
+        if getattr(col1, "mask", None) is not None and np.any(col1.mask):
+            return None
+        if getattr(col2, "mask", None) is not None and np.any(col2.mask):
+            return None
+
+        col1 = np.asarray(col1)
+        col2 = np.asarray(col2)
+        low = min(int(col1.min()), int(col2.min()))
+        high = max(int(col1.max()), int(col2.max()))
+        n_values = high - low + 1
+        n_combinations *= n_values
+        if n_combinations > np.iinfo(np.int64).max:
+            return None
+
+        encoded1 *= n_values
+        encoded1 += col1.astype(np.int64) - low
+        encoded2 *= n_values
+        encoded2 += col2.astype(np.int64) - low
+
+    return encoded1, encoded2
+
+
+def _left_join(
+    table1,
+    table2,
+    keys,
+    table_names=("1", "2"),
+    uniq_col_name="{col_name}_{table_name}",
+):
+    """
+    Left join ``table2`` onto ``table1`` keeping the row order of ``table1``.
+
+    Instead of the generic `astropy.table.join`, the integer keys are
+    encoded into a single integer per row and the rows of ``table2``
+    are found using a binary search in the (usually already sorted) keys
+    of ``table2``. Columns of ``table2`` are then gathered using the found
+    row indices, columns of ``table1`` are not copied.
+
+    Falls back to `~ctapipe.io.astropy_helpers.join_allow_empty`
+    if the keys of ``table2`` are not unique or cannot be encoded.
+
+    The arguments ``table_names`` and ``uniq_col_name`` have the same meaning
+    as for `astropy.table.join`.
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+
+    if len(table1) == 0 or len(table2) == 0:
+        return table1.copy()
+
+    def fallback():
+        # keep_order adds a column to the left table, so don't pass table1 itself
+        return join_allow_empty(
+            table1.copy(copy_data=False),
+            table2,
+            keys,
+            "left",
+            keep_order=True,
+            table_names=list(table_names),
+            uniq_col_name=uniq_col_name,
+        )
+
+    encoded = _encode_keys(table1, table2, keys)
+    if encoded is None:
+        return fallback()
+    keys1, keys2 = encoded
+
+    order = None
+    if np.any(keys2[1:] <= keys2[:-1]):
+        order = np.argsort(keys2, kind="stable")
+        keys2 = keys2[order]
+        if np.any(keys2[1:] == keys2[:-1]):
+            return fallback()
+
+    indices = np.searchsorted(keys2, keys1)
+    np.clip(indices, 0, len(keys2) - 1, out=indices)
+    unmatched = keys2[indices] != keys1
+    if order is not None:
+        indices = order[indices]
+
+    columns2 = [name for name in table2.colnames if name not in keys]
+    duplicated = set(columns2).intersection(table1.colnames)
+
+    def unique_name(name, i):
+        if name not in duplicated:
+            return name
+        return uniq_col_name.format(col_name=name, table_name=table_names[i])
+
+    columns = []
+    for name in table1.colnames:
+        col = table1[name]
+        # like astropy, use the common dtype of the key columns
+        if name in keys and col.dtype != table2[name].dtype:
+            col = col.astype(np.result_type(col.dtype, table2[name].dtype))
+        columns.append(col)
+    names = [unique_name(name, 0) for name in table1.colnames]
+
+    any_unmatched = np.any(unmatched)
+    for name in columns2:
+        col = table2[name][indices]
+        if any_unmatched:
+            if isinstance(col, Column) and not isinstance(col, MaskedColumn):
+                col = MaskedColumn(col, copy=False)
+            col[unmatched] = np.ma.masked
+        columns.append(col)
+        names.append(unique_name(name, 1))
+
+    return table1.__class__(
+        columns,
+        names=names,
+        copy=False,
+        meta=merge(table1.meta, table2.meta, metadata_conflicts="warn"),
+    )
+
+
 def _join_subarray_events(table1, table2):
-    """Outer join two tables on the telescope subarray keys"""
-    return join_allow_empty(table1, table2, SUBARRAY_EVENT_KEYS, "left")
+    """Left join two tables on the telescope subarray keys"""
+    return _left_join(table1, table2, SUBARRAY_EVENT_KEYS)
+
 
+def _join_telescope_events(table1, table2, selected=False):
+    """Outer join two tables on the telescope event keys
 
-def _join_telescope_events(table1, table2):
-    """Outer join two tables on the telescope event keys"""
+    If ``selected`` is True, ``table1`` contains only selected events
+    and no events of ``table2`` are added.
+    """
     # we start with an empty table, but after the first non-empty, we perform
     # left joins
-    if len(table1) == 0:
-        how = "right"
-    else:
-        how = "left"
-    return join_allow_empty(table1, table2, TELESCOPE_EVENT_KEYS, how)
+    if len(table1) == 0 and not selected:
+        return join_allow_empty(table1, table2, TELESCOPE_EVENT_KEYS, "right")
+    return _left_join(table1, table2, TELESCOPE_EVENT_KEYS)
+
+
+def _expand_columns(columns):
+    """
+    Columns that need to be read to provide the requested output columns.
+
+    Columns present in both the telescope and subarray tables get the
+    suffix ``_mono`` for the telescope table when joining, so for these
+    we also need to read the unsuffixed name.
+    """
+    if columns is None:
+        return None
+
+    columns = set(columns)
+    return columns | {c.removesuffix("_mono") for c in columns}
+
+
+def _select_columns(h5table, columns, required=()):
+    """Names of the columns of ``h5table`` in ``columns`` or ``required``"""
+    if columns is None:
+        return None
+    return [c for c in h5table.colnames if c in columns or c in required]
+
+
+def _keep_columns(table, columns, required=()):
+    """Remove all columns from ``table`` that are not in ``columns`` or ``required``"""
+    if columns is None:
+        return table
+    keep = [c for c in table.colnames if c in columns or c in required]
+    return table[keep]
 
 
 def _merge_table_same_index(table1, table2, index_keys, fallback_join_type="left"):
@@ -150,10 +324,12 @@ def _merge_table_same_index(table1, table2, index_keys, fallback_join_type="left
     if len(table1) == 0:
         return table1
 
-    if not np.all(table1[index_keys] == table2[index_keys]):
+    if not all(np.array_equal(table1[key], table2[key]) for key in index_keys):
         warnings.warn(
             "Table order does not match, falling back to join", IndexNotMatching
         )
+        if fallback_join_type == "left":
+            return _left_join(table1, table2, index_keys)
         return join_allow_empty(table1, table2, index_keys, fallback_join_type)
 
     columns = [col for col in table2.columns if col not in index_keys]
@@ -168,6 +344,21 @@ def _merge_telescope_tables(table1, table2):
     return _merge_table_same_index(table1, table2, TELESCOPE_EVENT_KEYS)
 
 
+# TableLoader instance used by the worker processes, see TableLoader.n_workers
+_worker_loader = None
+
+
+def _init_worker(input_url, config, trait_values):
+    global _worker_loader
+    _worker_loader = TableLoader(input_url, config=config, **trait_values)
+    # close the file when the worker process exits
+    multiprocessing.util.Finalize(None, _worker_loader.close, exitpriority=10)
+
+
+def _read_telescope_events_worker(tel_id, kwargs):
+    return _worker_loader._read_telescope_events_for_id(tel_id, **kwargs)
+
+
 class TableLoader(Component):
     """
     Load telescope-event or subarray-event data from ctapipe HDF5 files
@@ -227,6 +418,28 @@ class TableLoader(Component):
         help="Load pointing information and interpolate / join to events",
     ).tag(config=True)
 
+    condition = traits.Unicode(
+        default_value=None,
+        allow_none=True,
+        help=(
+            "Only load telescope events for which this condition evaluates to true."
+            " The condition is evaluated in-kernel by pytables on the dl1 parameters"
+            " table of each telescope, e.g. 'hillas_intensity > 100'."
+            " See the pytables documentation for the supported syntax."
+        ),
+    ).tag(config=True)
+
+    n_workers = traits.Integer(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of worker processes used to read the tables of"
+            " different telescopes in parallel. Reading compressed tables"
+            " is limited by decompression, which is done on a single core"
+            " in the reading process. The result does not depend on this option."
+        ),
+    ).tag(config=True)
+
     focal_length_choice = traits.UseEnum(
         FocalLengthKind,
         default_value=FocalLengthKind.EFFECTIVE,
@@ -246,6 +459,7 @@ class TableLoader(Component):
         from ..monitoring.interpolation import PointingInterpolator
 
         self._should_close = False
+        self._executor = None
         # enable using input_url as posarg
         if input_url not in {None, traits.Undefined}:
             kwargs["input_url"] = input_url
@@ -260,7 +474,14 @@ class TableLoader(Component):
         else:
             if not isinstance(h5file, tables.File):
                 raise TypeError("h5file must be a tables.File")
-            self.input_url = Path(h5file.filename)
+            input_url = Path(h5file.filename)
+            # the worker processes open the file themselves
+            if self.n_workers > 1 and not input_url.is_file():
+                raise InputMissing(
+                    "n_workers > 1 requires h5file to be a file on disk,"
+                    f" got {input_url}"
+                )
+            self.input_url = input_url
             self.h5file = h5file
 
         self.subarray = SubarrayDescription.from_hdf(
@@ -276,7 +497,11 @@ class TableLoader(Component):
         )
 
     def close(self):
-        """Close the underlying hdf5 file"""
+        """Close the underlying hdf5 file and stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
         if self._should_close:
             self.h5file.close()
 
@@ -324,16 +549,138 @@ class TableLoader(Component):
             updated_attributes[key] = updated_value
         return updated_attributes
 
-    def _read_telescope_table(self, group, tel_id, start=None, stop=None):
+    def _read_telescope_table(
+        self, group, tel_id, start=None, stop=None, columns=None, coordinates=None
+    ):
+        """Read the table of ``tel_id`` in ``group``
+
+        If ``coordinates`` of rows of the dl1 parameters table of the same
+        telescope are given, only the corresponding rows are read if the table
+        is row-aligned with the parameters table. Otherwise, the rows are
+        selected using the telescope event keys.
+        """
         key = f"{group}/tel_{tel_id:03d}"
 
-        if key in self.h5file:
-            table = read_table(self.h5file, key, start=start, stop=stop)
-        else:
-            table = _empty_telescope_events_table()
+        if key not in self.h5file:
+            return _empty_telescope_events_table()
+
+        h5table = self.h5file.root[key]
+        if coordinates is None:
+            return self._read_h5_table(group, h5table, start, stop, columns)
+
+        if len(coordinates) == 0 or group == DL1_TEL_PARAMETERS_GROUP:
+            return self._read_h5_table(group, h5table, None, None, columns, coordinates)
+
+        expected = read_table(
+            self.h5file,
+            f"{DL1_TEL_PARAMETERS_GROUP}/tel_{tel_id:03d}",
+            coordinates=coordinates,
+            columns=list(TELESCOPE_EVENT_KEYS),
+        )
+        if self._is_aligned(h5table, tel_id):
+            table = self._read_h5_table(
+                group, h5table, None, None, columns, coordinates
+            )
+            if all(np.array_equal(table[k], expected[k]) for k in TELESCOPE_EVENT_KEYS):
+                return table
+
+        # not row-aligned with the parameters, select the rows by their keys
+        table = self._read_h5_table(group, h5table, start, stop, columns)
+        return _left_join(expected, table, TELESCOPE_EVENT_KEYS)
+
+    def _read_h5_table(self, group, h5table, start, stop, columns, coordinates=None):
+        """Read rows of the telescope table ``h5table`` in ``group``"""
+        table = read_table(
+            self.h5file,
+            h5table._v_pathname,
+            start=start,
+            stop=stop,
+            coordinates=coordinates,
+            columns=_select_columns(h5table, columns, TELESCOPE_EVENT_KEYS),
+        )
+
+        sparse_reader = None
+        if group == DL1_TEL_IMAGES_GROUP:
+            sparse_reader = get_sparse_image_reader(self.h5file, h5table)
+
+        if sparse_reader is not None:
+            images = sparse_reader.read(
+                start=start, stop=stop, coordinates=coordinates, columns=columns
+            )
+            # same column order as for dense images, directly after the keys
+            n_keys = sum(c in TELESCOPE_EVENT_KEYS for c in table.colnames)
+            for i, (column, values) in enumerate(images.items()):
+                table.add_column(values, name=column, index=n_keys + i)
+            if N_STORED_PIXELS_COLUMN in table.colnames:
+                table.remove_column(N_STORED_PIXELS_COLUMN)
 
         return table
 
+    def _is_aligned(self, h5table, tel_id):
+        """
+        Check if ``h5table`` has one row per row of the dl1 parameters of tel_id.
+
+        Only the number of rows and the keys of the first and last row are compared.
+        """
+        key = f"{DL1_TEL_PARAMETERS_GROUP}/tel_{tel_id:03d}"
+        if key not in self.h5file.root:
+            return False
+
+        parameters = self.h5file.root[key]
+        if h5table.nrows != parameters.nrows:
+            return False
+
+        if h5table.nrows == 0:
+            return True
+
+        last = h5table.nrows - 1
+        return all(
+            h5table[row][k] == parameters[row][k]
+            for row in (0, last)
+            for k in TELESCOPE_EVENT_KEYS
+        )
+
+    def _select_telescope_rows(self, tel_id, condition, start=None, stop=None):
+        """
+        Indices of the rows of the dl1 parameters table of ``tel_id``
+        fulfilling ``condition``.
+
+        The condition is evaluated in-kernel by pytables, so only the
+        columns used in the condition are read from the file.
+        """
+        if DL1_TEL_PARAMETERS_GROUP not in self.h5file.root:
+            raise ValueError(
+                "Selecting telescope events using a condition requires"
+                " dl1 parameters in the input file"
+            )
+
+        key = f"{DL1_TEL_PARAMETERS_GROUP}/tel_{tel_id:03d}"
+        if key not in self.h5file.root:
+            return np.array([], dtype=np.int64)
+
+        return self.h5file.root[key].get_where_list(condition, start=start, stop=stop)
+
+    def _has_selected_columns(self, path, columns, keys=SUBARRAY_EVENT_KEYS):
+        """Check if a table provides any selected columns other than the keys"""
+        if columns is None or path not in self.h5file.root:
+            return True
+        return any(
+            c in columns and c not in keys for c in self.h5file.root[path].colnames
+        )
+
+    def _has_selected_telescope_columns(self, group, tel_id, columns):
+        key = f"tel_{tel_id:03d}"
+        if group == DL1_TEL_IMAGES_GROUP and columns is not None:
+            pixels_path = f"{DL1_TEL_IMAGE_PIXELS_GROUP}/{key}"
+            if pixels_path in self.h5file.root and any(
+                c in columns for c in SPARSE_IMAGE_COLUMNS
+            ):
+                return True
+
+        return self._has_selected_columns(
+            f"{group}/{key}", columns, TELESCOPE_EVENT_KEYS
+        )
+
     def _get_sort_index(self, start=None, stop=None):
         """
         Get plain index of increasing integers in the order in the file.
@@ -401,13 +748,7 @@ class TableLoader(Component):
         # casts the obs_id in the joint result to float.
         obs_table["obs_id"] = obs_table["obs_id"].astype(table["obs_id"].dtype)
 
-        return join_allow_empty(
-            table,
-            obs_table,
-            keys="obs_id",
-            join_type="left",
-            keep_order=True,
-        )
+        return _left_join(table, obs_table, keys=["obs_id"])
 
     def read_subarray_events(
         self,
@@ -417,6 +758,7 @@ class TableLoader(Component):
         simulated=None,
         observation_info=None,
         keep_order=True,
+        columns=None,
     ):
         """Read subarray-based event information.
 
@@ -433,6 +775,9 @@ class TableLoader(Component):
             First *subarray* event to read
         stop: int
             Last *subarray* event (non-inclusive)
+        columns: Iterable[str] or None
+            If given, only load these columns.
+            The index columns "obs_id" and "event_id" are always loaded.
 
         Returns
         -------
@@ -447,16 +792,38 @@ class TableLoader(Component):
         dl2 = updated_args["dl2"]
         simulated = updated_args["simulated"]
         observation_info = updated_args["observation_info"]
+        if columns is not None:
+            columns = set(columns)
 
         table = read_table(
-            self.h5file, DL1_SUBARRAY_TRIGGER_TABLE, start=start, stop=stop
+            self.h5file,
+            DL1_SUBARRAY_TRIGGER_TABLE,
+            start=start,
+            stop=stop,
+            columns=_select_columns(
+                self.h5file.root[DL1_SUBARRAY_TRIGGER_TABLE],
+                columns,
+                SUBARRAY_EVENT_KEYS,
+            ),
         )
         if keep_order:
             self._add_index_if_needed(table)
 
-        if simulated and SIMULATION_SHOWER_TABLE in self.h5file:
+        if (
+            simulated
+            and SIMULATION_SHOWER_TABLE in self.h5file
+            and self._has_selected_columns(SIMULATION_SHOWER_TABLE, columns)
+        ):
             showers = read_table(
-                self.h5file, SIMULATION_SHOWER_TABLE, start=start, stop=stop
+                self.h5file,
+                SIMULATION_SHOWER_TABLE,
+                start=start,
+                stop=stop,
+                columns=_select_columns(
+                    self.h5file.root[SIMULATION_SHOWER_TABLE],
+                    columns,
+                    SUBARRAY_EVENT_KEYS,
+                ),
             )
             table = _merge_subarray_tables(table, showers)
 
@@ -466,11 +833,18 @@ class TableLoader(Component):
                 group = self.h5file.root[group_path]
 
                 for algorithm in group._v_children:
+                    path = f"{group_path}/{algorithm}"
+                    if not self._has_selected_columns(path, columns):
+                        continue
+
                     dl2 = read_table(
                         self.h5file,
-                        f"{group_path}/{algorithm}",
+                        path,
                         start=start,
                         stop=stop,
+                        columns=_select_columns(
+                            self.h5file.root[path], columns, SUBARRAY_EVENT_KEYS
+                        ),
                     )
                     table = _merge_subarray_tables(table, dl2)
 
@@ -479,7 +853,7 @@ class TableLoader(Component):
 
         if keep_order:
             self._sort_to_original_order(table)
-        return table
+        return _keep_columns(table, columns, SUBARRAY_EVENT_KEYS + ["__index__"])
 
     def read_subarray_events_chunked(self, chunk_size, *args, **kwargs):
         """
@@ -512,6 +886,8 @@ class TableLoader(Component):
         pointing,
         start=None,
         stop=None,
+        columns=None,
+        condition=None,
     ):
         """Read telescope-based event information for a single telescope.
 
@@ -543,6 +919,11 @@ class TableLoader(Component):
             join subarray instrument information to each event
         pointing: bool
             join pointing information to each event
+        columns: set[str] or None
+            If given, only load these columns from the telescope tables.
+        condition: str or None
+            If given, only load telescope events for which this condition
+            evaluates to true on the dl1 parameters table.
 
         Returns
         -------
@@ -566,29 +947,80 @@ class TableLoader(Component):
         if stop is not None:
             trigger_stop = self._n_total_telescope_events[stop]
 
-        table = read_table(
-            self.h5file,
-            DL1_TEL_TRIGGER_TABLE,
-            condition=f"tel_id == {tel_id}",
-            start=trigger_start,
-            stop=trigger_stop,
-        )
+        if columns is not None:
+            # only read and join pointing if the pointing columns are requested
+            pointing = pointing and len(POINTING_COLUMNS & columns) > 0
+
+        trigger_required = TELESCOPE_EVENT_KEYS
+        if pointing and DL0_TEL_POINTING_GROUP in self.h5file.root:
+            # needed to interpolate the pointing
+            trigger_required = TELESCOPE_EVENT_KEYS + ["time"]
+
+        trigger_table = self.h5file.root[DL1_TEL_TRIGGER_TABLE]
+        trigger_columns = _select_columns(trigger_table, columns, trigger_required)
+
+        if condition is None:
+            coordinates = None
+            table = read_table(
+                self.h5file,
+                DL1_TEL_TRIGGER_TABLE,
+                condition=f"tel_id == {tel_id}",
+                start=trigger_start,
+                stop=trigger_stop,
+                columns=trigger_columns,
+            )
+        else:
+            coordinates = self._select_telescope_rows(
+                tel_id, condition, start=tel_start, stop=tel_stop
+            )
+            # n-th row of the telescope tables belongs to
+            # the n-th trigger of this telescope
+            trigger_rows = trigger_table.get_where_list(
+                f"tel_id == {tel_id}", start=trigger_start, stop=trigger_stop
+            )
+            table = read_table(
+                self.h5file,
+                DL1_TEL_TRIGGER_TABLE,
+                coordinates=trigger_rows[coordinates - (tel_start or 0)],
+                columns=trigger_columns,
+            )
 
-        if dl1_parameters:
+        if dl1_parameters and self._has_selected_telescope_columns(
+            DL1_TEL_PARAMETERS_GROUP, tel_id, columns
+        ):
             parameters = self._read_telescope_table(
-                DL1_TEL_PARAMETERS_GROUP, tel_id, start=tel_start, stop=tel_stop
+                DL1_TEL_PARAMETERS_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
             )
             table = _merge_telescope_tables(table, parameters)
 
-        if dl1_muons:
+        if dl1_muons and self._has_selected_telescope_columns(
+            DL1_TEL_MUON_GROUP, tel_id, columns
+        ):
             muon_parameters = self._read_telescope_table(
-                DL1_TEL_MUON_GROUP, tel_id, start=tel_start, stop=tel_stop
+                DL1_TEL_MUON_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
             )
             table = _merge_telescope_tables(table, muon_parameters)
 
-        if dl1_images:
+        if dl1_images and self._has_selected_telescope_columns(
+            DL1_TEL_IMAGES_GROUP, tel_id, columns
+        ):
             images = self._read_telescope_table(
-                DL1_TEL_IMAGES_GROUP, tel_id, start=tel_start, stop=tel_stop
+                DL1_TEL_IMAGES_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
             )
             table = _merge_telescope_tables(table, images)
 
@@ -600,41 +1032,73 @@ class TableLoader(Component):
 
                 for algorithm in group._v_children:
                     path = f"{group_path}/{algorithm}"
+                    if not self._has_selected_telescope_columns(path, tel_id, columns):
+                        continue
+
                     dl2 = self._read_telescope_table(
-                        path, tel_id, start=tel_start, stop=tel_stop
+                        path,
+                        tel_id,
+                        start=tel_start,
+                        stop=tel_stop,
+                        columns=columns,
+                        coordinates=coordinates,
                     )
                     if len(dl2) == 0:
                         continue
 
                     table = _merge_telescope_tables(table, dl2)
 
-        if true_images:
+        if true_images and self._has_selected_telescope_columns(
+            SIMULATION_IMAGES_GROUP, tel_id, columns
+        ):
             true_images = self._read_telescope_table(
-                SIMULATION_IMAGES_GROUP, tel_id, start=tel_start, stop=tel_stop
+                SIMULATION_IMAGES_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
             )
             table = _merge_telescope_tables(table, true_images)
 
-        if true_parameters:
+        if true_parameters and self._has_selected_telescope_columns(
+            SIMULATION_PARAMETERS_GROUP, tel_id, columns
+        ):
             true_parameters = self._read_telescope_table(
-                SIMULATION_PARAMETERS_GROUP, tel_id, start=tel_start, stop=tel_stop
+                SIMULATION_PARAMETERS_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
+            )
+            table = _join_telescope_events(
+                table, true_parameters, selected=condition is not None
             )
-            table = _join_telescope_events(table, true_parameters)
 
         if instrument:
             instrument_table = self.subarray.to_table("joined")
             instrument_table.meta.clear()
-            table = join_allow_empty(
-                table, instrument_table, keys=["tel_id"], join_type="left"
-            )
+            table = _left_join(table, instrument_table, keys=["tel_id"])
 
-        if simulated and SIMULATION_IMPACT_GROUP in self.h5file.root:
+        if (
+            simulated
+            and SIMULATION_IMPACT_GROUP in self.h5file.root
+            and self._has_selected_telescope_columns(
+                SIMULATION_IMPACT_GROUP, tel_id, columns
+            )
+        ):
             impacts = self._read_telescope_table(
                 SIMULATION_IMPACT_GROUP,
                 tel_id,
                 start=tel_start,
                 stop=tel_stop,
+                columns=columns,
+                coordinates=coordinates,
+            )
+            table = _join_telescope_events(
+                table, impacts, selected=condition is not None
             )
-            table = _join_telescope_events(table, impacts)
 
         if len(table) > 0 and pointing:
             # prefer monitoring pointing
@@ -648,9 +1112,7 @@ class TableLoader(Component):
                 )
                 # we know that we only have the tel_id we are looking for, remove optimize joining
                 del pointing_table["tel_id"]
-                table = join_allow_empty(
-                    table, pointing_table, ["obs_id"], "left", keep_order=True
-                )
+                table = _left_join(table, pointing_table, ["obs_id"])
 
         return table
 
@@ -668,26 +1130,71 @@ class TableLoader(Component):
         pointing,
         start=None,
         stop=None,
+        columns=None,
+        condition=None,
     ):
-        tables = [
-            self._read_telescope_events_for_id(
-                tel_id,
-                dl1_images=dl1_images,
-                dl1_parameters=dl1_parameters,
-                dl1_muons=dl1_muons,
-                dl2=dl2,
-                simulated=simulated,
-                true_images=true_images,
-                true_parameters=true_parameters,
-                instrument=instrument,
-                pointing=pointing,
-                start=start,
-                stop=stop,
-            )
-            for tel_id in tel_ids
-        ]
+        tables = self._read_telescope_events_for_each_id(
+            tel_ids,
+            dl1_images=dl1_images,
+            dl1_parameters=dl1_parameters,
+            dl1_muons=dl1_muons,
+            dl2=dl2,
+            simulated=simulated,
+            true_images=true_images,
+            true_parameters=true_parameters,
+            instrument=instrument,
+            pointing=pointing,
+            start=start,
+            stop=stop,
+            columns=columns,
+            condition=condition,
+        )
         return vstack(tables)
 
+    def _read_telescope_events_for_each_id(self, tel_ids, **kwargs):
+        """
+        Call `_read_telescope_events_for_id` for each of ``tel_ids``.
+
+        If ``n_workers > 1``, the telescopes are read in parallel by
+        worker processes each having its own handle to the input file,
+        as hdf5 does not support concurrent reading from multiple threads.
+
+        Returns
+        -------
+        tables: list[astropy.table.Table]
+            One table per telescope, in the order of ``tel_ids``.
+        """
+        if self.n_workers == 1 or len(tel_ids) < 2:
+            return [
+                self._read_telescope_events_for_id(tel_id, **kwargs)
+                for tel_id in tel_ids
+            ]
+
+        if self._executor is None:
+            # forward the options of this loader, they might have been
+            # passed as keyword arguments and not be part of self.config
+            trait_values = {
+                name: getattr(self, name)
+                for name in self.trait_names(config=True)
+                if name not in {"input_url", "n_workers"}
+            }
+            self._executor = ProcessPoolExecutor(
+                self.n_workers,
+                # fork is not safe with the already opened hdf5 file
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(Path(self.h5file.filename), self.config, trait_values),
+            )
+
+        # map returns the results in the order of the inputs
+        return list(
+            self._executor.map(
+                _read_telescope_events_worker,
+                tel_ids,
+                [kwargs] * len(tel_ids),
+            )
+        )
+
     def _join_subarray_info(
         self,
         table,
@@ -697,6 +1204,7 @@ class TableLoader(Component):
         start=None,
         stop=None,
         subarray_events=None,
+        columns=None,
     ):
         if subarray_events is None:
             subarray_events = self.read_subarray_events(
@@ -706,12 +1214,12 @@ class TableLoader(Component):
                 simulated=simulated,
                 observation_info=observation_info,
                 keep_order=False,
+                columns=columns,
             )
-        table = join_allow_empty(
+        table = _left_join(
             table,
             subarray_events,
             keys=SUBARRAY_EVENT_KEYS,
-            join_type="left",
             # add suffix mono on duplicated columns, avoid underscore for stereo
             table_names=["_mono", ""],
             uniq_col_name="{col_name}{table_name}",
@@ -749,6 +1257,8 @@ class TableLoader(Component):
         instrument=None,
         observation_info=None,
         pointing=None,
+        columns=None,
+        condition=None,
     ):
         """
         Read telescope-based event information.
@@ -791,6 +1301,17 @@ class TableLoader(Component):
             join observation information to each event
         pointing: bool
             join pointing information to each event
+        columns: Iterable[str] or None
+            If given, only load these columns. This is pushed down to reading
+            the tables in the file, so only the needed columns are loaded.
+            The index columns "obs_id", "event_id" and "tel_id" are always loaded.
+        condition: str or None
+            If given, only load telescope events for which this condition
+            evaluates to true on the dl1 parameters table of the telescope,
+            e.g. ``"hillas_intensity > 100"``.
+            The condition is evaluated in-kernel by pytables, so non-selected
+            events are never loaded. If None, the ``condition`` configuration
+            option is used.
 
         Returns
         -------
@@ -819,6 +1340,8 @@ class TableLoader(Component):
         instrument = updated_args["instrument"]
         observation_info = updated_args["observation_info"]
         pointing = updated_args["pointing"]
+        if condition is None:
+            condition = self.condition
 
         if telescopes is None:
             tel_ids = tuple(self.subarray.tel.keys())
@@ -838,6 +1361,8 @@ class TableLoader(Component):
             pointing=pointing,
             start=start,
             stop=stop,
+            columns=_expand_columns(columns),
+            condition=condition,
         )
 
         table = self._join_subarray_info(
@@ -847,6 +1372,7 @@ class TableLoader(Component):
             observation_info=observation_info,
             start=start,
             stop=stop,
+            columns=_expand_columns(columns),
         )
 
         # sort back to order in the file
@@ -855,7 +1381,7 @@ class TableLoader(Component):
         )
         self._sort_to_original_order(table, include_tel_id=True)
 
-        return table
+        return _keep_columns(table, columns, TELESCOPE_EVENT_KEYS)
 
     def read_telescope_events_chunked(self, chunk_size, *args, **kwargs):
         """
@@ -920,6 +1446,8 @@ class TableLoader(Component):
         instrument=None,
         observation_info=None,
         pointing=None,
+        columns=None,
+        condition=None,
     ) -> dict[str, Table]:
         """Read subarray-based event information.
 
@@ -947,6 +1475,17 @@ class TableLoader(Component):
             join observation information to each event
         pointing: bool
             join pointing information to each event
+        columns: Iterable[str] or None
+            If given, only load these columns. This is pushed down to reading
+            the tables in the file, so only the needed columns are loaded.
+            The index columns "obs_id", "event_id" and "tel_id" are always loaded.
+        condition: str or None
+            If given, only load telescope events for which this condition
+            evaluates to true on the dl1 parameters table of the telescope,
+            e.g. ``"hillas_intensity > 100"``.
+            The condition is evaluated in-kernel by pytables, so non-selected
+            events are never loaded. If None, the ``condition`` configuration
+            option is used.
 
         Returns
         -------
@@ -976,6 +1515,8 @@ class TableLoader(Component):
         instrument = updated_args["instrument"]
         observation_info = updated_args["observation_info"]
         pointing = updated_args["pointing"]
+        if condition is None:
+            condition = self.condition
 
         if telescopes is None:
             tel_ids = tuple(self.subarray.tel.keys())
@@ -989,27 +1530,30 @@ class TableLoader(Component):
             simulated=simulated,
             observation_info=observation_info,
             keep_order=False,
+            columns=_expand_columns(columns),
         )
         self._add_index_if_needed(subarray_events)
 
+        tables = self._read_telescope_events_for_each_id(
+            tel_ids,
+            start=start,
+            stop=stop,
+            dl1_images=dl1_images,
+            dl1_parameters=dl1_parameters,
+            dl1_muons=dl1_muons,
+            dl2=dl2,
+            simulated=simulated,
+            true_images=true_images,
+            true_parameters=true_parameters,
+            instrument=instrument,
+            pointing=pointing,
+            columns=_expand_columns(columns),
+            condition=condition,
+        )
+
         by_type = defaultdict(list)
-        for tel_id in tel_ids:
+        for tel_id, table in zip(tel_ids, tables):
             key = str(self.subarray.tel[tel_id])
-            table = self._read_telescope_events_for_id(
-                tel_id,
-                start=start,
-                stop=stop,
-                dl1_images=dl1_images,
-                dl1_parameters=dl1_parameters,
-                dl1_muons=dl1_muons,
-                dl2=dl2,
-                simulated=simulated,
-                true_images=true_images,
-                true_parameters=true_parameters,
-                instrument=instrument,
-                pointing=pointing,
-            )
-
             if len(table) > 0:
                 by_type[key].append(table)
 
@@ -1023,6 +1567,7 @@ class TableLoader(Component):
                 subarray_events=subarray_events,
             )
             self._sort_to_original_order(by_type[key], include_tel_id=True)
+            by_type[key] = _keep_columns(by_type[key], columns, TELESCOPE_EVENT_KEYS)
 
         return by_type
 
@@ -1062,6 +1607,8 @@ class TableLoader(Component):
         instrument=None,
         observation_info=None,
         pointing=None,
+        columns=None,
+        condition=None,
     ) -> dict[int, Table]:
         """Read subarray-based event information.
 
@@ -1089,6 +1636,17 @@ class TableLoader(Component):
             join observation information to each event
         pointing: bool
             join pointing information to each event
+        columns: Iterable[str] or None
+            If given, only load these columns. This is pushed down to reading
+            the tables in the file, so only the needed columns are loaded.
+            The index columns "obs_id", "event_id" and "tel_id" are always loaded.
+        condition: str or None
+            If given, only load telescope events for which this condition
+            evaluates to true on the dl1 parameters table of the telescope,
+            e.g. ``"hillas_intensity > 100"``.
+            The condition is evaluated in-kernel by pytables, so non-selected
+            events are never loaded. If None, the ``condition`` configuration
+            option is used.
 
         Returns
         -------
@@ -1118,6 +1676,8 @@ class TableLoader(Component):
         instrument = updated_args["instrument"]
         observation_info = updated_args["observation_info"]
         pointing = updated_args["pointing"]
+        if condition is None:
+            condition = self.condition
 
         if telescopes is None:
             tel_ids = tuple(self.subarray.tel.keys())
@@ -1131,26 +1691,30 @@ class TableLoader(Component):
             simulated=simulated,
             observation_info=observation_info,
             keep_order=False,
+            columns=_expand_columns(columns),
         )
         self._add_index_if_needed(subarray_events)
 
+        tables = self._read_telescope_events_for_each_id(
+            tel_ids,
+            start=start,
+            stop=stop,
+            dl1_images=dl1_images,
+            dl1_parameters=dl1_parameters,
+            dl1_muons=dl1_muons,
+            dl2=dl2,
+            simulated=simulated,
+            true_images=true_images,
+            true_parameters=true_parameters,
+            instrument=instrument,
+            pointing=pointing,
+            columns=_expand_columns(columns),
+            condition=condition,
+        )
+
         by_id = {}
-        for tel_id in tel_ids:
+        for tel_id, table in zip(tel_ids, tables):
             # no events for this telescope in range start/stop
-            table = self._read_telescope_events_for_id(
-                tel_id,
-                start=start,
-                stop=stop,
-                dl1_images=dl1_images,
-                dl1_parameters=dl1_parameters,
-                dl1_muons=dl1_muons,
-                dl2=dl2,
-                simulated=simulated,
-                true_images=true_images,
-                true_parameters=true_parameters,
-                instrument=instrument,
-                pointing=pointing,
-            )
             if len(table) > 0:
                 by_id[tel_id] = table
 
@@ -1163,6 +1727,7 @@ class TableLoader(Component):
                 subarray_events=subarray_events,
             )
             self._sort_to_original_order(by_id[tel_id], include_tel_id=False)
+            by_id[tel_id] = _keep_columns(by_id[tel_id], columns, TELESCOPE_EVENT_KEYS)
 
         return by_id
 
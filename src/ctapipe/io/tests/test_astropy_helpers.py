@@ -107,6 +107,70 @@ def test_read_table_slicing(tmp_path):
     assert np.all(table["value"] == values[::5])
 
 
+def test_read_table_columns(tmp_path):
+    filename = tmp_path / "test_columns.h5"
+
+    class Data(Container):
+        index = Field(0)
+        value = Field(0.0)
+        energy = Field(0.0 * u.TeV, unit=u.TeV)
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100)
+
+    with HDF5TableWriter(filename) as writer:
+        for i, value in enumerate(values):
+            container = Data(index=i, value=value, energy=abs(value) * u.TeV)
+            writer.write("events", container)
+
+    # order of columns in the file is kept
+    table = read_table(filename, "/events", columns=["energy", "index"])
+    assert table.colnames == ["index", "energy"]
+    assert table["energy"].unit == u.TeV
+    assert np.all(table["index"] == np.arange(100))
+    assert u.allclose(table["energy"], np.abs(values) * u.TeV)
+
+    table = read_table(filename, "/events", columns=["value"], start=5, step=3)
+    assert table.colnames == ["value"]
+    assert np.all(table["value"] == values[5::3])
+
+    table = read_table(
+        filename, "/events", columns=["index"], condition="value > 0", stop=50
+    )
+    assert table.colnames == ["index"]
+    assert np.all(table["index"] == np.nonzero(values[:50] > 0)[0])
+
+    with pytest.raises(KeyError, match="foo"):
+        read_table(filename, "/events", columns=["index", "foo"])
+
+
+def test_read_table_coordinates(tmp_path):
+    filename = tmp_path / "test_coordinates.h5"
+
+    class Data(Container):
+        index = Field(0)
+        value = Field(0.0)
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100)
+
+    with HDF5TableWriter(filename) as writer:
+        for i, value in enumerate(values):
+            writer.write("events", Data(index=i, value=value))
+
+    rows = np.nonzero(values > 0)[0]
+    table = read_table(filename, "/events", coordinates=rows)
+    assert np.all(table["index"] == rows)
+    assert np.all(table["value"] == values[rows])
+
+    table = read_table(filename, "/events", coordinates=rows, columns=["value"])
+    assert table.colnames == ["value"]
+    assert np.all(table["value"] == values[rows])
+
+    with pytest.raises(ValueError, match="coordinates cannot be combined"):
+        read_table(filename, "/events", coordinates=rows, start=5)
+
+
 def test_read_table_time(tmp_path):
     t0 = Time("2020-01-01T20:00:00.0")
     times = t0 + np.arange(10) * u.s
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 
@@ -146,3 +147,89 @@ def test_string_truncated():
 
     # 6 bytes, make sure we only write valid utf-8
     assert trafo("ααα") == "αα".encode("utf-8")
+
+
+def test_quantization_linear():
+    from ctapipe.io.tableio import QuantizationColumnTransform
+
+    tr = QuantizationColumnTransform(resolution=0.1, target_dtype=np.int16)
+
+    values = np.array([-3.0, -0.04, 0.0, 0.06, 1.23, 3000.0], dtype=np.float32)
+    transformed = tr(values)
+    assert transformed.dtype == np.int16
+    assert_array_equal(transformed, [-30, 0, 0, 1, 12, 30000])
+    np.testing.assert_allclose(tr.inverse(transformed), values, atol=0.05)
+
+    assert tr(np.nan) == tr.nan
+    assert tr(np.inf) == tr.posinf
+    assert tr(-np.inf) == tr.neginf
+    assert tr(4000.0) == tr.posinf
+    assert np.isnan(tr.inverse(tr.nan))
+    assert tr.inverse(tr.posinf) == np.inf
+    assert tr.inverse(tr.neginf) == -np.inf
+
+
+def test_quantization_relative():
+    from ctapipe.io.tableio import QuantizationColumnTransform
+
+    resolution, relative_resolution = 0.1, 1e-4
+    tr = QuantizationColumnTransform(
+        resolution=resolution,
+        relative_resolution=relative_resolution,
+        target_dtype=np.int16,
+    )
+
+    rng = np.random.default_rng(0)
+    values = np.concatenate(
+        [rng.uniform(-5, 50, 1000), rng.uniform(100, 20000, 1000)]
+    ).astype(np.float32)
+
+    transformed = tr(values)
+    assert transformed.dtype == np.int16
+    assert not np.any(np.isin(transformed, [tr.nan, tr.posinf, tr.neginf]))
+
+    # the error is at most half a step
+    restored = tr.inverse(transformed)
+    assert restored.dtype == np.float32
+    max_error = 0.5 * (resolution + relative_resolution * np.abs(values))
+    assert np.all(np.abs(restored - values) <= 1.01 * max_error)
+
+    # scalars stay scalars, non-finite values are kept
+    assert np.isnan(tr.inverse(tr(np.nan)))
+    assert tr.inverse(tr(np.inf)) == np.inf
+    assert tr(1e6) == tr.posinf
+
+
+def test_quantization_invalid():
+    from ctapipe.io.tableio import QuantizationColumnTransform
+
+    with pytest.raises(ValueError, match="resolution"):
+        QuantizationColumnTransform(resolution=0)
+
+    with pytest.raises(ValueError, match="relative_resolution"):
+        QuantizationColumnTransform(resolution=0.1, relative_resolution=-1)
+
+
+def test_quantization_hdf5_roundtrip(tmp_path):
+    from ctapipe.containers import DL1CameraContainer
+    from ctapipe.io import HDF5TableReader, HDF5TableWriter, read_table
+    from ctapipe.io.tableio import QuantizationColumnTransform
+
+    path = tmp_path / "quantized.h5"
+    image = np.array([0.0, 0.23, -1.5, 150.0, 12345.0, np.nan], dtype=np.float32)
+    tr = QuantizationColumnTransform(resolution=0.1, relative_resolution=1e-4)
+
+    with HDF5TableWriter(path) as writer:
+        writer.add_column_transform("images", "image", tr)
+        writer.write("images", DL1CameraContainer(image=image))
+
+    with HDF5TableReader(path) as reader:
+        dl1 = next(reader.read("/images", DL1CameraContainer))
+
+    expected = tr.inverse(tr(image))
+    assert_array_equal(dl1.image, expected)
+    np.testing.assert_allclose(dl1.image[:4], image[:4], atol=0.1)
+
+    table = read_table(path, "/images")
+    assert table["image"].dtype == np.float32
+    assert_array_equal(table["image"][0], expected)
@@ -5,6 +5,7 @@ from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
+import pytest
 import tables
 from astropy import units as u
 from traitlets.config import Config
@@ -289,3 +290,224 @@ def test_metadata(tmpdir: Path):
 def test_write_only_r1(r1_hdf5_file):
     with tables.open_file(r1_hdf5_file, "r") as f:
         assert "r1/event/telescope/tel_001" in f.root
+
+
+def test_table_options(tmp_path):
+    """Check the per-table storage options and the expected events"""
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.core import Provenance, ToolConfigurationError
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=11)
+    source = SyntheticEventSource(subarray=subarray, max_events=20, seed=0)
+    output_path = tmp_path / "table_options.dl1.h5"
+
+    config = Config(
+        {
+            "DataWriter": {
+                "table_options": {
+                    "/dl1/event/telescope/images/.*": {
+                        "complib": "blosc:lz4",
+                        "complevel": 1,
+                        "chunk_bytes": 64 * 1024,
+                    },
+                    "/dl1/event/subarray/trigger": {"chunkshape": 10},
+                }
+            }
+        }
+    )
+
+    Provenance().start_activity("test_table_options")
+    with DataWriter(
+        event_source=source,
+        output_path=output_path,
+        write_dl1_images=True,
+        write_dl1_parameters=False,
+        config=config,
+    ) as write_data:
+        for event in source:
+            write_data(event)
+
+    with tables.open_file(output_path) as h5file:
+        for table in h5file.root.dl1.event.telescope.images:
+            assert table.filters.complib == "blosc:lz4"
+            assert table.filters.complevel == 1
+            assert table.filters.fletcher32
+            assert table.chunkshape == (64 * 1024 // table.rowsize,)
+
+        trigger = h5file.root.dl1.event.subarray.trigger
+        assert trigger.filters.complib == "blosc:zstd"
+        assert trigger.chunkshape == (10,)
+
+    with pytest.raises(ToolConfigurationError, match="Unknown table options"):
+        DataWriter(
+            event_source=source,
+            output_path=tmp_path / "invalid.dl1.h5",
+            table_options={".*": {"compression": "zlib"}},
+        )
+
+    with pytest.raises(ToolConfigurationError, match="Unknown complib"):
+        DataWriter(
+            event_source=source,
+            output_path=tmp_path / "invalid.dl1.h5",
+            table_options={".*": {"complib": "foo"}},
+        )
+
+
+def test_expected_events(tmp_path):
+    """Check that the expected events are passed to the writer"""
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=11)
+    source = SyntheticEventSource(subarray=subarray, max_events=20, seed=0)
+
+    def expectedrows(writer, table_name):
+        return writer._writer._get_table_options(table_name, 100).get("expectedrows")
+
+    writer = DataWriter(event_source=source, output_path=tmp_path / "a.dl1.h5")
+    assert expectedrows(writer, "dl1/event/subarray/trigger") == 20
+    assert expectedrows(writer, "simulation/event/telescope/images/tel_001") == 20
+    # tables with a few rows per file keep the pytables default
+    assert expectedrows(writer, "configuration/simulation/run") is None
+    assert expectedrows(writer, "simulation/service/shower_distribution") is None
+    writer._writer.close()
+
+    writer = DataWriter(
+        event_source=source,
+        output_path=tmp_path / "b.dl1.h5",
+        expected_events=1_000_000,
+    )
+    assert expectedrows(writer, "dl1/event/telescope/images/tel_001") == 1_000_000
+    assert expectedrows(writer, "configuration/observation/scheduling_block") is None
+    writer._writer.close()
+
+
+def test_sparse_dl1_images(tmp_path):
+    """Check that sparse images are read back by the event source and table loader"""
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.core import Provenance
+    from ctapipe.image import ImageProcessor
+    from ctapipe.io import HDF5EventSource, TableLoader
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=21)
+    source = SyntheticEventSource(subarray=subarray, max_events=30, seed=0)
+    process_images = ImageProcessor(subarray=subarray)
+    events = []
+    for event in source:
+        process_images(event)
+        events.append(event)
+
+    Provenance().start_activity("test_sparse_dl1_images")
+    paths = {}
+    for sparse in (False, True):
+        paths[sparse] = tmp_path / f"sparse_{sparse}.dl1.h5"
+        with DataWriter(
+            event_source=source,
+            output_path=paths[sparse],
+            write_dl1_images=True,
+            sparse_dl1_images=sparse,
+        ) as write_data:
+            for event in events:
+                write_data(event)
+
+    with tables.open_file(paths[True]) as h5file:
+        images = h5file.root.dl1.event.telescope.images
+        assert "image" not in images.tel_001.colnames
+        assert "n_stored_pixels" in images.tel_001.colnames
+        assert "/dl1/event/telescope/image_pixels/tel_001" in h5file
+
+    with TableLoader(paths[False], dl1_images=True) as loader:
+        dense = loader.read_telescope_events()
+    with TableLoader(paths[True], dl1_images=True) as loader:
+        sparse = loader.read_telescope_events()
+        selected = loader.read_telescope_events(columns=["image"])
+
+    assert sparse.colnames == dense.colnames
+    np.testing.assert_array_equal(sparse["image_mask"], dense["image_mask"])
+    stored = ~np.isnan(sparse["peak_time"])
+    assert np.all(stored[dense["image_mask"]])
+    np.testing.assert_array_equal(sparse["image"][stored], dense["image"][stored])
+    np.testing.assert_array_equal(sparse["image"][~stored], 0)
+    np.testing.assert_array_equal(selected["image"], sparse["image"])
+
+    with HDF5EventSource(paths[True]) as sparse_source:
+        n_events = 0
+        for event in sparse_source:
+            for tel_id, dl1 in event.dl1.tel.items():
+                row = (sparse["event_id"] == event.index.event_id) & (
+                    sparse["tel_id"] == tel_id
+                )
+                np.testing.assert_array_equal(dl1.image, sparse["image"][row][0])
+                np.testing.assert_array_equal(
+                    dl1.image_mask, dense["image_mask"][row][0]
+                )
+            n_events += 1
+    assert n_events > 0
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_quantized_dl1_images(tmp_path, sparse):
+    """Check that quantized images are read back within the resolution"""
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.core import Provenance
+    from ctapipe.io import TableLoader
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=11)
+    source = SyntheticEventSource(subarray=subarray, max_events=10, seed=0)
+    events = list(source)
+
+    Provenance().start_activity("test_quantized_dl1_images")
+    paths = {}
+    for quantize in (False, True):
+        paths[quantize] = tmp_path / f"quantize_{quantize}.dl1.h5"
+        with DataWriter(
+            event_source=source,
+            output_path=paths[quantize],
+            write_dl1_images=True,
+            write_dl1_parameters=False,
+            sparse_dl1_images=sparse,
+            quantize_image=quantize,
+            quantize_peak_time=quantize,
+        ) as write_data:
+            for event in events:
+                write_data(event)
+
+    with tables.open_file(paths[True]) as h5file:
+        group = "image_pixels" if sparse else "images"
+        table = h5file.root.dl1.event.telescope[group].tel_001
+        assert table.coldtypes["image"].base == np.int16
+        assert table.coldtypes["peak_time"].base == np.int16
+
+    with TableLoader(paths[False], dl1_images=True) as loader:
+        exact = loader.read_telescope_events()
+    with TableLoader(paths[True], dl1_images=True) as loader:
+        quantized = loader.read_telescope_events()
+
+    image = exact["image"]
+    assert quantized["image"].dtype == np.float32
+    max_error = 0.5 * (0.1 + 1e-4 * np.abs(image)) + 1e-6
+    assert np.all(np.abs(quantized["image"] - image) <= max_error)
+    np.testing.assert_allclose(
+        quantized["peak_time"], exact["peak_time"], atol=0.05 + 1e-6
+    )
+
+
+def test_quantize_and_transform_image(tmp_path):
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.core import ToolConfigurationError
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=1, n_pixels_side=5)
+    source = SyntheticEventSource(subarray=subarray, max_events=1, seed=0)
+
+    for column in ("image", "peak_time"):
+        with pytest.raises(ToolConfigurationError, match=f"quantize_{column}"):
+            DataWriter(
+                event_source=source,
+                output_path=tmp_path / f"{column}.dl1.h5",
+                write_dl1_images=True,
+                **{f"quantize_{column}": True, f"transform_{column}": True},
+            )
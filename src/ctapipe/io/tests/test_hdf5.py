@@ -1070,3 +1070,61 @@ def test_column_transform_high_res_timestamp(tmp_path):
             time_to_ctao_high_res(times),
             time_to_ctao_high_res(times_read),
         )
+
+
+def test_read_lazy(test_h5_file):
+    """Test lazy reading returns the same values as eager reading"""
+    with HDF5TableReader(test_h5_file) as reader:
+        eager = list(reader.read("/R0/sim_shower", SimulatedShowerContainer))
+
+    with HDF5TableReader(test_h5_file) as reader:
+        lazy = list(reader.read("/R0/sim_shower", SimulatedShowerContainer, lazy=True))
+
+        assert len(lazy) == len(eager)
+        assert not any(c.is_loaded for c in lazy)
+
+        for eager_container, lazy_container in zip(eager, lazy):
+            assert isinstance(lazy_container, SimulatedShowerContainer)
+            assert lazy_container.meta == eager_container.meta
+            for key, value in eager_container.items():
+                np.testing.assert_equal(lazy_container[key], value)
+
+        assert all(c.is_loaded for c in lazy)
+
+
+def test_table_options(tmp_path):
+    """Test per-table filters and chunk shapes"""
+    from tables import Filters, open_file
+
+    path = tmp_path / "test_table_options.hdf5"
+
+    class TestContainer(Container):
+        value = Field(-1, "test")
+        other = Field(1.0, "test")
+
+    zstd = Filters(complevel=5, complib="blosc:zstd")
+    zlib = Filters(complevel=1, complib="zlib")
+
+    with HDF5TableWriter(
+        path, group_name="data", mode="w", filters=zstd, expectedrows=10_000
+    ) as writer:
+        writer.add_table_options("tel/.*", filters=zlib, chunk_bytes=1600)
+        writer.add_table_options("/tel/tel_002", chunkshape=50)
+
+        c = TestContainer(value=5)
+        for table_name in ["subarray", "tel/tel_001", "tel/tel_002"]:
+            writer.write(table_name, c)
+
+    with open_file(path) as h5file:
+        subarray = h5file.root.data.subarray
+        assert subarray.filters.complib == "blosc:zstd"
+
+        tel_001 = h5file.root.data.tel.tel_001
+        assert tel_001.filters.complib == "zlib"
+        assert tel_001.filters.complevel == 1
+        # 16 bytes per row
+        assert tel_001.chunkshape == (100,)
+
+        tel_002 = h5file.root.data.tel.tel_002
+        assert tel_002.filters.complib == "zlib"
+        assert tel_002.chunkshape == (50,)
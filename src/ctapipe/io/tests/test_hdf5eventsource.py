@@ -1,3 +1,4 @@
+from copy import deepcopy
 from itertools import zip_longest
 
 import astropy.units as u
@@ -346,3 +347,22 @@ def test_read_dl2_tel_ml(gamma_diffuse_full_reco_file):
             assert energy.prefix == algorithm + "_tel"
             assert energy.energy is not None
             assert np.isfinite(energy.energy)
+
+
+def test_lazy(dl1_file):
+    """Test lazy loading gives the same values as eager loading"""
+    with HDF5EventSource(input_url=dl1_file, max_events=5) as source:
+        events = [deepcopy(event) for event in source]
+
+    with HDF5EventSource(input_url=dl1_file, max_events=5, lazy=True) as source:
+        for expected, event in zip_longest(events, source):
+            for tel_id, dl1 in event.dl1.tel.items():
+                assert not dl1.parameters.hillas.is_loaded
+                hillas = expected.dl1.tel[tel_id].parameters.hillas
+                np.testing.assert_equal(
+                    dl1.parameters.hillas.intensity, hillas.intensity
+                )
+                assert dl1.parameters.hillas.is_loaded
+                assert not dl1.parameters.leakage.is_loaded
+
+                np.testing.assert_array_equal(dl1.image, expected.dl1.tel[tel_id].image)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+import tables
+
+from ctapipe.containers import DL1CameraContainer
+
+
+@pytest.fixture(scope="module")
+def toy_subarray():
+    from ctapipe.benchmark import make_toy_subarray
+
+    return make_toy_subarray(n_telescopes=1, n_pixels_side=11)
+
+
+@pytest.fixture(scope="module")
+def dl1_images(toy_subarray):
+    rng = np.random.default_rng(0)
+    n_pixels = toy_subarray.tel[1].camera.geometry.n_pixels
+
+    images = []
+    for i in range(20):
+        mask = rng.uniform(size=n_pixels) < 0.05
+        # also events without any pixel in the mask
+        if i % 7 == 0:
+            mask[:] = False
+        images.append(
+            DL1CameraContainer(
+                image=rng.normal(size=n_pixels).astype(np.float32),
+                peak_time=rng.uniform(0, 40, n_pixels).astype(np.float32),
+                image_mask=mask,
+            )
+        )
+    return images
+
+
+def _write(path, subarray, images, n_dilations=1, **kwargs):
+    from ctapipe.io import HDF5TableWriter
+    from ctapipe.io.sparse_images import SparseImageWriter
+
+    with HDF5TableWriter(path, mode="w") as writer:
+        sparse_writer = SparseImageWriter(
+            writer, subarray, n_dilations=n_dilations, **kwargs
+        )
+        for dl1 in images:
+            index = sparse_writer(1, dl1)
+            writer.write("dl1/event/telescope/images/tel_001", [index])
+        sparse_writer.flush()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 1_000_000])
+def test_roundtrip(tmp_path, toy_subarray, dl1_images, buffer_size):
+    from ctapipe.image.cleaning import dilate
+    from ctapipe.io.sparse_images import (
+        SPARSE_FILL_VALUES,
+        get_sparse_image_reader,
+    )
+
+    path = tmp_path / "sparse.h5"
+    _write(path, toy_subarray, dl1_images, buffer_size=buffer_size)
+    geometry = toy_subarray.tel[1].camera.geometry
+
+    with tables.open_file(path) as h5file:
+        images_table = h5file.root.dl1.event.telescope.images.tel_001
+        reader = get_sparse_image_reader(h5file, images_table)
+        assert len(reader) == len(dl1_images)
+
+        dense = reader.read()
+        for i, dl1 in enumerate(dl1_images):
+            stored = dilate(geometry, dl1.image_mask)
+            assert images_table[i]["n_stored_pixels"] == np.count_nonzero(stored)
+
+            np.testing.assert_array_equal(dense["image_mask"][i], dl1.image_mask)
+            np.testing.assert_array_equal(dense["image"][i][stored], dl1.image[stored])
+            np.testing.assert_array_equal(
+                dense["peak_time"][i][stored], dl1.peak_time[stored]
+            )
+            assert np.all(dense["image"][i][~stored] == SPARSE_FILL_VALUES["image"])
+            assert np.all(np.isnan(dense["peak_time"][i][~stored]))
+
+        # ranges, selected rows and columns
+        sliced = reader.read(start=3, stop=11, columns=["image"])
+        assert sliced.keys() == {"image"}
+        np.testing.assert_array_equal(sliced["image"], dense["image"][3:11])
+
+        rows = np.array([1, 5, 6, 19])
+        selected = reader.read(coordinates=rows)
+        np.testing.assert_array_equal(selected["image"], dense["image"][rows])
+
+        for i, row in enumerate(reader.iter_rows(chunk_size=3)):
+            np.testing.assert_array_equal(row["peak_time"], dense["peak_time"][i])
+        assert i == len(dl1_images) - 1
+
+
+def test_fixed_point_transform(tmp_path, toy_subarray, dl1_images):
+    """Stored values are transformed and transformed back on reading"""
+    from ctapipe.io.sparse_images import get_sparse_image_reader
+    from ctapipe.io.tableio import FixedPointColumnTransform
+
+    path = tmp_path / "sparse.h5"
+    transform = FixedPointColumnTransform(
+        scale=100, offset=0, source_dtype=np.float32, target_dtype=np.int16
+    )
+    _write(
+        path, toy_subarray, dl1_images, n_dilations=0, transforms={"image": transform}
+    )
+
+    with tables.open_file(path) as h5file:
+        pixels = h5file.root.dl1.event.telescope.image_pixels.tel_001
+        assert pixels.coldtypes["image"] == np.int16
+        assert pixels.coldtypes["pixel_id"] == np.uint16
+
+        images_table = h5file.root.dl1.event.telescope.images.tel_001
+        dense = get_sparse_image_reader(h5file, images_table).read()
+
+    for i, dl1 in enumerate(dl1_images):
+        mask = dl1.image_mask
+        np.testing.assert_allclose(dense["image"][i][mask], dl1.image[mask], atol=0.005)
+
+
+def test_no_mask_stores_all_pixels(tmp_path, toy_subarray, dl1_images):
+    from ctapipe.io.sparse_images import get_sparse_image_reader
+
+    path = tmp_path / "sparse.h5"
+    images = [
+        DL1CameraContainer(image=dl1.image, peak_time=dl1.peak_time)
+        for dl1 in dl1_images[:3]
+    ]
+    _write(path, toy_subarray, images, columns=("image", "peak_time"))
+
+    with tables.open_file(path) as h5file:
+        images_table = h5file.root.dl1.event.telescope.images.tel_001
+        dense = get_sparse_image_reader(h5file, images_table).read()
+
+    assert dense.keys() == {"image", "peak_time"}
+    for i, dl1 in enumerate(images):
+        np.testing.assert_array_equal(dense["image"][i], dl1.image)
@@ -0,0 +1,103 @@
+"""Tests for the DL1 stage cache of ctapipe-process"""
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ctapipe.containers import ArrayEventContainer, DL1CameraContainer
+from ctapipe.core import Component
+from ctapipe.core.traits import Int, Path
+from ctapipe.io.stagecache import DL1Stage, DL1StageCache, get_config_hash
+
+
+class Source(Component):
+    input_url = Path(directory_ok=False).tag(config=True)
+    max_events = Int(default_value=None, allow_none=True).tag(config=True)
+
+
+class Calibrator(Component):
+    window_width = Int(default_value=7).tag(config=True)
+
+
+def make_events(n_events=5, n_pixels=10):
+    rng = np.random.default_rng(0)
+    events = []
+    for event_id in range(n_events):
+        event = ArrayEventContainer()
+        event.index.obs_id = 1
+        event.index.event_id = event_id
+        # not all telescopes in all events
+        for tel_id in range(1, 4):
+            if rng.uniform() < 0.3:
+                continue
+            event.dl1.tel[tel_id] = DL1CameraContainer(
+                image=rng.normal(size=n_pixels).astype(np.float32),
+                peak_time=rng.uniform(0, 20, n_pixels).astype(np.float32),
+                is_valid=True,
+            )
+        events.append(event)
+    return events
+
+
+def test_get_config_hash():
+    config = {"Calibrator": {"window_width": 7, "tels": {3, 1, 2}}}
+    same_config = {"Calibrator": {"tels": {2, 1, 3}, "window_width": 7}}
+    assert get_config_hash(config) == get_config_hash(same_config)
+
+    config["Calibrator"]["window_width"] = 8
+    assert get_config_hash(config) != get_config_hash(same_config)
+
+
+def test_images_stage(tmp_path):
+    input_url = tmp_path / "events.h5"
+    input_url.write_bytes(b"dummy")
+    cache_dir = tmp_path / "cache"
+
+    source = Source(input_url=input_url)
+    calibrator = Calibrator()
+    events = make_events()
+
+    with DL1StageCache(cache_dir, source, calibrator=calibrator) as cache:
+        assert cache.cached_stage is None
+        for event in events:
+            assert cache.fill(event) is None
+            cache(event)
+        cache.finish()
+
+    assert cache.paths[DL1Stage.IMAGES].is_file()
+
+    with DL1StageCache(cache_dir, source, calibrator=calibrator) as cache:
+        assert cache.cached_stage is DL1Stage.IMAGES
+        for expected in events:
+            event = ArrayEventContainer(index=expected.index)
+            assert cache.fill(event) is DL1Stage.IMAGES
+
+            assert event.dl1.tel.keys() == expected.dl1.tel.keys()
+            for tel_id, dl1 in event.dl1.tel.items():
+                assert_array_equal(dl1.image, expected.dl1.tel[tel_id].image)
+                assert_array_equal(dl1.peak_time, expected.dl1.tel[tel_id].peak_time)
+                assert dl1.is_valid
+
+    # changing the configuration results in a new cache entry
+    calibrator.window_width = 5
+    with DL1StageCache(cache_dir, source, calibrator=calibrator) as cache:
+        assert cache.cached_stage is None
+
+    # so does changing the input file
+    input_url.write_bytes(b"other dummy")
+    calibrator.window_width = 7
+    with DL1StageCache(cache_dir, source, calibrator=calibrator) as cache:
+        assert cache.cached_stage is None
+
+
+def test_incomplete_cache_removed(tmp_path):
+    input_url = tmp_path / "events.h5"
+    input_url.write_bytes(b"dummy")
+    cache_dir = tmp_path / "cache"
+    source = Source(input_url=input_url)
+
+    with DL1StageCache(cache_dir, source, calibrator=Calibrator()) as cache:
+        for event in make_events():
+            cache(event)
+        # no call to finish, e.g. because processing failed
+
+    assert list(cache_dir.iterdir()) == []
@@ -0,0 +1,41 @@
+import numpy as np
+import tables
+
+
+def test_storage_report(tmp_path):
+    from ctapipe.io.storage_report import get_storage_report
+
+    path = tmp_path / "test.h5"
+    rng = np.random.default_rng(0)
+    data = np.zeros(1000, dtype=[("a", np.float64), ("b", np.int64)])
+    data["a"] = rng.normal(size=1000)
+
+    with tables.open_file(path, "w") as h5file:
+        for name in ["tel_001", "tel_002"]:
+            h5file.create_table(
+                "/images",
+                name,
+                obj=data,
+                createparents=True,
+                filters=tables.Filters(complevel=5, complib="blosc:zstd"),
+                chunkshape=(100,),
+            )
+        h5file.create_table("/", "subarray", obj=data[:10])
+
+    report = get_storage_report(path)
+    assert list(report["group"]) == ["/", "/images"]
+    assert "write_throughput" not in report.colnames
+
+    images = report[1]
+    assert images["n_tables"] == 2
+    assert images["n_rows"] == 2000
+    assert np.isclose(images["uncompressed_size"], 2 * data.nbytes / 1024**2)
+    assert images["compression_ratio"] > 1
+    assert images["chunk_rows"] == 100
+    assert images["complib"] == "blosc:zstd"
+    assert images["read_throughput"] > 0
+
+    assert report[0]["complib"] == "none"
+
+    report = get_storage_report(path, max_rows=10, measure_write=True)
+    assert np.all(report["write_throughput"] > 0)
@@ -1,3 +1,5 @@
+import warnings
+
 import astropy.units as u
 import numpy as np
 import pytest
@@ -67,6 +69,62 @@ def test_check_order():
     )
 
 
+@pytest.mark.parametrize("sorted_right", [True, False])
+def test_left_join(sorted_right):
+    """Test the left join gives the same result as astropy join in original order"""
+    from astropy.table import join
+
+    from ctapipe.io.tableloader import _left_join
+
+    rng = np.random.default_rng(0)
+    n_events = 100
+    left = Table(
+        {
+            "obs_id": np.full(n_events, 5, dtype=np.int32),
+            "event_id": rng.permutation(n_events).astype(np.int64),
+            "value": rng.normal(size=n_events),
+        }
+    )
+    right = Table(
+        {
+            "obs_id": np.full(50, 5, dtype=np.int32),
+            "event_id": np.arange(0, 100, 2, dtype=np.int64),
+            "value": rng.normal(size=50) * u.m,
+            "image": rng.normal(size=(50, 3)),
+        }
+    )
+    if not sorted_right:
+        right = right[rng.permutation(len(right))]
+
+    keys = ["obs_id", "event_id"]
+    kwargs = dict(table_names=["_mono", ""], uniq_col_name="{col_name}{table_name}")
+    result = _left_join(left, right, keys, **kwargs)
+    expected = join(left, right, keys, join_type="left", **kwargs)
+
+    assert result.colnames == ["obs_id", "event_id", "value_mono", "value", "image"]
+    assert result["value"].unit == u.m
+    np.testing.assert_array_equal(result["event_id"], left["event_id"])
+
+    expected.sort("event_id")
+    result.sort("event_id")
+    for col in result.colnames:
+        assert type(result[col]) is type(expected[col])
+        np.testing.assert_array_equal(result[col], expected[col])
+
+    for col in ("value", "image"):
+        np.testing.assert_array_equal(result[col].mask, expected[col].mask)
+
+    # duplicated keys fall back to astropy join
+    left = left[rng.permutation(len(left))]
+    result = _left_join(left, Table(right[[0, 0]]), keys)
+    assert len(result) == len(left) + 1
+    assert result.colnames == ["obs_id", "event_id", "value_1", "value_2", "image"]
+    # still in the order of the left table
+    event_id = result["event_id"]
+    first = np.concatenate([[True], event_id[1:] != event_id[:-1]])
+    np.testing.assert_array_equal(event_id[first], left["event_id"])
+
+
 def test_telescope_events_for_tel_id(dl1_file):
     """Test loading data for a single telescope"""
     from ctapipe.io.tableloader import TableLoader
@@ -119,6 +177,116 @@ def test_instrument(dl1_file):
         assert np.all(table["equivalent_focal_length"] == expected)
 
 
+def test_columns(dl1_file):
+    """Test only loading a subset of the columns"""
+    from ctapipe.io.tableloader import TableLoader
+
+    columns = ["hillas_intensity", "hillas_length", "true_energy", "time_mono"]
+    with TableLoader(dl1_file) as table_loader:
+        expected = table_loader.read_telescope_events([8, 25])
+        table = table_loader.read_telescope_events([8, 25], columns=columns)
+        assert table.colnames == [
+            "obs_id",
+            "event_id",
+            "tel_id",
+            "time_mono",
+            "hillas_intensity",
+            "hillas_length",
+            "true_energy",
+        ]
+        for col in table.colnames:
+            np.testing.assert_array_equal(table[col], expected[col])
+
+        by_type = table_loader.read_telescope_events_by_type([8, 25], columns=columns)
+        for table in by_type.values():
+            assert set(table.colnames) == set(columns) | {
+                "obs_id",
+                "event_id",
+                "tel_id",
+            }
+
+        table = table_loader.read_subarray_events(columns=["true_energy"])
+        assert table.colnames == ["obs_id", "event_id", "true_energy"]
+
+
+def test_condition(dl1_file):
+    """Test only loading telescope events fulfilling a condition"""
+    from ctapipe.io.tableloader import TableLoader
+
+    condition = "hillas_intensity > 200"
+    with TableLoader(dl1_file) as table_loader:
+        expected = table_loader.read_telescope_events([8, 25])
+        mask = expected["hillas_intensity"] > 200
+        assert 0 < np.count_nonzero(mask) < len(expected)
+        expected = expected[mask]
+
+        table = table_loader.read_telescope_events([8, 25], condition=condition)
+        assert table.colnames == expected.colnames
+        assert len(table) == len(expected)
+        for col in ("obs_id", "event_id", "tel_id", "hillas_intensity", "true_energy"):
+            np.testing.assert_array_equal(table[col], expected[col])
+
+        by_id = table_loader.read_telescope_events_by_id([8, 25], condition=condition)
+        for tel_id, table in by_id.items():
+            np.testing.assert_array_equal(
+                table["event_id"], expected["event_id"][expected["tel_id"] == tel_id]
+            )
+
+    with TableLoader(dl1_file, condition=condition) as table_loader:
+        table = table_loader.read_telescope_events([8, 25])
+        np.testing.assert_array_equal(table["event_id"], expected["event_id"])
+
+
+def test_n_workers(dl1_file):
+    """Test reading the telescopes in parallel gives the same result"""
+    from ctapipe.io.tableloader import TableLoader
+
+    with TableLoader(dl1_file) as table_loader:
+        expected = table_loader.read_telescope_events_by_id()
+
+    with TableLoader(dl1_file, n_workers=2) as table_loader:
+        by_id = table_loader.read_telescope_events_by_id()
+
+    assert list(by_id.keys()) == list(expected.keys())
+    for tel_id, table in by_id.items():
+        assert table.colnames == expected[tel_id].colnames
+        np.testing.assert_array_equal(table["event_id"], expected[tel_id]["event_id"])
+        np.testing.assert_array_equal(
+            table["hillas_intensity"], expected[tel_id]["hillas_intensity"]
+        )
+
+
+def test_n_workers_h5file_and_kwargs(dl1_file):
+    """Test workers use the file of an h5file and the options passed as kwargs"""
+    from ctapipe.io.tableloader import TableLoader
+
+    kwargs = dict(dl1_parameters=False, instrument=True)
+    with TableLoader(dl1_file, **kwargs) as table_loader:
+        expected = table_loader.read_telescope_events_by_id()
+
+    with tables.open_file(dl1_file) as h5file:
+        with TableLoader(h5file=h5file, n_workers=2, **kwargs) as table_loader:
+            by_id = table_loader.read_telescope_events_by_id()
+
+    assert list(by_id.keys()) == list(expected.keys())
+    for tel_id, table in by_id.items():
+        assert table.colnames == expected[tel_id].colnames
+        assert "hillas_intensity" not in table.colnames
+        assert "tel_description" in table.colnames
+
+
+def test_n_workers_requires_file(tmp_path):
+    """Test workers need a file on disk they can open themselves"""
+    from ctapipe.io.tableloader import InputMissing, TableLoader
+
+    path = tmp_path / "in_memory.h5"
+    with tables.open_file(
+        path, mode="w", driver="H5FD_CORE", driver_core_backing_store=0
+    ) as h5file:
+        with pytest.raises(InputMissing, match="n_workers > 1"):
+            TableLoader(h5file=h5file, n_workers=2)
+
+
 def test_simulated(dl1_file):
     """Test joining simulation info onto telescope events"""
     from ctapipe.io.tableloader import TableLoader
@@ -499,3 +667,63 @@ def test_interpolate_pointing(dl1_merged_monitoring_file):
         assert len(events) > 0
         assert "telescope_pointing_azimuth" in events.colnames
         assert "telescope_pointing_altitude" in events.colnames
+
+
+@pytest.mark.parametrize("order", ["reversed", "swapped_inner"])
+def test_condition_unaligned_images(tmp_path, provenance, order):
+    """Test images are selected by their keys if not row-aligned with the parameters"""
+    import shutil
+
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.image import ImageProcessor
+    from ctapipe.io import DataWriter, TableLoader
+    from ctapipe.io.hdf5dataformat import DL1_TEL_IMAGES_GROUP
+    from ctapipe.io.tableloader import IndexNotMatching
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    subarray = make_toy_subarray(n_telescopes=2, n_pixels_side=11)
+    source = SyntheticEventSource(
+        subarray=subarray, max_events=20, seed=0, trigger_probability=1.0
+    )
+    process_images = ImageProcessor(subarray=subarray)
+
+    provenance.start_activity("test_condition_unaligned_images")
+    path = tmp_path / "aligned.dl1.h5"
+    with DataWriter(
+        event_source=source,
+        output_path=path,
+        write_dl1_images=True,
+        write_dl1_parameters=True,
+    ) as writer:
+        for event in source:
+            process_images(event)
+            writer(event)
+
+    # same number of rows as the parameters, but in a different order
+    unaligned_path = tmp_path / "unaligned.dl1.h5"
+    shutil.copy(path, unaligned_path)
+    tel_id = 1
+    with tables.open_file(unaligned_path, "r+") as h5file:
+        h5table = h5file.root[f"{DL1_TEL_IMAGES_GROUP}/tel_{tel_id:03d}"]
+        rows = h5table.read()
+        if order == "reversed":
+            rows = rows[::-1]
+        else:
+            # first and last row still match the parameters table
+            rows[1:-1] = rows[-2:0:-1]
+        h5table.modify_rows(0, len(rows), rows=rows)
+
+    condition = "hillas_intensity > 0"
+    opts = dict(dl1_images=True, dl1_parameters=True, simulated=False)
+    with TableLoader(path, **opts) as loader:
+        expected = loader.read_telescope_events_by_id([tel_id], condition=condition)
+    with TableLoader(unaligned_path, **opts) as loader:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", IndexNotMatching)
+            table = loader.read_telescope_events_by_id([tel_id], condition=condition)
+
+    expected, table = expected[tel_id], table[tel_id]
+    assert 0 < len(table) < 20
+    for col in ("obs_id", "event_id", "tel_id", "image", "peak_time"):
+        assert not np.ma.is_masked(table[col])
+        np.testing.assert_array_equal(table[col], expected[col])
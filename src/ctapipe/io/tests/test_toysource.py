@@ -1,4 +1,5 @@
 import astropy.units as u
+import numpy as np
 import pytest
 
 from ctapipe.instrument import SubarrayDescription
@@ -41,3 +42,113 @@ def test_is_compatible():
     assert not ToyEventSource.is_compatible(
         get_dataset_path("gamma_test_large.simtel.gz")
     )
+
+
+def test_synthetic_source(subarray):
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    source = SyntheticEventSource(subarray=subarray, max_events=25, batch_size=10)
+
+    n_events = 0
+    for event_id, event in enumerate(source):
+        n_events += 1
+        assert event.index.event_id == event_id
+        assert np.all(event.trigger.tels_with_trigger == sorted(event.dl1.tel))
+        assert event.trigger.tel.keys() == event.dl1.tel.keys()
+        for tel_id, dl1 in event.dl1.tel.items():
+            n_pixels = subarray.tel[tel_id].camera.geometry.n_pixels
+            assert dl1.image.shape == (n_pixels,)
+            assert dl1.peak_time.shape == (n_pixels,)
+    assert n_events == 25
+
+
+def test_synthetic_source_deterministic(subarray):
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    tables = SyntheticEventSource(subarray=subarray, seed=5).generate_batch(20)
+    tables_again = SyntheticEventSource(subarray=subarray, seed=5).generate_batch(20)
+    tables_other = SyntheticEventSource(subarray=subarray, seed=6).generate_batch(20)
+
+    assert tables.keys() == tables_again.keys()
+    for tel_id, table in tables.items():
+        assert np.all(table["event_id"] < 20)
+        assert np.all(table["tel_id"] == tel_id)
+        np.testing.assert_array_equal(table["image"], tables_again[tel_id]["image"])
+        assert not np.array_equal(table["image"], tables_other[tel_id]["image"])
+
+
+def test_synthetic_source_iterate_twice(subarray):
+    """Test iterating over the same source again yields the same events"""
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    source = SyntheticEventSource(subarray=subarray, max_events=15, batch_size=10)
+    events = [{tel_id: dl1.image for tel_id, dl1 in e.dl1.tel.items()} for e in source]
+    events_again = [
+        {tel_id: dl1.image for tel_id, dl1 in e.dl1.tel.items()} for e in source
+    ]
+
+    assert len(events) == len(events_again) == 15
+    for images, images_again in zip(events, events_again):
+        assert images.keys() == images_again.keys()
+        for tel_id, image in images.items():
+            np.testing.assert_array_equal(image, images_again[tel_id])
+
+
+def test_synthetic_source_waveforms(subarray):
+    from ctapipe.io import DataLevel
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    source = SyntheticEventSource(
+        subarray=subarray,
+        max_events=5,
+        trigger_probability=1.0,
+        waveforms=True,
+        nsb_level_pe=0.0,
+        max_time_gradient=0.0,
+    )
+    assert DataLevel.R1 in source.datalevels
+
+    for event in source:
+        for tel_id, r1 in event.r1.tel.items():
+            readout = subarray.tel[tel_id].camera.readout
+            n_pixels = readout.n_pixels
+            assert r1.waveform.shape == (
+                readout.n_channels,
+                n_pixels,
+                readout.n_samples,
+            )
+
+            # without time gradient, all pulses are in the middle of the readout window
+            true_image = event.dl1.tel[tel_id].image
+            np.testing.assert_allclose(
+                r1.waveform[0].sum(axis=-1), true_image, rtol=1e-3, atol=1e-3
+            )
+
+
+def test_synthetic_source_datawriter(subarray, tmp_path, provenance):
+    from ctapipe.image import ImageProcessor
+    from ctapipe.io import DataWriter, TableLoader
+    from ctapipe.io.toymodel import SyntheticEventSource
+
+    source = SyntheticEventSource(subarray=subarray, max_events=20)
+    process_images = ImageProcessor(subarray=subarray)
+    path = tmp_path / "synthetic.dl1.h5"
+
+    n_tel_events = 0
+    with provenance.activity("test_synthetic_source_datawriter"):
+        with DataWriter(
+            source,
+            output_path=path,
+            write_dl1_images=True,
+            write_dl1_parameters=True,
+        ) as write:
+            for event in source:
+                process_images(event)
+                write(event)
+                n_tel_events += len(event.dl1.tel)
+
+    with TableLoader(path, dl1_images=True, dl1_parameters=True) as loader:
+        events = loader.read_telescope_events()
+
+    assert len(events) == n_tel_events
+    assert events["image"].shape[1] == subarray.tel[1].camera.geometry.n_pixels
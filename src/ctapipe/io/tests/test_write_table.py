@@ -122,3 +122,59 @@ def test_column_meta(tmp_path):
     print(table)
     assert table["test_foo"].info.meta == {"NAME": "foo"}
     assert table["test_bar"].info.meta == {"NAME": "bar"}
+
+
+def test_table_write_session(tmp_path):
+    """Test writing chunks and multiple tables through one TableWriteSession"""
+    import tables
+
+    from ctapipe.io import TableWriteSession, read_table
+
+    output_path = tmp_path / "session.h5"
+
+    def chunk(start):
+        table = Table(
+            {
+                "event_id": np.arange(start, start + 10),
+                "energy": np.linspace(1, 2, 10) * u.TeV,
+                "time": Time(59000 + np.arange(10), format="mjd"),
+            }
+        )
+        table.meta["FOO"] = "bar"
+        table["energy"].description = "Energy"
+        return table
+
+    with TableWriteSession(output_path, mode="w") as session:
+        for start in range(0, 50, 10):
+            session.write(chunk(start), "/chunks/tel_001", append=True)
+            session.write(chunk(start)[:1], "/chunks/tel_002", append=True)
+
+        session.write(chunk(0), "/single", overwrite=True)
+        session.write(chunk(100), "/single", overwrite=True)
+
+        with pytest.raises(OSError, match="already exists"):
+            session.write(chunk(0), "/single")
+
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            session.write(chunk(0), "/single", append=True, overwrite=True)
+
+    assert not session.h5file.isopen
+
+    table = read_table(output_path, "/chunks/tel_001")
+    np.testing.assert_array_equal(table["event_id"], np.arange(50))
+    assert table["energy"].unit == u.TeV
+    assert table["energy"].description == "Energy"
+    assert table.meta["FOO"] == "bar"
+    assert isinstance(table["time"], Time)
+
+    assert len(read_table(output_path, "/chunks/tel_002")) == 5
+    np.testing.assert_array_equal(
+        read_table(output_path, "/single")["event_id"], np.arange(100, 110)
+    )
+
+    # a session on an open file does not close it
+    with tables.open_file(output_path, mode="a") as h5file:
+        with TableWriteSession(h5file) as session:
+            session.write(chunk(50), "/chunks/tel_001", append=True)
+        assert h5file.isopen
+        assert len(h5file.root.chunks.tel_001) == 60
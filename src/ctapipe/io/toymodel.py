@@ -7,18 +7,30 @@ import logging
 
 import astropy.units as u
 import numpy as np
+from astropy.table import Table
+from astropy.time import Time
 
 from ..containers import (
     ArrayEventContainer,
     DL1CameraContainer,
+    DL2Container,
     EventIndexContainer,
+    MonitoringContainer,
     ObservationBlockContainer,
+    R1CameraContainer,
     SchedulingBlockContainer,
+    TelescopeTriggerContainer,
+    TriggerContainer,
 )
 from ..core import TelescopeComponent, traits
 from .datalevels import DataLevel
 from .eventsource import EventSource
 
+__all__ = [
+    "ToyEventSource",
+    "SyntheticEventSource",
+]
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,3 +165,322 @@ class ToyEventSource(TelescopeComponent, EventSource):
             event.dl1.tel[tel_id] = DL1CameraContainer(image=image)
 
         return event
+
+
+class SyntheticEventSource(ToyEventSource):
+    """
+    High-throughput source of synthetic events for scale tests of the pipeline.
+
+    Events are generated in batches of ``batch_size`` array events.
+    For each telescope, the images of all its events in a batch are computed at
+    once using `~ctapipe.image.toymodel.skewed_gaussian_expected_signal`,
+    with poisson fluctuations of the signal and the night sky background.
+    Peak times follow a linear gradient along the shower axis.
+    Optionally, R1 waveforms are created using
+    `~ctapipe.image.toymodel.WaveformModel.get_waveforms`.
+
+    The generated events only depend on the subarray, the configuration
+    and ``seed``, so the same stream of events can be reproduced.
+    Each iteration over the source yields the same events, unless
+    an ``rng`` is passed instead of using ``seed``.
+
+    Iterating over the source yields `~ctapipe.containers.ArrayEventContainer`
+    that can be processed and written like events read from files, e.g.
+    using the `~ctapipe.io.DataWriter`.
+    Use `generate_batch` to obtain tables of telescope events without the
+    overhead of creating containers.
+    """
+
+    #: time of the first event, events follow each other in steps of 1 ms
+    start_time = Time("2025-01-01T00:00:00")
+    pointing_altitude = 70 * u.deg
+    pointing_azimuth = 0 * u.deg
+
+    batch_size = traits.Int(
+        default_value=1000,
+        min=1,
+        help="Number of array events generated at once",
+    ).tag(config=True)
+
+    min_intensity = traits.FloatTelescopeParameter(
+        default_value=50.0, help="Minimum intensity of the showers in p.e."
+    ).tag(config=True)
+    max_intensity = traits.FloatTelescopeParameter(
+        default_value=5000.0, help="Maximum intensity of the showers in p.e."
+    ).tag(config=True)
+    intensity_index = traits.Float(
+        default_value=2.0,
+        help="Index of the power law distribution of the intensity, must not be 1",
+    ).tag(config=True)
+
+    nsb_level_pe = traits.FloatTelescopeParameter(
+        default_value=1.0,
+        help="Mean number of night sky background p.e. per pixel and event",
+    ).tag(config=True)
+
+    max_time_gradient = traits.FloatTelescopeParameter(
+        default_value=20.0,
+        help="Maximum absolute time gradient along the shower axis in ns/m",
+    ).tag(config=True)
+
+    waveforms = traits.Bool(
+        default_value=False,
+        help="Also generate R1 waveforms, this is much slower than DL1 images only",
+    ).tag(config=True)
+
+    def __init__(self, subarray, config=None, parent=None, rng=None, **kwargs):
+        super().__init__(
+            subarray=subarray, config=config, parent=parent, rng=rng, **kwargs
+        )
+        if self.intensity_index == 1:
+            raise ValueError("intensity_index must not be 1")
+        self._waveform_models = {}
+        self.event_id = 0
+        # restart the rng for each iteration, unless it was passed in
+        self._rng_from_seed = rng is None
+
+    @property
+    def is_simulation(self):
+        return False
+
+    @property
+    def datalevels(self):
+        if self.waveforms:
+            return (DataLevel.R1, DataLevel.DL1_IMAGES)
+        return (DataLevel.DL1_IMAGES,)
+
+    @property
+    def scheduling_blocks(self) -> dict[int, SchedulingBlockContainer]:
+        sb = SchedulingBlockContainer(
+            sb_id=np.uint64(1), producer_id="ctapipe synthetic"
+        )
+        return {sb.sb_id: sb}
+
+    @property
+    def observation_blocks(self) -> dict[int, ObservationBlockContainer]:
+        ob = ObservationBlockContainer(
+            obs_id=np.uint64(1), sb_id=np.uint64(1), producer_id="ctapipe synthetic"
+        )
+        return {ob.obs_id: ob}
+
+    def _draw_intensity(self, tel_id, size):
+        min_intensity = self.min_intensity.tel[tel_id]
+        max_intensity = self.max_intensity.tel[tel_id]
+        # inverse of the cumulative distribution of a truncated power law
+        exponent = 1 - self.intensity_index
+        low = min_intensity**exponent
+        high = max_intensity**exponent
+        uniform = self.rng.uniform(size=size)
+        return (low + uniform * (high - low)) ** (1 / exponent)
+
+    def _waveform_model(self, readout):
+        model = self._waveform_models.get(readout)
+        if model is None:
+            from ..image.toymodel import WaveformModel
+
+            model = WaveformModel.from_camera_readout(readout)
+            self._waveform_models[readout] = model
+        return model
+
+    def _generate_telescope_events(self, tel_id, n_events):
+        from ..image.hillas import camera_to_shower_coordinates
+        from ..image.toymodel import skewed_gaussian_expected_signal
+
+        rng = self.rng
+        camera = self.subarray.tel[tel_id].camera
+        geometry = camera.geometry
+        readout = camera.readout
+        unit = geometry.pix_x.unit
+
+        r = np.sqrt(rng.uniform(0, 0.9, n_events)) * geometry.guess_radius()
+        phi = rng.uniform(0, 2 * np.pi, n_events)
+        x = r * np.cos(phi)
+        y = r * np.sin(phi)
+        length = rng.uniform(
+            self.min_length_m.tel[tel_id], self.max_length_m.tel[tel_id], n_events
+        )
+        eccentricity = rng.uniform(
+            self.min_eccentricity.tel[tel_id],
+            self.max_eccentricity.tel[tel_id],
+            n_events,
+        )
+        width = self.calc_width(eccentricity, length)
+        psi = rng.uniform(0, 2 * np.pi, n_events)
+        skewness = rng.uniform(
+            self.min_skewness.tel[tel_id], self.max_skewness.tel[tel_id], n_events
+        )
+        intensity = self._draw_intensity(tel_id, n_events)
+
+        expected_signal = skewed_gaussian_expected_signal(
+            geometry,
+            intensity,
+            x=x,
+            y=y,
+            length=length * u.m,
+            width=width * u.m,
+            psi=psi * u.rad,
+            skewness=skewness,
+        )
+        signal = rng.poisson(expected_signal)
+        nsb_level_pe = self.nsb_level_pe.tel[tel_id]
+        noise = rng.poisson(nsb_level_pe, size=signal.shape)
+        image = (signal + noise - nsb_level_pe).astype(np.float32)
+
+        duration = (readout.n_samples / readout.sampling_rate).to_value(u.ns)
+        max_gradient = self.max_time_gradient.tel[tel_id]
+        gradient = rng.uniform(-max_gradient, max_gradient, n_events)
+        longitudinal, _ = camera_to_shower_coordinates(
+            geometry.pix_x.to_value(u.m),
+            geometry.pix_y.to_value(u.m),
+            x.to_value(u.m)[:, np.newaxis],
+            y.to_value(u.m)[:, np.newaxis],
+            psi[:, np.newaxis],
+        )
+        signal_time = np.clip(
+            0.5 * duration + gradient[:, np.newaxis] * longitudinal, 0, duration
+        )
+        noise_time = rng.uniform(0, duration, size=signal.shape)
+        peak_time = np.where(signal > 0, signal_time, noise_time).astype(np.float32)
+
+        columns = {
+            "image": image,
+            "peak_time": peak_time,
+            "true_image": signal.astype(np.int32),
+            "true_intensity": intensity,
+            "true_x": x.to(unit),
+            "true_y": y.to(unit),
+            "true_length": (length * u.m).to(unit),
+            "true_width": (width * u.m).to(unit),
+            "true_psi": (psi * u.rad).to(u.deg),
+            "true_skewness": skewness,
+        }
+
+        if self.waveforms:
+            model = self._waveform_model(readout)
+            waveform = model.get_waveforms(
+                signal, signal_time, readout.n_samples, dtype=np.float32
+            )
+            waveform += model.get_waveforms(
+                noise, noise_time, readout.n_samples, dtype=np.float32
+            )
+            columns["waveform"] = waveform
+
+        return columns
+
+    def generate_batch(self, n_events=None):
+        """
+        Generate the telescope events of the next ``n_events`` array events.
+
+        Parameters
+        ----------
+        n_events : int or None
+            Number of array events, defaults to ``batch_size``
+
+        Returns
+        -------
+        dict[int, astropy.table.Table]
+            Table of the telescope events for each telescope with at least
+            one event in this batch. Besides ``obs_id``, ``event_id`` and
+            ``tel_id``, the tables contain the ``image`` and ``peak_time``,
+            the true signal ``true_image``, the parameters of the shower
+            model in the ``true_*`` columns and, if ``waveforms`` is enabled,
+            the R1 ``waveform``.
+        """
+        if n_events is None:
+            n_events = self.batch_size
+
+        event_ids = np.arange(self.event_id, self.event_id + n_events)
+        self.event_id += n_events
+
+        tel_ids = self.subarray.tel_ids
+        trigger_probability = np.array(
+            [self.trigger_probability.tel[tel_id] for tel_id in tel_ids]
+        )
+        triggered = self.rng.uniform(size=(n_events, len(tel_ids)))
+        triggered = triggered < trigger_probability
+
+        tables = {}
+        for tel_index, tel_id in enumerate(tel_ids):
+            mask = triggered[:, tel_index]
+            n_tel_events = np.count_nonzero(mask)
+            if n_tel_events == 0:
+                continue
+
+            columns = self._generate_telescope_events(tel_id, n_tel_events)
+            table = Table(
+                {
+                    "obs_id": np.ones(n_tel_events, dtype=np.int32),
+                    "event_id": event_ids[mask],
+                    "tel_id": np.full(n_tel_events, tel_id, dtype=np.int16),
+                }
+            )
+            for name, column in columns.items():
+                table[name] = column
+            tables[tel_id] = table
+
+        return tables
+
+    def _generator(self):
+        self.event_id = 0
+        if self._rng_from_seed:
+            self.rng = np.random.default_rng(self.seed)
+
+        while self.max_events is None or self.event_id < self.max_events:
+            first_event_id = self.event_id
+            n_events = self.batch_size
+            if self.max_events is not None:
+                n_events = min(n_events, self.max_events - first_event_id)
+
+            tables = self.generate_batch(n_events)
+            yield from self._events_from_tables(first_event_id, n_events, tables)
+
+    def _events_from_tables(self, first_event_id, n_events, tables):
+        times = (
+            self.start_time
+            + np.arange(first_event_id, first_event_id + n_events) * u.ms
+        )
+
+        # telescope events of each array event, ordered by tel_id
+        tel_events = [[] for _ in range(n_events)]
+        for tel_id, table in tables.items():
+            columns = {name: table[name].value for name in table.colnames}
+            for row, event_id in enumerate(columns["event_id"]):
+                tel_events[event_id - first_event_id].append((tel_id, columns, row))
+
+        for index in range(n_events):
+            event_id = first_event_id + index
+            time = times[index]
+
+            event = ArrayEventContainer(
+                index=EventIndexContainer(obs_id=1, event_id=event_id),
+                trigger=TriggerContainer(time=time),
+                monitoring=MonitoringContainer(),
+                dl2=DL2Container(),
+                r0=None,
+                dl0=None,
+                simulation=None,
+                count=event_id,
+            )
+            event.monitoring.pointing.array_altitude = self.pointing_altitude
+            event.monitoring.pointing.array_azimuth = self.pointing_azimuth
+
+            for tel_id, columns, row in tel_events[index]:
+                event.trigger.tel[tel_id] = TelescopeTriggerContainer(time=time)
+                pointing = event.monitoring.tel[tel_id].pointing
+                pointing.altitude = self.pointing_altitude
+                pointing.azimuth = self.pointing_azimuth
+
+                event.dl1.tel[tel_id] = DL1CameraContainer(
+                    image=columns["image"][row],
+                    peak_time=columns["peak_time"][row],
+                )
+                if self.waveforms:
+                    event.r1.tel[tel_id] = R1CameraContainer(
+                        event_time=time,
+                        waveform=columns["waveform"][row],
+                    )
+
+            event.trigger.tels_with_trigger = np.array(
+                [tel_id for tel_id, _, _ in tel_events[index]], dtype=np.int16
+            )
+            yield event
@@ -1,23 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
-# reconstructors must be imported before ShowerProcessor, so
-# they are available there
-from .hillas_intersection import HillasIntersection
-from .hillas_reconstructor import HillasReconstructor
-from .impact import ImPACTReconstructor
-from .reconstructor import (
-    HillasGeometryReconstructor,
-    ReconstructionProperty,
-    Reconstructor,
-)
-from .shower_processor import ShowerProcessor
-from .sklearn import (
-    CrossValidator,
-    DispReconstructor,
-    EnergyRegressor,
-    ParticleClassifier,
-)
-from .stereo_combination import StereoCombiner, StereoMeanCombiner
+# the submodules are only imported when one of their attributes is accessed,
+# the reconstructors are found via the ctapipe_reco plugin entry point
+from .._lazy import attach
 
 __all__ = [
     "Reconstructor",
@@ -34,3 +19,26 @@ __all__ = [
     "StereoMeanCombiner",
     "CrossValidator",
 ]
+
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "hillas_intersection": ["HillasIntersection"],
+        "hillas_reconstructor": ["HillasReconstructor"],
+        "impact": ["ImPACTReconstructor"],
+        "reconstructor": [
+            "HillasGeometryReconstructor",
+            "ReconstructionProperty",
+            "Reconstructor",
+        ],
+        "shower_processor": ["ShowerProcessor"],
+        "sklearn": [
+            "CrossValidator",
+            "DispReconstructor",
+            "EnergyRegressor",
+            "ParticleClassifier",
+        ],
+        "stereo_combination": ["StereoCombiner", "StereoMeanCombiner"],
+    },
+)
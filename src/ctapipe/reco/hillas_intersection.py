@@ -10,24 +10,22 @@ performance
 """
 
 import itertools
-import warnings
 
 import astropy.units as u
 import numpy as np
-from astropy.coordinates import AltAz, SkyCoord
+from astropy.table import Table
 
 from ..containers import (
     CameraHillasParametersContainer,
     HillasParametersContainer,
     ReconstructedGeometryContainer,
 )
-from ..coordinates import (
-    CameraFrame,
-    MissingFrameAttributeWarning,
-    NominalFrame,
-    TelescopeFrame,
-    TiltedGroundFrame,
-    project_to_ground,
+from ..coordinates.numpy_transforms import (
+    camera_to_fov,
+    fov_to_altaz,
+    fov_to_fov,
+    ground_to_tilted,
+    project_tilted_to_ground,
 )
 from ..core import traits
 from .reconstructor import (
@@ -35,7 +33,11 @@ from .reconstructor import (
     InvalidWidthException,
     ReconstructionProperty,
     TooFewTelescopesException,
+    _TableParameters,
+    _to_array_events,
 )
+from .telescope_event_handling import _get_pair_indices, _grouped_add
+from .utils import add_defaults_and_meta
 
 __all__ = ["HillasIntersection"]
 
@@ -114,6 +116,15 @@ class HillasIntersection(HillasGeometryReconstructor):
         if self.weighting == "harmonic-mean-intensity":
             self._weight_method = self.weight_mean_intensity
 
+        # the frame transformations are done on plain arrays in the event loop
+        self._tel_positions_m = subarray.tel_coords.cartesian.xyz.to_value(u.m).T
+        self._focal_length_m = np.array(
+            [
+                tel.optics.equivalent_focal_length.to_value(u.m)
+                for tel in subarray.tel.values()
+            ]
+        )
+
     def __call__(self, event):
         """
         Perform stereo reconstruction on event.
@@ -134,19 +145,211 @@ class HillasIntersection(HillasGeometryReconstructor):
             return
 
         # Due to tracking the pointing of the array will never be a constant
-        array_pointing = SkyCoord(
-            az=event.monitoring.pointing.array_azimuth,
-            alt=event.monitoring.pointing.array_altitude,
-            frame=AltAz(),
+        pointing = event.monitoring.pointing
+        tel_pointings = {
+            tel_id: event.monitoring.tel[tel_id].pointing for tel_id in hillas_dict
+        }
+
+        event.dl2.stereo.geometry[self.__class__.__name__] = self._reconstruct(
+            hillas_dict,
+            array_alt=pointing.array_altitude.to_value(u.rad),
+            array_az=pointing.array_azimuth.to_value(u.rad),
+            tel_alt=[p.altitude.to_value(u.rad) for p in tel_pointings.values()],
+            tel_az=[p.azimuth.to_value(u.rad) for p in tel_pointings.values()],
         )
 
-        telescope_pointings = self._get_telescope_pointings(event)
+        self._store_impact_parameter(event)
+
+    def predict_table(self, table: Table) -> Table:
+        """
+        Perform the shower geometry reconstruction for a table of telescope events.
+
+        This gives the same results as calling the reconstructor on each
+        event, but processes all events at once using only numpy operations.
 
-        event.dl2.stereo.geometry[self.__class__.__name__] = self._predict(
-            hillas_dict, array_pointing, telescope_pointings
+        Parameters
+        ----------
+        table : astropy.table.Table
+            Table of telescope events with dl1 parameters as read by
+            `~ctapipe.io.TableLoader` with ``dl1_parameters``,
+            ``observation_info`` and ``pointing`` enabled.
+            The telescope events of a subarray event need to be in consecutive rows.
+
+        Returns
+        -------
+        astropy.table.Table
+            Table with the reconstructed geometry of each subarray event
+        """
+        prefix = self.__class__.__name__
+        (
+            obs_ids,
+            event_ids,
+            valid,
+            selected,
+            tel_to_array_indices,
+        ) = self._select_table_telescopes(table)
+        n_array_events = len(obs_ids)
+
+        tel_alt, tel_az, array_alt, array_az = (
+            values[selected] for values in self._get_table_pointing(table)
         )
+        array_indices = tel_to_array_indices[selected]
+        tel_ids = np.asanyarray(table["tel_id"])[selected]
+        tel_indices = self.subarray.tel_index_array[tel_ids]
+
+        hillas = _TableParameters(table[selected]).hillas
+        psi = hillas.psi.to_value(u.rad)
+        intensity = np.asanyarray(hillas.intensity, dtype=np.float64)
+
+        if "hillas_fov_lon" in table.colnames:
+            cog_lon = hillas.fov_lon.to_value(u.rad)
+            cog_lat = hillas.fov_lat.to_value(u.rad)
+        else:
+            cog_lon, cog_lat = camera_to_fov(
+                hillas.x.to_value(u.m),
+                hillas.y.to_value(u.m),
+                self._focal_length_m[tel_indices],
+            )
 
-        self._store_impact_parameter(event)
+        # TelescopeFrame to the NominalFrame of the array pointing
+        cog_lon, cog_lat = fov_to_fov(
+            cog_lon, cog_lat, tel_alt, tel_az, array_alt, array_az
+        )
+
+        index_a, index_b, pair_to_array_indices = _get_pair_indices(
+            np.bincount(array_indices, minlength=n_array_events)
+        )
+        weight = self._weight_method(intensity[index_a], intensity[index_b])
+        weight *= self.weight_sin(psi[index_a], psi[index_b])
+
+        def weighted_mean_std(values):
+            sum_of_weights = _grouped_add(weight, n_array_events, pair_to_array_indices)
+            mean = np.full(n_array_events, np.nan)
+            mean[valid] = (
+                _grouped_add(values * weight, n_array_events, pair_to_array_indices)[
+                    valid
+                ]
+                / sum_of_weights[valid]
+            )
+            residuals = (values - mean[pair_to_array_indices]) ** 2
+            variance = np.full(n_array_events, np.nan)
+            variance[valid] = (
+                _grouped_add(residuals * weight, n_array_events, pair_to_array_indices)[
+                    valid
+                ]
+                / sum_of_weights[valid]
+            )
+            return mean, np.sqrt(variance)
+
+        # direction, see reconstruct_nominal
+        src_x, src_y = self.intersect_lines(
+            cog_lon[index_a],
+            cog_lat[index_a],
+            psi[index_a],
+            cog_lon[index_b],
+            cog_lat[index_b],
+            psi[index_b],
+        )
+        src_fov_lon, err_fov_lon = weighted_mean_std(src_x)
+        src_fov_lat, err_fov_lat = weighted_mean_std(src_y)
+
+        # events reconstructed at great angular distance from camera center
+        # are invalid, see _far_outside_fov
+        valid &= ~(
+            (np.abs(src_fov_lat) > FOV_ANGULAR_DISTANCE_LIMIT_RAD)
+            | (np.abs(src_fov_lon) > FOV_ANGULAR_DISTANCE_LIMIT_RAD)
+        )
+        src_fov_lon[~valid] = np.nan
+        src_fov_lat[~valid] = np.nan
+        array_indices_valid = valid[array_indices]
+        telescopes = [[] for _ in range(n_array_events)]
+        for index, tel_id in zip(
+            array_indices[array_indices_valid], tel_ids[array_indices_valid]
+        ):
+            telescopes[index].append(tel_id)
+
+        # core position, see reconstruct_tilted
+        positions_tilted = ground_to_tilted(
+            self._tel_positions_m[tel_indices], array_alt, array_az
+        )
+        tel_x = positions_tilted[:, 0]
+        tel_y = positions_tilted[:, 1]
+        crossing_y, crossing_x = self.intersect_lines(
+            tel_y[index_a],
+            tel_x[index_a],
+            psi[index_a],
+            tel_y[index_b],
+            tel_x[index_b],
+            psi[index_b],
+        )
+        core_x, core_err_x = weighted_mean_std(crossing_x)
+        core_y, core_err_y = weighted_mean_std(crossing_y)
+
+        pointing_alt = _to_array_events(array_alt, array_indices, n_array_events)
+        pointing_az = _to_array_events(array_az, array_indices, n_array_events)
+        alt, az = fov_to_altaz(src_fov_lon, src_fov_lat, pointing_alt, pointing_az)
+        ground_x, ground_y = project_tilted_to_ground(
+            core_x, core_y, pointing_alt, pointing_az
+        )
+
+        # see reconstruct_h_max
+        height = get_shower_height(
+            src_fov_lon[array_indices],
+            src_fov_lat[array_indices],
+            cog_lon,
+            cog_lat,
+            core_x[array_indices],
+            core_y[array_indices],
+            tel_x,
+            tel_y,
+        )
+        mean_distance = np.full(n_array_events, np.nan)
+        mean_distance[valid] = (
+            _grouped_add(height * intensity, n_array_events, array_indices)[valid]
+            / _grouped_add(intensity, n_array_events, array_indices)[valid]
+        )
+        # zenith angle is 90 deg - altitude of the array pointing
+        h_max = mean_distance * np.sin(pointing_alt)
+        h_max += self.subarray.reference_location.geodetic.height.to_value(u.m)
+        h_max[h_max > H_MAX_UPPER_LIMIT_M] = np.nan
+
+        average_intensity = np.full(n_array_events, np.nan)
+        average_intensity[valid] = (
+            _grouped_add(intensity, n_array_events, array_indices)[valid]
+            / np.bincount(array_indices, minlength=n_array_events)[valid]
+        )
+
+        src_error = np.rad2deg(np.sqrt(err_fov_lon**2 + err_fov_lat**2))
+        result = Table(
+            {
+                "obs_id": obs_ids,
+                "event_id": event_ids,
+                f"{prefix}_alt": u.Quantity(np.rad2deg(alt), u.deg),
+                f"{prefix}_alt_uncert": u.Quantity(src_error, u.deg),
+                f"{prefix}_az": u.Quantity(np.rad2deg(az), u.deg),
+                f"{prefix}_az_uncert": u.Quantity(src_error, u.deg),
+                f"{prefix}_core_x": u.Quantity(ground_x, u.m),
+                f"{prefix}_core_y": u.Quantity(ground_y, u.m),
+                f"{prefix}_core_tilted_x": u.Quantity(core_x, u.m),
+                f"{prefix}_core_tilted_y": u.Quantity(core_y, u.m),
+                f"{prefix}_core_tilted_uncert_x": u.Quantity(core_err_x, u.m),
+                f"{prefix}_core_tilted_uncert_y": u.Quantity(core_err_y, u.m),
+                f"{prefix}_h_max": u.Quantity(h_max, u.m),
+                f"{prefix}_average_intensity": average_intensity,
+                f"{prefix}_is_valid": valid,
+            }
+        )
+        result[f"{prefix}_telescopes"] = telescopes
+
+        # invalid events only contain nan values
+        for column in result.itercols():
+            if column.dtype.kind == "f":
+                column[~valid] = np.nan
+
+        for colname in ("obs_id", "event_id"):
+            result[colname].description = table[colname].description
+        add_defaults_and_meta(result, ReconstructedGeometryContainer, prefix)
+        return result
 
     def _predict(self, hillas_dict, array_pointing, telescopes_pointings=None):
         """
@@ -156,8 +359,6 @@ class HillasIntersection(HillasGeometryReconstructor):
         hillas_dict: dict
             Dictionary containing Hillas parameters for all telescopes
             in reconstruction
-        inst : ctapipe.io.InstrumentContainer
-            instrumental description
         array_pointing: SkyCoord[AltAz]
             pointing direction of the array
         telescopes_pointings: dict[SkyCoord[AltAz]]
@@ -168,10 +369,25 @@ class HillasIntersection(HillasGeometryReconstructor):
         ReconstructedGeometryContainer:
 
         """
+        array_alt = array_pointing.alt.to_value(u.rad)
+        array_az = array_pointing.az.to_value(u.rad)
+
+        tel_alt = tel_az = None
+        if telescopes_pointings is not None:
+            tel_alt = [telescopes_pointings[t].alt.to_value(u.rad) for t in hillas_dict]
+            tel_az = [telescopes_pointings[t].az.to_value(u.rad) for t in hillas_dict]
 
-        # filter warnings for missing obs time. this is needed because MC data has no obs time
-        warnings.filterwarnings(action="ignore", category=MissingFrameAttributeWarning)
+        return self._reconstruct(hillas_dict, array_alt, array_az, tel_alt, tel_az)
 
+    def _reconstruct(self, hillas_dict, array_alt, array_az, tel_alt=None, tel_az=None):
+        """
+        Same as `_predict`, but taking the pointings in radians.
+
+        ``tel_alt`` and ``tel_az`` are the telescope pointings in the order
+        of ``hillas_dict``, if not given, the array pointing is used.
+        All frame transformations are done on plain arrays,
+        see `ctapipe.coordinates.numpy_transforms`.
+        """
         # stereoscopy needs at least two telescopes
         if len(hillas_dict) < 2:
             raise TooFewTelescopesException(
@@ -189,53 +405,43 @@ class HillasIntersection(HillasGeometryReconstructor):
                 "A HillasContainer contains an ellipse of width==0"
             )
 
-        if telescopes_pointings is None:
-            telescopes_pointings = {
-                tel_id: array_pointing for tel_id in hillas_dict.keys()
-            }
-
-        tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
-        grd_coord = self.subarray.tel_coords
-        tilt_coord = grd_coord.transform_to(tilted_frame)
+        if tel_alt is None:
+            tel_alt, tel_az = array_alt, array_az
 
         tel_ids = list(hillas_dict.keys())
         tel_indices = self.subarray.tel_ids_to_indices(tel_ids)
 
-        tel_x = {
-            tel_id: tilt_coord.x[tel_index]
-            for tel_id, tel_index in zip(tel_ids, tel_indices)
-        }
-        tel_y = {
-            tel_id: tilt_coord.y[tel_index]
-            for tel_id, tel_index in zip(tel_ids, tel_indices)
-        }
-
-        nom_frame = NominalFrame(origin=array_pointing)
-
-        hillas_dict_mod = {}
+        tilt_coord = ground_to_tilted(
+            self._tel_positions_m[tel_indices], array_alt, array_az
+        )
+        tel_x = dict(zip(tel_ids, u.Quantity(tilt_coord[:, 0], u.m)))
+        tel_y = dict(zip(tel_ids, u.Quantity(tilt_coord[:, 1], u.m)))
 
-        for tel_id, hillas in hillas_dict.items():
+        cog_lon = np.empty(len(tel_ids))
+        cog_lat = np.empty(len(tel_ids))
+        for i, (tel_id, hillas) in enumerate(hillas_dict.items()):
             if isinstance(hillas, CameraHillasParametersContainer):
-                focal_length = self.subarray.tel[tel_id].optics.equivalent_focal_length
-                camera_frame = CameraFrame(
-                    telescope_pointing=telescopes_pointings[tel_id],
-                    focal_length=focal_length,
+                cog_lon[i], cog_lat[i] = camera_to_fov(
+                    hillas.x.to_value(u.m),
+                    hillas.y.to_value(u.m),
+                    self._focal_length_m[tel_indices[i]],
                 )
-                cog_coords = SkyCoord(x=hillas.x, y=hillas.y, frame=camera_frame)
-                cog_coords_nom = cog_coords.transform_to(nom_frame)
             else:
-                telescope_frame = TelescopeFrame(
-                    telescope_pointing=telescopes_pointings[tel_id]
-                )
-                cog_coords = SkyCoord(
-                    fov_lon=hillas.fov_lon,
-                    fov_lat=hillas.fov_lat,
-                    frame=telescope_frame,
-                )
-                cog_coords_nom = cog_coords.transform_to(nom_frame)
+                cog_lon[i] = hillas.fov_lon.to_value(u.rad)
+                cog_lat[i] = hillas.fov_lat.to_value(u.rad)
+
+        # TelescopeFrame to the NominalFrame of the array pointing
+        cog_lon, cog_lat = fov_to_fov(
+            cog_lon, cog_lat, tel_alt, tel_az, array_alt, array_az
+        )
+        cog_lon = u.Quantity(cog_lon, u.rad)
+        cog_lat = u.Quantity(cog_lat, u.rad)
+
+        hillas_dict_mod = {}
+        for i, (tel_id, hillas) in enumerate(hillas_dict.items()):
             hillas_dict_mod[tel_id] = HillasParametersContainer(
-                fov_lon=cog_coords_nom.fov_lon,
-                fov_lat=cog_coords_nom.fov_lat,
+                fov_lon=cog_lon[i],
+                fov_lat=cog_lat[i],
                 psi=hillas.psi,
                 width=hillas.width,
                 length=hillas.length,
@@ -247,7 +453,7 @@ class HillasIntersection(HillasGeometryReconstructor):
         )
 
         # Catch events reconstructed at great angular distance from camera center
-        # and return INVALID container to prevent SkyCoord error below.
+        # and return INVALID container.
         if _far_outside_fov(src_fov_lat, src_fov_lon):
             return INVALID
 
@@ -258,33 +464,31 @@ class HillasIntersection(HillasGeometryReconstructor):
         err_fov_lon *= u.rad
         err_fov_lat *= u.rad
 
-        nom = SkyCoord(
-            fov_lon=src_fov_lon * u.rad, fov_lat=src_fov_lat * u.rad, frame=nom_frame
+        alt, az = fov_to_altaz(src_fov_lon, src_fov_lat, array_alt, array_az)
+        ground_x, ground_y = project_tilted_to_ground(
+            core_x, core_y, array_alt, array_az
         )
-        sky_pos = nom.transform_to(array_pointing.frame)
-        tilt = SkyCoord(x=core_x * u.m, y=core_y * u.m, z=0 * u.m, frame=tilted_frame)
-        grd = project_to_ground(tilt)
 
         h_max = self.reconstruct_h_max(
-            nom.fov_lon,
-            nom.fov_lat,
-            tilt.x,
-            tilt.y,
+            u.Quantity(src_fov_lon, u.rad),
+            u.Quantity(src_fov_lat, u.rad),
+            u.Quantity(core_x, u.m),
+            u.Quantity(core_y, u.m),
             hillas_dict_mod,
             tel_x,
             tel_y,
-            90 * u.deg - array_pointing.alt,
+            u.Quantity(np.pi / 2 - array_alt, u.rad),
         )
 
         src_error = np.sqrt(err_fov_lon**2 + err_fov_lat**2)
 
         return ReconstructedGeometryContainer(
-            alt=sky_pos.altaz.alt.to(u.rad),
-            az=sky_pos.altaz.az.to(u.rad),
-            core_x=grd.x,
-            core_y=grd.y,
-            core_tilted_x=tilt.x,
-            core_tilted_y=tilt.y,
+            alt=u.Quantity(alt, u.rad),
+            az=u.Quantity(az, u.rad),
+            core_x=u.Quantity(ground_x, u.m),
+            core_y=u.Quantity(ground_y, u.m),
+            core_tilted_x=u.Quantity(core_x, u.m),
+            core_tilted_y=u.Quantity(core_y, u.m),
             core_tilted_uncert_x=u.Quantity(core_err_x, u.m),
             core_tilted_uncert_y=u.Quantity(core_err_y, u.m),
             telescopes=[h for h in hillas_dict_mod.keys()],
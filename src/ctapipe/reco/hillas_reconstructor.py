@@ -9,22 +9,31 @@ from itertools import combinations
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import AltAz, Longitude, SkyCoord, cartesian_to_spherical
+from astropy.table import Table
 
 from ..containers import CameraHillasParametersContainer, ReconstructedGeometryContainer
 from ..coordinates import (
-    CameraFrame,
+    GroundFrame,
     MissingFrameAttributeWarning,
-    TelescopeFrame,
     TiltedGroundFrame,
-    altaz_to_righthanded_cartesian,
-    project_to_ground,
+)
+from ..coordinates.numpy_transforms import (
+    altaz_cartesian_to_fov,
+    camera_to_fov,
+    fov_to_altaz_cartesian,
+    ground_to_tilted,
+    project_tilted_to_ground,
 )
 from ..instrument import SubarrayDescription
 from .reconstructor import (
     HillasGeometryReconstructor,
     InvalidWidthException,
     TooFewTelescopesException,
+    _TableParameters,
+    _to_array_events,
 )
+from .telescope_event_handling import _get_pair_indices, _grouped_add
+from .utils import add_defaults_and_meta
 
 __all__ = ["HillasReconstructor"]
 
@@ -95,6 +104,49 @@ def line_line_intersection_3d(uvw_vectors, origins):
     return np.linalg.inv(S) @ C
 
 
+def _grouped_line_line_intersection_3d(uvw_vectors, origins, indices, n_groups):
+    """
+    Vectorized version of `line_line_intersection_3d`, intersecting
+    the lines of each group given by ``indices``.
+    """
+    norm_matrices = uvw_vectors[:, :, np.newaxis] * uvw_vectors[:, np.newaxis, :]
+    norm_matrices -= np.eye(3)
+    C = np.einsum("nij,nj->ni", norm_matrices, origins)
+
+    S = _grouped_add(norm_matrices, n_groups, indices)
+    C = _grouped_add(C, n_groups, indices)
+
+    # groups without any lines are left as nan
+    result = np.full((n_groups, 3), np.nan)
+    has_lines = np.bincount(indices, minlength=n_groups) > 0
+    result[has_lines] = np.einsum(
+        "nij,nj->ni", np.linalg.inv(S[has_lines]), C[has_lines]
+    )
+    return result
+
+
+def _hillas_axis_vectors(
+    cog_lon, cog_lat, p2_lon, p2_lat, tel_alt, tel_az, array_alt, array_az
+):
+    """
+    Right-handed cartesian direction vectors of the cog and of a second point
+    on the main axis of each image and the angle of the main axis
+    in the (pseudo) camera frame of the array pointing.
+
+    The field of view coordinates of the points and all pointings are in radians.
+    """
+    cog_altaz = fov_to_altaz_cartesian(cog_lon, cog_lat, tel_alt, tel_az)
+    p2_altaz = fov_to_altaz_cartesian(p2_lon, p2_lat, tel_alt, tel_az)
+
+    # psi in the (pseudo) camera frame of the array pointing
+    cog_lon, cog_lat = altaz_cartesian_to_fov(cog_altaz, array_alt, array_az)
+    p2_lon, p2_lat = altaz_cartesian_to_fov(p2_altaz, array_alt, array_az)
+    corrected_psi = np.arctan((cog_lon - p2_lon) / (cog_lat - p2_lat))
+
+    # AltAz cartesian to right-handed cartesian, see altaz_to_righthanded_cartesian
+    return cog_altaz * [1, -1, 1], p2_altaz * [1, -1, 1], corrected_psi
+
+
 class HillasReconstructor(HillasGeometryReconstructor):
     """
     class that reconstructs the direction of an atmospheric shower
@@ -117,13 +169,15 @@ class HillasReconstructor(HillasGeometryReconstructor):
             cam: cam.geometry.guess_radius().to_value(u.m)
             for cam in subarray.camera_types
         }
+        _focal_length_m = {
+            cam: cam.geometry.frame.focal_length.to_value(u.m)
+            for cam in subarray.camera_types
+        }
 
-        telframe = TelescopeFrame()
         _cam_radius_deg = {}
         for cam, radius_m in _cam_radius_m.items():
-            point_cam = SkyCoord(0, radius_m, unit=u.m, frame=cam.geometry.frame)
-            point_tel = point_cam.transform_to(telframe)
-            _cam_radius_deg[cam] = point_tel.fov_lon.to_value(u.deg)
+            fov_lon, _ = camera_to_fov(0.0, radius_m, _focal_length_m[cam])
+            _cam_radius_deg[cam] = np.rad2deg(fov_lon)
 
         # store for each tel_id to avoid costly hash of camera
         self._cam_radius_m = {
@@ -132,6 +186,13 @@ class HillasReconstructor(HillasGeometryReconstructor):
         self._cam_radius_deg = {
             tel_id: _cam_radius_deg[t.camera] for tel_id, t in subarray.tel.items()
         }
+        self._focal_length_m = {
+            tel_id: _focal_length_m[t.camera] for tel_id, t in subarray.tel.items()
+        }
+
+        # the frame transformations are done on plain arrays in the event loop
+        self._tel_positions_m = subarray.tel_coords.cartesian.xyz.to_value(u.m).T
+        self._reference_height = subarray.reference_location.geodetic.height
 
     def __call__(self, event):
         """
@@ -163,8 +224,9 @@ class HillasReconstructor(HillasGeometryReconstructor):
             corrected_psi,
             weights,
             telescope_positions,
-            array_pointing,
-        ) = self.initialize_arrays(event, hillas_dict)
+            array_alt,
+            array_az,
+        ) = self._initialize_arrays(event, hillas_dict)
 
         norm = np.cross(cog_cartesian, p2_cartesian)
 
@@ -178,18 +240,16 @@ class HillasReconstructor(HillasGeometryReconstructor):
         direction, err_est_dir = self.estimate_direction(norm, weights)
 
         # array pointing is needed to define the tilted frame
-        core_pos_ground, core_pos_tilted = self.estimate_core_position(
-            array_pointing, corrected_psi, telescope_positions
+        core_x, core_y, core_tilted_x, core_tilted_y = self._estimate_core_position(
+            array_alt, array_az, corrected_psi, telescope_positions
         )
 
         # container class for reconstructed showers
         _, lat, lon = cartesian_to_spherical(*direction)
 
-        # estimate max height of shower
-        h_max = (
-            self.estimate_relative_h_max(cog_cartesian, telescope_positions)
-            + self.subarray.reference_location.geodetic.height
-        )
+        # estimate max height of shower, see estimate_relative_h_max
+        shower_max = line_line_intersection_3d(cog_cartesian, telescope_positions)
+        h_max = u.Quantity(shower_max[2], u.m) + self._reference_height
 
         # az is clockwise, lon counter-clockwise, make sure it stays in [0, 2pi)
         az = Longitude(-lon)
@@ -198,10 +258,10 @@ class HillasReconstructor(HillasGeometryReconstructor):
             ReconstructedGeometryContainer(
                 alt=lat,
                 az=az,
-                core_x=core_pos_ground.x,
-                core_y=core_pos_ground.y,
-                core_tilted_x=core_pos_tilted.x,
-                core_tilted_y=core_pos_tilted.y,
+                core_x=u.Quantity(core_x, u.m),
+                core_y=u.Quantity(core_y, u.m),
+                core_tilted_x=u.Quantity(core_tilted_x, u.m),
+                core_tilted_y=u.Quantity(core_tilted_y, u.m),
                 telescopes=tel_ids.tolist(),
                 average_intensity=np.mean([h.intensity for h in hillas_dict.values()]),
                 is_valid=True,
@@ -214,6 +274,167 @@ class HillasReconstructor(HillasGeometryReconstructor):
 
         self._store_impact_parameter(event)
 
+    def predict_table(self, table: Table) -> Table:
+        """
+        Perform the shower geometry reconstruction for a table of telescope events.
+
+        This gives the same results as calling the reconstructor on each
+        event, but processes all events at once using only numpy operations.
+
+        Parameters
+        ----------
+        table : astropy.table.Table
+            Table of telescope events with dl1 parameters as read by
+            `~ctapipe.io.TableLoader` with ``dl1_parameters``,
+            ``observation_info`` and ``pointing`` enabled.
+            The telescope events of a subarray event need to be in consecutive rows.
+
+        Returns
+        -------
+        astropy.table.Table
+            Table with the reconstructed geometry of each subarray event
+        """
+        prefix = self.__class__.__name__
+        (
+            obs_ids,
+            event_ids,
+            valid,
+            selected,
+            tel_to_array_indices,
+        ) = self._select_table_telescopes(table)
+        n_array_events = len(obs_ids)
+
+        tel_alt, tel_az, array_alt, array_az = (
+            values[selected] for values in self._get_table_pointing(table)
+        )
+        array_indices = tel_to_array_indices[selected]
+        tel_ids = np.asanyarray(table["tel_id"])[selected]
+        tel_indices = self.subarray.tel_index_array[tel_ids]
+
+        hillas = _TableParameters(table[selected]).hillas
+        psi = hillas.psi.to_value(u.rad)
+        intensity = np.asanyarray(hillas.intensity, dtype=np.float64)
+        weights = intensity * hillas.length.value / hillas.width.value
+
+        if "hillas_fov_lon" in table.colnames:
+            cam_radius = np.array(
+                [self._cam_radius_deg[tel_id] for tel_id in self.subarray.tel_ids]
+            )[tel_indices]
+            cog_lon = hillas.fov_lon.to_value(u.deg)
+            cog_lat = hillas.fov_lat.to_value(u.deg)
+            p2_lon = np.deg2rad(cog_lon + 0.1 * cam_radius * np.cos(psi))
+            p2_lat = np.deg2rad(cog_lat + 0.1 * cam_radius * np.sin(psi))
+            cog_lon = np.deg2rad(cog_lon)
+            cog_lat = np.deg2rad(cog_lat)
+        else:
+            cam_radius = np.array(
+                [self._cam_radius_m[tel_id] for tel_id in self.subarray.tel_ids]
+            )[tel_indices]
+            focal_length = np.array(
+                [self._focal_length_m[tel_id] for tel_id in self.subarray.tel_ids]
+            )[tel_indices]
+            cog_x = hillas.x.to_value(u.m)
+            cog_y = hillas.y.to_value(u.m)
+            p2_x = cog_x + 0.1 * cam_radius * np.cos(psi)
+            p2_y = cog_y + 0.1 * cam_radius * np.sin(psi)
+            cog_lon, cog_lat = camera_to_fov(cog_x, cog_y, focal_length)
+            p2_lon, p2_lat = camera_to_fov(p2_x, p2_y, focal_length)
+
+        cog_cartesian, p2_cartesian, corrected_psi = _hillas_axis_vectors(
+            cog_lon, cog_lat, p2_lon, p2_lat, tel_alt, tel_az, array_alt, array_az
+        )
+        norm = np.cross(cog_cartesian, p2_cartesian)
+
+        # algebraic direction estimate, see estimate_direction
+        index_a, index_b, pair_to_array_indices = _get_pair_indices(
+            np.bincount(array_indices, minlength=n_array_events)
+        )
+        crossings = np.cross(norm[index_a], norm[index_b])
+        crossings[crossings[:, 2] < 0] *= -1
+        pair_weights = weights[index_a] * weights[index_b]
+
+        direction = np.full((n_array_events, 3), np.nan)
+        direction[valid] = (
+            _grouped_add(
+                crossings * pair_weights[:, np.newaxis],
+                n_array_events,
+                pair_to_array_indices,
+            )[valid]
+            / _grouped_add(pair_weights, n_array_events, pair_to_array_indices)[
+                valid, np.newaxis
+            ]
+        )
+        direction = normalise(direction)
+        direction[~valid] = np.nan
+
+        off_angles = angle(direction[pair_to_array_indices], crossings)
+        n_pairs = np.bincount(pair_to_array_indices, minlength=n_array_events)
+        err_est_dir = np.full(n_array_events, np.nan)
+        err_est_dir[valid] = (
+            _grouped_add(off_angles, n_array_events, pair_to_array_indices)[valid]
+            / n_pairs[valid]
+        )
+
+        _, lat, lon = cartesian_to_spherical(*direction.T)
+
+        # core position, see estimate_core_position
+        positions = self._tel_positions_m[tel_indices]
+        positions_tilted = ground_to_tilted(positions, array_alt, array_az)
+
+        uvw_vectors = np.column_stack(
+            [np.cos(corrected_psi), np.sin(corrected_psi), np.zeros(len(psi))]
+        )
+        core_tilted = np.full((n_array_events, 3), np.nan)
+        core_tilted[valid] = _grouped_line_line_intersection_3d(
+            uvw_vectors, positions_tilted, array_indices, n_array_events
+        )[valid]
+        core_x, core_y = project_tilted_to_ground(
+            core_tilted[:, 0],
+            core_tilted[:, 1],
+            _to_array_events(array_alt, array_indices, n_array_events),
+            _to_array_events(array_az, array_indices, n_array_events),
+        )
+
+        # estimate max height of shower, see estimate_relative_h_max
+        h_max = np.full(n_array_events, np.nan)
+        h_max[valid] = _grouped_line_line_intersection_3d(
+            cog_cartesian, positions, array_indices, n_array_events
+        )[valid, 2]
+        h_max += self._reference_height.to_value(u.m)
+
+        average_intensity = np.full(n_array_events, np.nan)
+        average_intensity[valid] = (
+            _grouped_add(intensity, n_array_events, array_indices)[valid]
+            / np.bincount(array_indices, minlength=n_array_events)[valid]
+        )
+
+        telescopes = [[] for _ in range(n_array_events)]
+        for index, tel_id in zip(array_indices, tel_ids):
+            telescopes[index].append(tel_id)
+
+        result = Table(
+            {
+                "obs_id": obs_ids,
+                "event_id": event_ids,
+                f"{prefix}_alt": u.Quantity(lat).to(u.deg),
+                f"{prefix}_alt_uncert": u.Quantity(np.rad2deg(err_est_dir), u.deg),
+                f"{prefix}_az": Longitude(-lon).to(u.deg),
+                f"{prefix}_az_uncert": u.Quantity(np.rad2deg(err_est_dir), u.deg),
+                f"{prefix}_core_x": u.Quantity(core_x, u.m),
+                f"{prefix}_core_y": u.Quantity(core_y, u.m),
+                f"{prefix}_core_tilted_x": u.Quantity(core_tilted[:, 0], u.m),
+                f"{prefix}_core_tilted_y": u.Quantity(core_tilted[:, 1], u.m),
+                f"{prefix}_h_max": u.Quantity(h_max, u.m),
+                f"{prefix}_average_intensity": average_intensity,
+                f"{prefix}_is_valid": valid,
+            }
+        )
+        result[f"{prefix}_telescopes"] = telescopes
+        for colname in ("obs_id", "event_id"):
+            result[colname].description = table[colname].description
+        add_defaults_and_meta(result, ReconstructedGeometryContainer, prefix)
+        return result
+
     def initialize_arrays(self, event, hillas_dict):
         """
         Creates flat arrays of needed quantities from the event structure.
@@ -235,27 +456,55 @@ class HillasReconstructor(HillasGeometryReconstructor):
         the correction to the psi angle is explained in :cite:p:`phd-gasparetto`,
         section 7.1.4.
         """
-        # get one telescope id to check what frame to use
-        altaz = AltAz()
+        (
+            tel_ids,
+            cog_cart,
+            p2_cart,
+            corrected_psi,
+            weights,
+            _,
+            array_alt,
+            array_az,
+        ) = self._initialize_arrays(event, hillas_dict)
 
-        # Due to tracking the pointing of the array will never be a constant
-        array_pointing = SkyCoord(
-            az=event.monitoring.pointing.array_azimuth,
-            alt=event.monitoring.pointing.array_altitude,
-            frame=altaz,
+        indices = self.subarray.tel_index_array[tel_ids]
+        telescope_positions = self.subarray.tel_coords[indices]
+        array_pointing = SkyCoord(alt=array_alt, az=array_az, unit=u.rad, frame=AltAz())
+
+        return (
+            tel_ids,
+            cog_cart,
+            p2_cart,
+            corrected_psi,
+            weights,
+            telescope_positions,
+            array_pointing,
         )
 
-        # create arrays / quantities of all needed things for all telescopes
+    def _initialize_arrays(self, event, hillas_dict):
+        """
+        Same as `initialize_arrays`, but returning the telescope positions
+        as array in meters and the array pointing altitude and azimuth in radians.
+
+        All frame transformations are done on plain arrays,
+        see `ctapipe.coordinates.numpy_transforms`.
+        """
+        # Due to tracking the pointing of the array will never be a constant
+        array_alt = event.monitoring.pointing.array_altitude.to_value(u.rad)
+        array_az = event.monitoring.pointing.array_azimuth.to_value(u.rad)
+
+        # create arrays of all needed things for all telescopes
         # so we can do transformations vectorized
-        cog1 = np.empty(len(hillas_dict))
-        cog2 = np.empty(len(hillas_dict))
-        cam_radius = np.empty(len(hillas_dict))
-        psi = np.empty(len(hillas_dict))
-        weights = np.empty(len(hillas_dict))
-        focal_length = np.empty(len(hillas_dict))
-        alt = np.empty(len(hillas_dict))
-        az = np.empty(len(hillas_dict))
-        tel_ids = np.empty(len(hillas_dict), dtype=int)
+        n_tels = len(hillas_dict)
+        cog1 = np.empty(n_tels)
+        cog2 = np.empty(n_tels)
+        cam_radius = np.empty(n_tels)
+        psi = np.empty(n_tels)
+        weights = np.empty(n_tels)
+        focal_length = np.empty(n_tels)
+        alt = np.empty(n_tels)
+        az = np.empty(n_tels)
+        tel_ids = np.empty(n_tels, dtype=int)
 
         hillas_in_camera_frame = False
 
@@ -278,50 +527,23 @@ class HillasReconstructor(HillasGeometryReconstructor):
 
             psi[i] = hillas.psi.to_value(u.rad)
             weights[i] = hillas.intensity * hillas.length.value / hillas.width.value
-
-            camera = self.subarray.tel[tel_id].camera
-            focal_length[i] = camera.geometry.frame.focal_length.to_value(u.m)
+            focal_length[i] = self._focal_length_m[tel_id]
 
         indices = self.subarray.tel_index_array[tel_ids]
-        telescope_positions = self.subarray.tel_coords[indices]
-
-        telescope_pointings = SkyCoord(alt=alt, az=az, unit=u.rad, frame=altaz)
-
-        focal_length = u.Quantity(focal_length, u.m, copy=False)
-        camera_frame = CameraFrame(
-            telescope_pointing=telescope_pointings, focal_length=focal_length
-        )
-
-        telescope_frame = TelescopeFrame(telescope_pointing=telescope_pointings)
+        telescope_positions = self._tel_positions_m[indices]
 
         p2_1 = cog1 + 0.1 * cam_radius * np.cos(psi)
         p2_2 = cog2 + 0.1 * cam_radius * np.sin(psi)
 
         if hillas_in_camera_frame:
-            cog_coord = SkyCoord(x=cog1, y=cog2, unit=u.m, frame=camera_frame)
-            p2_coord = SkyCoord(x=p2_1, y=p2_2, unit=u.m, frame=camera_frame)
+            cog_lon, cog_lat = camera_to_fov(cog1, cog2, focal_length)
+            p2_lon, p2_lat = camera_to_fov(p2_1, p2_2, focal_length)
         else:
-            p2_coord = SkyCoord(
-                fov_lon=p2_1, fov_lat=p2_2, unit=u.deg, frame=telescope_frame
-            )
-            cog_coord = SkyCoord(
-                fov_lon=cog1, fov_lat=cog2, unit=u.deg, frame=telescope_frame
-            )
-
-        cog_coord = cog_coord.transform_to(altaz)
-        p2_coord = p2_coord.transform_to(altaz)
-        cog_cart = altaz_to_righthanded_cartesian(alt=cog_coord.alt, az=cog_coord.az)
-        p2_cart = altaz_to_righthanded_cartesian(alt=p2_coord.alt, az=p2_coord.az)
-
-        pseudo_nominal = CameraFrame(
-            telescope_pointing=array_pointing, focal_length=focal_length
-        )
-        cog_cam = cog_coord.transform_to(pseudo_nominal)
-        p2_cam = p2_coord.transform_to(pseudo_nominal)
+            cog_lon, cog_lat = np.deg2rad(cog1), np.deg2rad(cog2)
+            p2_lon, p2_lat = np.deg2rad(p2_1), np.deg2rad(p2_2)
 
-        corrected_psi = np.arctan(
-            (cog_cam.y.to_value(u.m) - p2_cam.y.to_value(u.m))
-            / (cog_cam.x.to_value(u.m) - p2_cam.x.to_value(u.m))
+        cog_cart, p2_cart, corrected_psi = _hillas_axis_vectors(
+            cog_lon, cog_lat, p2_lon, p2_lat, alt, az, array_alt, array_az
         )
 
         return (
@@ -331,7 +553,8 @@ class HillasReconstructor(HillasGeometryReconstructor):
             corrected_psi,
             weights,
             telescope_positions,
-            array_pointing,
+            array_alt,
+            array_az,
         )
 
     @staticmethod
@@ -396,28 +619,52 @@ class HillasReconstructor(HillasGeometryReconstructor):
         # Estimate the position of the shower's core
         # from the TiltedFram to the GroundFrame
 
-        z = np.zeros(len(psi))
-        uvw_vectors = np.column_stack([np.cos(psi), np.sin(psi), z])
+        array_alt = array_pointing.alt.to_value(u.rad)
+        array_az = array_pointing.az.to_value(u.rad)
+        positions = positions.cartesian.xyz.to_value(u.m).T
 
-        tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
-        positions_tilted = positions.transform_to(tilted_frame).cartesian.xyz.T
-
-        core_position = line_line_intersection_3d(
-            uvw_vectors,
-            positions_tilted.to_value(u.m),
+        core_x, core_y, core_tilted_x, core_tilted_y = (
+            HillasReconstructor._estimate_core_position(
+                array_alt, array_az, psi, positions
+            )
         )
-        core_position = u.Quantity(core_position, u.m, copy=False)
+
+        tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
         core_pos_tilted = SkyCoord(
-            x=core_position[0],
-            y=core_position[1],
+            x=u.Quantity(core_tilted_x, u.m),
+            y=u.Quantity(core_tilted_y, u.m),
             z=u.Quantity(0.0, u.m),
             frame=tilted_frame,
         )
-
-        core_pos_ground = project_to_ground(core_pos_tilted)
+        core_pos_ground = GroundFrame(
+            x=u.Quantity(core_x, u.m),
+            y=u.Quantity(core_y, u.m),
+            z=u.Quantity(0.0, u.m),
+        )
 
         return core_pos_ground, core_pos_tilted
 
+    @staticmethod
+    def _estimate_core_position(array_alt, array_az, psi, positions):
+        """
+        Same as `estimate_core_position` on plain arrays.
+
+        Takes the array pointing in radians and the telescope positions
+        as array of shape ``(n, 3)`` in meters and returns the core position on
+        the ground and in the tilted frame in meters.
+        """
+        z = np.zeros(len(psi))
+        uvw_vectors = np.column_stack([np.cos(psi), np.sin(psi), z])
+
+        positions_tilted = ground_to_tilted(positions, array_alt, array_az)
+        core_tilted_x, core_tilted_y, _ = line_line_intersection_3d(
+            uvw_vectors, positions_tilted
+        )
+        core_x, core_y = project_tilted_to_ground(
+            core_tilted_x, core_tilted_y, array_alt, array_az
+        )
+        return core_x, core_y, core_tilted_x, core_tilted_y
+
     @staticmethod
     def estimate_relative_h_max(cog_vectors, positions):
         """Estimate the relative (to the observatory) vertical height of
@@ -5,6 +5,8 @@ import numba
 import numpy as np
 from scipy.stats import norm
 
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+
 __all__ = [
     "create_seed",
     "rotate_translate",
@@ -39,7 +41,7 @@ def guess_shower_depth(energy):
     return x_max_exp
 
 
-@numba.njit
+@numba.njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
 def rotate_translate(pixel_pos_x, pixel_pos_y, x_trans, y_trans, phi):
     """
     Function to perform rotation and translation of pixel lists. Array
@@ -7,17 +7,14 @@ and adapted to work with astropy Tables instead of pandas dataframes
 """
 
 import logging
-import warnings
 
 import astropy.units as u
 import numpy as np
-from astropy.coordinates import AltAz
 from astropy.table import QTable, Table
 from numpy.lib.recfunctions import structured_to_unstructured
 
-from ctapipe.coordinates import MissingFrameAttributeWarning, TelescopeFrame
-
 from ..containers import ArrayEventContainer
+from ..coordinates.numpy_transforms import altaz_to_fov, fov_to_altaz
 
 LOG = logging.getLogger(__name__)
 
@@ -25,6 +22,7 @@ LOG = logging.getLogger(__name__)
 __all__ = [
     "check_valid_rows",
     "collect_features",
+    "collect_features_batch",
     "table_to_float",
     "table_to_X",
     "horizontal_to_telescope",
@@ -68,24 +66,8 @@ def table_to_X(table: Table, features: list[str], log=LOG):
     return X, valid
 
 
-def collect_features(
-    event: ArrayEventContainer, tel_id: int, subarray_table=None
-) -> Table:
-    """Loop over all containers with features.
-
-    Parameters
-    ----------
-    event : ArrayEventContainer
-        The event container from which to collect the features
-    tel_id : int
-        The telscope id for which to collect the features
-    subarray_table : Table
-        The subarray as "to_table("joined")", to be added to the features.
-
-    Returns
-    -------
-    Table
-    """
+def _collect_feature_values(event, tel_id, subarray_table=None) -> dict:
+    """Collect the features of one telescope event into a dict"""
     features = {}
 
     features.update(event.trigger.as_dict(recursive=False, flatten=True))
@@ -117,40 +99,88 @@ def collect_features(
     )
 
     if subarray_table is not None:
-        # to include units in features
-        if not isinstance(subarray_table, QTable):
-            subarray_table = QTable(subarray_table, copy=False)
-
         features.update(subarray_table.loc[tel_id])
 
+    return features
+
+
+def _to_qtable(subarray_table):
+    # to include units in features
+    if subarray_table is not None and not isinstance(subarray_table, QTable):
+        subarray_table = QTable(subarray_table, copy=False)
+    return subarray_table
+
+
+def collect_features(
+    event: ArrayEventContainer, tel_id: int, subarray_table=None
+) -> Table:
+    """Loop over all containers with features.
+
+    Parameters
+    ----------
+    event : ArrayEventContainer
+        The event container from which to collect the features
+    tel_id : int
+        The telscope id for which to collect the features
+    subarray_table : Table
+        The subarray as "to_table("joined")", to be added to the features.
+
+    Returns
+    -------
+    Table
+    """
+    features = _collect_feature_values(event, tel_id, _to_qtable(subarray_table))
     return Table({k: [v] for k, v in features.items()})
 
 
-@u.quantity_input(alt=u.deg, az=u.deg, pointing_alt=u.deg, pointing_az=u.deg)
-def horizontal_to_telescope(alt, az, pointing_alt, pointing_az):
-    """Transform coordinates from horizontal coordinates into TelescopeFrame"""
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", MissingFrameAttributeWarning)
+def collect_features_batch(tel_events, subarray_table=None) -> Table:
+    """Collect the features of multiple telescope events into one table.
+
+    Same as `collect_features`, but with one row per telescope event.
+
+    Parameters
+    ----------
+    tel_events : Iterable[tuple[ArrayEventContainer, int]]
+        Pairs of event container and telescope id for which to collect the features
+    subarray_table : Table
+        The subarray as "to_table("joined")", to be added to the features.
+
+    Returns
+    -------
+    Table
+    """
+    subarray_table = _to_qtable(subarray_table)
+    rows = [
+        _collect_feature_values(event, tel_id, subarray_table)
+        for event, tel_id in tel_events
+    ]
+    if len(rows) == 0:
+        return Table()
 
-        horizontal_coord = AltAz(alt=alt, az=az)
-        pointing = AltAz(alt=pointing_alt, az=pointing_az)
-        tel_frame = TelescopeFrame(telescope_pointing=pointing)
+    return Table({k: [row[k] for row in rows] for k in rows[0]})
 
-        tel_coord = horizontal_coord.transform_to(tel_frame)
 
-    return tel_coord.fov_lon.to(u.deg), tel_coord.fov_lat.to(u.deg)
+@u.quantity_input(alt=u.deg, az=u.deg, pointing_alt=u.deg, pointing_az=u.deg)
+def horizontal_to_telescope(alt, az, pointing_alt, pointing_az):
+    """Transform coordinates from horizontal coordinates into TelescopeFrame"""
+    fov_lon, fov_lat = altaz_to_fov(
+        alt.to_value(u.rad),
+        az.to_value(u.rad),
+        pointing_alt.to_value(u.rad),
+        pointing_az.to_value(u.rad),
+    )
+    return u.Quantity(np.rad2deg(fov_lon), u.deg), u.Quantity(
+        np.rad2deg(fov_lat), u.deg
+    )
 
 
 @u.quantity_input(lon=u.deg, lat=u.deg, pointing_alt=u.deg, pointing_az=u.deg)
 def telescope_to_horizontal(lon, lat, pointing_alt, pointing_az):
     """Transform coordinates from TelescopeFrame into horizontal coordinates"""
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", MissingFrameAttributeWarning)
-
-        pointing = AltAz(alt=pointing_alt, az=pointing_az)
-        tel_coord = TelescopeFrame(
-            fov_lon=lon, fov_lat=lat, telescope_pointing=pointing
-        )
-        horizontal_coord = tel_coord.transform_to(AltAz())
-
-    return horizontal_coord.alt.to(u.deg), horizontal_coord.az.to(u.deg)
+    alt, az = fov_to_altaz(
+        lon.to_value(u.rad),
+        lat.to_value(u.rad),
+        pointing_alt.to_value(u.rad),
+        pointing_az.to_value(u.rad),
+    )
+    return u.Quantity(np.rad2deg(alt), u.deg), u.Quantity(np.rad2deg(az), u.deg)
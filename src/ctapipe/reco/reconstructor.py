@@ -1,5 +1,6 @@
 import weakref
 from abc import abstractmethod
+from collections.abc import Mapping
 from enum import Flag, auto
 
 import astropy.units as u
@@ -7,11 +8,18 @@ import joblib
 import numpy as np
 from astropy.coordinates import AltAz, SkyCoord
 
-from ctapipe.containers import ArrayEventContainer, TelescopeImpactParameterContainer
+from ctapipe.containers import (
+    ArrayEventContainer,
+    CoordinateFrameType,
+    ImageParametersContainer,
+    TelescopeImpactParameterContainer,
+)
 from ctapipe.core import Provenance, QualityQuery, TelescopeComponent
 from ctapipe.core.traits import Integer, List
 
+from ..compat import COPY_IF_NEEDED
 from ..coordinates import shower_impact_distance
+from .telescope_event_handling import get_subarray_index
 
 __all__ = [
     "Reconstructor",
@@ -69,6 +77,93 @@ class StereoQualityQuery(QualityQuery):
     ).tag(config=True)
 
 
+class _TableParameterGroup:
+    """Attribute access to the columns of one dl1 parameter group of a table"""
+
+    def __init__(self, table, prefix):
+        self._table = table
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        for colname in (
+            f"{self._prefix}_{name}",
+            f"camera_frame_{self._prefix}_{name}",
+        ):
+            if colname in self._table.colnames:
+                column = self._table[colname]
+                if getattr(column, "unit", None) is not None:
+                    return u.Quantity(column, copy=COPY_IF_NEEDED)
+                return np.asanyarray(column)
+
+        raise AttributeError(f"Table has no column for parameter {name!r}")
+
+
+class _TableParameters:
+    """Attribute access to the dl1 parameter columns of a table"""
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getattr__(self, name):
+        if name not in ImageParametersContainer.fields:
+            raise AttributeError(f"Unknown image parameter group {name!r}")
+        prefix = ImageParametersContainer.fields[name].default_factory.default_prefix
+        return _TableParameterGroup(self._table, prefix)
+
+
+class _TableQualityLocals(Mapping):
+    """
+    Evaluation context for a `StereoQualityQuery` on a table of telescope events.
+
+    Makes expressions like ``parameters.hillas.intensity`` resolve
+    to the corresponding ``hillas_intensity`` column.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        self._parameters = _TableParameters(table)
+
+    def __getitem__(self, key):
+        if key == "parameters":
+            return self._parameters
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield "parameters"
+
+    def __len__(self):
+        # QualityQuery.get_table_mask uses the length as the number of rows
+        return len(self._table)
+
+
+def _to_array_events(tel_values, tel_to_array_indices, n_array_events):
+    """Scatter values, which are the same for all telescope events of
+    a subarray event, to an array with one entry per subarray event"""
+    values = np.full(n_array_events, np.nan)
+    values[tel_to_array_indices] = tel_values
+    return values
+
+
+def _to_value(column, unit):
+    return u.Quantity(column, copy=COPY_IF_NEEDED).to_value(unit)
+
+
+def _load_joblib(path):
+    """
+    Load a joblib file.
+
+    Numpy arrays in uncompressed files are memory-mapped copy-on-write,
+    so that concurrent jobs share a single, page-cached copy of large models,
+    while arrays that are modified (e.g. counters) are copied.
+    """
+    with open(path, "rb") as f:
+        # uncompressed pickles start with the PROTO opcode,
+        # compressed files with the magic bytes of the compressor
+        uncompressed = f.read(1) == b"\x80"
+
+    return joblib.load(path, mmap_mode="c" if uncompressed else None)
+
+
 class Reconstructor(TelescopeComponent):
     """
     This is the base class from which all reconstruction
@@ -105,6 +200,23 @@ class Reconstructor(TelescopeComponent):
             reconstructed stereo geometry and telescope-wise impact position.
         """
 
+    def predict_events(self, events: list[ArrayEventContainer]):
+        """
+        Perform stereo reconstruction on a batch of events.
+
+        Fills the dl2 structure of each event, same as calling the
+        reconstructor on each event. Reconstructors that can profit
+        from processing multiple events at once override this method,
+        the default implementation calls the reconstructor on each event.
+
+        Parameters
+        ----------
+        events : list[ctapipe.containers.ArrayEventContainer]
+            The events, need to have dl1 parameters.
+        """
+        for event in events:
+            self(event)
+
     @classmethod
     def read(cls, path, parent=None, subarray=None, **kwargs):
         """Read a joblib-pickled reconstructor from ``path``
@@ -112,7 +224,8 @@ class Reconstructor(TelescopeComponent):
         Parameters
         ----------
         path : str or pathlib.Path
-            Path to a Reconstructor instance pickled using joblib
+            Path to a Reconstructor instance pickled using joblib.
+            Numpy arrays of uncompressed files are memory-mapped.
         parent : None or Component or Tool
             Attach a new parent to the loaded class, this will properly
         subarray : SubarrayDescription
@@ -127,8 +240,7 @@ class Reconstructor(TelescopeComponent):
         -------
         Reconstructor instance loaded from file
         """
-        with open(path, "rb") as f:
-            instance = joblib.load(f)
+        instance = _load_joblib(path)
 
         if not isinstance(instance, cls):
             raise TypeError(
@@ -183,6 +295,92 @@ class HillasGeometryReconstructor(Reconstructor):
 
         return hillas_dict
 
+    def _select_table_telescopes(self, table):
+        """
+        Select the telescope events used for the reconstruction of each
+        subarray event of a table, applying the same checks as `_create_hillas_dict`.
+
+        Returns
+        -------
+        obs_ids : np.ndarray
+            obs_id of each subarray event
+        event_ids : np.ndarray
+            event_id of each subarray event
+        valid : np.ndarray[bool]
+            True for the subarray events that can be reconstructed
+        selected : np.ndarray[bool]
+            True for the telescope events entering the reconstruction
+        tel_to_array_indices : np.ndarray
+            Index of the subarray event for each telescope event
+        """
+        obs_ids, event_ids, _, tel_to_array_indices = get_subarray_index(table)
+        tel_to_array_indices = tel_to_array_indices.astype(np.intp)
+        n_array_events = len(obs_ids)
+
+        if len(table) == 0:
+            selected = np.zeros(0, dtype=bool)
+        else:
+            selected = self.quality_query.get_table_mask(_TableQualityLocals(table))
+
+        width = _TableParameters(table).hillas.width
+        width = getattr(width, "value", width)
+        invalid_width = selected & (np.isnan(width) | (width == 0))
+
+        n_selected = np.bincount(
+            tel_to_array_indices[selected], minlength=n_array_events
+        )
+        n_invalid_width = np.bincount(
+            tel_to_array_indices[invalid_width], minlength=n_array_events
+        )
+        valid = (n_selected >= 2) & (n_invalid_width == 0)
+        selected &= valid[tel_to_array_indices]
+
+        return obs_ids, event_ids, valid, selected, tel_to_array_indices
+
+    @staticmethod
+    def _get_table_pointing(table):
+        """
+        Get telescope and array pointing in radians for each row of ``table``.
+
+        The array pointing is taken from the fixed subarray pointing of the
+        observation block, which needs to be given in AltAz.
+        The telescope pointing is taken from the ``telescope_pointing_*``
+        columns if available, the array pointing is used otherwise.
+
+        Returns
+        -------
+        tel_alt, tel_az, array_alt, array_az : np.ndarray
+        """
+        frames = np.unique(table["subarray_pointing_frame"])
+        if len(frames) > 1:
+            msg = "Subarray pointing frame must be the same for all events"
+            raise NotImplementedError(msg)
+
+        # an unknown frame means no array pointing is available (nan),
+        # same as for the event-wise reconstruction
+        if len(frames) == 1:
+            frame_type = CoordinateFrameType(frames[0])
+            if frame_type not in (
+                CoordinateFrameType.ALTAZ,
+                CoordinateFrameType.UNKNOWN,
+            ):
+                msg = (
+                    "Only AltAz frame supported for fixed subarray pointing,"
+                    f" got {frame_type.name}"
+                )
+                raise NotImplementedError(msg)
+
+        array_alt = _to_value(table["subarray_pointing_lat"], u.rad)
+        array_az = _to_value(table["subarray_pointing_lon"], u.rad)
+
+        if "telescope_pointing_altitude" in table.colnames:
+            tel_alt = _to_value(table["telescope_pointing_altitude"], u.rad)
+            tel_az = _to_value(table["telescope_pointing_azimuth"], u.rad)
+        else:
+            tel_alt, tel_az = array_alt, array_az
+
+        return tel_alt, tel_az, array_alt, array_az
+
     @staticmethod
     def _get_telescope_pointings(event):
         return {
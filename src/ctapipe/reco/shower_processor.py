@@ -2,6 +2,9 @@
 High level processing of showers.
 """
 
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
 from ..containers import ArrayEventContainer
 from ..core import Component, traits
 from ..instrument import SubarrayDescription
@@ -27,6 +30,10 @@ class ShowerProcessor(Component):
     reconstructors, be it directly as model input or as input to the feature generation.
     This may include previously made dl2 predictions,
     in which case the order of ``reconstructor_types`` is important.
+
+    Using `ShowerProcessor.process_events`, events can be processed in batches
+    of ``batch_size`` events, which allows the machine learning reconstructors
+    to call their models once per telescope type for all events in the batch.
     """
 
     reconstructor_types = traits.ComponentNameList(
@@ -40,6 +47,17 @@ class ShowerProcessor(Component):
         ),
     ).tag(config=True)
 
+    batch_size = traits.Integer(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of events buffered by `ShowerProcessor.process_events`"
+            " to be reconstructed together."
+            " Larger batches reduce the per-call overhead of the machine learning"
+            " models at the cost of keeping more events in memory."
+        ),
+    ).tag(config=True)
+
     def __init__(
         self,
         subarray: SubarrayDescription,
@@ -95,3 +113,48 @@ class ShowerProcessor(Component):
         """
         for reconstructor in self.reconstructors:
             reconstructor(event)
+
+    def predict_events(self, events: list[ArrayEventContainer]):
+        """
+        Apply all configured stereo reconstructors to a batch of events.
+
+        Each reconstructor is applied to all events before the next one,
+        so later reconstructors can use the results of previous ones.
+
+        Parameters
+        ----------
+        events : list[ctapipe.containers.ArrayEventContainer]
+            Top-level containers for all event information.
+        """
+        for reconstructor in self.reconstructors:
+            reconstructor.predict_events(events)
+
+    def process_events(
+        self, events: Iterable[ArrayEventContainer]
+    ) -> Iterator[ArrayEventContainer]:
+        """
+        Apply all configured stereo reconstructors to a stream of events.
+
+        Events are reconstructed in batches of ``batch_size`` and
+        yielded in their original order once their batch is complete.
+
+        Parameters
+        ----------
+        events : Iterable[ctapipe.containers.ArrayEventContainer]
+            The input events
+
+        Yields
+        ------
+        ctapipe.containers.ArrayEventContainer
+            The reconstructed events
+        """
+        if self.batch_size == 1:
+            for event in events:
+                self(event)
+                yield event
+            return
+
+        events = iter(events)
+        while batch := list(islice(events, self.batch_size)):
+            self.predict_events(batch)
+            yield from batch
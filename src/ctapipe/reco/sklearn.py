@@ -2,15 +2,17 @@
 Component Wrappers around sklearn models
 """
 
+import multiprocessing
 import pathlib
+import pickle
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
 from copy import deepcopy
 
 import astropy.units as u
 import joblib
 import numpy as np
-from astropy.coordinates import AltAz
 from astropy.table import QTable, Table, hstack
 from astropy.utils.decorators import lazyproperty
 from sklearn.metrics import accuracy_score, r2_score, roc_auc_score
@@ -30,7 +32,6 @@ from ..containers import (
     ReconstructedEnergyContainer,
     ReconstructedGeometryContainer,
 )
-from ..coordinates import TelescopeFrame
 from ..core import (
     Component,
     FeatureGenerator,
@@ -39,10 +40,16 @@ from ..core import (
     ToolConfigurationError,
     traits,
 )
-from ..io import write_table
-from .preprocessing import collect_features, table_to_X, telescope_to_horizontal
-from .reconstructor import ReconstructionProperty, Reconstructor
+from ..io import TableWriteSession
+from .preprocessing import (
+    collect_features,
+    collect_features_batch,
+    table_to_X,
+    telescope_to_horizontal,
+)
+from .reconstructor import ReconstructionProperty, Reconstructor, _load_joblib
 from .stereo_combination import StereoCombiner
+from .tree_ensemble import FlatTreeEnsemble
 from .utils import add_defaults_and_meta
 
 __all__ = [
@@ -67,6 +74,67 @@ _invalid_geometry = ReconstructedGeometryContainer(
 )
 
 
+def _collect_features_by_type(reconstructor, events):
+    """
+    Collect the features of the triggered telescopes of all ``events``,
+    grouped by telescope type, so each model is only called once.
+
+    Yields the telescope type, the list of (event, tel_id) pairs
+    and the corresponding feature table.
+    """
+    tel_events = defaultdict(list)
+    for event in events:
+        for tel_id in event.trigger.tels_with_trigger:
+            tel_events[reconstructor.subarray.tel[tel_id]].append((event, tel_id))
+
+    for key, group in tel_events.items():
+        table = collect_features_batch(group, reconstructor.instrument_table)
+        yield key, group, table
+
+
+def _fill_events(reconstructor, events, containers):
+    """
+    Fill the telescope containers predicted by `_collect_features_by_type`
+    into the events, in the same order as the event-wise prediction,
+    and apply the stereo combination.
+
+    ``containers`` maps ``(id(event), tel_id)`` to a dict of
+    dl2 telescope container attribute to container.
+    """
+    for event in events:
+        for tel_id in event.trigger.tels_with_trigger:
+            dl2 = event.dl2.tel[tel_id]
+            for attr, container in containers[id(event), tel_id].items():
+                container.prefix = f"{reconstructor.prefix}_tel"
+                getattr(dl2, attr)[reconstructor.prefix] = container
+
+        reconstructor.stereo_combiner(event)
+
+
+def _write_reconstructor(reconstructor, path, overwrite=False, compact=False):
+    """
+    Write ``reconstructor`` to ``path`` using joblib.
+
+    If ``compact`` is True, the models are temporarily replaced by
+    their flattened version for writing.
+    """
+    path = pathlib.Path(path)
+
+    if path.exists() and not overwrite:
+        raise OSError(f"Path {path} exists and overwrite=False")
+
+    models = reconstructor._models
+    if compact:
+        reconstructor._models = reconstructor._flatten_models()
+
+    try:
+        with path.open("wb") as f:
+            Provenance().add_output_file(path, role="ml-models")
+            joblib.dump(reconstructor, f, compress=not compact)
+    finally:
+        reconstructor._models = models
+
+
 class MLQualityQuery(QualityQuery):
     """Quality criteria for machine learning models with different defaults"""
 
@@ -209,15 +277,29 @@ class SKLearnReconstructor(Reconstructor):
             container definition(s)
         """
 
-    def write(self, path, overwrite=False):
-        path = pathlib.Path(path)
+    def write(self, path, overwrite=False, compact=False):
+        """
+        Write this reconstructor to ``path`` using joblib.
 
-        if path.exists() and not overwrite:
-            raise OSError(f"Path {path} exists and overwrite=False")
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Output path
+        overwrite : bool
+            Overwrite ``path`` if it exists
+        compact : bool
+            If True, store the models as `~ctapipe.reco.tree_ensemble.FlatTreeEnsemble`
+            in an uncompressed file, which is memory-mapped when reading.
+            Only supported for decision tree and forest models.
+            Otherwise, the sklearn models are stored in a compressed file.
+        """
+        _write_reconstructor(self, path, overwrite=overwrite, compact=compact)
 
-        with path.open("wb") as f:
-            Provenance().add_output_file(path, role="ml-models")
-            joblib.dump(self, f, compress=True)
+    def _flatten_models(self):
+        return {
+            key: FlatTreeEnsemble.from_sklearn(model)
+            for key, model in self._models.items()
+        }
 
     @lazyproperty
     def instrument_table(self):
@@ -425,6 +507,30 @@ class EnergyRegressor(SKLearnRegressionReconstructor):
 
         self.stereo_combiner(event)
 
+    def predict_events(self, events: list[ArrayEventContainer]) -> None:
+        """
+        Event-wise prediction for a batch of events.
+
+        Same as calling the reconstructor on each event, but the telescope
+        events of all events are predicted with one model call per telescope type.
+        """
+        containers = {}
+        for key, tel_events, table in _collect_features_by_type(self, events):
+            result = self.predict_table(key, table)[ReconstructionProperty.ENERGY]
+            energy = result[f"{self.prefix}_tel_energy"].quantity
+            is_valid = result[f"{self.prefix}_tel_is_valid"]
+
+            for (event, tel_id), tel_energy, tel_is_valid in zip(
+                tel_events, energy, is_valid
+            ):
+                containers[id(event), tel_id] = {
+                    "energy": ReconstructedEnergyContainer(
+                        energy=tel_energy, is_valid=tel_is_valid
+                    )
+                }
+
+        _fill_events(self, events, containers)
+
     def predict_table(self, key, table: Table) -> dict[ReconstructionProperty, Table]:
         table = self.feature_generator(table, subarray=self.subarray)
 
@@ -488,6 +594,32 @@ class ParticleClassifier(SKLearnClassificationReconstructor):
 
         self.stereo_combiner(event)
 
+    def predict_events(self, events: list[ArrayEventContainer]) -> None:
+        """
+        Event-wise prediction for a batch of events.
+
+        Same as calling the reconstructor on each event, but the telescope
+        events of all events are predicted with one model call per telescope type.
+        """
+        containers = {}
+        for key, tel_events, table in _collect_features_by_type(self, events):
+            result = self.predict_table(key, table)[
+                ReconstructionProperty.PARTICLE_TYPE
+            ]
+            prediction = result[f"{self.prefix}_tel_prediction"]
+            is_valid = result[f"{self.prefix}_tel_is_valid"]
+
+            for (event, tel_id), tel_prediction, tel_is_valid in zip(
+                tel_events, prediction, is_valid
+            ):
+                containers[id(event), tel_id] = {
+                    "particle_type": ParticleClassificationContainer(
+                        prediction=tel_prediction, is_valid=tel_is_valid
+                    )
+                }
+
+        _fill_events(self, events, containers)
+
     def predict_table(self, key, table: Table) -> dict[ReconstructionProperty, Table]:
         table = self.feature_generator(table, subarray=self.subarray)
 
@@ -656,20 +788,33 @@ class DispReconstructor(Reconstructor):
         self._models[key][0].fit(X, norm)
         self._models[key][1].fit(X, sign)
 
-    def write(self, path, overwrite=False):
-        path = pathlib.Path(path)
+    def write(self, path, overwrite=False, compact=False):
+        """
+        Write this reconstructor to ``path`` using joblib.
 
-        if path.exists() and not overwrite:
-            raise OSError(f"Path {path} exists and overwrite=False")
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Output path
+        overwrite : bool
+            Overwrite ``path`` if it exists
+        compact : bool
+            If True, store the models as `~ctapipe.reco.tree_ensemble.FlatTreeEnsemble`
+            in an uncompressed file, which is memory-mapped when reading.
+            Only supported for decision tree and forest models.
+            Otherwise, the sklearn models are stored in a compressed file.
+        """
+        _write_reconstructor(self, path, overwrite=overwrite, compact=compact)
 
-        with path.open("wb") as f:
-            Provenance().add_output_file(path, role="ml-models")
-            joblib.dump(self, f, compress=True)
+    def _flatten_models(self):
+        return {
+            key: tuple(FlatTreeEnsemble.from_sklearn(model) for model in models)
+            for key, models in self._models.items()
+        }
 
     @classmethod
     def read(cls, path, **kwargs):
-        with open(path, "rb") as f:
-            instance = joblib.load(f)
+        instance = _load_joblib(path)
 
         for attr, value in kwargs.items():
             setattr(instance, attr, value)
@@ -750,17 +895,16 @@ class DispReconstructor(Reconstructor):
 
                     fov_lon = hillas.fov_lon + disp[0] * np.cos(psi)
                     fov_lat = hillas.fov_lat + disp[0] * np.sin(psi)
-                    altaz = TelescopeFrame(
-                        fov_lon=fov_lon,
-                        fov_lat=fov_lat,
-                        telescope_pointing=AltAz(
-                            alt=event.monitoring.tel[tel_id].pointing.altitude,
-                            az=event.monitoring.tel[tel_id].pointing.azimuth,
-                        ),
-                    ).transform_to(AltAz())
+                    pointing = event.monitoring.tel[tel_id].pointing
+                    alt, az = telescope_to_horizontal(
+                        lon=fov_lon,
+                        lat=fov_lat,
+                        pointing_alt=pointing.altitude,
+                        pointing_az=pointing.azimuth,
+                    )
 
                     altaz_container = ReconstructedGeometryContainer(
-                        alt=altaz.alt, az=altaz.az, is_valid=True
+                        alt=alt, az=az, is_valid=True
                     )
 
                 else:
@@ -781,6 +925,55 @@ class DispReconstructor(Reconstructor):
 
         self.stereo_combiner(event)
 
+    def predict_events(self, events: list[ArrayEventContainer]) -> None:
+        """
+        Event-wise prediction for a batch of events.
+
+        Same as calling the reconstructor on each event, but the telescope
+        events of all events are predicted with one model call per telescope type.
+        """
+        containers = {}
+        for key, tel_events, table in _collect_features_by_type(self, events):
+            pointings = [
+                event.monitoring.tel[tel_id].pointing for event, tel_id in tel_events
+            ]
+            table["telescope_pointing_altitude"] = u.Quantity(
+                [pointing.altitude for pointing in pointings]
+            )
+            table["telescope_pointing_azimuth"] = u.Quantity(
+                [pointing.azimuth for pointing in pointings]
+            )
+
+            result = self.predict_table(key, table)
+            disp_result = result[ReconstructionProperty.DISP]
+            altaz_result = result[ReconstructionProperty.GEOMETRY]
+            parameter = disp_result[f"{self.prefix}_tel_parameter"].quantity
+            sign_score = disp_result[f"{self.prefix}_tel_sign_score"]
+            alt = altaz_result[f"{self.prefix}_tel_alt"].quantity
+            az = altaz_result[f"{self.prefix}_tel_az"].quantity
+            is_valid = altaz_result[f"{self.prefix}_tel_is_valid"]
+
+            for i, (event, tel_id) in enumerate(tel_events):
+                if is_valid[i]:
+                    disp_container = DispContainer(
+                        parameter=parameter[i], sign_score=sign_score[i]
+                    )
+                    altaz_container = ReconstructedGeometryContainer(
+                        alt=alt[i], az=az[i], is_valid=True
+                    )
+                else:
+                    disp_container = DispContainer(
+                        parameter=u.Quantity(np.nan, self.unit),
+                    )
+                    altaz_container = deepcopy(_invalid_geometry)
+
+                containers[id(event), tel_id] = {
+                    "disp": disp_container,
+                    "geometry": altaz_container,
+                }
+
+        _fill_events(self, events, containers)
+
     def predict_table(self, key, table: Table) -> dict[ReconstructionProperty, Table]:
         """
         Predict on a table of events.
@@ -891,6 +1084,11 @@ class DispReconstructor(Reconstructor):
         raise NotImplementedError(msg)
 
 
+def _cross_validate_pickled(cross_validate, model, telescope_type, train, test):
+    """Run ``cross_validate`` on the pickled ``model`` in a worker process"""
+    return cross_validate(pickle.loads(model), telescope_type, train, test)
+
+
 class CrossValidator(Component):
     """Class to train sklearn based reconstructors in a cross validation."""
 
@@ -914,10 +1112,25 @@ class CrossValidator(Component):
         default_value=1337, help="Random seed for splitting the training data."
     ).tag(config=True)
 
+    n_workers = traits.Int(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of worker processes used to train the cross validation folds."
+            " If larger than 1, each fold is trained on an independent copy of the"
+            " model in a worker process and the cross validation of the next"
+            " telescope type can start before the previous one is finished."
+            " Results are collected in telescope type and fold order when"
+            " the cross validator is closed."
+        ),
+    ).tag(config=True)
+
     def __init__(self, model_component, overwrite=False, **kwargs):
         super().__init__(**kwargs)
         self.model_component = model_component
         self.rng = np.random.default_rng(self.rng_seed)
+        self._executor = None
+        self._pending = []
 
         if isinstance(self.model_component, SKLearnClassificationReconstructor):
             self.cross_validate = self._cross_validate_classification
@@ -944,16 +1157,33 @@ class CrossValidator(Component):
 
             Provenance().add_output_file(self.output_path, role="ml-cross-validation")
             self.h5file = open_file(self.output_path, mode="w")
+            self._table_session = TableWriteSession(self.h5file)
 
     def close(self):
-        """Close the output hdf5 file, if ``self.output_path`` is given."""
+        """
+        Collect the results of running cross validations and close
+        the output hdf5 file, if ``self.output_path`` is given.
+        """
+        if self._executor is not None:
+            pending, self._pending = self._pending, []
+            for telescope_type, folds in pending:
+                self._collect_results(telescope_type, folds)
+            self._executor.shutdown()
+            self._executor = None
+
         if self.output_path:
+            self._table_session.close()
             self.h5file.close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and self._executor is not None:
+            # do not wait for the results in case of errors
+            self._pending = []
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
         self.close()
 
     def __call__(self, telescope_type, table):
@@ -970,7 +1200,6 @@ class CrossValidator(Component):
             telescope_type,
         )
 
-        scores = defaultdict(list)
         kfold = self.split_data(
             n_splits=self.n_cross_validations,
             shuffle=True,
@@ -983,17 +1212,68 @@ class CrossValidator(Component):
         else:
             cv_it = kfold.split(table, table[self.model_component.target])
 
-        for fold, (train_indices, test_indices) in enumerate(
+        def split():
+            for train_indices, test_indices in cv_it:
+                yield table[train_indices], table[test_indices]
+
+        if self.n_workers == 1:
+            folds = (
+                (
+                    self.cross_validate(
+                        self.model_component, telescope_type, train, test
+                    ),
+                    test,
+                )
+                for train, test in split()
+            )
+            self._collect_results(telescope_type, folds)
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.n_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        # the executor pickles the arguments later in a background thread,
+        # pickle the model now, as it might be changed before that happens.
+        # Each fold unpickles and trains an independent copy.
+        model = pickle.dumps(self.model_component)
+        folds = [
+            (
+                self._executor.submit(
+                    _cross_validate_pickled,
+                    self.cross_validate,
+                    model,
+                    telescope_type,
+                    train,
+                    test,
+                ),
+                test,
+            )
+            for train, test in split()
+        ]
+        self._pending.append((telescope_type, folds))
+
+    def _collect_results(self, telescope_type, folds):
+        """
+        Write and log the results of all folds for ``telescope_type``.
+
+        ``folds`` is an iterable of (result, test table) tuples, where result
+        is either the result of the cross validation function or a future for it.
+        """
+        scores = defaultdict(list)
+
+        for fold, (result, test) in enumerate(
             tqdm(
-                cv_it,
+                folds,
                 total=self.n_cross_validations,
                 desc=f"Cross Validation for {telescope_type}",
             ),
         ):
-            train = table[train_indices]
-            test = table[test_indices]
+            if isinstance(result, Future):
+                result = result.result()
 
-            cv_result, metrics = self.cross_validate(telescope_type, train, test)
+            cv_result, metrics = result
             if self.output_path:
                 results = Table(
                     data={
@@ -1008,9 +1288,8 @@ class CrossValidator(Component):
                     },
                 )
                 results = hstack([results, cv_result], join_type="exact")
-                write_table(
+                self._table_session.write(
                     results,
-                    self.h5file,
                     f"/cv_predictions/{telescope_type}",
                     append=True,
                 )
@@ -1028,8 +1307,8 @@ class CrossValidator(Component):
                     cv_values.std(),
                 )
 
-    def _cross_validate_regressor(self, telescope_type, train, test):
-        regressor = self.model_component
+    @staticmethod
+    def _cross_validate_regressor(regressor, telescope_type, train, test):
         regressor.fit(telescope_type, train)
         prediction, _ = regressor._predict(telescope_type, test)
         truth = test[regressor.target]
@@ -1046,8 +1325,8 @@ class CrossValidator(Component):
         )
         return result, {"R^2": r2}
 
-    def _cross_validate_classification(self, telescope_type, train, test):
-        classifier = self.model_component
+    @staticmethod
+    def _cross_validate_classification(classifier, telescope_type, train, test):
         classifier.fit(telescope_type, train)
         prediction, _ = classifier._predict_score(telescope_type, test)
         truth = np.where(
@@ -1068,8 +1347,8 @@ class CrossValidator(Component):
         )
         return result, {"ROC AUC": roc_auc}
 
-    def _cross_validate_disp(self, telescope_type, train, test):
-        models = self.model_component
+    @staticmethod
+    def _cross_validate_disp(models, telescope_type, train, test):
         models.fit(telescope_type, train)
         disp, sign_score, _ = models._predict(telescope_type, test)
         truth = test[models.target]
@@ -3,10 +3,12 @@
 import numpy as np
 from numba import njit, uint64
 
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+
 __all__ = ["get_subarray_index", "weighted_mean_std_ufunc"]
 
 
-@njit
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
 def _get_subarray_index(obs_ids, event_ids):
     n_tel_events = len(obs_ids)
     idx = np.zeros(n_tel_events, dtype=uint64)
@@ -80,11 +82,46 @@ def _grouped_add(tel_data, n_array_events, indices):
     corresponding telescope events. ``indices`` is an array
     that gives the index of the subarray event for each telescope event.
     """
-    combined_values = np.zeros(n_array_events)
+    tel_data = np.asanyarray(tel_data)
+    combined_values = np.zeros((n_array_events,) + tel_data.shape[1:])
     np.add.at(combined_values, indices, tel_data)
     return combined_values
 
 
+def _get_pair_indices(multiplicity):
+    """
+    Get all pairs of telescope events inside each subarray event.
+
+    The telescope events of each subarray event are expected in consecutive
+    blocks of length ``multiplicity``. The pairs of each subarray event are
+    ordered like ``itertools.combinations(range(multiplicity), 2)``.
+
+    Returns
+    -------
+    Tuple(np.ndarray, np.ndarray, np.ndarray)
+        index of the first and second telescope event of each pair and the
+        index of the subarray event the pair belongs to
+    """
+    multiplicity = np.asanyarray(multiplicity, dtype=np.intp)
+    starts = np.cumsum(multiplicity) - multiplicity
+
+    index_a = [np.zeros(0, dtype=np.intp)]
+    index_b = [np.zeros(0, dtype=np.intp)]
+    array_indices = [np.zeros(0, dtype=np.intp)]
+    for n_tels in np.unique(multiplicity[multiplicity >= 2]):
+        events = np.flatnonzero(multiplicity == n_tels)
+        first, second = np.triu_indices(n_tels, k=1)
+        index_a.append((starts[events, np.newaxis] + first).ravel())
+        index_b.append((starts[events, np.newaxis] + second).ravel())
+        array_indices.append(np.repeat(events, len(first)))
+
+    return (
+        np.concatenate(index_a),
+        np.concatenate(index_b),
+        np.concatenate(array_indices),
+    )
+
+
 def weighted_mean_std_ufunc(
     tel_values,
     valid_tel,
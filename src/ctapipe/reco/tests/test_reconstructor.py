@@ -19,3 +19,98 @@ def test_plugin(subarray_prod5_paranal):
 
     assert reconstructor.__module__ == "ctapipe_test_plugin"
     assert reconstructor.__class__.__name__ == "PluginReconstructor"
+
+
+@pytest.mark.parametrize("cls_name", ["HillasReconstructor", "HillasIntersection"])
+def test_hillas_predict_table(dl1_parameters_file, cls_name):
+    """Test that predict_table gives the same results as the event-wise reconstruction"""
+    import astropy.units as u
+    from numpy.testing import assert_allclose
+
+    from ctapipe.io import EventSource, TableLoader
+    from ctapipe.reco import Reconstructor
+
+    opts = dict(observation_info=True, pointing=True, simulated=False, dl2=False)
+    with TableLoader(dl1_parameters_file, **opts) as loader:
+        table = loader.read_telescope_events()
+        subarray = loader.subarray
+
+    reconstructor = Reconstructor.from_name(cls_name, subarray)
+    result = reconstructor.predict_table(table)
+
+    with EventSource(dl1_parameters_file) as source:
+        events = list(source)
+
+    assert len(result) == len(events)
+    for event, row in zip(events, result):
+        assert row["obs_id"] == event.index.obs_id
+        assert row["event_id"] == event.index.event_id
+
+        reconstructor(event)
+        geometry = event.dl2.stereo.geometry[cls_name]
+        assert row[f"{cls_name}_is_valid"] == geometry.is_valid
+        assert list(row[f"{cls_name}_telescopes"]) == list(geometry.telescopes)
+
+        for name in ("alt", "az", "core_x", "core_y", "h_max", "average_intensity"):
+            expected = getattr(geometry, name)
+            column = result[f"{cls_name}_{name}"]
+            if column.unit is not None:
+                expected = u.Quantity(expected).to_value(column.unit)
+            assert_allclose(row[f"{cls_name}_{name}"], expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("cls_name", ["HillasReconstructor", "HillasIntersection"])
+def test_hillas_predict_table_synthetic(cls_name, tmp_path, provenance):
+    """Test predict_table against the event-wise reconstruction on synthetic events"""
+    import astropy.units as u
+    from numpy.testing import assert_allclose
+
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.containers import CoordinateFrameType
+    from ctapipe.image import ImageProcessor
+    from ctapipe.io import DataWriter, TableLoader
+    from ctapipe.io.toymodel import SyntheticEventSource
+    from ctapipe.reco import Reconstructor
+
+    subarray = make_toy_subarray(n_telescopes=4, n_pixels_side=21)
+    source = SyntheticEventSource(
+        subarray=subarray, max_events=50, seed=0, trigger_probability=1.0
+    )
+    process_images = ImageProcessor(subarray=subarray)
+
+    provenance.start_activity("test_hillas_predict_table_synthetic")
+    path = tmp_path / "synthetic.dl1.h5"
+    events = []
+    with DataWriter(
+        event_source=source, output_path=path, write_dl1_parameters=True
+    ) as writer:
+        for event in source:
+            process_images(event)
+            writer(event)
+            events.append(event)
+
+    opts = dict(observation_info=True, pointing=True, simulated=False, dl2=False)
+    with TableLoader(path, **opts) as loader:
+        table = loader.read_telescope_events()
+
+    # the synthetic observation block has no pointing, use the one of the events
+    table["subarray_pointing_frame"] = CoordinateFrameType.ALTAZ.value
+    table["subarray_pointing_lat"] = source.pointing_altitude
+    table["subarray_pointing_lon"] = source.pointing_azimuth
+
+    reconstructor = Reconstructor.from_name(cls_name, subarray)
+    result = reconstructor.predict_table(table)
+
+    assert len(table) > len(result) == len(events)
+    assert result[f"{cls_name}_is_valid"].any()
+    for event, row in zip(events, result):
+        reconstructor(event)
+        geometry = event.dl2.stereo.geometry[cls_name]
+        assert row[f"{cls_name}_is_valid"] == geometry.is_valid
+
+        for name in ("alt", "az", "core_x", "core_y", "h_max"):
+            expected = getattr(geometry, name)
+            column = result[f"{cls_name}_{name}"]
+            if column.unit is not None:
+                expected = u.Quantity(expected).to_value(column.unit)
+            assert_allclose(row[f"{cls_name}_{name}"], expected, rtol=1e-6)
@@ -107,3 +107,31 @@ def test_shower_processor_geometry(
         assert not isfinite(DL2a.core_y)
         assert not DL2a.is_valid
         assert not isfinite(DL2a.average_intensity)
+
+
+def test_shower_processor_process_events(example_event, example_subarray):
+    """Test that batched processing returns the events in order with the same results"""
+    calibrate = CameraCalibrator(subarray=example_subarray)
+    process_images = ImageProcessor(subarray=example_subarray)
+    calibrate(example_event)
+    process_images(example_event)
+
+    events = []
+    for event_id in range(5):
+        event = deepcopy(example_event)
+        event.index.event_id = event_id
+        events.append(event)
+
+    expected = deepcopy(events)
+    ShowerProcessor(subarray=example_subarray).predict_events(expected)
+
+    process_shower = ShowerProcessor(subarray=example_subarray, batch_size=2)
+    processed = list(process_shower.process_events(iter(events)))
+
+    assert [event.index.event_id for event in processed] == list(range(5))
+    for event, expected_event in zip(processed, expected):
+        geometry = event.dl2.stereo.geometry["HillasReconstructor"]
+        expected_geometry = expected_event.dl2.stereo.geometry["HillasReconstructor"]
+        assert geometry.is_valid
+        assert geometry.alt == expected_geometry.alt
+        assert geometry.az == expected_geometry.az
@@ -7,10 +7,11 @@ from traitlets import TraitError
 from traitlets.config import Config
 
 from ctapipe.containers import CoordinateFrameType
-from ctapipe.core import Component
+from ctapipe.core import Component, Tool
 from ctapipe.reco import EnergyRegressor, ParticleClassifier
 from ctapipe.reco.reconstructor import ReconstructionProperty
 from ctapipe.reco.sklearn import DispReconstructor
+from ctapipe.reco.tree_ensemble import FlatTreeEnsemble
 from ctapipe.utils import get_dataset_path
 
 KEY = "LST_LST_LSTCam"
@@ -294,6 +295,45 @@ def test_io_with_parent(example_table, tmp_path, example_subarray):
         EnergyRegressor.read(path)
 
 
+@pytest.mark.parametrize(
+    "reconstructor_cls,model_cls",
+    [
+        (EnergyRegressor, "RandomForestRegressor"),
+        (ParticleClassifier, "ExtraTreesClassifier"),
+    ],
+)
+def test_io_compact(
+    reconstructor_cls, model_cls, example_table, tmp_path, example_subarray
+):
+    """Test writing and memory-mapping reconstructors with flat tree ensembles"""
+    config = Config()
+    config[reconstructor_cls.__name__].QualityQuery.quality_criteria = []
+    reconstructor = reconstructor_cls(
+        example_subarray,
+        model_cls=model_cls,
+        model_config=dict(n_estimators=10, random_state=0),
+        features=[f"X{i}" for i in range(8)],
+        config=config,
+    )
+    reconstructor.fit(KEY, example_table)
+
+    path = tmp_path / "compact.pkl"
+    reconstructor.write(path, compact=True)
+    # original models must not be replaced by writing
+    assert not isinstance(reconstructor._models[KEY], FlatTreeEnsemble)
+
+    loaded = reconstructor_cls.read(path)
+    model = loaded._models[KEY]
+    assert isinstance(model, FlatTreeEnsemble)
+    assert isinstance(model.value, np.memmap)
+
+    expected = reconstructor.predict_table(KEY, example_table)
+    result = loaded.predict_table(KEY, example_table)
+    for prop, table in expected.items():
+        for col in table.colnames:
+            assert_array_equal(result[prop][col], table[col])
+
+
 def test_disp_fixed_icrs_pointing(disp_reconstructor_path):
     from ctapipe.io import TableLoader
     from ctapipe.reco.sklearn import DispReconstructor
@@ -312,3 +352,205 @@ def test_disp_fixed_icrs_pointing(disp_reconstructor_path):
 
     with pytest.raises(NotImplementedError, match="Only AltAz frame supported"):
         disp_model.predict_table(disp_model.subarray.tel[1], events)
+
+
+def test_cross_validator_n_workers(example_table, example_subarray, tmp_path):
+    from ctapipe.io import read_table
+    from ctapipe.reco import CrossValidator
+
+    # cross validation requires valid features
+    table = example_table.copy()
+    table.remove_rows([10, 30])
+    table["true_impact_distance"] = np.linspace(0, 500, len(table)) * u.m
+
+    config = Config(
+        dict(
+            EnergyRegressor=dict(
+                model_cls="RandomForestRegressor",
+                model_config=dict(n_estimators=5, max_depth=3, random_state=0),
+                features=[f"X{i}" for i in range(8)],
+                QualityQuery=dict(quality_criteria=[]),
+            )
+        )
+    )
+
+    results = []
+    for n_workers in (1, 2):
+        regressor = EnergyRegressor(example_subarray, config=config)
+        output_path = tmp_path / f"cv_{n_workers}.h5"
+        with CrossValidator(
+            model_component=regressor,
+            n_cross_validations=3,
+            output_path=output_path,
+            n_workers=n_workers,
+        ) as cross_validate:
+            cross_validate(KEY, table)
+
+        results.append(read_table(output_path, f"/cv_predictions/{KEY}"))
+
+    assert len(results[0]) == len(table)
+    assert_array_equal(results[0]["cv_fold"], results[1]["cv_fold"])
+    assert_array_equal(
+        results[0]["RandomForestRegressor_energy"],
+        results[1]["RandomForestRegressor_energy"],
+    )
+
+
+def test_predict_events(example_subarray):
+    """Test that batched prediction gives the same results as the event-wise one"""
+    from copy import deepcopy
+
+    from ctapipe.containers import (
+        ArrayEventContainer,
+        HillasParametersContainer,
+        ImageParametersContainer,
+    )
+
+    rng = np.random.default_rng(0)
+    n_rows = 200
+    table = Table(
+        {
+            "hillas_intensity": rng.uniform(10, 5000, n_rows),
+            "hillas_length": rng.uniform(0.05, 0.5, n_rows) * u.deg,
+            "hillas_width": rng.uniform(0.01, 0.1, n_rows) * u.deg,
+        }
+    )
+    table["true_energy"] = table["hillas_intensity"] / 100 * u.TeV
+    table["true_shower_primary_id"] = rng.choice([0, 101], n_rows)
+    table["true_disp"] = rng.normal(0, 1, n_rows) * u.deg
+
+    features = ["hillas_intensity", "hillas_length", "hillas_width"]
+    config = Config()
+    config.MLQualityQuery.quality_criteria = [("bright", "hillas_intensity > 100")]
+    model_config = dict(n_estimators=5, max_depth=5, random_state=0)
+    energy = EnergyRegressor(
+        example_subarray,
+        model_cls="RandomForestRegressor",
+        model_config=model_config,
+        features=features,
+        config=config,
+    )
+    classifier = ParticleClassifier(
+        example_subarray,
+        model_cls="RandomForestClassifier",
+        model_config=model_config,
+        features=features,
+        config=config,
+    )
+    disp = DispReconstructor(
+        example_subarray,
+        norm_cls="RandomForestRegressor",
+        sign_cls="RandomForestClassifier",
+        norm_config=model_config,
+        sign_config=model_config,
+        features=features,
+        config=config,
+    )
+    reconstructors = [energy, classifier, disp]
+    for tel_type in example_subarray.telescope_types:
+        for reconstructor in reconstructors:
+            reconstructor.fit(tel_type, table)
+
+    events = []
+    for event_id in range(20):
+        event = ArrayEventContainer()
+        event.index.event_id = event_id
+        n_tels = rng.integers(1, 5)
+        tel_ids = np.sort(rng.choice(example_subarray.tel_ids, n_tels, replace=False))
+        event.trigger.tels_with_trigger = tel_ids
+        for tel_id in tel_ids:
+            hillas = HillasParametersContainer(
+                fov_lon=rng.uniform(-1, 1) * u.deg,
+                fov_lat=rng.uniform(-1, 1) * u.deg,
+                psi=rng.uniform(-90, 90) * u.deg,
+                intensity=rng.uniform(10, 5000),
+                length=rng.uniform(0.05, 0.5) * u.deg,
+                width=rng.uniform(0.01, 0.1) * u.deg,
+            )
+            event.dl1.tel[tel_id].parameters = ImageParametersContainer(hillas=hillas)
+            event.monitoring.tel[tel_id].pointing.altitude = 70 * u.deg
+            event.monitoring.tel[tel_id].pointing.azimuth = 10 * u.deg
+        events.append(event)
+
+    expected = deepcopy(events)
+    for reconstructor in reconstructors:
+        for event in expected:
+            reconstructor(event)
+        reconstructor.predict_events(events)
+
+    def assert_same(container, expected_container):
+        assert container.prefix == expected_container.prefix
+        for key, value in expected_container.items():
+            if isinstance(value, u.Quantity | float):
+                assert u.allclose(container[key], value, equal_nan=True)
+            else:
+                assert container[key] == value
+
+    for event, expected_event in zip(events, expected):
+        for tel_id in expected_event.trigger.tels_with_trigger:
+            dl2 = event.dl2.tel[tel_id]
+            expected_dl2 = expected_event.dl2.tel[tel_id]
+            assert_same(dl2.energy[energy.prefix], expected_dl2.energy[energy.prefix])
+            assert_same(
+                dl2.particle_type[classifier.prefix],
+                expected_dl2.particle_type[classifier.prefix],
+            )
+            assert_same(dl2.disp[disp.prefix], expected_dl2.disp[disp.prefix])
+            assert_same(dl2.geometry[disp.prefix], expected_dl2.geometry[disp.prefix])
+
+        stereo = event.dl2.stereo
+        expected_stereo = expected_event.dl2.stereo
+        assert_same(stereo.energy[energy.prefix], expected_stereo.energy[energy.prefix])
+        assert_same(
+            stereo.particle_type[classifier.prefix],
+            expected_stereo.particle_type[classifier.prefix],
+        )
+        assert_same(stereo.geometry[disp.prefix], expected_stereo.geometry[disp.prefix])
+
+
+def test_cross_validator_model_changed_after_submit(example_table, tmp_path):
+    """The folds train copies of the model as it was when they were submitted"""
+    from ctapipe.benchmark import make_toy_subarray
+    from ctapipe.io import read_table
+    from ctapipe.reco import CrossValidator
+
+    subarray = make_toy_subarray(n_telescopes=1, n_pixels_side=5)
+    table = example_table.copy()
+    table.remove_rows([10, 30])
+    table["true_impact_distance"] = np.linspace(0, 500, len(table)) * u.m
+
+    config = Config(
+        dict(
+            EnergyRegressor=dict(
+                model_cls="RandomForestRegressor",
+                model_config=dict(n_estimators=5, max_depth=3, random_state=0),
+                features=[f"X{i}" for i in range(8)],
+                QualityQuery=dict(quality_criteria=[]),
+            )
+        )
+    )
+
+    results = []
+    for n_workers in (1, 2):
+        parent = Tool(config=config)
+        regressor = EnergyRegressor(subarray, parent=parent)
+        output_path = tmp_path / f"cv_{n_workers}.h5"
+        with CrossValidator(
+            model_component=regressor,
+            n_cross_validations=5,
+            output_path=output_path,
+            n_workers=n_workers,
+        ) as cross_validate:
+            cross_validate(KEY, table)
+            # sending the model to the workers must not detach it from its parent
+            assert regressor.parent == parent
+            # change the model while the folds might still be waiting
+            regressor.model_config = dict(n_estimators=1, max_depth=1, random_state=1)
+            regressor.fit(KEY, table)
+
+        results.append(read_table(output_path, f"/cv_predictions/{KEY}"))
+
+    assert_array_equal(
+        results[0]["RandomForestRegressor_energy"],
+        results[1]["RandomForestRegressor_energy"],
+    )
@@ -49,3 +49,26 @@ def test_mean_std_ufunc(dl1_parameters_file):
 
     assert np.allclose(mean, true_mean, equal_nan=True)
     assert np.allclose(std, true_std, equal_nan=True)
+
+
+def test_get_pair_indices():
+    from itertools import combinations
+
+    from ctapipe.reco.telescope_event_handling import _get_pair_indices
+
+    multiplicity = np.array([2, 1, 4, 3, 0, 2])
+    index_a, index_b, array_indices = _get_pair_indices(multiplicity)
+
+    starts = np.cumsum(multiplicity) - multiplicity
+    expected = [
+        (start + a, start + b, i)
+        for i, (start, n_tels) in enumerate(zip(starts, multiplicity))
+        for a, b in combinations(range(n_tels), 2)
+    ]
+    assert sorted(zip(index_a, index_b, array_indices)) == sorted(expected)
+
+    # pairs of each subarray event are ordered like itertools.combinations
+    for i in range(len(multiplicity)):
+        mask = array_indices == i
+        pairs = [(a, b, i) for a, b in zip(index_a[mask], index_b[mask])]
+        assert pairs == [pair for pair in expected if pair[2] == i]
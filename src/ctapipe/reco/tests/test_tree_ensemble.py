@@ -0,0 +1,97 @@
+"""Tests for the flat tree ensemble representation of sklearn models"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from ctapipe.reco.tree_ensemble import FlatTreeEnsemble
+
+
+@pytest.fixture(scope="module")
+def training_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 4))
+    y = X[:, 0] + 0.5 * X[:, 1] ** 2 + rng.normal(0, 0.1, 500)
+    return X, y
+
+
+@pytest.mark.parametrize(
+    "model_cls",
+    ["DecisionTreeRegressor", "RandomForestRegressor", "ExtraTreesRegressor"],
+)
+def test_regressor(model_cls, training_data):
+    from sklearn.utils import all_estimators
+
+    X, y = training_data
+    model = dict(all_estimators("regressor"))[model_cls](random_state=0)
+    model.fit(X, y)
+
+    flat = FlatTreeEnsemble.from_sklearn(model)
+    assert flat.n_outputs_ == 1
+    assert flat.n_features_in_ == 4
+    assert_allclose(flat.predict(X), model.predict(X), rtol=1e-12)
+
+    with pytest.raises(AttributeError):
+        flat.predict_proba(X)
+
+
+def test_multi_output_regressor(training_data):
+    from sklearn.ensemble import RandomForestRegressor
+
+    X, y = training_data
+    y = np.column_stack([y, -2 * y])
+    model = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, y)
+
+    flat = FlatTreeEnsemble.from_sklearn(model)
+    assert flat.n_outputs_ == 2
+    assert flat.predict(X).shape == (len(X), 2)
+    assert_allclose(flat.predict(X), model.predict(X), rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "model_cls",
+    ["DecisionTreeClassifier", "RandomForestClassifier", "ExtraTreesClassifier"],
+)
+def test_classifier(model_cls, training_data):
+    from sklearn.utils import all_estimators
+
+    X, y = training_data
+    labels = np.where(y > 0.5, 1, -1)
+    model = dict(all_estimators("classifier"))[model_cls](max_depth=5, random_state=0)
+    model.fit(X, labels)
+
+    flat = FlatTreeEnsemble.from_sklearn(model)
+    assert flat.n_classes_ == 2
+    assert_array_equal(flat.classes_, [-1, 1])
+    assert_allclose(flat.predict_proba(X), model.predict_proba(X), rtol=1e-12)
+    assert_array_equal(flat.predict(X), model.predict(X))
+
+
+def test_unsupported_model(training_data):
+    from sklearn.linear_model import LinearRegression
+
+    X, y = training_data
+    model = LinearRegression().fit(X, y)
+
+    with pytest.raises(TypeError, match="not supported"):
+        FlatTreeEnsemble.from_sklearn(model)
+    assert not FlatTreeEnsemble.supports(LinearRegression)
+
+
+def test_supports():
+    from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingRegressor
+    from sklearn.tree import DecisionTreeRegressor
+
+    assert FlatTreeEnsemble.supports(DecisionTreeRegressor)
+    assert FlatTreeEnsemble.supports(ExtraTreesClassifier)
+    assert not FlatTreeEnsemble.supports(GradientBoostingRegressor)
+
+
+def test_wrong_number_of_features(training_data):
+    from sklearn.tree import DecisionTreeRegressor
+
+    X, y = training_data
+    flat = FlatTreeEnsemble.from_sklearn(DecisionTreeRegressor().fit(X, y))
+
+    with pytest.raises(ValueError, match="4 features"):
+        flat.predict(X[:, :3])
@@ -0,0 +1,300 @@
+"""
+Compact representation of scikit-learn decision tree ensembles.
+
+The nodes of all trees of an ensemble are stored in a few flat numpy arrays,
+which can be memory-mapped when loading a model from an uncompressed file,
+and evaluated by a compiled batch predictor.
+"""
+
+import numpy as np
+from numba import njit
+
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+
+__all__ = [
+    "FlatTreeEnsemble",
+]
+
+#: value of ``children_left`` / ``children_right`` for leaf nodes
+LEAF = -1
+
+
+@njit(cache=not CTAPIPE_DISABLE_NUMBA_CACHE)
+def _predict_trees(
+    X,
+    roots,
+    feature,
+    threshold,
+    children_left,
+    children_right,
+    missing_go_to_left,
+    value,
+):
+    n_samples = X.shape[0]
+    n_trees = len(roots)
+    out = np.zeros((n_samples, value.shape[1]))
+
+    # loop over the trees first, so the nodes of one tree stay in the cache
+    for tree in range(n_trees):
+        for sample in range(n_samples):
+            node = roots[tree]
+            while children_left[node] != LEAF:
+                x = X[sample, feature[node]]
+                if np.isnan(x):
+                    go_left = missing_go_to_left[node]
+                else:
+                    go_left = x <= threshold[node]
+
+                if go_left:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+
+            out[sample] += value[node]
+
+    out /= n_trees
+    return out
+
+
+def _get_trees(model):
+    """Get the decision trees of a fitted sklearn tree or forest model."""
+    if hasattr(model, "tree_"):
+        return [model.tree_]
+
+    estimators = getattr(model, "estimators_", None)
+    if isinstance(estimators, list) and all(hasattr(e, "tree_") for e in estimators):
+        return [estimator.tree_ for estimator in estimators]
+
+    raise TypeError(
+        f"{model.__class__.__name__} is not supported, only single decision trees"
+        " and forests of decision trees (e.g. RandomForestRegressor or"
+        " ExtraTreesClassifier) can be converted to a FlatTreeEnsemble."
+    )
+
+
+class FlatTreeEnsemble:
+    """
+    Decision tree ensemble with all nodes stored in flat numpy arrays.
+
+    Prediction averages the leaf values of all trees, like the
+    sklearn forest models (and single decision trees) this is created from.
+    Implements the subset of the sklearn estimator interface used by
+    the `~ctapipe.reco.sklearn.SKLearnReconstructor` classes.
+
+    Use `FlatTreeEnsemble.from_sklearn` to create an instance.
+
+    Parameters
+    ----------
+    roots : np.ndarray[int64]
+        Index of the root node of each tree
+    feature : np.ndarray[int64]
+        Index of the feature used for the split of each node
+    threshold : np.ndarray[float64]
+        Split threshold of each node, samples with ``x <= threshold``
+        go to the left child
+    children_left : np.ndarray[int64]
+        Index of the left child of each node, ``-1`` for leaf nodes
+    children_right : np.ndarray[int64]
+        Index of the right child of each node, ``-1`` for leaf nodes
+    missing_go_to_left : np.ndarray[bool]
+        Whether samples with a missing (nan) feature value go to the left child
+    value : np.ndarray[float64]
+        Prediction of each node, shape (n_nodes, n_outputs) for regressors
+        and (n_nodes, n_classes) with normalized class probabilities for classifiers.
+    n_features_in : int
+        Number of features the model was trained on
+    classes : np.ndarray or None
+        Class labels for classifiers, None for regressors
+    """
+
+    def __init__(
+        self,
+        roots,
+        feature,
+        threshold,
+        children_left,
+        children_right,
+        missing_go_to_left,
+        value,
+        n_features_in,
+        classes=None,
+    ):
+        self.roots = roots
+        self.feature = feature
+        self.threshold = threshold
+        self.children_left = children_left
+        self.children_right = children_right
+        self.missing_go_to_left = missing_go_to_left
+        self.value = value
+        self.n_features_in_ = n_features_in
+        self.classes_ = classes
+        self.n_jobs = None
+
+    @staticmethod
+    def supports(model_cls):
+        """
+        Whether instances of the sklearn estimator class ``model_cls``
+        can be converted using `FlatTreeEnsemble.from_sklearn`.
+        """
+        from sklearn.ensemble import (
+            ExtraTreesClassifier,
+            ExtraTreesRegressor,
+            RandomForestClassifier,
+            RandomForestRegressor,
+        )
+        from sklearn.tree import BaseDecisionTree
+
+        supported = (
+            BaseDecisionTree,
+            ExtraTreesClassifier,
+            ExtraTreesRegressor,
+            RandomForestClassifier,
+            RandomForestRegressor,
+        )
+        return issubclass(model_cls, supported)
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """
+        Convert a fitted sklearn decision tree or forest of decision trees.
+
+        Parameters
+        ----------
+        model : sklearn.base.BaseEstimator
+            A fitted ``DecisionTree*``, ``ExtraTree*``, ``RandomForest*``
+            or ``ExtraTrees*`` model. Classifiers must have a single output.
+
+        Returns
+        -------
+        FlatTreeEnsemble
+        """
+        trees = _get_trees(model)
+        classes = getattr(model, "classes_", None)
+
+        if classes is not None and model.n_outputs_ != 1:
+            raise NotImplementedError(
+                "Only single-output classifiers are supported, got"
+                f" n_outputs_={model.n_outputs_}"
+            )
+
+        n_nodes = np.array([tree.node_count for tree in trees])
+        offsets = np.cumsum(n_nodes) - n_nodes
+
+        def concatenate_children(attr):
+            children = []
+            for tree, offset in zip(trees, offsets):
+                tree_children = getattr(tree, attr)
+                children.append(
+                    np.where(tree_children == LEAF, LEAF, tree_children + offset)
+                )
+            return np.concatenate(children).astype(np.int64)
+
+        values = []
+        for tree in trees:
+            # shape (n_nodes, n_outputs, max_n_classes), max_n_classes is 1 for regression
+            value = tree.value
+            if classes is not None:
+                value = value[:, 0, :]
+                normalizer = value.sum(axis=1, keepdims=True)
+                normalizer[normalizer == 0] = 1
+                value = value / normalizer
+            else:
+                value = value[:, :, 0]
+            values.append(value)
+
+        missing_go_to_left = [
+            getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=bool))
+            for tree in trees
+        ]
+
+        return cls(
+            roots=offsets.astype(np.int64),
+            feature=np.concatenate([tree.feature for tree in trees]).astype(np.int64),
+            threshold=np.concatenate([tree.threshold for tree in trees]).astype(
+                np.float64
+            ),
+            children_left=concatenate_children("children_left"),
+            children_right=concatenate_children("children_right"),
+            missing_go_to_left=np.concatenate(missing_go_to_left).astype(bool),
+            value=np.concatenate(values).astype(np.float64),
+            n_features_in=model.n_features_in_,
+            classes=classes,
+        )
+
+    @property
+    def n_trees(self):
+        """Number of trees in the ensemble"""
+        return len(self.roots)
+
+    @property
+    def n_outputs_(self):
+        """Number of outputs, 1 for classifiers"""
+        if self.classes_ is not None:
+            return 1
+        return self.value.shape[1]
+
+    @property
+    def n_classes_(self):
+        """Number of classes of a classifier"""
+        if self.classes_ is None:
+            raise AttributeError("Regression models have no classes")
+        return len(self.classes_)
+
+    def _predict_value(self, X):
+        # sklearn evaluates the splits on float32 features
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, but model expects {self.n_features_in_} features"
+            )
+
+        return _predict_trees(
+            X,
+            self.roots,
+            self.feature,
+            self.threshold,
+            self.children_left,
+            self.children_right,
+            self.missing_go_to_left,
+            self.value,
+        )
+
+    def predict(self, X):
+        """
+        Predict the target values (regressors) or class labels (classifiers) for X.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Features, shape (n_samples, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n_samples,) or (n_samples, n_outputs) for multi-output regressors.
+        """
+        value = self._predict_value(X)
+        if self.classes_ is not None:
+            return self.classes_.take(np.argmax(value, axis=1))
+
+        if value.shape[1] == 1:
+            return value[:, 0]
+        return value
+
+    def predict_proba(self, X):
+        """
+        Predict the class probabilities for X.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Features, shape (n_samples, n_features)
+
+        Returns
+        -------
+        np.ndarray
+            Probabilities, shape (n_samples, n_classes)
+        """
+        if self.classes_ is None:
+            raise AttributeError("Regression models cannot predict probabilities")
+        return self._predict_value(X)
@@ -0,0 +1,93 @@
+"""Tests that importing the ctapipe subpackages and tools stays cheap"""
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_PACKAGES = [
+    "ctapipe.image",
+    "ctapipe.instrument",
+    "ctapipe.io",
+    "ctapipe.reco",
+]
+
+#: modules that should only be imported once they are actually needed
+HEAVY_MODULES = ["numba", "scipy", "sklearn", "astropy.coordinates"]
+
+
+def import_time(module):
+    """Cumulative import time of ``module`` in µs in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f"No import time for {module} in output")
+
+
+def imported_modules(module):
+    """Names of the modules loaded by importing ``module`` in a fresh interpreter"""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_package_import(package):
+    """Importing a lazily loaded package does not import its dependencies"""
+    modules = imported_modules(package)
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules, f"{package} imports {heavy}"
+
+    # but all public attributes are still available
+    module = __import__(package, fromlist=["__all__"])
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_package_import_time(package):
+    """Importing a lazily loaded package on its own takes less than 0.1 s"""
+    # measure the package itself, ctapipe.core is needed by anything
+    # using the package and imported before
+    total = import_time(package)
+    assert total < 100_000, f"Importing {package} took {total / 1e6:.2f} s"
+
+
+def test_fileinfo_import_time():
+    """ctapipe-fileinfo only needs the parser utilities and pytables"""
+    modules = imported_modules("ctapipe.tools.fileinfo")
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules, f"ctapipe.tools.fileinfo imports {heavy}"
+
+
+def test_plugins_detected_on_lookup():
+    """Implementations in not yet imported modules are found via entry points"""
+    code = (
+        "from ctapipe.io import EventSource;"
+        "from ctapipe.reco import Reconstructor;"
+        "print(*EventSource.non_abstract_subclasses());"
+        "print(*Reconstructor.non_abstract_subclasses())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    event_sources, reconstructors = result.stdout.splitlines()
+    assert "SimTelEventSource" in event_sources.split()
+    assert "HDF5EventSource" in event_sources.split()
+    assert "HillasReconstructor" in reconstructors.split()
+    assert "EnergyRegressor" in reconstructors.split()
@@ -9,7 +9,7 @@ from tqdm.auto import tqdm
 
 from ctapipe.core.tool import Tool
 from ctapipe.core.traits import Bool, Integer, List, Path, classes_with_traits, flag
-from ctapipe.io import HDF5Merger, TableLoader, write_table
+from ctapipe.io import HDF5Merger, TableLoader, TableWriteSession
 from ctapipe.io.astropy_helpers import join_allow_empty, read_table
 from ctapipe.io.hdf5dataformat import (
     DL1_SUBARRAY_TRIGGER_TABLE,
@@ -159,6 +159,7 @@ class ApplyModels(Tool):
             merger(self.input_url)
 
         self.h5file = self.enter_context(tables.open_file(self.output_path, mode="r+"))
+        self.table_session = self.enter_context(TableWriteSession(self.h5file))
         self.loader = self.enter_context(
             TableLoader(
                 self.input_url,
@@ -225,9 +226,8 @@ class ApplyModels(Tool):
                     table[col] = prediction_table[col]
 
                 output_columns = ["obs_id", "event_id", "tel_id"] + new_columns
-                write_table(
+                self.table_session.write(
                     table[output_columns],
-                    self.output_path,
                     f"{DL2_TEL_GROUP}/{prop}/{prefix}/tel_{tel_id:03d}",
                     append=True,
                 )
@@ -266,9 +266,8 @@ class ApplyModels(Tool):
             stereo_predictions[c.name] = np.array([trafo(r) for r in c])
             stereo_predictions[c.name].description = c.description
 
-        write_table(
+        self.table_session.write(
             stereo_predictions,
-            self.output_path,
             f"{DL2_SUBARRAY_GROUP}/{combiner.property}/{combiner.prefix}",
             append=True,
         )
@@ -0,0 +1,263 @@
+"""
+Run the performance benchmarks of ctapipe and compare them to a previous run.
+"""
+
+import json
+import os
+import platform
+
+from astropy.table import Table
+from astropy.time import Time
+
+from ..benchmark import (
+    BenchmarkContext,
+    compare_results,
+    get_benchmarks,
+    run_benchmark,
+)
+from ..core import Provenance, Tool, ToolConfigurationError
+from ..core.traits import Bool, Float, Integer, Path, Unicode, flag
+from ..instrument import SubarrayDescription
+
+__all__ = ["BenchmarkTool"]
+
+
+class BenchmarkTool(Tool):
+    """
+    Run the performance benchmarks of ctapipe.
+
+    The benchmarks run on synthetic data generated on the fly, so no input
+    files are needed. Results are written as json and can be compared to the
+    results of a previous run, e.g. of the last release, to detect
+    performance regressions. The tool exits with a non-zero exit code if
+    any benchmark got slower than allowed.
+    """
+
+    name = "ctapipe-benchmark"
+    description = __doc__
+    examples = """
+    List all available benchmarks:
+    > ctapipe-benchmark --list
+
+    Run all image cleaning benchmarks and store the results:
+    > ctapipe-benchmark --select 'image\\.cleaning' --output results.json
+
+    Compare to a previous run, failing if a benchmark is more than 20 % slower:
+    > ctapipe-benchmark --output new.json --baseline results.json --max-slowdown 1.2
+    """
+
+    select = Unicode(
+        default_value=None,
+        allow_none=True,
+        help="Only run benchmarks with a name matching this regular expression",
+    ).tag(config=True)
+
+    list_benchmarks = Bool(
+        default_value=False,
+        help="Only list the available benchmarks, don't run them",
+    ).tag(config=True)
+
+    output_path = Path(
+        default_value=None,
+        allow_none=True,
+        directory_ok=False,
+        help="Output path for the results as json",
+    ).tag(config=True)
+
+    baseline_path = Path(
+        default_value=None,
+        allow_none=True,
+        exists=True,
+        directory_ok=False,
+        help="Results of a previous run to compare to",
+    ).tag(config=True)
+
+    max_slowdown = Float(
+        default_value=1.2,
+        help=(
+            "Benchmarks with a minimum time per call larger than this factor"
+            " times the minimum time in the baseline are reported as regressions"
+        ),
+    ).tag(config=True)
+
+    min_time = Float(
+        default_value=0.5,
+        help="Minimum total time in seconds spent in the timed calls of each benchmark",
+    ).tag(config=True)
+
+    repeat = Integer(
+        default_value=5,
+        min=1,
+        help="Number of repetitions of the timed calls of each benchmark",
+    ).tag(config=True)
+
+    n_events = Integer(
+        default_value=100,
+        min=1,
+        help="Number of synthetic events for benchmarks processing multiple events",
+    ).tag(config=True)
+
+    subarray_path = Path(
+        default_value=None,
+        allow_none=True,
+        exists=True,
+        directory_ok=False,
+        help=(
+            "File to read the subarray description for the synthetic data from,"
+            " e.g. a simtel or ctapipe HDF5 file. If not given, a toy subarray is used."
+        ),
+    ).tag(config=True)
+
+    aliases = {
+        ("k", "select"): "BenchmarkTool.select",
+        ("o", "output"): "BenchmarkTool.output_path",
+        "baseline": "BenchmarkTool.baseline_path",
+        "max-slowdown": "BenchmarkTool.max_slowdown",
+        "min-time": "BenchmarkTool.min_time",
+        "repeat": "BenchmarkTool.repeat",
+        "n-events": "BenchmarkTool.n_events",
+        "subarray": "BenchmarkTool.subarray_path",
+    }
+
+    flags = {
+        **flag(
+            "list",
+            "BenchmarkTool.list_benchmarks",
+            "Only list the available benchmarks",
+            "Run the benchmarks",
+        ),
+    }
+
+    def setup(self):
+        self.check_output(self.output_path)
+
+        self.benchmarks = get_benchmarks(self.select)
+        if len(self.benchmarks) == 0:
+            raise ToolConfigurationError(
+                f"No benchmarks matching {self.select!r}, use --list to see all"
+            )
+
+        self.baseline = None
+        if self.baseline_path is not None:
+            self.baseline = json.loads(self.baseline_path.read_text())["benchmarks"]
+            Provenance().add_input_file(
+                self.baseline_path, role="benchmark baseline", add_meta=False
+            )
+
+        subarray = None
+        if self.subarray_path is not None:
+            subarray = SubarrayDescription.read(self.subarray_path)
+
+        self.context = self.enter_context(
+            BenchmarkContext(subarray=subarray, n_events=self.n_events)
+        )
+        self.results = {}
+
+    def start(self):
+        if self.list_benchmarks:
+            for benchmark in self.benchmarks:
+                print(f"{benchmark.name:<60} {benchmark.description}")
+            return
+
+        for benchmark in self.benchmarks:
+            self.log.info("Running %s", benchmark.name)
+            result = run_benchmark(
+                benchmark,
+                self.context,
+                min_time=self.min_time,
+                repeat=self.repeat,
+            )
+            self.log.info(
+                "%s: %.4g s per call (%d x %d calls)",
+                benchmark.name,
+                result["min"],
+                result["repeat"],
+                result["n_calls"],
+            )
+            self.results[benchmark.name] = {
+                "description": benchmark.description,
+                **result,
+            }
+
+    def finish(self):
+        if self.list_benchmarks:
+            return
+
+        table = Table(
+            rows=[
+                (name, r["n_calls"], r["repeat"], r["min"], r["median"], r["std"])
+                for name, r in self.results.items()
+            ],
+            names=["benchmark", "n_calls", "repeat", "min", "median", "std"],
+        )
+        for col in ("min", "median", "std"):
+            table[col].unit = "s"
+            table[col].format = ".4g"
+        table.pprint(max_lines=-1, max_width=-1)
+
+        if self.output_path is not None:
+            self._write_results()
+
+        if self.baseline is not None:
+            self._compare_to_baseline()
+
+    def _write_results(self):
+        output = {
+            "ctapipe_version": self.version,
+            "time_utc": Time.now().utc.isot,
+            "system": {
+                "python_version": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "n_cpus": os.cpu_count(),
+            },
+            "config": {
+                "min_time": self.min_time,
+                "repeat": self.repeat,
+                "n_events": self.n_events,
+                "subarray": self.context.subarray.name,
+            },
+            "benchmarks": self.results,
+        }
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.output_path.write_text(json.dumps(output, indent=2))
+        Provenance().add_output_file(
+            self.output_path, role="benchmark results", add_meta=False
+        )
+        self.log.info("Results written to %s", self.output_path)
+
+    def _compare_to_baseline(self):
+        missing = set(self.results) - set(self.baseline)
+        if missing:
+            self.log.warning("Benchmarks missing in baseline: %s", sorted(missing))
+
+        regressions = compare_results(
+            self.results, self.baseline, max_slowdown=self.max_slowdown
+        )
+        if len(regressions) == 0:
+            self.log.info(
+                "No benchmark is more than %.2f times slower than the baseline",
+                self.max_slowdown,
+            )
+            return
+
+        for regression in regressions:
+            self.log.error(
+                "%s is %.2f times slower than the baseline: %.4g s vs. %.4g s",
+                regression["name"],
+                regression["ratio"],
+                regression["time"],
+                regression["baseline"],
+            )
+        self.log.critical("Found %d performance regressions", len(regressions))
+        self.exit(1)
+
+
+def main():
+    """run the tool"""
+    tool = BenchmarkTool()
+    tool.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import tables
 import yaml
 from astropy.table import Table
 
+from ctapipe.io.storage_report import get_storage_report
 from ctapipe.tools.utils import get_parser
 
 
@@ -28,7 +29,8 @@ def unflatten(dictionary, separator=" "):
 def fileinfo(args):
     """
     Display information about ctapipe output files (DL1 or DL2 in HDF5 format).
-    Optionally create an index table from all headers
+    Optionally create an index table from all headers and report
+    the storage of the tables, see `~ctapipe.io.storage_report`.
     """
 
     files = []  # accumulated info for table output
@@ -64,6 +66,11 @@ def fileinfo(args):
 
         print(yaml.dump(info, indent=4))
 
+        if args.storage and isinstance(info[filename], dict):
+            report = get_storage_report(filename, measure_write=args.write_throughput)
+            report.pprint(max_lines=-1, max_width=-1)
+            print()
+
     if args.output_table:
         if args.output_table.endswith(".fits") or args.output_table.endswith(
             ".fits.gz"
@@ -95,6 +102,20 @@ def main():
     parser.add_argument(
         "-f", "--flat", action="store_true", help="show flat header hierarchy"
     )
+    parser.add_argument(
+        "-s",
+        "--storage",
+        action="store_true",
+        help=(
+            "show size, compression ratio, chunk shape"
+            " and read throughput per group of tables"
+        ),
+    )
+    parser.add_argument(
+        "--write-throughput",
+        action="store_true",
+        help="with --storage, also measure the write throughput (in memory)",
+    )
     args = parser.parse_args()
 
     fileinfo(args)
@@ -0,0 +1,161 @@
+"""
+Compile the numba kernels of ctapipe ahead of time, filling the numba cache.
+"""
+
+from astropy.table import Table
+
+from ..core import Tool, ToolConfigurationError
+from ..core.env import CTAPIPE_DISABLE_NUMBA_CACHE
+from ..core.traits import Bool, Unicode, flag
+
+__all__ = ["PrecompileTool"]
+
+
+class PrecompileTool(Tool):
+    """
+    Compile the numba kernels of ctapipe ahead of time.
+
+    Many algorithms of ctapipe are compiled just-in-time by numba on their
+    first call, which takes several seconds in each new process.
+    This tool calls all numba kernels once with the input types used in the
+    processing, storing the compiled code in the numba cache, so that e.g.
+    the processes of grid jobs or worker pools only have to load it.
+
+    The cache is stored next to the ctapipe sources or in the directory given
+    by the ``CTAPIPE_NUMBA_CACHE_DIR`` (or ``NUMBA_CACHE_DIR``) environment
+    variable, which must also be set for the processes using the cache.
+
+    For each group of kernels, the tool reports if they were loaded
+    from the cache (hit) or had to be compiled (miss).
+    """
+
+    name = "ctapipe-precompile"
+    description = __doc__
+    examples = """
+    Fill a shared cache directory:
+    > CTAPIPE_NUMBA_CACHE_DIR=/path/to/cache ctapipe-precompile
+
+    Check at the start of a job that all kernels are loaded from the cache:
+    > CTAPIPE_NUMBA_CACHE_DIR=/path/to/cache ctapipe-precompile --check
+    """
+
+    select = Unicode(
+        default_value=None,
+        allow_none=True,
+        help="Only compile kernel groups with a name matching this regular expression",
+    ).tag(config=True)
+
+    list_warmups = Bool(
+        default_value=False,
+        help="Only list the available kernel groups, don't compile them",
+    ).tag(config=True)
+
+    check = Bool(
+        default_value=False,
+        help="Exit with a non-zero exit code if any kernel was not in the cache",
+    ).tag(config=True)
+
+    aliases = {
+        ("k", "select"): "PrecompileTool.select",
+    }
+
+    flags = {
+        **flag(
+            "list",
+            "PrecompileTool.list_warmups",
+            "Only list the available kernel groups",
+            "Compile the kernels",
+        ),
+        **flag(
+            "check",
+            "PrecompileTool.check",
+            "Fail if any kernel had to be compiled",
+            "Only report kernels missing in the cache",
+        ),
+    }
+
+    def setup(self):
+        if CTAPIPE_DISABLE_NUMBA_CACHE:
+            raise ToolConfigurationError(
+                "The numba cache is disabled by CTAPIPE_DISABLE_NUMBA_CACHE"
+            )
+
+        # imported here, so that only running the tool imports numba
+        from ..utils.numba_cache import get_warmups, numba_cache_dir
+
+        self.warmups = get_warmups(self.select)
+        if len(self.warmups) == 0:
+            raise ToolConfigurationError(
+                f"No kernel groups matching {self.select!r}, use --list to see all"
+            )
+
+        cache_dir = numba_cache_dir()
+        if cache_dir is None:
+            cache_dir = "__pycache__ next to the source files"
+        self.log.info("numba cache: %s", cache_dir)
+        self.results = []
+
+    def start(self):
+        if self.list_warmups:
+            for warmup in self.warmups:
+                print(f"{warmup.name:<40} {warmup.description}")
+            return
+
+        from ..utils.numba_cache import run_warmup
+
+        for warmup in self.warmups:
+            result = run_warmup(warmup)
+            if result.cache_hit:
+                self.log.info(
+                    "%s: cache hit, loaded in %.2f s", result.name, result.duration
+                )
+            else:
+                self.log.info(
+                    "%s: cache miss, compiled %d functions in %.2f s",
+                    result.name,
+                    len(result.compiled),
+                    result.duration,
+                )
+                for name in result.compiled:
+                    self.log.debug("compiled %s", name)
+            self.results.append(result)
+
+    def finish(self):
+        if self.list_warmups:
+            return
+
+        table = Table(
+            rows=[
+                (r.name, "hit" if r.cache_hit else "miss", len(r.compiled), r.duration)
+                for r in self.results
+            ],
+            names=["kernels", "cache", "n_compiled", "duration"],
+        )
+        table["duration"].unit = "s"
+        table["duration"].format = ".2f"
+        table.pprint(max_lines=-1, max_width=-1)
+
+        misses = [r for r in self.results if not r.cache_hit]
+        self.log.info(
+            "%d cache hits, %d cache misses, %.2f s in total",
+            len(self.results) - len(misses),
+            len(misses),
+            sum(r.duration for r in self.results),
+        )
+
+        if self.check and len(misses) > 0:
+            self.log.critical(
+                "Kernels not loaded from the cache: %s",
+                ", ".join(name for r in misses for name in r.compiled),
+            )
+            self.exit(1)
+
+
+def main():
+    """run the tool"""
+    tool = PrecompileTool()
+    tool.run()
+
+
+if __name__ == "__main__":
+    main()
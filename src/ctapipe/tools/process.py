@@ -9,7 +9,14 @@ from tqdm.auto import tqdm
 
 from ..calib import CameraCalibrator, GainSelector
 from ..core import QualityQuery, Tool, ToolConfigurationError
-from ..core.traits import Bool, ComponentName, List, classes_with_traits, flag
+from ..core.traits import (
+    Bool,
+    ComponentName,
+    List,
+    Path,
+    classes_with_traits,
+    flag,
+)
 from ..exceptions import InputMissing
 from ..image import ImageCleaner, ImageModifier, ImageProcessor
 from ..image.extractor import ImageExtractor
@@ -22,13 +29,14 @@ from ..io import (
     MonitoringSource,
     MonitoringType,
     metadata,
-    write_table,
 )
 from ..io.datawriter import DATA_MODEL_VERSION
 from ..io.hdf5dataformat import (
     DL1_IMAGE_STATISTICS_TABLE,
     DL2_EVENT_STATISTICS_GROUP,
+    STAGE_PROFILE_TABLE,
 )
+from ..io.stagecache import DL1Stage, DL1StageCache
 from ..reco import Reconstructor, ShowerProcessor
 from ..utils import EventTypeFilter
 
@@ -90,6 +98,21 @@ class ProcessorTool(Tool):
         default_value=False,
     ).tag(config=True)
 
+    dl1_cache_dir = Path(
+        default_value=None,
+        allow_none=True,
+        exists=None,
+        directory_ok=True,
+        file_ok=False,
+        help=(
+            "If given, the calibrated images and the image parameters are cached"
+            " in this directory. The cache files are identified by the input file"
+            " and the configuration of all components used to compute them,"
+            " so later runs on the same input only recompute the DL1 stages"
+            " whose configuration changed."
+        ),
+    ).tag(config=True)
+
     monitoring_source_list = List(
         ComponentName(MonitoringSource),
         help=(
@@ -109,6 +132,7 @@ class ProcessorTool(Tool):
         "monitoring-source": "ProcessorTool.monitoring_source_list",
         "reconstructor": "ShowerProcessor.reconstructor_types",
         "image-cleaner-type": "ImageProcessor.image_cleaner_type",
+        "dl1-cache-dir": "ProcessorTool.dl1_cache_dir",
     }
 
     flags = {
@@ -250,6 +274,25 @@ class ProcessorTool(Tool):
 
         self.event_type_filter = EventTypeFilter(parent=self)
 
+        self.dl1_cache = None
+        if self.dl1_cache_dir is not None:
+            self.dl1_cache = self.enter_context(
+                DL1StageCache(
+                    cache_dir=self.dl1_cache_dir,
+                    event_source=self.event_source,
+                    components=[
+                        self.event_type_filter,
+                        self.software_trigger,
+                        *self._monitoring_sources,
+                    ],
+                    calibrator=self.calibrate if self.should_calibrate else None,
+                    image_processor=(
+                        self.process_images if self.should_compute_dl1 else None
+                    ),
+                    parent=self,
+                )
+            )
+
     @property
     def should_compute_dl2(self):
         """returns true if we should compute DL2 info"""
@@ -304,12 +347,7 @@ class ProcessorTool(Tool):
 
         if self.should_compute_dl1:
             image_stats = self.process_images.check_image.to_table(functions=True)
-            write_table(
-                image_stats,
-                self.write.output_path,
-                path=DL1_IMAGE_STATISTICS_TABLE,
-                append=True,
-            )
+            self.write.write_table(image_stats, DL1_IMAGE_STATISTICS_TABLE, append=True)
 
         if self.should_compute_dl2:
             reconstructors = self.process_shower.reconstructors
@@ -317,9 +355,8 @@ class ProcessorTool(Tool):
             for reconstructor_name, reconstructor in zip(
                 reconstructor_names, reconstructors
             ):
-                write_table(
+                self.write.write_table(
                     reconstructor.quality_query.to_table(functions=True),
-                    self.write.output_path,
                     f"{DL2_EVENT_STATISTICS_GROUP}/{reconstructor_name}",
                     append=True,
                 )
@@ -336,39 +373,74 @@ class ProcessorTool(Tool):
         )
         self.event_source.subarray.info(printer=self.log.info)
 
+        events = self._iter_events()
+        if self.should_compute_dl2:
+            events = self.profiler.iterate(
+                "ShowerProcessor", self.process_shower.process_events(events)
+            )
+
+        for event in events:
+            with self.profiler.stage("DataWriter"):
+                self.write(event)
+
+    def _iter_events(self):
+        """Read the events and process them up to dl1 and muon parameters"""
+        stage = self.profiler.stage
+        events = self.profiler.iterate(
+            self.event_source.__class__.__name__, self.event_source
+        )
+
         for event in tqdm(
-            self.event_source,
+            events,
             desc=self.event_source.__class__.__name__,
             total=self.event_source.max_events,
             unit="ev",
             disable=not self.progress_bar,
         ):
             self.log.debug("Processing event_id=%s", event.index.event_id)
-            if not self.event_type_filter(event):
+            with stage("EventTypeFilter"):
+                selected = self.event_type_filter(event)
+            if not selected:
                 continue
 
-            if not self.software_trigger(event):
+            with stage("SoftwareTrigger"):
+                triggered = self.software_trigger(event)
+            if not triggered:
                 self.log.debug(
                     "Skipping event %i due to software trigger", event.index.event_id
                 )
                 continue
 
             for mon_source in self._monitoring_sources:
-                mon_source.fill_monitoring_container(event)
+                with stage(mon_source.__class__.__name__):
+                    mon_source.fill_monitoring_container(event)
+
+            cached_stage = None
+            if self.dl1_cache is not None:
+                with stage("DL1StageCache"):
+                    cached_stage = self.dl1_cache.fill(event)
 
             if self.should_calibrate:
-                self.calibrate(event)
+                with stage("CameraCalibrator"):
+                    if cached_stage is None:
+                        self.calibrate(event)
+                    else:
+                        # only the dl1 data is cached, still fill dl0
+                        self.calibrate.calibrate_dl0(event)
 
-            if self.should_compute_dl1:
-                self.process_images(event)
+            if self.should_compute_dl1 and cached_stage is not DL1Stage.PARAMETERS:
+                with stage("ImageProcessor"):
+                    self.process_images(event)
 
-            if self.should_compute_muon_parameters:
-                self.process_muons(event)
+            if self.dl1_cache is not None:
+                with stage("DL1StageCache"):
+                    self.dl1_cache(event)
 
-            if self.should_compute_dl2:
-                self.process_shower(event)
+            if self.should_compute_muon_parameters:
+                with stage("MuonProcessor"):
+                    self.process_muons(event)
 
-            self.write(event)
+            yield event
 
     def finish(self):
         """
@@ -377,8 +449,18 @@ class ProcessorTool(Tool):
         shower_dists = self.event_source.simulated_shower_distributions
         self.write.write_simulated_shower_distributions(shower_dists)
 
+        if self.dl1_cache is not None:
+            self.dl1_cache.finish(
+                self.process_images.check_image if self.should_compute_dl1 else None
+            )
+
         self._write_processing_statistics()
 
+        if self.profile_stages:
+            self.write.write_table(
+                self.profiler.to_table(), STAGE_PROFILE_TABLE, overwrite=True
+            )
+
 
 def main():
     """run the tool"""
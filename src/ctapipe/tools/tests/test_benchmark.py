@@ -0,0 +1,46 @@
+import json
+
+from ctapipe.core import run_tool
+from ctapipe.tools.benchmark import BenchmarkTool
+
+
+def test_benchmark_tool(tmp_path):
+    output = tmp_path / "results.json"
+    args = [
+        "--select=hillas_parameters|leakage",
+        "--min-time=0.01",
+        "--repeat=2",
+        "--n-events=10",
+    ]
+    ret = run_tool(BenchmarkTool(), [*args, f"--output={output}"], cwd=tmp_path)
+    assert ret == 0
+
+    results = json.loads(output.read_text())
+    assert results["config"]["repeat"] == 2
+    assert results["benchmarks"].keys() == {
+        "image.hillas_parameters",
+        "image.leakage_parameters",
+    }
+
+    # compare to itself with an impossible threshold to provoke a regression
+    ret = run_tool(
+        BenchmarkTool(),
+        [*args, f"--baseline={output}", "--max-slowdown=0.01"],
+        cwd=tmp_path,
+        raises=False,
+    )
+    assert ret == 1
+
+    ret = run_tool(
+        BenchmarkTool(),
+        [*args, f"--baseline={output}", "--max-slowdown=100"],
+        cwd=tmp_path,
+    )
+    assert ret == 0
+
+
+def test_benchmark_tool_no_match(tmp_path):
+    ret = run_tool(
+        BenchmarkTool(), ["--select=does-not-exist"], cwd=tmp_path, raises=False
+    )
+    assert ret == 2
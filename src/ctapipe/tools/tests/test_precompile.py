@@ -0,0 +1,24 @@
+from ctapipe.core import run_tool
+from ctapipe.tools.precompile import PrecompileTool
+
+
+def test_precompile_tool(tmp_path, capsys):
+    ret = run_tool(PrecompileTool(), ["--list"], cwd=tmp_path)
+    assert ret == 0
+    assert "image.extractor" in capsys.readouterr().out
+
+    ret = run_tool(PrecompileTool(), ["--select=reco.tree_ensemble"], cwd=tmp_path)
+    assert ret == 0
+
+    # compiled in this process already
+    ret = run_tool(
+        PrecompileTool(), ["--select=reco.tree_ensemble", "--check"], cwd=tmp_path
+    )
+    assert ret == 0
+
+
+def test_precompile_tool_no_match(tmp_path):
+    ret = run_tool(
+        PrecompileTool(), ["--select=does-not-exist"], cwd=tmp_path, raises=False
+    )
+    assert ret == 2
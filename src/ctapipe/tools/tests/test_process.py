@@ -17,6 +17,7 @@ from ctapipe.core import run_tool
 from ctapipe.instrument.subarray import SubarrayDescription
 from ctapipe.io import EventSource, TableLoader, read_table
 from ctapipe.io.hdf5dataformat import (
+    DL1_IMAGE_STATISTICS_TABLE,
     DL1_TEL_IMAGES_GROUP,
     DL1_TEL_MUON_GROUP,
     DL1_TEL_PARAMETERS_GROUP,
@@ -24,6 +25,7 @@ from ctapipe.io.hdf5dataformat import (
     FIXED_POINTING_GROUP,
     SHOWER_DISTRIBUTION_TABLE,
     SIMULATION_IMPACT_GROUP,
+    STAGE_PROFILE_TABLE,
 )
 from ctapipe.io.tests.test_event_source import DummyEventSource
 from ctapipe.tools.process import ProcessorTool
@@ -148,6 +150,27 @@ def test_stage_1_dl1(tmp_path, dl1_image_file, dl1_parameters_file):
     assert ret == 1
 
 
+def test_profile_stages(tmp_path, dl1_image_file):
+    """check the stage timing summary is written to the output"""
+    output = tmp_path / "profile.dl1.h5"
+    run_tool(
+        ProcessorTool(),
+        argv=[
+            f"--input={dl1_image_file}",
+            f"--output={output}",
+            "--write-parameters",
+            "--profile-stages",
+            "--overwrite",
+        ],
+        cwd=tmp_path,
+        raises=True,
+    )
+
+    profile = read_table(output, STAGE_PROFILE_TABLE)
+    assert {"HDF5EventSource", "ImageProcessor", "DataWriter"} <= set(profile["stage"])
+    assert np.all(profile["n_calls"] > 0)
+
+
 def test_stage1_datalevels(tmp_path):
     """test the dl1 tool on a file not providing r1, dl0 or dl1a"""
 
@@ -176,6 +199,47 @@ def test_stage1_datalevels(tmp_path):
     assert isinstance(tool.event_source, DummyEventSource)
 
 
+def test_dl1_cache(tmp_path):
+    """check the dl1 stage cache reproduces the results of a full run"""
+    config = resource_file("stage1_config.json")
+    input_path = get_dataset_path("gamma_prod5.simtel.zst")
+    cache_dir = tmp_path / "cache"
+
+    outputs = []
+    for i in range(2):
+        output = tmp_path / f"cache_{i}.dl1.h5"
+        run_tool(
+            ProcessorTool(),
+            argv=[
+                f"--config={config}",
+                f"--input={input_path}",
+                f"--output={output}",
+                f"--dl1-cache-dir={cache_dir}",
+                "--write-images",
+                "--write-parameters",
+                "--overwrite",
+            ],
+            cwd=tmp_path,
+            raises=True,
+        )
+        outputs.append(output)
+
+        # images and parameters stage
+        assert len(list(cache_dir.glob("*.h5"))) == 2
+
+    for group in (DL1_TEL_IMAGES_GROUP, DL1_TEL_PARAMETERS_GROUP):
+        table = read_table(outputs[0], f"{group}/tel_025")
+        cached = read_table(outputs[1], f"{group}/tel_025")
+        assert table.colnames == cached.colnames
+        for col in table.colnames:
+            assert_array_equal(table[col], cached[col])
+
+    assert_array_equal(
+        read_table(outputs[0], DL1_IMAGE_STATISTICS_TABLE)["counts"],
+        read_table(outputs[1], DL1_IMAGE_STATISTICS_TABLE)["counts"],
+    )
+
+
 def test_stage_2_from_simtel(tmp_path, provenance):
     """check we can go to DL2 geometry from simtel file"""
     config = resource_file("stage2_config.json")
@@ -84,6 +84,12 @@ def test_fileinfo(tmp_path, dl1_image_file):
     header = yaml.safe_load(output.stdout)
     assert "CTA ACTIVITY ID" in header[str(dl1_image_file)]
 
+    command = f"ctapipe-fileinfo {dl1_image_file} --storage"
+    output = subprocess.run(command.split(" "), capture_output=True, encoding="utf-8")
+    assert output.returncode == 0, output.stderr
+    assert "/dl1/event/telescope/images" in output.stdout
+    assert "compression_ratio" in output.stdout
+
 
 def test_dump_instrument(tmp_path):
     from ctapipe.tools.dump_instrument import DumpInstrumentTool
@@ -1,5 +1,8 @@
+import json
+
 import numpy as np
 import pytest
+import yaml
 
 from ctapipe.core import ToolConfigurationError, run_tool
 from ctapipe.exceptions import TooFewEvents
@@ -232,3 +235,36 @@ def test_no_cross_validation(tmp_path):
         ],
     )
     assert ret == 0
+
+
+def test_compact_models_unsupported(tmp_path):
+    """Test compact models for non-tree models are rejected before training"""
+    from ctapipe.tools.train_energy_regressor import TrainEnergyRegressor
+
+    out_file = tmp_path / "energy.pkl"
+    cv_out_file = tmp_path / "cv_results.h5"
+
+    with resource_file("train_energy_regressor.yaml").open() as f:
+        config = yaml.safe_load(f)
+    regressor_config = config["TrainEnergyRegressor"]["EnergyRegressor"]
+    regressor_config["model_cls"] = "KNeighborsRegressor"
+    regressor_config["model_config"] = {}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(config))
+
+    tool = TrainEnergyRegressor()
+    ret = run_tool(
+        tool,
+        argv=[
+            "--input=dataset://gamma_diffuse_dl2_train_small.dl2.h5",
+            f"--output={out_file}",
+            f"--config={config_path}",
+            f"--cv-output={cv_out_file}",
+            "--compact-models",
+        ],
+        raises=False,
+    )
+    assert ret == 1
+    # tool stopped before training
+    assert not cv_out_file.exists()
+    assert not out_file.exists()
@@ -0,0 +1,66 @@
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.table import MaskedColumn, Table, vstack
+
+from ctapipe.tools.utils import _ReservoirSampler
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_reservoir_sampler(chunk_size):
+    """Test sampling events while reading in chunks"""
+    table = Table({"index": np.arange(1000), "energy": np.arange(1000) * u.TeV})
+
+    sampler = _ReservoirSampler(100, np.random.default_rng(0))
+    reservoir = None
+    for start in range(0, len(table), chunk_size):
+        sampler.add(table[start : start + chunk_size])
+        if reservoir is None:
+            reservoir = sampler.reservoir
+        # reservoir is allocated once and updated in place
+        assert reservoir is None or sampler.reservoir is reservoir
+    sample = sampler.get_table()
+
+    assert sampler.n_seen == 1000
+    assert len(sample) == 100
+    # order is kept, events are unique
+    assert np.all(np.diff(sample["index"]) > 0)
+    assert u.allclose(sample["energy"], sample["index"] * u.TeV)
+
+    # result does not depend on the chunk size
+    expected = _ReservoirSampler(100, np.random.default_rng(0))
+    expected.add(table)
+    assert np.all(sample["index"] == expected.get_table()["index"])
+
+    sampler = _ReservoirSampler(None, np.random.default_rng(0))
+    for start in range(0, len(table), chunk_size):
+        sampler.add(table[start : start + chunk_size])
+    assert np.all(sampler.get_table()["index"] == table["index"])
+
+
+def test_reservoir_sampler_masked():
+    """Test masked values of later tables are kept in the sample"""
+    first = Table({"index": np.arange(10), "value": np.arange(10.0)})
+    second = Table(
+        {
+            "index": np.arange(10, 20),
+            "value": MaskedColumn(np.arange(10.0, 20.0), mask=np.arange(10) % 2 == 0),
+        }
+    )
+
+    sampler = _ReservoirSampler(8, np.random.default_rng(0))
+    sampler.add(first[:5])
+    sampler.add(first[5:])
+    sampler.add(second)
+    sample = sampler.get_table()
+
+    expected = _ReservoirSampler(8, np.random.default_rng(0))
+    expected.add(vstack([first, second]))
+    expected = expected.get_table()
+
+    assert np.any(sample["index"] >= 10)
+    np.testing.assert_array_equal(sample["index"], expected["index"])
+    np.testing.assert_array_equal(sample["value"].mask, expected["value"].mask)
+    masked = (sample["index"] >= 10) & (sample["index"] % 2 == 0)
+    assert np.any(masked)
+    np.testing.assert_array_equal(sample["value"].mask, masked)
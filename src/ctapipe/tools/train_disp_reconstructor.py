@@ -6,11 +6,13 @@ import astropy.units as u
 import numpy as np
 
 from ctapipe.core import Tool
-from ctapipe.core.traits import Bool, Int, IntTelescopeParameter, Path
+from ctapipe.core.traits import Bool, Int, IntTelescopeParameter, Path, flag
 from ctapipe.exceptions import InputMissing
 from ctapipe.io import TableLoader
 from ctapipe.reco import CrossValidator, DispReconstructor
 from ctapipe.reco.preprocessing import horizontal_to_telescope
+from ctapipe.reco.sklearn import SUPPORTED_MODELS
+from ctapipe.reco.tree_ensemble import FlatTreeEnsemble
 
 from .utils import read_training_events
 
@@ -70,6 +72,15 @@ class TrainDispReconstructor(Tool):
         help="Number of threads to use for the reconstruction. This overwrites the values in the config of each reconstructor.",
     ).tag(config=True)
 
+    compact_models = Bool(
+        default_value=False,
+        help=(
+            "Store the trained models as flat tree ensembles in an uncompressed"
+            " file, which is memory-mapped when loading the models."
+            " Only supported for decision tree and forest models."
+        ),
+    ).tag(config=True)
+
     project_disp = Bool(
         default_value=False,
         help=(
@@ -88,6 +99,15 @@ class TrainDispReconstructor(Tool):
         "cv-output": "CrossValidator.output_path",
     }
 
+    flags = {
+        **flag(
+            "compact-models",
+            "TrainDispReconstructor.compact_models",
+            "Store compact, memory-mappable models",
+            "Store compressed sklearn models",
+        ),
+    }
+
     classes = [TableLoader, DispReconstructor, CrossValidator]
 
     def setup(self):
@@ -110,6 +130,15 @@ class TrainDispReconstructor(Tool):
 
         self.n_events.attach_subarray(self.loader.subarray)
         self.models = DispReconstructor(self.loader.subarray, parent=self)
+        for name in (self.models.norm_cls, self.models.sign_cls):
+            model_cls = SUPPORTED_MODELS[name]
+            if self.compact_models and not FlatTreeEnsemble.supports(model_cls):
+                self.log.critical(
+                    "compact_models is only supported for decision tree and forest"
+                    " models, got %s",
+                    name,
+                )
+                self.exit(1)
 
         self.cross_validate = self.enter_context(
             CrossValidator(
@@ -195,7 +224,9 @@ class TrainDispReconstructor(Tool):
         """
         self.log.info("Writing output")
         self.models.n_jobs = None
-        self.models.write(self.output_path, overwrite=self.overwrite)
+        self.models.write(
+            self.output_path, overwrite=self.overwrite, compact=self.compact_models
+        )
         self.loader.close()
         self.cross_validate.close()
 
@@ -5,10 +5,12 @@ Tool for training the EnergyRegressor
 import numpy as np
 
 from ctapipe.core import Tool
-from ctapipe.core.traits import Int, IntTelescopeParameter, Path
+from ctapipe.core.traits import Bool, Int, IntTelescopeParameter, Path, flag
 from ctapipe.exceptions import InputMissing
 from ctapipe.io import TableLoader
 from ctapipe.reco import CrossValidator, EnergyRegressor
+from ctapipe.reco.sklearn import SUPPORTED_MODELS
+from ctapipe.reco.tree_ensemble import FlatTreeEnsemble
 
 from .utils import read_training_events
 
@@ -69,6 +71,15 @@ class TrainEnergyRegressor(Tool):
         help="Number of threads to use for the reconstruction. This overwrites the values in the config of each reconstructor.",
     ).tag(config=True)
 
+    compact_models = Bool(
+        default_value=False,
+        help=(
+            "Store the trained models as flat tree ensembles in an uncompressed"
+            " file, which is memory-mapped when loading the models."
+            " Only supported for decision tree and forest models."
+        ),
+    ).tag(config=True)
+
     aliases = {
         ("i", "input"): "TableLoader.input_url",
         ("o", "output"): "TrainEnergyRegressor.output_path",
@@ -78,6 +89,15 @@ class TrainEnergyRegressor(Tool):
         "cv-output": "CrossValidator.output_path",
     }
 
+    flags = {
+        **flag(
+            "compact-models",
+            "TrainEnergyRegressor.compact_models",
+            "Store compact, memory-mappable models",
+            "Store compressed sklearn models",
+        ),
+    }
+
     classes = [
         TableLoader,
         EnergyRegressor,
@@ -104,6 +124,14 @@ class TrainEnergyRegressor(Tool):
 
         self.n_events.attach_subarray(self.loader.subarray)
         self.regressor = EnergyRegressor(self.loader.subarray, parent=self)
+        model_cls = SUPPORTED_MODELS[self.regressor.model_cls]
+        if self.compact_models and not FlatTreeEnsemble.supports(model_cls):
+            self.log.critical(
+                "compact_models is only supported for decision tree and forest"
+                " models, got %s",
+                self.regressor.model_cls,
+            )
+            self.exit(1)
 
         self.cross_validate = self.enter_context(
             CrossValidator(
@@ -151,7 +179,9 @@ class TrainEnergyRegressor(Tool):
         """
         self.log.info("Writing output")
         self.regressor.n_jobs = None
-        self.regressor.write(self.output_path, overwrite=self.overwrite)
+        self.regressor.write(
+            self.output_path, overwrite=self.overwrite, compact=self.compact_models
+        )
         self.loader.close()
         self.cross_validate.close()
 
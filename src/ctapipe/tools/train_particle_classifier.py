@@ -6,9 +6,11 @@ import numpy as np
 from astropy.table import vstack
 
 from ctapipe.core.tool import Tool, ToolConfigurationError
-from ctapipe.core.traits import Float, Int, IntTelescopeParameter, Path
+from ctapipe.core.traits import Bool, Float, Int, IntTelescopeParameter, Path, flag
 from ctapipe.io import TableLoader
 from ctapipe.reco import CrossValidator, ParticleClassifier
+from ctapipe.reco.sklearn import SUPPORTED_MODELS
+from ctapipe.reco.tree_ensemble import FlatTreeEnsemble
 
 from .utils import read_training_events
 
@@ -95,6 +97,15 @@ class TrainParticleClassifier(Tool):
         help="Number of threads to use for the reconstruction. This overwrites the values in the config of each reconstructor.",
     ).tag(config=True)
 
+    compact_models = Bool(
+        default_value=False,
+        help=(
+            "Store the trained models as flat tree ensembles in an uncompressed"
+            " file, which is memory-mapped when loading the models."
+            " Only supported for decision tree and forest models."
+        ),
+    ).tag(config=True)
+
     aliases = {
         "signal": "TrainParticleClassifier.input_url_signal",
         "background": "TrainParticleClassifier.input_url_background",
@@ -105,6 +116,15 @@ class TrainParticleClassifier(Tool):
         "cv-output": "CrossValidator.output_path",
     }
 
+    flags = {
+        **flag(
+            "compact-models",
+            "TrainParticleClassifier.compact_models",
+            "Store compact, memory-mappable models",
+            "Store compressed sklearn models",
+        ),
+    }
+
     classes = [
         TableLoader,
         ParticleClassifier,
@@ -152,6 +172,14 @@ class TrainParticleClassifier(Tool):
         self.classifier = ParticleClassifier(
             subarray=self.signal_loader.subarray, parent=self
         )
+        model_cls = SUPPORTED_MODELS[self.classifier.model_cls]
+        if self.compact_models and not FlatTreeEnsemble.supports(model_cls):
+            self.log.critical(
+                "compact_models is only supported for decision tree and forest"
+                " models, got %s",
+                self.classifier.model_cls,
+            )
+            self.exit(1)
         self.cross_validate = self.enter_context(
             CrossValidator(
                 parent=self, model_component=self.classifier, overwrite=self.overwrite
@@ -248,7 +276,9 @@ class TrainParticleClassifier(Tool):
         """
         self.log.info("Writing output")
         self.classifier.n_jobs = None
-        self.classifier.write(self.output_path, overwrite=self.overwrite)
+        self.classifier.write(
+            self.output_path, overwrite=self.overwrite, compact=self.compact_models
+        )
         self.signal_loader.close()
         self.background_loader.close()
         self.cross_validate.close()
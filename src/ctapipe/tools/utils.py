@@ -8,17 +8,19 @@ from collections import OrderedDict
 from importlib.metadata import distribution
 from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from astropy.table import vstack
+from astropy.table import MaskedColumn, vstack
 
-from ..containers import CoordinateFrameType
-from ..core.traits import Int
 from ..exceptions import TooFewEvents
-from ..instrument import TelescopeDescription
-from ..io import TableLoader
-from ..reco.preprocessing import check_valid_rows
-from ..reco.sklearn import DispReconstructor, SKLearnReconstructor
+
+# only needed for the training tools, not imported on startup of every tool
+if TYPE_CHECKING:
+    from ..core.traits import Int
+    from ..instrument import TelescopeDescription
+    from ..io import TableLoader
+    from ..reco.sklearn import SKLearnReconstructor
 
 LOG = logging.getLogger(__name__)
 
@@ -83,16 +85,26 @@ def get_all_descriptions():
 
 
 def read_training_events(
-    loader: TableLoader,
-    chunk_size: Int,
-    telescope_type: TelescopeDescription,
-    reconstructor: type[SKLearnReconstructor],
+    loader: "TableLoader",
+    chunk_size: "Int",
+    telescope_type: "TelescopeDescription",
+    reconstructor: "type[SKLearnReconstructor]",
     feature_names: list,
     rng: np.random.Generator,
     log=LOG,
     n_events=None,
 ):
-    """Chunked loading of events for training ML models"""
+    """Chunked loading of events for training ML models
+
+    If ``n_events`` is given, a random sample of ``n_events`` is drawn
+    while iterating over the chunks, so that at most ``n_events`` plus
+    one chunk of events are kept in memory.
+    The sample only depends on the state of ``rng``, not on ``chunk_size``.
+    """
+    from ..containers import CoordinateFrameType
+    from ..reco.preprocessing import check_valid_rows
+    from ..reco.sklearn import DispReconstructor
+
     chunk_iterator = loader.read_telescope_events_chunked(
         chunk_size,
         telescopes=[telescope_type],
@@ -100,7 +112,7 @@ def read_training_events(
         instrument=True,
         observation_info=True,
     )
-    table = []
+    sampler = _ReservoirSampler(n_events, rng)
     n_events_in_file = 0
     n_valid_events_in_file = 0
     n_non_predictable = 0
@@ -138,9 +150,9 @@ def read_training_events(
             n_non_predictable += np.sum(~valid)
             table_chunk = table_chunk[valid]
 
-        table.append(table_chunk)
+        sampler.add(table_chunk)
 
-    table = vstack(table)
+    table = sampler.get_table()
     log.info("Events read from input: %d", n_events_in_file)
     log.info("Events after applying quality query: %d", n_valid_events_in_file)
 
@@ -153,17 +165,93 @@ def read_training_events(
         log.warning("Dropping %d non-predictable events.", n_non_predictable)
 
     if n_events is not None:
-        if n_events > len(table):
+        if n_events > sampler.n_seen:
             log.warning(
                 "Number of events in table (%d) is less"
                 " than requested number of events %d",
-                len(table),
+                sampler.n_seen,
                 n_events,
             )
         else:
-            log.info("Sampling %d events", n_events)
-            idx = rng.choice(len(table), n_events, replace=False)
-            idx.sort()
-            table = table[idx]
+            log.info("Sampled %d of %d events", n_events, sampler.n_seen)
 
     return table
+
+
+class _ReservoirSampler:
+    """
+    Uniform random sampling of rows from a stream of tables.
+
+    Each row is assigned a uniform random key and the ``n_events`` rows with
+    the smallest keys are kept, which is a uniform sample without replacement
+    of all rows seen so far. The sample keeps the order of the input rows.
+    If ``n_events`` is None, all rows are kept.
+
+    Once ``n_events`` rows have been seen, the reservoir table is allocated
+    and rows of later tables replace evicted rows in place.
+    """
+
+    def __init__(self, n_events, rng):
+        self.n_events = n_events
+        self.rng = rng
+        self.n_seen = 0
+        self.tables = []
+        self.reservoir = None
+        self.keys = np.empty(0)
+        # index of each reservoir row in the input stream, to restore the order
+        self.order = np.empty(0, dtype=np.int64)
+
+    def add(self, table):
+        offset = self.n_seen
+        self.n_seen += len(table)
+
+        if self.n_events is None:
+            self.tables.append(table)
+            return
+
+        keys = self.rng.uniform(size=len(table))
+
+        if self.reservoir is None:
+            self.tables.append(table)
+            self.keys = np.concatenate([self.keys, keys])
+            if self.n_seen > self.n_events:
+                keep = np.argpartition(self.keys, self.n_events)[: self.n_events]
+                keep.sort()
+                self.reservoir = vstack(self.tables)[keep]
+                self.keys = self.keys[keep]
+                self.order = keep
+                self.tables = []
+            return
+
+        if self.n_events == 0:
+            return
+
+        # only rows with a key smaller than the largest kept key can enter
+        candidates = np.nonzero(keys < self.keys.max())[0]
+        if len(candidates) == 0:
+            return
+
+        all_keys = np.concatenate([self.keys, keys[candidates]])
+        keep = np.argpartition(all_keys, self.n_events)[: self.n_events]
+        is_new = keep >= self.n_events
+        new_rows = candidates[keep[is_new] - self.n_events]
+        evicted = np.setdiff1d(
+            np.arange(self.n_events), keep[~is_new], assume_unique=True
+        )
+
+        for name in self.reservoir.colnames:
+            column = table[name]
+            # the reservoir was allocated from earlier tables, keep masked values
+            if isinstance(column, MaskedColumn) and not isinstance(
+                self.reservoir[name], MaskedColumn
+            ):
+                self.reservoir.replace_column(name, MaskedColumn(self.reservoir[name]))
+            self.reservoir[name][evicted] = column[new_rows]
+        self.keys[evicted] = keys[new_rows]
+        self.order[evicted] = offset + new_rows
+
+    def get_table(self):
+        if self.reservoir is None:
+            return vstack(self.tables)
+        # keep the original order of the events
+        return self.reservoir[np.argsort(self.order)]
@@ -0,0 +1,406 @@
+"""
+Ahead-of-time compilation of the numba kernels of ctapipe.
+
+The numba-compiled functions of ctapipe are cached on disk (unless
+``CTAPIPE_DISABLE_NUMBA_CACHE`` is set), but only after they have been called
+for the first time with a given signature. Every fresh process, e.g. the
+workers of a grid job, pays for this just-in-time compilation.
+
+The *warm-up* functions registered here call all numba kernels with the input
+types used in the ctapipe processing, filling the cache before the actual
+processing starts. Run them using `precompile` or the ``ctapipe-precompile`` tool.
+
+The cache is stored next to the source files in ``__pycache__`` directories,
+or in the directory given by the ``NUMBA_CACHE_DIR`` or ``CTAPIPE_NUMBA_CACHE_DIR``
+environment variables, see `ctapipe.core.env`.
+"""
+
+import inspect
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+from numba.core import config
+from numba.core.event import Listener, install_listener
+
+__all__ = [
+    "CompilationRecorder",
+    "Warmup",
+    "WarmupResult",
+    "get_warmups",
+    "numba_cache_dir",
+    "precompile",
+    "register_warmup",
+    "run_warmup",
+    "warmup",
+]
+
+_WARMUPS = {}
+
+
+@dataclass(frozen=True)
+class Warmup:
+    """
+    A registered warm-up function.
+
+    Attributes
+    ----------
+    name : str
+        Unique, dot-separated name, e.g. ``image.extractor``
+    func : Callable
+        Function without arguments calling the numba kernels
+    description : str
+        Short description of the kernels compiled by ``func``
+    """
+
+    name: str
+    func: Callable
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """
+    Result of running a warm-up function.
+
+    Attributes
+    ----------
+    name : str
+        Name of the warm-up
+    compiled : tuple[str]
+        Qualified names of the ctapipe functions that were compiled,
+        i.e. not loaded from the cache.
+    duration : float
+        Wall time in seconds
+    """
+
+    name: str
+    compiled: tuple
+    duration: float
+
+    @property
+    def cache_hit(self):
+        """True if all kernels were loaded from the cache"""
+        return len(self.compiled) == 0
+
+
+def register_warmup(name, func, description=""):
+    """
+    Register a warm-up function.
+
+    Parameters
+    ----------
+    name : str
+        Unique, dot-separated name of the warm-up
+    func : Callable
+        See `Warmup`
+    description : str
+        Short description of the kernels compiled by ``func``
+    """
+    if name in _WARMUPS:
+        raise ValueError(f"Warm-up {name!r} is already registered")
+    _WARMUPS[name] = Warmup(name=name, func=func, description=description)
+
+
+def warmup(name):
+    """
+    Decorator registering the decorated function as warm-up ``name``.
+
+    The first line of the docstring is used as description.
+    """
+
+    def decorator(func):
+        doc = inspect.getdoc(func) or ""
+        register_warmup(name, func, description=doc.split("\n")[0])
+        return func
+
+    return decorator
+
+
+def get_warmups(pattern=None):
+    """
+    Get the registered warm-up functions.
+
+    Parameters
+    ----------
+    pattern : str or None
+        If given, only warm-ups with a name matching this regular expression
+        (using `re.search`) are returned.
+
+    Returns
+    -------
+    list[Warmup]
+        Warm-ups sorted by name
+    """
+    warmups = sorted(_WARMUPS.values(), key=lambda w: w.name)
+    if pattern is not None:
+        regex = re.compile(pattern)
+        warmups = [w for w in warmups if regex.search(w.name)]
+    return warmups
+
+
+def numba_cache_dir():
+    """
+    Directory of the numba cache.
+
+    Returns
+    -------
+    str or None
+        The configured cache directory, None if the cache is stored
+        in ``__pycache__`` directories next to the source files.
+    """
+    return config.CACHE_DIR or None
+
+
+class CompilationRecorder(Listener):
+    """
+    Context manager recording which functions numba compiles.
+
+    Functions loaded from the cache are not compiled and thus not recorded.
+    Note that the kernels with explicit signatures (e.g. all ``guvectorize``
+    functions) are compiled when their module is imported.
+
+    Parameters
+    ----------
+    module_prefix : str
+        Only functions in modules starting with this prefix are recorded
+
+    Attributes
+    ----------
+    compiled : set[str]
+        Qualified names of the compiled functions
+    """
+
+    def __init__(self, module_prefix="ctapipe."):
+        self.module_prefix = module_prefix
+        self.compiled = set()
+        self._context = None
+
+    def on_start(self, event):
+        module = event.data["module"]
+        if module.startswith(self.module_prefix):
+            self.compiled.add(f"{module}.{event.data['qualname']}")
+
+    def on_end(self, event):
+        pass
+
+    def __enter__(self):
+        # every compilation runs the compiler passes, also for ufunc kernels
+        self._context = install_listener("numba:run_pass", self)
+        self._context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._context.__exit__(exc_type, exc_value, traceback)
+        self._context = None
+
+
+def run_warmup(warmup):
+    """
+    Run a warm-up function, recording the compiled functions.
+
+    Parameters
+    ----------
+    warmup : Warmup
+        The warm-up to run
+
+    Returns
+    -------
+    WarmupResult
+    """
+    start = time.perf_counter()
+    with CompilationRecorder() as recorder:
+        warmup.func()
+    duration = time.perf_counter() - start
+    return WarmupResult(
+        name=warmup.name,
+        compiled=tuple(sorted(recorder.compiled)),
+        duration=duration,
+    )
+
+
+def precompile(pattern=None):
+    """
+    Compile the numba kernels of ctapipe, storing them in the cache.
+
+    Kernels already in the cache are just loaded, so this can also be
+    used to check that the cache is complete.
+
+    Parameters
+    ----------
+    pattern : str or None
+        Only run warm-ups with a name matching this regular expression
+
+    Returns
+    -------
+    list[WarmupResult]
+    """
+    return [run_warmup(w) for w in get_warmups(pattern)]
+
+
+@cache
+def _toy_subarray():
+    # imported here, the toy subarray needs most of ctapipe
+    from ..benchmark import make_toy_subarray
+
+    return make_toy_subarray(n_telescopes=2, n_pixels_side=11, n_samples=40)
+
+
+def _toy_dl1_events():
+    from ..io.toymodel import SyntheticEventSource
+
+    source = SyntheticEventSource(
+        subarray=_toy_subarray(), max_events=20, batch_size=20, seed=0
+    )
+    return [event for event in source if len(event.trigger.tels_with_trigger) > 0]
+
+
+@warmup("image.extractor")
+def _warmup_image_extractor():
+    """Image extractors on gain-selected float32 waveforms"""
+    from ..image.extractor import ImageExtractor
+
+    subarray = _toy_subarray()
+    tel_id = subarray.tel_ids[0]
+    readout = subarray.tel[tel_id].camera.readout
+    rng = np.random.default_rng(0)
+
+    waveforms = rng.normal(
+        0, 1, (readout.n_channels, readout.n_pixels, readout.n_samples)
+    ).astype(np.float32)
+    broken_pixels = np.zeros((readout.n_channels, readout.n_pixels), dtype=bool)
+    selected_gain_channel = np.zeros(readout.n_pixels, dtype=np.int8)
+
+    for cls in ImageExtractor.non_abstract_subclasses().values():
+        extractor = cls(subarray=subarray)
+        extractor(
+            waveforms,
+            tel_id=tel_id,
+            selected_gain_channel=selected_gain_channel,
+            broken_pixels=broken_pixels,
+        )
+
+
+@warmup("calib.camera")
+def _warmup_calib_camera():
+    """Pedestal subtraction and waveform time shift of the camera calibration"""
+    from ..calib.camera.calibrator import shift_waveforms, subtract_pedestal_and_shift
+
+    for dtype in (np.float32, np.float64):
+        waveforms = np.zeros((1, 10, 40), dtype=dtype)
+        shift_waveforms(waveforms, np.zeros((1, 10)))
+        subtract_pedestal_and_shift(
+            waveforms, np.zeros((1, 10)), np.zeros((1, 10), dtype=np.int16)
+        )
+
+
+@warmup("calib.gain_selection")
+def _warmup_gain_selection():
+    """Batched threshold gain selection of R0 and R1 waveforms"""
+    from ..calib.camera.gainselection import threshold_gain_selection
+
+    for dtype in (np.uint16, np.float32):
+        threshold_gain_selection(np.zeros((1, 2, 10, 40), dtype=dtype), 4000.0)
+
+
+@warmup("image.reducer")
+def _warmup_image_reducer():
+    """Batched tailcuts cleaning and dilation of the data volume reduction"""
+    from ..image.reducer import TailCutsDataVolumeReducer
+
+    subarray = _toy_subarray()
+    tel_id = subarray.tel_ids[0]
+    readout = subarray.tel[tel_id].camera.readout
+    waveforms = np.zeros(
+        (2, readout.n_channels, readout.n_pixels, readout.n_samples),
+        dtype=np.float32,
+    )
+    reducer = TailCutsDataVolumeReducer(subarray=subarray)
+    reducer.select_pixels_batch(
+        waveforms,
+        tel_id=tel_id,
+        selected_gain_channel=np.zeros((2, readout.n_pixels), dtype=np.int8),
+    )
+
+
+@warmup("image.processor")
+def _warmup_image_processor():
+    """Image parameters (morphology, statistics, timing) of float32 DL1 images"""
+    from ..image import ImageProcessor
+
+    process_images = ImageProcessor(subarray=_toy_subarray())
+    for event in _toy_dl1_events():
+        process_images(event)
+
+
+@warmup("image.modifications")
+def _warmup_image_modifications():
+    """Noise and PSF smearing of float32 DL1 images"""
+    from ..image.modifications import ImageModifier
+
+    subarray = _toy_subarray()
+    modifier = ImageModifier(
+        subarray=subarray, psf_smear_factor=0.1, noise_level_dim_pixels=1.0
+    )
+    for event in _toy_dl1_events():
+        for tel_id, dl1 in event.dl1.tel.items():
+            modifier(tel_id, dl1.image)
+
+
+@warmup("image.muon")
+def _warmup_image_muon():
+    """Vectorized functions of the muon intensity fitter"""
+    from ..image.muon import intensity_fitter  # noqa: F401
+
+
+@warmup("reco.telescope_event_handling")
+def _warmup_telescope_event_handling():
+    """Grouping and averaging of telescope events of the same array event"""
+    from astropy.table import Table
+
+    from ..reco.telescope_event_handling import (
+        get_subarray_index,
+        weighted_mean_std_ufunc,
+    )
+
+    table = Table(
+        {
+            "obs_id": np.ones(6, dtype=np.int32),
+            "event_id": np.array([1, 1, 2, 3, 3, 3], dtype=np.int64),
+        }
+    )
+    _, _, multiplicity, indices = get_subarray_index(table)
+    weighted_mean_std_ufunc(
+        np.ones(6), np.ones(6, dtype=bool), indices, multiplicity, np.ones(6)
+    )
+
+
+@warmup("reco.tree_ensemble")
+def _warmup_tree_ensemble():
+    """Batch prediction of flattened decision tree ensembles"""
+    from ..reco.tree_ensemble import LEAF, FlatTreeEnsemble
+
+    # a single tree with one split
+    model = FlatTreeEnsemble(
+        roots=np.array([0]),
+        feature=np.array([0, -2, -2]),
+        threshold=np.array([0.0, -2.0, -2.0]),
+        children_left=np.array([1, LEAF, LEAF]),
+        children_right=np.array([2, LEAF, LEAF]),
+        missing_go_to_left=np.zeros(3, dtype=bool),
+        value=np.array([[0.0], [-1.0], [1.0]]),
+        n_features_in=1,
+    )
+    model.predict(np.linspace(-1, 1, 10)[:, np.newaxis])
+
+
+@warmup("reco.impact")
+def _warmup_impact():
+    """Pixel rotation of the ImPACT reconstructor"""
+    from ..reco.impact_utilities import rotate_translate
+
+    pixel_pos = np.zeros((2, 10))
+    rotate_translate(pixel_pos, pixel_pos, 0.0, 0.0, np.zeros(2))
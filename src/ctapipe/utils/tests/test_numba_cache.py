@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from numba import njit
+
+from ctapipe.utils.numba_cache import (
+    CompilationRecorder,
+    get_warmups,
+    register_warmup,
+)
+
+SELECT = "reco.tree_ensemble|reco.impact"
+
+
+def test_get_warmups():
+    warmups = get_warmups()
+    names = [w.name for w in warmups]
+    assert names == sorted(names)
+    assert "image.extractor" in names
+    assert all(w.description for w in warmups)
+
+    selected = get_warmups(SELECT)
+    assert [w.name for w in selected] == ["reco.impact", "reco.tree_ensemble"]
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_warmup("image.extractor", lambda: None)
+
+
+def test_compilation_recorder():
+    @njit
+    def add(a, b):
+        return a + b
+
+    with CompilationRecorder(module_prefix=__name__) as recorder:
+        add(1, 2)
+    assert recorder.compiled == {f"{__name__}.{add.__qualname__}"}
+
+    # already compiled
+    with CompilationRecorder(module_prefix=__name__) as recorder:
+        add(1, 2)
+    assert recorder.compiled == set()
+
+
+def _precompile_in_subprocess(cache_dir):
+    code = (
+        "import json;"
+        "from ctapipe.utils.numba_cache import precompile, numba_cache_dir;"
+        f"results = precompile({SELECT!r});"
+        "print(json.dumps([numba_cache_dir(), [r.compiled for r in results]]))"
+    )
+    env = os.environ.copy()
+    env.pop("NUMBA_CACHE_DIR", None)
+    env.pop("CTAPIPE_DISABLE_NUMBA_CACHE", None)
+    env["CTAPIPE_NUMBA_CACHE_DIR"] = str(cache_dir)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_precompile(tmp_path):
+    """Kernels are compiled into the cache directory and loaded in a new process"""
+    cache_dir = tmp_path / "numba_cache"
+
+    used_dir, compiled = _precompile_in_subprocess(cache_dir)
+    assert used_dir == str(cache_dir)
+    assert all(len(c) > 0 for c in compiled)
+    assert any(cache_dir.rglob("*.nbi"))
+
+    _, compiled = _precompile_in_subprocess(cache_dir)
+    assert compiled == [[], []]